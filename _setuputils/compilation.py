@@ -123,8 +123,16 @@ def getSetupOptions(path):
     return options
 
 def getExtensionArgsFromSetupOptions(options):
-    args = {}
+    args = {"extra_compile_args" : [], "extra_link_args" : []}
     if "c++11" in options:
         if onLinux or onMacOS:
-            args["extra_compile_args"] = ["-std=c++11"]
+            args["extra_compile_args"].append("-std=c++11")
+    # The default compiler on MacOS does not support OpenMP.
+    # The parallel loops are executed serially there.
+    if "openmp" in options:
+        if onLinux:
+            args["extra_compile_args"].append("-fopenmp")
+            args["extra_link_args"].append("-fopenmp")
+        elif onWindows:
+            args["extra_compile_args"].append("/openmp")
     return args
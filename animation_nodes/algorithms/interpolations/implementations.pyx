@@ -3,7 +3,8 @@ from libc.math cimport M_PI as PI
 from ... utils.clamp cimport clamp
 from libc.math cimport pow, sqrt, sin, cos
 from ... utils.lists cimport findListSegment_LowLevel
-from ... data_structures cimport Interpolation, DoubleList
+from ... data_structures cimport Interpolation, DoubleList, FCurveSnapshot
+from ... data_structures.fcurve_snapshot import getFCurveSnapshot
 
 '''
 Here is a good source for different interpolation functions in Java:
@@ -390,14 +391,14 @@ cdef class CachedInterpolation(Interpolation):
 
 cdef class FCurveMapping(Interpolation):
     cdef:
-        object fCurve
+        FCurveSnapshot snapshot
         double xMove, xFactor, yMove, yFactor
 
     def __cinit__(self, object fCurve, double xMove, double xFactor, double yMove, double yFactor):
         from bpy.types import FCurve
         if not isinstance(fCurve, FCurve):
             raise TypeError("Expected FCurve")
-        self.fCurve = fCurve
+        self.snapshot = getFCurveSnapshot(fCurve)
         self.xMove = xMove
         self.xFactor = xFactor
         self.yMove = yMove
@@ -405,7 +406,7 @@ cdef class FCurveMapping(Interpolation):
 
     cdef double evaluate(self, double x):
         x = x * self.xFactor + self.xMove
-        return (self.fCurve.evaluate(x) + self.yMove) * self.yFactor
+        return (self.snapshot.evaluate(<float>x) + self.yMove) * self.yFactor
 
 
 cdef class MirroredAndChainedInterpolation(Interpolation):
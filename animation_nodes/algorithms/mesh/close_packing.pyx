@@ -1,11 +1,13 @@
 import cython
 from libc.math cimport sqrt
 from mathutils import Vector
-from mathutils.kdtree import KDTree
 from mathutils.bvhtree import BVHTree
+from libc.stdlib cimport malloc, free
 from ... algorithms.rotations.rotation_and_direction cimport directionToMatrix_LowLevel
 from ... data_structures cimport (
     Mesh,
+    KDTree,
+    KDTreeNeighbour,
     LongList,
     FloatList,
     DoubleList,
@@ -27,22 +29,24 @@ from ... math cimport (
 def dynamicRadiusSpherePacking(Vector3DList points, float margin, float radiusMax, float radiusStep,
                                  FloatList influences, bint mask, DoubleList objectRadii):
     cdef Py_ssize_t numberOfPoints = points.length
-    kdTree = buildKDTree(numberOfPoints, points)
+    cdef KDTree kdTree = KDTree(points)
 
     cdef DoubleList radii = DoubleList(length = numberOfPoints)
     radii.fill(0)
 
     cdef float searchRadius = max(2 * (margin + radiusMax), 0)
     cdef DoubleList distances
-    cdef LongList indices
+    cdef LongList indices, offsets
     cdef float radius
     cdef Py_ssize_t i, iterations, numberOfNonZeroRadius
 
+    indices, distances, offsets = kdTree.findInRadiusForList(points, searchRadius)
+
     numberOfNonZeroRadius = 0
     for i in range(numberOfPoints):
-        indices, distances = calculateDistancesByRange(kdTree, points.data[i], searchRadius)
         iterations = int(radiusMax * influences.data[i] / radiusStep)
-        radius = calulateMaxRadius(iterations, margin, radiusStep, radii, indices, distances)
+        radius = calulateMaxRadius(iterations, margin, radiusStep, radii, indices, distances,
+                                   offsets.data[i], offsets.data[i + 1])
         radii.data[i] = radius
         if radius > 0:
             numberOfNonZeroRadius += 1
@@ -54,7 +58,7 @@ def dynamicRadiusSpherePacking(Vector3DList points, float margin, float radiusMa
 def neighbourRadiusSpherePacking(Vector3DList points, float margin, float radiusMax, float radiusStep,
                                  FloatList influences, bint mask, DoubleList objectRadii):
     cdef Py_ssize_t numberOfPoints = points.length
-    kdTree = buildKDTree(numberOfPoints, points)
+    cdef KDTree kdTree = KDTree(points)
 
     cdef DoubleList radii = DoubleList(length = numberOfPoints)
     radii.fill(0)
@@ -72,7 +76,8 @@ def neighbourRadiusSpherePacking(Vector3DList points, float margin, float radius
             nextRadius = radii.data[i] + radiusStep
             indices, distances = calculateDistancesByRange(kdTree, points.data[i], 2 * (margin + nextRadius))
             influence = influences.data[i]
-            if comapareRadiusDistanceOfKDTree(margin + nextRadius * influence, radii, indices, distances):
+            if comapareRadiusDistanceOfKDTree(margin + nextRadius * influence, radii, indices, distances,
+                                              0, indices.length):
                 radii.data[i] = nextRadius * influence
             if radii.data[i] > 0: numberOfNonZeroRadius += 1
 
@@ -122,7 +127,7 @@ def relaxSpherePacking(Vector3DList points, float margin, DoubleList radii, floa
     cdef Vector3DList prePoints = points
     cdef Vector3 point, force
     cdef DoubleList distances
-    cdef LongList indices
+    cdef LongList indices, offsets
     cdef float radius, totalRadius, distance, forceScale, error
     cdef Py_ssize_t i, j, k, count, index, numberOfNonZeroRadius
 
@@ -134,14 +139,14 @@ def relaxSpherePacking(Vector3DList points, float margin, DoubleList radii, floa
 
     for k in range(iterations):
         count = 0
-        kdTree = buildKDTree(numberOfPoints, relaxPoints)
+        # the first neighbour of every point is the point itself
+        indices, distances, offsets = KDTree(relaxPoints).findNearestForList(relaxPoints, 1 + neighbourAmount)
         for j in range(numberOfPoints):
             radius = radii.data[j]
             point = relaxPoints.data[j]
-            indices, distances = calculateDistancesByAmount(kdTree, point, 1 + neighbourAmount)
 
             if radius == 0: continue
-            for i in range(1, indices.length):
+            for i in range(offsets.data[j] + 1, offsets.data[j + 1]):
                 index = indices.data[i]
                 distance = distances.data[i]
 
@@ -177,7 +182,7 @@ def relaxSpherePackingOnMesh(Vector3DList points, float margin, DoubleList radii
     cdef Vector3DList prePoints = points
     cdef Vector3 point, force
     cdef DoubleList distances
-    cdef LongList indices
+    cdef LongList indices, offsets
     cdef float radius, totalRadius, distance, forceScale, error, x, y, z
     cdef Py_ssize_t i, j, k, count, index, numberOfNonZeroRadius
 
@@ -189,14 +194,14 @@ def relaxSpherePackingOnMesh(Vector3DList points, float margin, DoubleList radii
 
     for k in range(iterations):
         count = 0
-        kdTree = buildKDTree(numberOfPoints, relaxPoints)
+        # the first neighbour of every point is the point itself
+        indices, distances, offsets = KDTree(relaxPoints).findNearestForList(relaxPoints, 1 + neighbourAmount)
         for j in range(numberOfPoints):
             radius = radii.data[j]
             point = relaxPoints.data[j]
-            indices, distances = calculateDistancesByAmount(kdTree, point, 1 + neighbourAmount)
 
             if radius == 0: continue
-            for i in range(1, indices.length):
+            for i in range(offsets.data[j] + 1, offsets.data[j + 1]):
                 index = indices.data[i]
                 distance = distances.data[i]
 
@@ -316,18 +321,21 @@ cdef float mapping(float x, float xMin, float xMax, float yMin, float yMax):
     if mapValue < yMin: return yMin
     return mapValue
 
-cdef float calulateMaxRadius(Py_ssize_t iterations, float margin, float radiusStep, DoubleList radii, LongList indices, DoubleList distances):
+cdef float calulateMaxRadius(Py_ssize_t iterations, float margin, float radiusStep, DoubleList radii, LongList indices, DoubleList distances,
+                             Py_ssize_t start, Py_ssize_t end):
     cdef float newRadius = 0
     cdef Py_ssize_t i
     for i in range(iterations):
-        if not comapareRadiusDistanceOfKDTree(newRadius + margin, radii, indices, distances): break
+        if not comapareRadiusDistanceOfKDTree(newRadius + margin, radii, indices, distances, start, end): break
         newRadius += radiusStep
     return newRadius
 
-cdef bint comapareRadiusDistanceOfKDTree(float newRadius, DoubleList radii, LongList indices, DoubleList distances):
+cdef bint comapareRadiusDistanceOfKDTree(float newRadius, DoubleList radii, LongList indices, DoubleList distances,
+                                         Py_ssize_t start, Py_ssize_t end):
+    '''The first neighbour in the range is the point itself.'''
     cdef bint newRadiusCheck = True
     cdef Py_ssize_t i
-    for i in range(1, distances.length):
+    for i in range(start + 1, end):
         if newRadius + radii.data[indices.data[i]] > distances.data[i]:
             newRadiusCheck = False
             break
@@ -352,40 +360,20 @@ cdef bint comapareRadiusDistanceIndexOfPoints(Py_ssize_t index, float newRadius,
         if newRadius + radii.data[i] > distanceVec3(&point, &points.data[i]): return False
     return True
 
-cdef calculateDistancesByRange(kdTree, Vector3 searchVector, float searchRadius):
-    cdef list results = kdTree.find_range(Vector((searchVector.x, searchVector.y, searchVector.z)), searchRadius)
-    cdef Py_ssize_t lenResult = len(results)
-    cdef DoubleList distances = DoubleList(length = lenResult)
-    cdef LongList indices = LongList(length = lenResult)
-    cdef Py_ssize_t i
-    for i in range(lenResult):
-        result = results[i]
-        indices.data[i] = result[1]
-        distances.data[i] = result[2]
-    return indices, distances
+cdef calculateDistancesByRange(KDTree kdTree, Vector3 searchVector, float searchRadius):
+    cdef Py_ssize_t amount = kdTree.countInRadius_LowLevel(&searchVector, searchRadius)
+    cdef KDTreeNeighbour *neighbours = <KDTreeNeighbour*>malloc(max(amount, 1) * sizeof(KDTreeNeighbour))
+    amount = kdTree.findInRadius_LowLevel(&searchVector, searchRadius, neighbours)
 
-cdef calculateDistancesByAmount(kdTree, Vector3 searchVector, long amount):
-    cdef list results = kdTree.find_n(Vector((searchVector.x, searchVector.y, searchVector.z)), amount)
-    cdef Py_ssize_t lenResult = len(results)
-    cdef DoubleList distances = DoubleList(length = lenResult)
-    cdef LongList indices = LongList(length = lenResult)
+    cdef DoubleList distances = DoubleList(length = amount)
+    cdef LongList indices = LongList(length = amount)
     cdef Py_ssize_t i
-    for i in range(lenResult):
-        result = results[i]
-        indices.data[i] = result[1]
-        distances.data[i] = result[2]
+    for i in range(amount):
+        indices.data[i] = neighbours[i].index
+        distances.data[i] = sqrt(neighbours[i].distanceSquared)
+    free(neighbours)
     return indices, distances
 
-cdef buildKDTree(Py_ssize_t numberOfPoints, Vector3DList points):
-    kdTree = KDTree(numberOfPoints)
-    cdef Vector3 vector
-    cdef Py_ssize_t i
-    for i in range(numberOfPoints):
-        vector = points.data[i]
-        kdTree.insert(Vector((vector.x, vector.y, vector.z)), i)
-    kdTree.balance()
-    return kdTree
-
 cdef buildBVHTree(Vector3DList vertices, PolygonIndicesList polygons, epsilon):
     return BVHTree.FromPolygons(vertices, polygons, epsilon = max(epsilon, 0))
 
@@ -0,0 +1,28 @@
+import time
+from . grid import getGridMesh_Size
+from ... data_structures import LongList
+from . find_shortest_path import getShortestPath, getShortestTree
+
+# Not part of the test suite, run it from the Python console with:
+#   from animation_nodes.algorithms.mesh_generation import benchmark_find_shortest_path
+#   benchmark_find_shortest_path.run()
+
+def run(divisions = (50, 100, 200, 450)):
+    print("{:>10} {:>12} {:>12} {:>12}".format("Vertices", "Tree", "Path", "Near Path"))
+    for division in divisions:
+        mesh = getGridMesh_Size(10, 10, division, division)
+        vertexAmount = len(mesh.vertices)
+        sources = LongList.fromValues([0])
+
+        treeTime = measure(lambda: getShortestTree(mesh, sources, "SPLINE"))
+        # the far corner has to visit all vertices, a neighbour stops early
+        pathTime = measure(lambda: getShortestPath(mesh, sources, vertexAmount - 1))
+        nearPathTime = measure(lambda: getShortestPath(mesh, sources, division + 1))
+
+        print("{:>10} {:>10.4f} s {:>10.4f} s {:>10.4f} s".format(
+            vertexAmount, treeTime, pathTime, nearPathTime))
+
+def measure(function):
+    start = time.perf_counter()
+    function()
+    return time.perf_counter() - start
@@ -6,16 +6,19 @@ from ... data_structures cimport (
     FloatList,
     PolySpline,
     DoubleList,
-    BooleanList,
     Vector3DList,
 )
 
 from libc.math cimport INFINITY
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
 from . line import getLinesMesh
 from ... math cimport distanceVec3
 
 def getShortestPath(Mesh mesh, LongList sources, Py_ssize_t target):
-    cdef LongList previousVertices = computeShortestPathTree(mesh, sources, target)
+    cdef LongList previousVertices = LongList(length = mesh.vertices.length)
+    cdef DoubleList distances = DoubleList(length = mesh.vertices.length)
+    computeShortestPathTree(mesh, sources, previousVertices, distances, target)
+
     cdef LongList indices = LongList()
     cdef Py_ssize_t index
 
@@ -27,8 +30,11 @@ def getShortestPath(Mesh mesh, LongList sources, Py_ssize_t target):
 
     return indices.reversed()
 
-def getShortestTree(Mesh mesh, LongList sources, str pathType):
-    cdef LongList previousVertices = computeShortestPathTree(mesh, sources)
+def getShortestTree(Mesh mesh, LongList sources, str pathType, double maxDistance = INFINITY):
+    cdef LongList previousVertices = LongList(length = mesh.vertices.length)
+    cdef DoubleList distances = DoubleList(length = mesh.vertices.length)
+    computeShortestPathTree(mesh, sources, previousVertices, distances, -1, maxDistance)
+
     cdef Vector3DList vertices = mesh.vertices
     cdef Vector3DList sortLocations
     cdef Py_ssize_t i, index
@@ -44,7 +50,7 @@ def getShortestTree(Mesh mesh, LongList sources, str pathType):
 
         tree.append(constructPath(pathType, sortLocations))
 
-    return tree
+    return tree, distances
 
 def constructPath(str pathType, Vector3DList sortLocations):
     cdef long amount
@@ -64,48 +70,94 @@ def constructPath(str pathType, Vector3DList sortLocations):
         vertexColors.fill(0)
         return GPStroke(sortLocations.reversed(), strengths, pressures, uvRotations, vertexColors, 10)
 
-# Dijkstra's algorithm (https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm) but it is implemented
-# to handle multi-sources and mesh with multiple islands. For "target = -1", it calculates shortest
-# paths from all sources to all vertices or shortest path tree. When "target" is specified then it
-# calculates the shortest path from source to target or shortest path.
-cdef LongList computeShortestPathTree(Mesh mesh, LongList sources, Py_ssize_t target = -1):
+
+# Binary Min Heap
+##########################################
+
+cdef struct HeapItem:
+    double distance
+    Py_ssize_t index
+
+cdef void heapPush(HeapItem *heap, Py_ssize_t *size, double distance, Py_ssize_t index):
+    cdef Py_ssize_t current = size[0]
+    cdef Py_ssize_t parent
+    size[0] += 1
+
+    while current > 0:
+        parent = (current - 1) // 2
+        if heap[parent].distance <= distance: break
+        heap[current] = heap[parent]
+        current = parent
+
+    heap[current].distance = distance
+    heap[current].index = index
+
+cdef HeapItem heapPop(HeapItem *heap, Py_ssize_t *size):
+    cdef HeapItem first = heap[0]
+    size[0] -= 1
+    cdef HeapItem last = heap[size[0]]
+    cdef Py_ssize_t current = 0
+    cdef Py_ssize_t child
+
+    while True:
+        child = current * 2 + 1
+        if child >= size[0]: break
+        if child + 1 < size[0] and heap[child + 1].distance < heap[child].distance:
+            child += 1
+        if last.distance <= heap[child].distance: break
+        heap[current] = heap[child]
+        current = child
+
+    heap[current] = last
+    return first
+
+
+# Dijkstra's algorithm (https://en.wikipedia.org/wiki/Dijkstra%27s_algorithm) using a binary heap,
+# so that it runs in O((V + E) log V). It handles multiple sources and meshes with multiple islands.
+# For "target = -1", it calculates shortest paths from the sources to all vertices or shortest path
+# tree. When "target" is specified, the search stops as soon as the shortest path to it is known.
+# Vertices that are farther away than "maxDistance" from all sources are not visited.
+cdef computeShortestPathTree(Mesh mesh, LongList sources, LongList previousVertices, DoubleList distances,
+                             Py_ssize_t target = -1, double maxDistance = INFINITY):
     cdef Vector3DList vertices = mesh.vertices
-    cdef long vertexCount = vertices.length
-    cdef float maxDistance = INFINITY
-    cdef DoubleList distances = DoubleList.fromValue(maxDistance, length = vertexCount)
-    cdef LongList previousVertices = LongList.fromValue(-1, length = vertexCount)
-    cdef BooleanList visitedVertices = BooleanList.fromValue(False, length = vertexCount)
-    cdef Py_ssize_t i
-
-    for i in range (sources.length):
-        distances.data[sources.data[i]] = 0.0
-
-    cdef float distance, minDistance
-    cdef Py_ssize_t numberOfVisitedVertices = 0
-    cdef Py_ssize_t j, minDistanceIndex, neighboursStart, neighbourIndex
     cdef LongList neighboursAmounts, neighboursStarts, neighbours
     neighboursAmounts, neighboursStarts, neighbours = mesh.getLinkedVertices()[:3]
 
-    while numberOfVisitedVertices != vertexCount:
-        minDistance = maxDistance
-
-        for j in range(vertexCount):
-            distance = distances.data[j]
-            if distance < minDistance and not visitedVertices.data[j]:
-                minDistance = distance
-                minDistanceIndex = j
-
-        numberOfVisitedVertices += 1
-        visitedVertices.data[minDistanceIndex] = True
-
-        neighboursStart = neighboursStarts.data[minDistanceIndex]
-        for j in range(neighboursAmounts.data[minDistanceIndex]):
-            neighbourIndex = neighbours.data[neighboursStart + j]
-            distance = (distanceVec3(vertices.data + minDistanceIndex, vertices.data + neighbourIndex)
-                        + distances.data[minDistanceIndex])
-            if distance < distances.data[neighbourIndex]:
-                distances.data[neighbourIndex] = distance
-                previousVertices.data[neighbourIndex] = minDistanceIndex
-                if minDistanceIndex == target: break
-
-    return previousVertices
+    previousVertices.fill(-1)
+    distances.fill(INFINITY)
+
+    # Every vertex is pushed at most once per incoming edge and once as source.
+    cdef Py_ssize_t heapSize = 0
+    cdef HeapItem *heap = <HeapItem*>PyMem_Malloc((neighbours.length + sources.length + 1) * sizeof(HeapItem))
+    if heap == NULL: raise MemoryError()
+
+    cdef Py_ssize_t i, index, neighboursStart, neighbourIndex
+    cdef double distance
+    cdef HeapItem item
+
+    try:
+        for i in range(sources.length):
+            index = sources.data[i]
+            if distances.data[index] != 0:
+                distances.data[index] = 0
+                heapPush(heap, &heapSize, 0, index)
+
+        while heapSize > 0:
+            item = heapPop(heap, &heapSize)
+            index = item.index
+
+            # outdated entry, the vertex has been reached on a shorter path before
+            if item.distance > distances.data[index]: continue
+            if index == target: break
+
+            neighboursStart = neighboursStarts.data[index]
+            for i in range(neighboursAmounts.data[index]):
+                neighbourIndex = neighbours.data[neighboursStart + i]
+                distance = item.distance + distanceVec3(vertices.data + index, vertices.data + neighbourIndex)
+                if distance < distances.data[neighbourIndex] and distance <= maxDistance:
+                    distances.data[neighbourIndex] = distance
+                    previousVertices.data[neighbourIndex] = index
+                    heapPush(heap, &heapSize, distance, neighbourIndex)
+    finally:
+        PyMem_Free(heap)
+
@@ -0,0 +1,97 @@
+import heapq
+import random
+from math import inf, dist
+from unittest import TestCase
+from . find_shortest_path import getShortestPath, getShortestTree
+from ... data_structures import Mesh, LongList, Vector3DList, EdgeIndicesList
+
+# The heap based search is compared with a simple reference implementation
+# of Dijkstra's algorithm on random meshes with multiple islands.
+
+def referenceDistances(vertices, edges, sources, maxDistance = inf):
+    neighbours = [[] for _ in vertices]
+    for a, b in edges:
+        neighbours[a].append(b)
+        neighbours[b].append(a)
+
+    distances = [inf] * len(vertices)
+    queue = []
+    for source in sources:
+        distances[source] = 0
+        heapq.heappush(queue, (0, source))
+
+    while queue:
+        distance, index = heapq.heappop(queue)
+        if distance > distances[index]: continue
+        for neighbour in neighbours[index]:
+            newDistance = distance + dist(vertices[index], vertices[neighbour])
+            if newDistance < distances[neighbour] and newDistance <= maxDistance:
+                distances[neighbour] = newDistance
+                heapq.heappush(queue, (newDistance, neighbour))
+    return distances
+
+def randomMesh(seed, vertexAmount, edgeAmount):
+    rng = random.Random(seed)
+    vertices = [(rng.random(), rng.random(), rng.random()) for _ in range(vertexAmount)]
+    edges = set()
+    while len(edges) < edgeAmount:
+        a, b = rng.randrange(vertexAmount), rng.randrange(vertexAmount)
+        if a != b: edges.add((min(a, b), max(a, b)))
+    edges = sorted(edges)
+    mesh = Mesh(Vector3DList.fromValues(vertices), EdgeIndicesList.fromValues(edges))
+    # use the single precision locations that are stored in the mesh
+    vertices = mesh.vertices.asNumpyArray().reshape(-1, 3).tolist()
+    return mesh, vertices, edges, rng
+
+class TestShortestTree(TestCase):
+    def testRandomMeshes(self):
+        for seed in range(20):
+            mesh, vertices, edges, rng = randomMesh(seed, 60, 80)
+            sources = rng.sample(range(60), rng.randint(1, 3))
+            tree, distances = getShortestTree(mesh, LongList.fromValues(sources), "SPLINE")
+            self.assertDistancesEqual(distances, referenceDistances(vertices, edges, sources))
+
+    def testMaxDistance(self):
+        for seed in range(10):
+            mesh, vertices, edges, rng = randomMesh(seed, 60, 120)
+            sources = [rng.randrange(60)]
+            tree, distances = getShortestTree(mesh, LongList.fromValues(sources), "SPLINE", 0.8)
+            self.assertDistancesEqual(distances, referenceDistances(vertices, edges, sources, 0.8))
+
+    def testTreeContainsReachedVertices(self):
+        mesh, vertices, edges, rng = randomMesh(3, 60, 60)
+        tree, distances = getShortestTree(mesh, LongList.fromValues([0]), "SPLINE")
+        reached = [d for d in referenceDistances(vertices, edges, [0]) if d != inf]
+        # there is no path for the source itself
+        self.assertEqual(len(tree), len(reached) - 1)
+
+    def assertDistancesEqual(self, distances, expected):
+        self.assertEqual(len(distances), len(expected))
+        for distance, expectedDistance in zip(distances, expected):
+            if expectedDistance == inf:
+                self.assertEqual(distance, inf)
+            else:
+                self.assertAlmostEqual(distance, expectedDistance, places = 5)
+
+class TestShortestPath(TestCase):
+    def testRandomMeshes(self):
+        for seed in range(20):
+            mesh, vertices, edges, rng = randomMesh(seed, 60, 90)
+            sources = rng.sample(range(60), rng.randint(1, 3))
+            target = rng.randrange(60)
+            expected = referenceDistances(vertices, edges, sources)[target]
+            path = list(getShortestPath(mesh, LongList.fromValues(sources), target))
+
+            # like before, there is no path when the target is unreachable or a source
+            if expected == inf or target in sources:
+                self.assertEqual(path, [])
+                continue
+
+            self.assertIn(path[0], sources)
+            self.assertEqual(path[-1], target)
+            edgeSet = set(edges)
+            length = 0
+            for a, b in zip(path, path[1:]):
+                self.assertIn((min(a, b), max(a, b)), edgeSet)
+                length += dist(vertices[a], vertices[b])
+            self.assertAlmostEqual(length, expected, places = 5)
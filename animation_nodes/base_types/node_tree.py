@@ -11,6 +11,7 @@ from .. preferences import getBlenderVersion, getAnimationNodesVersion
 from .. utils.blender_ui import isViewportRendering, isInterfaceLocked
 from .. tree_info import getNetworksByNodeTree, getSubprogramNetworksByNodeTree
 from .. execution.units import getMainUnitsByNodeTree, setupExecutionUnits, finishExecutionUnits
+from .. execution.profiler import isProfiling, beginSpan, endSpan, beginExecution
 
 
 class LastTreeExecutionInfo(bpy.types.PropertyGroup):
@@ -18,6 +19,7 @@ class LastTreeExecutionInfo(bpy.types.PropertyGroup):
 
     isDefault: BoolProperty(default = True)
     executionTime: FloatProperty(name = "Execution Time")
+    setupTime: FloatProperty(name = "Setup Time")
     blenderVersion: IntVectorProperty(name = "Blender Version", default = bl_info["blender"])
     animationNodesVersion: IntVectorProperty(name = "Animation Nodes Version", default = bl_info["version"])
 
@@ -52,7 +54,7 @@ class AnimationNodeTree(bpy.types.NodeTree):
     editNodeLabels: BoolProperty(name = "Edit Node Labels", default = False)
 
     def update(self):
-        treeChanged()
+        treeChanged(self)
 
     def canAutoExecute(self, events):
         a = self.autoExecution
@@ -85,6 +87,7 @@ class AnimationNodeTree(bpy.types.NodeTree):
         self.autoExecution.lastExecutionTimestamp = time.process_time()
 
     def execute(self):
+        beginExecution()
         setupExecutionUnits([self])
         self._execute()
         finishExecutionUnits([self])
@@ -96,12 +99,17 @@ class AnimationNodeTree(bpy.types.NodeTree):
             return
 
         allExecutionsSuccessfull = True
+        profiling = isProfiling()
 
         start = time.perf_counter()
+        if profiling: beginSpan("Tree: " + self.name, "tree")
         for unit in units:
+            if profiling: beginSpan("Network: " + unit.network.name, "network")
             success = unit.execute()
+            if profiling: endSpan("Network: " + unit.network.name)
             if not success:
                 allExecutionsSuccessfull = False
+        if profiling: endSpan("Tree: " + self.name)
         end = time.perf_counter()
 
         if allExecutionsSuccessfull:
@@ -23,6 +23,7 @@ from ... utils.blender_ui import (
     getNodeCornerLocation_BottomRight
 )
 
+from ... execution.keyframe_recorder import redirectKeyframeInsertion
 from ... execution.measurements import (
     getMinExecutionTimeString,
     getMeasurementResultString
@@ -61,6 +62,14 @@ class AnimationNode:
     # can be "NONE", "ALWAYS" or "HIDDEN_ONLY"
     dynamicLabelType = "NONE"
 
+    # nodes that change something outside of the node tree (e.g. output nodes)
+    # are always executed; other nodes only when their results are used
+    hasSideEffects = False
+
+    # nodes that read state that can change without a property update
+    # (e.g. the current frame or files) must not be computed only once
+    allowConstantFolding = True
+
     # can be "CUSTOM", "MESSAGE" or "EXCEPTION"
     errorHandlingType = "CUSTOM"
     class ControlledExecutionException(Exception):
@@ -563,7 +572,7 @@ class AnimationNode:
             code = self.getLocalExecutionCode_GetExecutionCode(inputVariables, outputVariables, required)
 
         if bake:
-            code = "\n".join((code, toString(self.getBakeCode())))
+            code = "\n".join((code, redirectKeyframeInsertion(toString(self.getBakeCode()))))
 
         return self.applyCodeEffects(code, required)
 
@@ -15,7 +15,11 @@ from . splines.bezier_spline cimport BezierSpline
 from . attributes.attribute cimport Attribute
 
 from . falloffs.evaluation cimport FalloffEvaluator
-from . falloffs.falloff_base cimport Falloff, BaseFalloff, CompoundFalloff
+from . falloffs.falloff_base cimport (Falloff, BaseFalloff, CompoundFalloff,
+    BaseFalloffListFunction, CompoundFalloffListFunction)
 from . interpolation cimport InterpolationFunction, Interpolation
+from . fcurve_snapshot cimport FCurveSnapshot
+from . kd_tree cimport KDTree, KDTreeNeighbour
+from . bvh_tree cimport BVHTree, BVHHit
 
 from . action cimport *
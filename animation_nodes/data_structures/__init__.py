@@ -7,6 +7,7 @@ def importDataStructures():
     from . gpencils.gp_layer_data import GPLayer
     from . gpencils.gp_frame_data import GPFrame
     from . gpencils.gp_stroke_data import GPStroke
+    from . gpencils.gp_packed_strokes import PackedGPStrokes
     from . lists.polygon_indices_list import PolygonIndicesList
     from . lists.base_lists import (
         Vector3DList, Vector2DList, Matrix4x4List, EdgeIndicesList, EulerList, ColorList,
@@ -30,6 +31,9 @@ def importDataStructures():
     from . attributes.attribute import AttributeDomain
     from . attributes.attribute import AttributeDataType
     from . interpolation import Interpolation
+    from . fcurve_snapshot import FCurveSnapshot
+    from . kd_tree import KDTree
+    from . bvh_tree import BVHTree
     from . falloffs.falloff_base import Falloff, BaseFalloff, CompoundFalloff
 
     from . sounds.sound import Sound
@@ -0,0 +1,37 @@
+from .. math cimport Vector3
+from . lists.base_lists cimport Vector3DList, LongList
+from . lists.polygon_indices_list cimport PolygonIndicesList
+
+cdef struct BVHNode:
+    Vector3 low, high
+    Py_ssize_t start, end
+    Py_ssize_t secondChild
+
+cdef struct BVHHit:
+    Vector3 location
+    Vector3 normal
+    float distance
+    Py_ssize_t polygonIndex
+
+cdef class BVHTree:
+    cdef readonly Vector3DList vertices
+    cdef readonly PolygonIndicesList polygons
+    cdef readonly Vector3DList polygonNormals
+    cdef Vector3DList corners
+    cdef LongList trianglePolygons
+    cdef float epsilon
+
+    cdef Vector3 *_corners
+    cdef long *_trianglePolygons
+    cdef Vector3 *_polygonNormals
+    cdef BVHNode *nodes
+    cdef Py_ssize_t nodeAmount
+    cdef Py_ssize_t triangleAmount
+
+    cdef Py_ssize_t build(self, Vector3 *corners, Vector3 *centers, long *order,
+                          Py_ssize_t start, Py_ssize_t end) nogil
+
+    cdef bint rayCast_LowLevel(self, Vector3 *start, Vector3 *direction,
+                               float maxDistance, BVHHit *hit) nogil
+    cdef bint findNearest_LowLevel(self, Vector3 *point, float maxDistance, BVHHit *hit) nogil
+    cdef bint isInsideVolume_LowLevel(self, Vector3 *point) nogil
@@ -0,0 +1,641 @@
+# setup: options = openmp
+
+import cython
+from random import random
+from cython.parallel cimport prange
+from libc.stdlib cimport malloc, free
+from libc.math cimport sqrt, fmin, fmax, INFINITY
+from .. utils.parallel cimport getThreadAmount
+from .. math cimport (
+    Vector3, toVector3, toPyVector3,
+    subVec3, crossVec3, dotVec3,
+    normalizeVec3, normalizeVec3_InPlace,
+    distanceSquaredVec3,
+)
+from . lists.base_lists cimport Vector3DList, LongList, DoubleList, BooleanList
+from . lists.polygon_indices_list cimport PolygonIndicesList
+
+# Polygons are split into triangles. The triangles are sorted so that every
+# node of the tree references a continuous range of them. Nodes are stored in
+# depth first order, so the first child of a node is always the next node.
+# Besides the methods of mathutils.bvhtree.BVHTree (except overlap), it has
+# methods that query many rays or points at once and return lists.
+
+cdef Py_ssize_t maxLeafSize = 4
+
+cdef class BVHTree:
+    def __cinit__(self, Vector3DList vertices not None, PolygonIndicesList polygons not None,
+                  float epsilon = 0):
+        if polygons.getLength() > 0 and polygons.getMaxIndex() >= vertices.length:
+            raise IndexError("polygons use vertices that do not exist")
+
+        self.vertices = vertices.copy()
+        self.polygons = polygons.copy()
+        self.epsilon = max(epsilon, 0)
+        self.polygonNormals = calculatePolygonNormals(self.vertices, self.polygons)
+        self.nodes = NULL
+        self.nodeAmount = 0
+
+        cdef Vector3DList corners, centers
+        cdef LongList trianglePolygons
+        corners, centers, trianglePolygons = triangulatePolygons(self.vertices, self.polygons)
+        self.triangleAmount = centers.length
+
+        cdef LongList order = LongList(length = self.triangleAmount)
+        cdef Py_ssize_t i
+        for i in range(self.triangleAmount):
+            order.data[i] = i
+
+        self.nodes = <BVHNode*>malloc(max(2 * self.triangleAmount, 1) * sizeof(BVHNode))
+        if self.nodes == NULL:
+            raise MemoryError()
+        if self.triangleAmount > 0:
+            with nogil:
+                self.build(corners.data, centers.data, order.data, 0, self.triangleAmount)
+
+        self.corners = Vector3DList(length = 3 * self.triangleAmount)
+        self.trianglePolygons = trianglePolygons[order]
+        for i in range(self.triangleAmount):
+            self.corners.data[3 * i + 0] = corners.data[3 * order.data[i] + 0]
+            self.corners.data[3 * i + 1] = corners.data[3 * order.data[i] + 1]
+            self.corners.data[3 * i + 2] = corners.data[3 * order.data[i] + 2]
+
+        self._corners = self.corners.data
+        self._trianglePolygons = self.trianglePolygons.data
+        self._polygonNormals = self.polygonNormals.data
+
+    def __dealloc__(self):
+        if self.nodes != NULL:
+            free(self.nodes)
+
+    def __repr__(self):
+        return "<BVHTree with {} polygons>".format(self.polygons.getLength())
+
+    cdef Py_ssize_t build(self, Vector3 *corners, Vector3 *centers, long *order,
+                          Py_ssize_t start, Py_ssize_t end) nogil:
+        cdef Py_ssize_t index = self.nodeAmount
+        cdef BVHNode *node = self.nodes + index
+        self.nodeAmount += 1
+
+        node.start = start
+        node.end = end
+        node.secondChild = -1
+        calculateBounds(node, corners, order, self.epsilon)
+        if end - start <= maxLeafSize: return index
+
+        cdef int axis = findSplitAxis(centers, order, start, end)
+        if axis == -1: return index
+
+        cdef Py_ssize_t center = (start + end) // 2
+        selectNth(centers, order, start, end, center, axis)
+        self.build(corners, centers, order, start, center)
+        node.secondChild = self.build(corners, centers, order, center, end)
+        return index
+
+
+    # Low Level Queries
+    ###############################################
+
+    cdef bint rayCast_LowLevel(self, Vector3 *start, Vector3 *direction,
+                               float maxDistance, BVHHit *hit) nogil:
+        '''direction has to be normalized'''
+        if self.triangleAmount == 0: return False
+
+        cdef Vector3 inverse = inverseDirection(direction)
+        cdef Py_ssize_t stack[128]
+        cdef Py_ssize_t stackSize = 1
+        cdef Py_ssize_t i, index, found = -1
+        cdef float distance, closest = maxDistance
+        cdef BVHNode *node
+
+        stack[0] = 0
+        while stackSize > 0:
+            stackSize -= 1
+            index = stack[stackSize]
+            node = self.nodes + index
+            if not rayIntersectsBox(node, start, &inverse, closest): continue
+
+            if node.secondChild == -1:
+                for i in range(node.start, node.end):
+                    if rayIntersectsTriangle(start, direction, self._corners + 3 * i, &distance):
+                        if distance <= closest:
+                            closest = distance
+                            found = i
+            else:
+                stack[stackSize] = node.secondChild
+                stack[stackSize + 1] = index + 1
+                stackSize += 2
+
+        if found == -1: return False
+        hit.location.x = start.x + direction.x * closest
+        hit.location.y = start.y + direction.y * closest
+        hit.location.z = start.z + direction.z * closest
+        hit.distance = closest
+        setHitPolygon(self, hit, found)
+        return True
+
+    cdef bint findNearest_LowLevel(self, Vector3 *point, float maxDistance, BVHHit *hit) nogil:
+        if self.triangleAmount == 0: return False
+
+        cdef Py_ssize_t stack[128]
+        cdef Py_ssize_t stackSize = 1
+        cdef Py_ssize_t i, index, found = -1
+        cdef float distanceSquared, closestSquared = maxDistance * maxDistance
+        cdef Vector3 candidate, closest
+        cdef BVHNode *node
+
+        stack[0] = 0
+        while stackSize > 0:
+            stackSize -= 1
+            index = stack[stackSize]
+            node = self.nodes + index
+            if distanceSquaredToBox(node, point) >= closestSquared: continue
+
+            if node.secondChild == -1:
+                for i in range(node.start, node.end):
+                    closestPointOnTriangle(&candidate, point, self._corners + 3 * i)
+                    distanceSquared = distanceSquaredVec3(point, &candidate)
+                    if distanceSquared < closestSquared:
+                        closestSquared = distanceSquared
+                        closest = candidate
+                        found = i
+            else:
+                # the closer child is searched first
+                if (distanceSquaredToBox(self.nodes + index + 1, point) <=
+                    distanceSquaredToBox(self.nodes + node.secondChild, point)):
+                    stack[stackSize] = node.secondChild
+                    stack[stackSize + 1] = index + 1
+                else:
+                    stack[stackSize] = index + 1
+                    stack[stackSize + 1] = node.secondChild
+                stackSize += 2
+
+        if found == -1: return False
+        hit.location = closest
+        hit.distance = sqrt(closestSquared)
+        setHitPolygon(self, hit, found)
+        return True
+
+    cdef bint isInsideVolume_LowLevel(self, Vector3 *point) nogil:
+        '''Same tests as utils.bvh.isInsideVolume.'''
+        cdef Py_ssize_t hits1 = countRayHits(self, point, testDirections + 0)
+        if hits1 == 0: return False
+        if hits1 == 1: return True
+
+        cdef Py_ssize_t hits2 = countRayHits(self, point, testDirections + 1)
+        if hits1 % 2 == hits2 % 2:
+            return hits1 % 2 == 1
+
+        cdef Py_ssize_t hits3 = countRayHits(self, point, testDirections + 2)
+        return hits3 % 2 == 1
+
+
+    # Compatible with mathutils.bvhtree.BVHTree
+    ###############################################
+
+    def ray_cast(self, origin, direction, float distance = INFINITY):
+        cdef Vector3 _origin = toVector3(origin)
+        cdef Vector3 _direction = toVector3(direction)
+        cdef BVHHit hit
+        normalizeVec3_InPlace(&_direction)
+        if not self.rayCast_LowLevel(&_origin, &_direction, distance, &hit):
+            return None, None, None, None
+        return toResultTuple(&hit)
+
+    def find_nearest(self, origin, float distance = INFINITY):
+        cdef Vector3 _origin = toVector3(origin)
+        cdef BVHHit hit
+        if not self.findNearest_LowLevel(&_origin, distance, &hit):
+            return None, None, None, None
+        return toResultTuple(&hit)
+
+    def find_nearest_range(self, origin, float distance = INFINITY):
+        cdef Vector3 _origin = toVector3(origin)
+        cdef float maxDistanceSquared = distance * distance
+        cdef float distanceSquared
+        cdef Py_ssize_t i, index
+        cdef BVHNode *node
+        cdef BVHHit hit
+
+        result = []
+        stack = [0] if self.triangleAmount > 0 else []
+        while len(stack) > 0:
+            index = stack.pop()
+            node = self.nodes + index
+            if distanceSquaredToBox(node, &_origin) > maxDistanceSquared: continue
+
+            if node.secondChild == -1:
+                for i in range(node.start, node.end):
+                    closestPointOnTriangle(&hit.location, &_origin, self._corners + 3 * i)
+                    distanceSquared = distanceSquaredVec3(&_origin, &hit.location)
+                    if distanceSquared <= maxDistanceSquared:
+                        hit.distance = sqrt(distanceSquared)
+                        setHitPolygon(self, &hit, i)
+                        result.append(toResultTuple(&hit))
+            else:
+                stack.append(node.secondChild)
+                stack.append(index + 1)
+        return result
+
+    def isInsideVolume(self, vector):
+        cdef Vector3 _vector = toVector3(vector)
+        return self.isInsideVolume_LowLevel(&_vector)
+
+
+    # Query many Rays or Points
+    ###############################################
+
+    def rayCastList(self, Vector3DList starts not None, Vector3DList directions not None,
+                    float minDistance = 0, float maxDistance = INFINITY):
+        '''
+        Returns the locations, normals, distances, polygon indices and hit states
+        of all rays. Rays start at minDistance along the direction but distances
+        are measured from the start. Missed rays have the polygon index -1.
+        '''
+        if starts.length != directions.length:
+            raise ValueError("starts and directions have different lengths")
+
+        cdef Py_ssize_t i, length = starts.length
+        cdef Vector3 *_starts = starts.data
+        cdef Vector3 *_directions = directions.data
+        cdef int threads = getThreadAmount(length)
+        cdef BVHHit *hits = <BVHHit*>malloc(max(length, 1) * sizeof(BVHHit))
+        try:
+            if threads > 1:
+                for i in prange(length, nogil = True, num_threads = threads):
+                    rayCastFromDistance(self, _starts + i, _directions + i, minDistance, maxDistance, hits + i)
+            else:
+                with nogil:
+                    for i in range(length):
+                        rayCastFromDistance(self, _starts + i, _directions + i, minDistance, maxDistance, hits + i)
+            return splitHits(hits, length)
+        finally:
+            free(hits)
+
+    def findNearestList(self, Vector3DList points not None, float maxDistance = INFINITY):
+        '''
+        Returns the locations, normals, distances, polygon indices and hit states
+        of the nearest surface points. Points without result have the polygon index -1.
+        '''
+        cdef Py_ssize_t i, length = points.length
+        cdef Vector3 *_points = points.data
+        cdef int threads = getThreadAmount(length)
+        cdef BVHHit *hits = <BVHHit*>malloc(max(length, 1) * sizeof(BVHHit))
+        try:
+            if threads > 1:
+                for i in prange(length, nogil = True, num_threads = threads):
+                    if not self.findNearest_LowLevel(_points + i, maxDistance, hits + i):
+                        setMiss(hits + i)
+            else:
+                with nogil:
+                    for i in range(length):
+                        if not self.findNearest_LowLevel(_points + i, maxDistance, hits + i):
+                            setMiss(hits + i)
+            return splitHits(hits, length)
+        finally:
+            free(hits)
+
+    def isInsideVolumeList(self, Vector3DList points not None):
+        cdef Py_ssize_t i, length = points.length
+        cdef Vector3 *_points = points.data
+        cdef BooleanList result = BooleanList(length = length)
+        cdef char *_result = result.data
+        cdef int threads = getThreadAmount(length)
+        if threads > 1:
+            for i in prange(length, nogil = True, num_threads = threads):
+                _result[i] = self.isInsideVolume_LowLevel(_points + i)
+        else:
+            with nogil:
+                for i in range(length):
+                    _result[i] = self.isInsideVolume_LowLevel(_points + i)
+        return result
+
+cdef inline void setHitPolygon(BVHTree tree, BVHHit *hit, Py_ssize_t triangle) nogil:
+    hit.polygonIndex = tree._trianglePolygons[triangle]
+    hit.normal = tree._polygonNormals[hit.polygonIndex]
+
+cdef void rayCastFromDistance(BVHTree tree, Vector3 *start, Vector3 *direction,
+                              float minDistance, float maxDistance, BVHHit *hit) nogil:
+    cdef Vector3 _start, _direction
+    normalizeVec3(&_direction, direction)
+    _start.x = start.x + _direction.x * minDistance
+    _start.y = start.y + _direction.y * minDistance
+    _start.z = start.z + _direction.z * minDistance
+    if tree.rayCast_LowLevel(&_start, &_direction, maxDistance - minDistance, hit):
+        hit.distance += minDistance
+    else:
+        setMiss(hit)
+
+cdef inline void setMiss(BVHHit *hit) nogil:
+    hit.location.x = hit.location.y = hit.location.z = 0
+    hit.normal.x = hit.normal.y = hit.normal.z = 0
+    hit.distance = 0
+    hit.polygonIndex = -1
+
+cdef tuple splitHits(BVHHit *hits, Py_ssize_t amount):
+    cdef Vector3DList locations = Vector3DList(length = amount)
+    cdef Vector3DList normals = Vector3DList(length = amount)
+    cdef DoubleList distances = DoubleList(length = amount)
+    cdef LongList polygonIndices = LongList(length = amount)
+    cdef BooleanList hitStates = BooleanList(length = amount)
+    cdef Py_ssize_t i
+    for i in range(amount):
+        locations.data[i] = hits[i].location
+        normals.data[i] = hits[i].normal
+        distances.data[i] = hits[i].distance
+        polygonIndices.data[i] = hits[i].polygonIndex
+        hitStates.data[i] = hits[i].polygonIndex != -1
+    return locations, normals, distances, polygonIndices, hitStates
+
+cdef tuple toResultTuple(BVHHit *hit):
+    return (toPyVector3(&hit.location), toPyVector3(&hit.normal),
+            hit.polygonIndex, hit.distance)
+
+
+# Construction
+###############################################
+
+cdef Vector3DList calculatePolygonNormals(Vector3DList vertices, PolygonIndicesList polygons):
+    '''Newell's method, works for concave polygons as well.'''
+    cdef Py_ssize_t amount = polygons.getLength()
+    cdef Vector3DList normals = Vector3DList(length = amount)
+    cdef unsigned int *indices = polygons.indices.data
+    cdef unsigned int *polyStarts = polygons.polyStarts.data
+    cdef unsigned int *polyLengths = polygons.polyLengths.data
+    cdef Vector3 *a
+    cdef Vector3 *b
+    cdef Vector3 *normal
+    cdef Py_ssize_t i, j, start, length
+
+    for i in range(amount):
+        start = polyStarts[i]
+        length = polyLengths[i]
+        normal = normals.data + i
+        normal.x = normal.y = normal.z = 0
+        for j in range(length):
+            a = vertices.data + indices[start + j]
+            b = vertices.data + indices[start + (j + 1) % length]
+            normal.x += (a.y - b.y) * (a.z + b.z)
+            normal.y += (a.z - b.z) * (a.x + b.x)
+            normal.z += (a.x - b.x) * (a.y + b.y)
+        normalizeVec3_InPlace(normal)
+    return normals
+
+cdef tuple triangulatePolygons(Vector3DList vertices, PolygonIndicesList polygons):
+    '''Fan triangulation, returns the corners, centers and polygon indices of the triangles.'''
+    cdef Py_ssize_t polygonAmount = polygons.getLength()
+    cdef unsigned int *indices = polygons.indices.data
+    cdef unsigned int *polyStarts = polygons.polyStarts.data
+    cdef unsigned int *polyLengths = polygons.polyLengths.data
+    cdef Py_ssize_t i, j, k, start, triangleAmount = 0
+
+    for i in range(polygonAmount):
+        if polyLengths[i] >= 3:
+            triangleAmount += polyLengths[i] - 2
+
+    cdef Vector3DList corners = Vector3DList(length = 3 * triangleAmount)
+    cdef Vector3DList centers = Vector3DList(length = triangleAmount)
+    cdef LongList trianglePolygons = LongList(length = triangleAmount)
+    cdef Vector3 *c
+    cdef Vector3 *center
+
+    k = 0
+    for i in range(polygonAmount):
+        start = polyStarts[i]
+        for j in range(1, <Py_ssize_t>polyLengths[i] - 1):
+            c = corners.data + 3 * k
+            c[0] = vertices.data[indices[start]]
+            c[1] = vertices.data[indices[start + j]]
+            c[2] = vertices.data[indices[start + j + 1]]
+            center = centers.data + k
+            center.x = (c[0].x + c[1].x + c[2].x) / 3
+            center.y = (c[0].y + c[1].y + c[2].y) / 3
+            center.z = (c[0].z + c[1].z + c[2].z) / 3
+            trianglePolygons.data[k] = i
+            k += 1
+    return corners, centers, trianglePolygons
+
+cdef void calculateBounds(BVHNode *node, Vector3 *corners, long *order, float epsilon) nogil:
+    cdef Vector3 *p
+    cdef Py_ssize_t i, k
+    node.low = corners[3 * order[node.start]]
+    node.high = node.low
+    for i in range(node.start, node.end):
+        for k in range(3):
+            p = corners + 3 * order[i] + k
+            if p.x < node.low.x: node.low.x = p.x
+            if p.x > node.high.x: node.high.x = p.x
+            if p.y < node.low.y: node.low.y = p.y
+            if p.y > node.high.y: node.high.y = p.y
+            if p.z < node.low.z: node.low.z = p.z
+            if p.z > node.high.z: node.high.z = p.z
+    node.low.x -= epsilon
+    node.low.y -= epsilon
+    node.low.z -= epsilon
+    node.high.x += epsilon
+    node.high.y += epsilon
+    node.high.z += epsilon
+
+cdef inline float getCoordinate(Vector3 *v, int axis) nogil:
+    return (<float*>v)[axis]
+
+cdef int findSplitAxis(Vector3 *centers, long *order, Py_ssize_t start, Py_ssize_t end) nogil:
+    '''Axis with the largest extent of the triangle centers or -1 when they are all equal.'''
+    cdef Vector3 low = centers[order[start]]
+    cdef Vector3 high = low
+    cdef Vector3 *p
+    cdef Py_ssize_t i
+    for i in range(start + 1, end):
+        p = centers + order[i]
+        if p.x < low.x: low.x = p.x
+        if p.x > high.x: high.x = p.x
+        if p.y < low.y: low.y = p.y
+        if p.y > high.y: high.y = p.y
+        if p.z < low.z: low.z = p.z
+        if p.z > high.z: high.z = p.z
+
+    cdef float dx = high.x - low.x
+    cdef float dy = high.y - low.y
+    cdef float dz = high.z - low.z
+    if dx == 0 and dy == 0 and dz == 0: return -1
+    if dx >= dy and dx >= dz: return 0
+    if dy >= dz: return 1
+    return 2
+
+cdef void selectNth(Vector3 *centers, long *order, Py_ssize_t start, Py_ssize_t end,
+                    Py_ssize_t nth, int axis) nogil:
+    '''Quickselect, afterwards the nth element is at its sorted position.'''
+    cdef Py_ssize_t left = start
+    cdef Py_ssize_t right = end - 1
+    cdef Py_ssize_t i, j
+    cdef long tmp
+    cdef float pivot
+
+    while right > left:
+        pivot = getCoordinate(centers + order[(left + right) // 2], axis)
+        i = left
+        j = right
+        while i <= j:
+            while getCoordinate(centers + order[i], axis) < pivot: i += 1
+            while getCoordinate(centers + order[j], axis) > pivot: j -= 1
+            if i <= j:
+                tmp = order[i]
+                order[i] = order[j]
+                order[j] = tmp
+                i += 1
+                j -= 1
+        if nth <= j: right = j
+        elif nth >= i: left = i
+        else: break
+
+
+# Geometry
+###############################################
+
+@cython.cdivision(True)
+cdef inline Vector3 inverseDirection(Vector3 *direction) nogil:
+    # division by zero results in infinity which is handled by the box test
+    cdef Vector3 inverse
+    inverse.x = 1 / direction.x
+    inverse.y = 1 / direction.y
+    inverse.z = 1 / direction.z
+    return inverse
+
+cdef inline bint rayIntersectsBox(BVHNode *node, Vector3 *start, Vector3 *inverse,
+                                  float maxDistance) nogil:
+    cdef float tx1 = (node.low.x - start.x) * inverse.x
+    cdef float tx2 = (node.high.x - start.x) * inverse.x
+    cdef float ty1 = (node.low.y - start.y) * inverse.y
+    cdef float ty2 = (node.high.y - start.y) * inverse.y
+    cdef float tz1 = (node.low.z - start.z) * inverse.z
+    cdef float tz2 = (node.high.z - start.z) * inverse.z
+
+    # fmin and fmax ignore nan values that occur when the start is on a box side
+    cdef float near = fmax(fmax(fmin(tx1, tx2), fmin(ty1, ty2)), fmin(tz1, tz2))
+    cdef float far = fmin(fmin(fmax(tx1, tx2), fmax(ty1, ty2)), fmax(tz1, tz2))
+    return near <= far and far >= 0 and near <= maxDistance
+
+@cython.cdivision(True)
+cdef inline bint rayIntersectsTriangle(Vector3 *start, Vector3 *direction, Vector3 *corners,
+                                       float *distance) nogil:
+    '''Möller-Trumbore intersection, both sides of the triangle are hit.'''
+    cdef Vector3 edge1, edge2, p, s, q
+    subVec3(&edge1, corners + 1, corners)
+    subVec3(&edge2, corners + 2, corners)
+    crossVec3(&p, direction, &edge2)
+    cdef float determinant = dotVec3(&edge1, &p)
+    if determinant == 0: return False
+
+    cdef float inverse = 1 / determinant
+    subVec3(&s, start, corners)
+    cdef float u = dotVec3(&s, &p) * inverse
+    if u < 0 or u > 1: return False
+
+    crossVec3(&q, &s, &edge1)
+    cdef float v = dotVec3(direction, &q) * inverse
+    if v < 0 or u + v > 1: return False
+
+    distance[0] = dotVec3(&edge2, &q) * inverse
+    return distance[0] >= 0
+
+cdef inline float distanceSquaredToBox(BVHNode *node, Vector3 *point) nogil:
+    cdef float dx = fmax(fmax(node.low.x - point.x, 0), point.x - node.high.x)
+    cdef float dy = fmax(fmax(node.low.y - point.y, 0), point.y - node.high.y)
+    cdef float dz = fmax(fmax(node.low.z - point.z, 0), point.z - node.high.z)
+    return dx * dx + dy * dy + dz * dz
+
+@cython.cdivision(True)
+cdef void closestPointOnTriangle(Vector3 *result, Vector3 *point, Vector3 *corners) nogil:
+    '''From "Real-Time Collision Detection" by Christer Ericson.'''
+    cdef Vector3 *a = corners
+    cdef Vector3 *b = corners + 1
+    cdef Vector3 *c = corners + 2
+    cdef Vector3 ab, ac, ap, bp, cp
+    cdef float d1, d2, d3, d4, d5, d6, va, vb, vc, v, w, denominator
+
+    subVec3(&ab, b, a)
+    subVec3(&ac, c, a)
+    subVec3(&ap, point, a)
+    d1 = dotVec3(&ab, &ap)
+    d2 = dotVec3(&ac, &ap)
+    if d1 <= 0 and d2 <= 0:
+        result[0] = a[0]
+        return
+
+    subVec3(&bp, point, b)
+    d3 = dotVec3(&ab, &bp)
+    d4 = dotVec3(&ac, &bp)
+    if d3 >= 0 and d4 <= d3:
+        result[0] = b[0]
+        return
+
+    vc = d1 * d4 - d3 * d2
+    if vc <= 0 and d1 >= 0 and d3 <= 0:
+        v = d1 / (d1 - d3)
+        result.x = a.x + ab.x * v
+        result.y = a.y + ab.y * v
+        result.z = a.z + ab.z * v
+        return
+
+    subVec3(&cp, point, c)
+    d5 = dotVec3(&ab, &cp)
+    d6 = dotVec3(&ac, &cp)
+    if d6 >= 0 and d5 <= d6:
+        result[0] = c[0]
+        return
+
+    vb = d5 * d2 - d1 * d6
+    if vb <= 0 and d2 >= 0 and d6 <= 0:
+        w = d2 / (d2 - d6)
+        result.x = a.x + ac.x * w
+        result.y = a.y + ac.y * w
+        result.z = a.z + ac.z * w
+        return
+
+    va = d3 * d6 - d5 * d4
+    if va <= 0 and d4 - d3 >= 0 and d5 - d6 >= 0:
+        w = (d4 - d3) / ((d4 - d3) + (d5 - d6))
+        result.x = b.x + (c.x - b.x) * w
+        result.y = b.y + (c.y - b.y) * w
+        result.z = b.z + (c.z - b.z) * w
+        return
+
+    denominator = va + vb + vc
+    if denominator == 0:
+        result[0] = a[0]
+        return
+    v = vb / denominator
+    w = vc / denominator
+    result.x = a.x + ab.x * v + ac.x * w
+    result.y = a.y + ab.y * v + ac.y * w
+    result.z = a.z + ab.z * v + ac.z * w
+
+
+# Inside Test
+###############################################
+
+# Rays in random directions are used to reduce the
+# probability of errors when a ray hits an edge.
+
+cdef Vector3 testDirections[3]
+
+cdef initializeTestDirections():
+    cdef Py_ssize_t i
+    for i in range(3):
+        testDirections[i] = toVector3((random(), random(), random()))
+        normalizeVec3_InPlace(testDirections + i)
+
+initializeTestDirections()
+
+cdef Py_ssize_t countRayHits(BVHTree tree, Vector3 *start, Vector3 *direction) nogil:
+    cdef BVHHit hit
+    cdef Vector3 current = start[0]
+    cdef Py_ssize_t hits = 0
+
+    # the limit protects against loops when the offset is too small for large coordinates
+    while hits < tree.triangleAmount and tree.rayCast_LowLevel(&current, direction, INFINITY, &hit):
+        hits += 1
+        current.x = hit.location.x + direction.x * 0.0001
+        current.y = hit.location.y + direction.y * 0.0001
+        current.z = hit.location.z + direction.z * 0.0001
+    return hits
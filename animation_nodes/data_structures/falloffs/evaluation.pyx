@@ -1,8 +1,14 @@
+# setup: options = openmp
+
 from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from cython.parallel cimport prange, threadid
 from cpython.ref cimport PyObject, Py_INCREF, Py_DECREF
 
 from . falloff_base cimport Falloff
-from . falloff_base cimport BaseFalloff, CompoundFalloff
+from . falloff_base cimport (
+    BaseFalloff, CompoundFalloff,
+    BaseFalloffListFunction, CompoundFalloffListFunction
+)
 from . types cimport (
     falloffDataTypeExists,
     EvaluateBaseConverted,
@@ -15,12 +21,13 @@ from . types cimport (
     getConvertListFunction
 )
 
+from ... utils.parallel cimport getThreadAmount
 from ... utils.pointers cimport pointerToInt, intToPointer
 from ... math cimport Matrix4, Vector3, toVector3, toMatrix4
 
 ctypedef float (*EvaluatorFunction)(void *settings, void *value, Py_ssize_t index)
-ctypedef void (*ListEvaluatorFunction)(void *settings, void *values, Py_ssize_t startIndex,
-                                       Py_ssize_t amount, float *target)
+ctypedef int (*ListEvaluatorFunction)(void *settings, void *values, Py_ssize_t startIndex,
+                                      Py_ssize_t amount, float *target) except -1
 
 
 # Interface for other files
@@ -47,8 +54,8 @@ cdef class FalloffEvaluator:
     cdef pyEvaluate(self, object value, Py_ssize_t index):
         raise NotImplementedError()
 
-    cdef void evaluateList_LowLevel(self, void *values, Py_ssize_t startIndex,
-                                    Py_ssize_t amount, float *target):
+    cdef int evaluateList_LowLevel(self, void *values, Py_ssize_t startIndex,
+                                   Py_ssize_t amount, float *target) except -1:
         raise NotImplementedError()
 
     def evaluateList(self, CList values, Py_ssize_t startIndex = 0):
@@ -83,9 +90,9 @@ cdef class EvaluatorFunctionEvaluator(FalloffEvaluator):
     cdef float evaluate(self, void *value, Py_ssize_t index):
         return self.function(self.settings, value, index)
 
-    cdef void evaluateList_LowLevel(self, void *values, Py_ssize_t startIndex,
-                                    Py_ssize_t amount, float *target):
-        self.listFunction(self.listSettings, values, startIndex, amount, target)
+    cdef int evaluateList_LowLevel(self, void *values, Py_ssize_t startIndex,
+                                   Py_ssize_t amount, float *target) except -1:
+        return self.listFunction(self.listSettings, values, startIndex, amount, target)
 
     cdef pyEvaluate(self, object value, Py_ssize_t index):
         self.pyConversion(value, self.pyConversionBuffer)
@@ -325,8 +332,28 @@ cdef struct ListEvaluatorSettings:
     PyObject *sourceType
 
 
-cdef void evaluateList(void *_settings, void *values, Py_ssize_t startIndex,
-                       Py_ssize_t amount, float *target):
+# Lists are evaluated in chunks. The results of dependencies of compound
+# falloffs are written into small scratch buffers that are reused for
+# every chunk. When all falloffs can be evaluated without the gil,
+# the chunks of big lists are distributed over multiple threads.
+
+cdef Py_ssize_t chunkSize = 4096
+
+cdef struct FalloffNode:
+    PyObject *falloff
+    bint isCompound
+    bint clampResult
+    char *data
+    Py_ssize_t elementSize
+    void *functionSettings
+    BaseFalloffListFunction baseFunction
+    CompoundFalloffListFunction compoundFunction
+    int dependencyAmount
+    int dependencyOffset
+    int subtreeSize
+
+cdef int evaluateList(void *_settings, void *values, Py_ssize_t startIndex,
+                      Py_ssize_t amount, float *target) except -1:
     cdef ListEvaluatorSettings *settings = <ListEvaluatorSettings*>_settings
     cdef Falloff falloff = <Falloff>settings.falloff
     cdef str sourceType = <str>settings.sourceType
@@ -337,52 +364,146 @@ cdef void evaluateList(void *_settings, void *values, Py_ssize_t startIndex,
     cdef set listsToFree
     preparedLists, listsToFree = getListsForDataTypes(sourceType, dataTypes, values, amount)
 
-    evaluateList_UnknownType(falloff, preparedLists, startIndex, amount, target)
+    cdef int nodeAmount = countFalloffNodes(falloff)
+    cdef FalloffNode *nodes = <FalloffNode*>PyMem_Malloc(sizeof(FalloffNode) * nodeAmount)
+    cdef int dependencyOffset = 0
+    cdef bint threadSafe = True
+    try:
+        if nodes == NULL: raise MemoryError()
+        fillFalloffNodes(falloff, False, preparedLists, nodes, 0, &dependencyOffset, &threadSafe)
+        evaluateFalloffNodes(nodes, nodeAmount, threadSafe, startIndex, amount, target)
+    finally:
+        PyMem_Free(nodes)
+        freeListsForDataTypes(preparedLists, listsToFree)
+    return 0
+
+cdef int countFalloffNodes(Falloff falloff):
+    if isinstance(falloff, CompoundFalloff):
+        return 1 + sum(countFalloffNodes(d) for d in (<CompoundFalloff>falloff).getDependencies())
+    return 1
+
+cdef int fillFalloffNodes(Falloff falloff, bint clampResult, dict preparedLists,
+                          FalloffNode *nodes, int index, int *dependencyOffset, bint *threadSafe):
+    '''Stores the falloff tree in depth first order and returns the next free index.'''
+    cdef FalloffNode *node = nodes + index
+    cdef list dependencies, clampingRequirements
+    cdef Falloff dependency
+    cdef int nextIndex = index + 1
+    cdef Py_ssize_t i
 
-    freeListsForDataTypes(preparedLists, listsToFree)
+    node.falloff = <PyObject*>falloff
+    node.clampResult = clampResult and not falloff.clamped
+    node.data = NULL
+    node.elementSize = 0
+    node.functionSettings = NULL
+    node.baseFunction = NULL
+    node.compoundFunction = NULL
+    node.dependencyAmount = 0
+    node.dependencyOffset = 0
 
-cdef evaluateList_UnknownType(Falloff falloff, dict preparedLists, Py_ssize_t startIndex,
-                              Py_ssize_t amount, float *target):
     if isinstance(falloff, BaseFalloff):
-        evaluateList_BaseFalloff(falloff, preparedLists, startIndex, amount, target)
-    elif isinstance(falloff, CompoundFalloff):
-        evaluateList_CompoundFalloff(falloff, preparedLists, startIndex, amount, target)
-
-cdef evaluateList_BaseFalloff(BaseFalloff falloff, dict preparedLists, Py_ssize_t startIndex,
-                              Py_ssize_t amount, float *target):
-    cdef void *data = intToPointer(preparedLists[falloff.dataType])
-    falloff.evaluateList(data, startIndex, amount, target)
-
-cdef evaluateList_CompoundFalloff(CompoundFalloff falloff, dict preparedLists,
-                                  Py_ssize_t startIndex, Py_ssize_t amount, float *target):
-    cdef list dependencies = falloff.getDependencies()
-    cdef list clampingRequirements = falloff.getClampingRequirements()
-    cdef list subResults = evaluateList_UnkownType_Multiple(dependencies, preparedLists,
-                                                            startIndex, amount)
-
-    cdef Falloff subFalloff
-    for subFalloff, subResult, clampRequired in zip(dependencies, subResults, clampingRequirements):
-        if clampRequired and not subFalloff.clamped:
-            subResult.clamp(0, 1)
-
-    cdef float **depsResults = <float**>PyMem_Malloc(sizeof(float*) * len(dependencies))
+        node.isCompound = False
+        node.data = <char*>intToPointer(preparedLists[(<BaseFalloff>falloff).dataType])
+        node.elementSize = getSizeOfFalloffDataType((<BaseFalloff>falloff).dataType)
+        node.baseFunction = (<BaseFalloff>falloff).getListFunction_NoGil(&node.functionSettings)
+        if node.baseFunction == NULL:
+            threadSafe[0] = False
+    else:
+        node.isCompound = True
+        node.compoundFunction = (<CompoundFalloff>falloff).getListFunction_NoGil(&node.functionSettings)
+        if node.compoundFunction == NULL:
+            threadSafe[0] = False
+
+        dependencies = (<CompoundFalloff>falloff).getDependencies()
+        clampingRequirements = (<CompoundFalloff>falloff).getClampingRequirements()
+        node.dependencyAmount = len(dependencies)
+        node.dependencyOffset = dependencyOffset[0]
+        dependencyOffset[0] += node.dependencyAmount
+
+        for i in range(len(dependencies)):
+            dependency = dependencies[i]
+            nextIndex = fillFalloffNodes(dependency, clampingRequirements[i], preparedLists,
+                                         nodes, nextIndex, dependencyOffset, threadSafe)
+
+    node.subtreeSize = nextIndex - index
+    return nextIndex
+
+cdef int evaluateFalloffNodes(FalloffNode *nodes, int nodeAmount, bint threadSafe,
+                              Py_ssize_t startIndex, Py_ssize_t amount, float *target) except -1:
+    cdef int threads = getThreadAmount(amount) if threadSafe else 1
+
+    # a single falloff does not need scratch buffers
+    if threads == 1 and nodeAmount == 1:
+        evaluateFalloffNode(nodes, 0, 0, startIndex, amount, target, NULL, NULL)
+        return 0
+
+    cdef Py_ssize_t scratchSize = (nodeAmount - 1) * chunkSize
+    cdef float *scratch = <float*>PyMem_Malloc(sizeof(float) * max(scratchSize, 1) * threads)
+    cdef float **pointers = <float**>PyMem_Malloc(sizeof(float*) * nodeAmount * threads)
+    if scratch == NULL or pointers == NULL:
+        PyMem_Free(scratch)
+        PyMem_Free(pointers)
+        raise MemoryError()
+
+    cdef Py_ssize_t chunkAmount = (amount + chunkSize - 1) // chunkSize
+    cdef Py_ssize_t chunk, offset
+    cdef int thread
+
+    if threads > 1:
+        for chunk in prange(chunkAmount, nogil = True, num_threads = threads, schedule = "dynamic"):
+            thread = threadid()
+            offset = chunk * chunkSize
+            evaluateFalloffNode(nodes, 0, offset, startIndex, min(chunkSize, amount - offset),
+                target + offset, scratch + thread * scratchSize, pointers + thread * nodeAmount)
+    else:
+        for chunk in range(chunkAmount):
+            offset = chunk * chunkSize
+            evaluateFalloffNode(nodes, 0, offset, startIndex, min(chunkSize, amount - offset),
+                target + offset, scratch, pointers)
+
+    PyMem_Free(scratch)
+    PyMem_Free(pointers)
+    return 0
+
+cdef void evaluateFalloffNode(FalloffNode *nodes, int index, Py_ssize_t offset,
+                              Py_ssize_t startIndex, Py_ssize_t amount, float *target,
+                              float *scratch, float **pointers) nogil:
+    '''
+    Falloffs without a nogil list function are only used when all chunks
+    are evaluated in the main thread. The gil is acquired for them.
+    '''
+    cdef FalloffNode *node = nodes + index
+    cdef float **dependencyResults
+    cdef char *data
+    cdef int i, child
+    cdef Py_ssize_t j
+
+    if node.isCompound:
+        dependencyResults = pointers + node.dependencyOffset
+        child = index + 1
+        for i in range(node.dependencyAmount):
+            dependencyResults[i] = scratch + (child - 1) * chunkSize
+            evaluateFalloffNode(nodes, child, offset, startIndex, amount,
+                dependencyResults[i], scratch, pointers)
+            child += nodes[child].subtreeSize
+
+        if node.compoundFunction != NULL:
+            node.compoundFunction(node.functionSettings, dependencyResults, amount, target)
+        else:
+            with gil:
+                (<CompoundFalloff>node.falloff).evaluateList(dependencyResults, amount, target)
+    else:
+        data = node.data + offset * node.elementSize
+        if node.baseFunction != NULL:
+            node.baseFunction(node.functionSettings, data, startIndex + offset, amount, target)
+        else:
+            with gil:
+                (<BaseFalloff>node.falloff).evaluateList(data, startIndex + offset, amount, target)
 
-    cdef Py_ssize_t i
-    for i in range(len(dependencies)):
-        depsResults[i] = (<FloatList>subResults[i]).data
-    falloff.evaluateList(depsResults, amount, target)
-
-    PyMem_Free(depsResults)
-
-cdef evaluateList_UnkownType_Multiple(list falloffs, dict preparedLists,
-                                      Py_ssize_t startIndex, Py_ssize_t amount):
-    cdef list results = []
-    cdef FloatList result
-    for falloff in falloffs:
-        result = FloatList(length = amount)
-        evaluateList_UnknownType(falloff, preparedLists, startIndex, amount, result.data)
-        results.append(result)
-    return results
+    if node.clampResult:
+        for j in range(amount):
+            if target[j] < 0: target[j] = 0
+            elif target[j] > 1: target[j] = 1
 
 cdef set getBaseFalloffTypes(Falloff falloff):
     if isinstance(falloff, BaseFalloff):
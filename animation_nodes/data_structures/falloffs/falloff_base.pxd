@@ -1,5 +1,10 @@
 from . evaluation cimport FalloffEvaluator
 
+ctypedef void (*BaseFalloffListFunction)(void *settings, void *objects, Py_ssize_t startIndex,
+                                         Py_ssize_t amount, float *target) nogil
+ctypedef void (*CompoundFalloffListFunction)(void *settings, float **dependencyResults,
+                                             Py_ssize_t amount, float *target) nogil
+
 cdef class Falloff:
     cdef bint clamped
     cdef dict evaluators
@@ -11,9 +16,11 @@ cdef class BaseFalloff(Falloff):
     cdef float evaluate(self, void *object, Py_ssize_t index)
     cdef void evaluateList(self, void *objects, Py_ssize_t startIndex,
                            Py_ssize_t amount, float *target)
+    cdef BaseFalloffListFunction getListFunction_NoGil(self, void **outSettings)
 
 cdef class CompoundFalloff(Falloff):
     cdef list getDependencies(self)
     cdef list getClampingRequirements(self)
     cdef float evaluate(self, float *dependencyResults)
     cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target)
+    cdef CompoundFalloffListFunction getListFunction_NoGil(self, void **outSettings)
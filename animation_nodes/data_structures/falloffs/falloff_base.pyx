@@ -24,6 +24,14 @@ cdef class BaseFalloff(Falloff):
         for i in range(amount):
             target[i] = self.evaluate(<char*>objects + i * elementSize, i + startIndex)
 
+    cdef BaseFalloffListFunction getListFunction_NoGil(self, void **outSettings):
+        '''
+        Falloffs that can be evaluated without the gil return a function
+        that gets the settings pointer that is written into outSettings.
+        The settings have to stay valid as long as the falloff exists.
+        '''
+        return NULL
+
     def __repr__(self):
         return "{}".format(type(self).__name__)
 
@@ -41,14 +49,23 @@ cdef class CompoundFalloff(Falloff):
     cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
         cdef Py_ssize_t i, j
         cdef Py_ssize_t depsAmount = len(self.getDependencies())
-        cdef float *buffer = <float*>malloc(sizeof(float) * depsAmount)
+
+        # this is called for every chunk of a list, so avoid the allocation if possible
+        cdef float stackBuffer[16]
+        cdef float *buffer = stackBuffer
+        if depsAmount > 16:
+            buffer = <float*>malloc(sizeof(float) * depsAmount)
 
         for i in range(amount):
             for j in range(depsAmount):
                 buffer[j] = dependencyResults[j][i]
             target[i] = self.evaluate(buffer)
 
-        free(buffer)
+        if buffer != stackBuffer:
+            free(buffer)
+
+    cdef CompoundFalloffListFunction getListFunction_NoGil(self, void **outSettings):
+        return NULL
 
 
     def __repr__(self):
@@ -0,0 +1,64 @@
+import numpy
+from unittest import TestCase
+from ... preferences import applyThreadAmount
+from ... utils.parallel import setThreadAmount
+from .. lists.base_lists import Vector3DList
+from ... nodes.falloff.remap_falloff import RemapFalloff
+from ... nodes.falloff.constant_falloff import ConstantFalloff
+from ... nodes.falloff.point_distance_falloff import PointDistanceFalloff
+from ... nodes.falloff.mix_falloffs import AddTwoFalloffs, MultiplyTwoFalloffs
+
+# Lists are evaluated in chunks, big lists on multiple threads when all
+# falloffs support it. The results have to be the same as evaluating
+# every element on its own.
+
+amount = 100000
+
+def randomLocations():
+    values = numpy.random.RandomState(0).uniform(-5, 5, (amount, 3)).astype(numpy.float32)
+    return Vector3DList.fromNumpyArray(values.ravel())
+
+def getThreadSafeFalloff():
+    return AddTwoFalloffs(
+        PointDistanceFalloff((0, 0, 0), 2, 3),
+        MultiplyTwoFalloffs(PointDistanceFalloff((3, 1, 0), 1, 4), ConstantFalloff(0.5)))
+
+def getFalloffWithGil():
+    # the remap falloff has no list function that can run without the gil
+    return AddTwoFalloffs(RemapFalloff(PointDistanceFalloff((1, 2, 0), 1, 5), 0, 1, 0.2, 0.7),
+                          ConstantFalloff(0.1))
+
+class TestListEvaluation(TestCase):
+    def setUp(self):
+        self.locations = randomLocations()
+
+    def tearDown(self):
+        applyThreadAmount()
+
+    def evaluateList(self, falloff, threadAmount):
+        setThreadAmount(threadAmount)
+        evaluator = falloff.getEvaluator("LOCATION")
+        result = evaluator.evaluateList(self.locations)
+        return numpy.array(result.asNumpyArray())
+
+    def evaluateSingle(self, falloff):
+        evaluator = falloff.getEvaluator("LOCATION")
+        locations = self.locations.asNumpyArray().reshape(-1, 3).tolist()
+        return numpy.array([evaluator(location, i) for i, location in enumerate(locations)],
+                           dtype = numpy.float32)
+
+    def assertSameResults(self, falloff):
+        expected = self.evaluateSingle(falloff)
+        for threadAmount in (1, 4):
+            result = self.evaluateList(falloff, threadAmount)
+            self.assertTrue(numpy.allclose(result, expected, rtol = 1e-6, atol = 1e-7))
+
+    def testThreadSafeFalloffs(self):
+        self.assertSameResults(getThreadSafeFalloff())
+
+    def testFalloffsWithGil(self):
+        self.assertSameResults(getFalloffWithGil())
+
+    def testShortList(self):
+        self.locations = Vector3DList.fromValues([(0, 0, 0), (3, 1, 0), (10, 0, 0)])
+        self.assertSameResults(getThreadSafeFalloff())
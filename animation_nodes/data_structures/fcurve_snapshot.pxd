@@ -0,0 +1,14 @@
+from . lists.base_lists cimport FloatList, Vector2DList, IntegerList
+
+cdef class FCurveSnapshot:
+    cdef object fCurve
+    cdef tuple state
+    cdef Py_ssize_t pointAmount
+    cdef Vector2DList points, leftHandles, rightHandles
+    cdef IntegerList interpolations
+    cdef bint linearExtrapolation
+    cdef bint useFallback
+    cdef bint roundValues
+
+    cdef float evaluate(self, float frame)
+    cpdef FloatList evaluateList(self, FloatList frames)
@@ -0,0 +1,369 @@
+cimport cython
+from libc.math cimport sqrt, cos, acos, exp, log, fabs, floor
+from .. math cimport Vector2
+
+# Evaluating an FCurve with fCurve.evaluate is slow when it has to be done
+# for many frames. A snapshot reads the keyframes once and evaluates
+# constant, linear and bezier segments in the same way Blender does.
+# Other interpolation modes and FCurves with modifiers are still
+# evaluated by Blender.
+# Blender rounds the values of FCurves that animate integer properties
+# and always uses constant interpolation for boolean and enum properties.
+# The flags for that are not available in Python, so they are detected
+# by comparing a few evaluations with the results of Blender.
+
+# Same values as the interpolation enum of keyframes
+cdef int CONSTANT_INTERPOLATION = 0
+cdef int LINEAR_INTERPOLATION = 1
+cdef int BEZIER_INTERPOLATION = 2
+
+cdef float FLT_EPSILON = 1.192092896e-07
+cdef float exactFrameThreshold = 0.0001
+
+# Kinds of values detected by probeValueType
+cdef int FLOAT_VALUES = 0
+cdef int INT_VALUES = 1
+cdef int OTHER_VALUES = 2
+
+cdef class FCurveSnapshot:
+    def __cinit__(self, fCurve):
+        from bpy.types import FCurve
+        if not isinstance(fCurve, FCurve):
+            raise TypeError("Expected FCurve")
+
+        keyframes = fCurve.keyframe_points
+        self.fCurve = fCurve
+        self.state = getFCurveState(fCurve)
+        self.pointAmount = len(keyframes)
+        self.linearExtrapolation = fCurve.extrapolation == "LINEAR"
+        self.useFallback = self.pointAmount == 0 or len(fCurve.modifiers) > 0
+        self.roundValues = False
+
+        self.points, self.leftHandles, self.rightHandles, self.interpolations = readKeyframes(
+            keyframes, self.pointAmount)
+
+        if not self.useFallback:
+            valueType = probeValueType(self)
+            self.roundValues = valueType == INT_VALUES
+            self.useFallback = valueType == OTHER_VALUES
+
+    def __call__(self, float frame):
+        return self.evaluate(frame)
+
+    def isOutdated(self):
+        '''
+        Only detects changes of the keyframe amount, extrapolation and modifiers.
+        Moved keyframes are detected by invalidating the snapshots of changed actions.
+        '''
+        return getFCurveState(self.fCurve) != self.state
+
+    cdef float evaluate(self, float frame):
+        cdef float result
+        if self.useFallback or not evaluateKeyframes(self, frame, &result):
+            return self.fCurve.evaluate(frame)
+        if self.roundValues:
+            return floor(result + 0.5)
+        return result
+
+    cpdef FloatList evaluateList(self, FloatList frames):
+        cdef FloatList result = FloatList(length = frames.length)
+        cdef Py_ssize_t i
+        for i in range(frames.length):
+            result.data[i] = self.evaluate(frames.data[i])
+        return result
+
+
+def getFCurveState(fCurve):
+    return (len(fCurve.keyframe_points), fCurve.extrapolation, len(fCurve.modifiers))
+
+def readKeyframes(keyframes, Py_ssize_t amount):
+    points = Vector2DList(length = amount)
+    leftHandles = Vector2DList(length = amount)
+    rightHandles = Vector2DList(length = amount)
+    interpolations = IntegerList(length = amount)
+
+    if amount > 0:
+        keyframes.foreach_get("co", points.asMemoryView())
+        keyframes.foreach_get("handle_left", leftHandles.asMemoryView())
+        keyframes.foreach_get("handle_right", rightHandles.asMemoryView())
+        keyframes.foreach_get("interpolation", interpolations.asMemoryView())
+    return points, leftHandles, rightHandles, interpolations
+
+cdef int probeValueType(FCurveSnapshot snapshot):
+    '''
+    Evaluates frames inside of interpolated segments where rounding makes a
+    difference. Integer FCurves return the rounded values, boolean and enum
+    FCurves return the value of the previous keyframe.
+    '''
+    cdef Vector2 *points = snapshot.points.data
+    cdef bint isAmbiguous = False
+    cdef float factor, frame, value, rounded, expected
+    cdef Py_ssize_t i
+
+    for i in range(snapshot.pointAmount - 1):
+        if points[i].y == points[i + 1].y: continue
+        if snapshot.interpolations.data[i] == CONSTANT_INTERPOLATION: continue
+
+        for factor in (0.3, 0.7, 0.85):
+            frame = points[i].x + (points[i + 1].x - points[i].x) * factor
+            if not evaluateKeyframes(snapshot, frame, &value): break
+            rounded = floor(value + 0.5)
+            if fabs(value - rounded) < 0.1: continue
+
+            expected = snapshot.fCurve.evaluate(frame)
+            if fabs(expected - value) < 0.001:
+                return FLOAT_VALUES
+            if fabs(expected - rounded) >= 0.001:
+                return OTHER_VALUES
+            if rounded != points[i].y:
+                return INT_VALUES
+            # integer and discrete FCurves have the same value here
+            isAmbiguous = True
+
+    return OTHER_VALUES if isAmbiguous else FLOAT_VALUES
+
+
+# Keyframe Evaluation
+########################################
+
+cdef bint evaluateKeyframes(FCurveSnapshot snapshot, float frame, float *result):
+    '''Returns False when the segment has to be evaluated by Blender.'''
+    cdef Vector2 *points = snapshot.points.data
+    cdef Py_ssize_t lastIndex = snapshot.pointAmount - 1
+
+    if points[0].x >= frame:
+        result[0] = extrapolateStart(snapshot, frame)
+        return True
+    if points[lastIndex].x <= frame:
+        result[0] = extrapolateEnd(snapshot, frame)
+        return True
+
+    cdef Py_ssize_t index = findNextKeyframeIndex(points, snapshot.pointAmount, frame)
+    if points[index].x - frame < exactFrameThreshold:
+        result[0] = points[index].y
+        return True
+    if frame - points[index - 1].x < exactFrameThreshold:
+        result[0] = points[index - 1].y
+        return True
+
+    cdef int interpolation = snapshot.interpolations.data[index - 1]
+    if interpolation == CONSTANT_INTERPOLATION:
+        result[0] = points[index - 1].y
+    elif interpolation == LINEAR_INTERPOLATION:
+        result[0] = interpolateLinear(points + index - 1, points + index, frame)
+    elif interpolation == BEZIER_INTERPOLATION:
+        result[0] = interpolateBezier(points + index - 1, snapshot.rightHandles.data + index - 1,
+                                      snapshot.leftHandles.data + index, points + index, frame)
+    else:
+        return False
+    return True
+
+cdef Py_ssize_t findNextKeyframeIndex(Vector2 *points, Py_ssize_t amount, float frame):
+    '''Binary search for the first keyframe that is not before the frame.'''
+    cdef Py_ssize_t low = 0
+    cdef Py_ssize_t high = amount - 1
+    cdef Py_ssize_t center
+    while low < high:
+        center = (low + high) // 2
+        if points[center].x < frame:
+            low = center + 1
+        else:
+            high = center
+    return low
+
+@cython.cdivision(True)
+cdef float extrapolateStart(FCurveSnapshot snapshot, float frame):
+    cdef Vector2 *first = snapshot.points.data
+    cdef int interpolation = snapshot.interpolations.data[0]
+    if not snapshot.linearExtrapolation or interpolation == CONSTANT_INTERPOLATION:
+        return first.y
+    if interpolation == LINEAR_INTERPOLATION:
+        if snapshot.pointAmount == 1:
+            return first.y
+        return extrapolateLinear(first, first + 1, frame)
+    return extrapolateLinear(first, snapshot.leftHandles.data, frame)
+
+@cython.cdivision(True)
+cdef float extrapolateEnd(FCurveSnapshot snapshot, float frame):
+    cdef Py_ssize_t lastIndex = snapshot.pointAmount - 1
+    cdef Vector2 *last = snapshot.points.data + lastIndex
+    cdef int interpolation = snapshot.interpolations.data[lastIndex]
+    if not snapshot.linearExtrapolation or interpolation == CONSTANT_INTERPOLATION:
+        return last.y
+    if interpolation == LINEAR_INTERPOLATION:
+        if snapshot.pointAmount == 1:
+            return last.y
+        return extrapolateLinear(last, last - 1, frame)
+    return extrapolateLinear(last, snapshot.rightHandles.data + lastIndex, frame)
+
+@cython.cdivision(True)
+cdef float extrapolateLinear(Vector2 *endpoint, Vector2 *other, float frame):
+    cdef float dx = endpoint.x - frame
+    cdef float factor = other.x - endpoint.x
+    if factor == 0:
+        return endpoint.y
+    factor = (other.y - endpoint.y) / factor
+    return endpoint.y - factor * dx
+
+@cython.cdivision(True)
+cdef float interpolateLinear(Vector2 *start, Vector2 *end, float frame):
+    cdef float duration = end.x - start.x
+    if duration == 0:
+        return start.y
+    return (end.y - start.y) * (frame - start.x) / duration + start.y
+
+
+# Bezier Segments
+########################################
+
+cdef float interpolateBezier(Vector2 *_v1, Vector2 *_v2, Vector2 *_v3, Vector2 *_v4, float frame):
+    cdef Vector2 v1 = _v1[0], v2 = _v2[0], v3 = _v3[0], v4 = _v4[0]
+    cdef float roots[3]
+
+    if (fabs(v1.y - v4.y) < FLT_EPSILON and
+        fabs(v2.y - v3.y) < FLT_EPSILON and
+        fabs(v3.y - v4.y) < FLT_EPSILON):
+        return v1.y
+
+    correctBezierSegment(&v1, &v2, &v3, &v4)
+    if findBezierParameter(frame, v1.x, v2.x, v3.x, v4.x, roots) == 0:
+        # should not happen after the correction
+        return v1.y
+    return evaluateCubic(v1.y, v2.y, v3.y, v4.y, roots[0])
+
+@cython.cdivision(True)
+cdef void correctBezierSegment(Vector2 *v1, Vector2 *v2, Vector2 *v3, Vector2 *v4):
+    '''Shorten the handles so that the curve does not go back in time.'''
+    cdef float h1x = v1.x - v2.x
+    cdef float h1y = v1.y - v2.y
+    cdef float h2x = v4.x - v3.x
+    cdef float h2y = v4.y - v3.y
+
+    cdef float length = v4.x - v1.x
+    cdef float length1 = fabs(h1x)
+    cdef float length2 = fabs(h2x)
+
+    if length1 + length2 == 0:
+        return
+
+    cdef float factor
+    if length1 + length2 > length:
+        factor = length / (length1 + length2)
+        v2.x = v1.x - factor * h1x
+        v2.y = v1.y - factor * h1y
+        v3.x = v4.x - factor * h2x
+        v3.y = v4.y - factor * h2y
+
+cdef int findBezierParameter(float x, float q0, float q1, float q2, float q3, float *roots):
+    cdef double c0 = q0 - x
+    cdef double c1 = 3.0 * (q1 - q0)
+    cdef double c2 = 3.0 * (q0 - 2.0 * q1 + q2)
+    cdef double c3 = q3 - q0 + 3.0 * (q1 - q2)
+    return solveCubic(c0, c1, c2, c3, roots)
+
+cdef float evaluateCubic(float f1, float f2, float f3, float f4, float t):
+    cdef float c0 = f1
+    cdef float c1 = 3.0 * (f2 - f1)
+    cdef float c2 = 3.0 * (f1 - 2.0 * f2 + f3)
+    cdef float c3 = f4 - f1 + 3.0 * (f2 - f3)
+    return c0 + t * c1 + t * t * c2 + t * t * t * c3
+
+cdef inline bint isValidRoot(float t):
+    return -1.0e-10 <= t <= 1.000001
+
+cdef double cubicRoot(double d):
+    if d > 0: return exp(log(d) / 3)
+    if d < 0: return -exp(log(-d) / 3)
+    return 0
+
+@cython.cdivision(True)
+cdef int solveCubic(double c0, double c1, double c2, double c3, float *o):
+    '''Writes the roots between 0 and 1 into o and returns their amount.'''
+    cdef double a, b, c, p, q, d, t, phi
+    cdef int amount = 0
+
+    if c3 != 0:
+        a = c2 / c3
+        b = c1 / c3
+        c = c0 / c3
+        a = a / 3
+
+        p = b / 3 - a * a
+        q = (2 * a * a * a - a * b + c) / 2
+        d = q * q + p * p * p
+
+        if d > 0:
+            t = sqrt(d)
+            o[0] = <float>(cubicRoot(-q + t) + cubicRoot(-q - t) - a)
+            return 1 if isValidRoot(o[0]) else 0
+
+        if d == 0:
+            t = cubicRoot(-q)
+            o[0] = <float>(2 * t - a)
+            if isValidRoot(o[0]): amount += 1
+            o[amount] = <float>(-t - a)
+            return amount + 1 if isValidRoot(o[amount]) else amount
+
+        phi = acos(-q / sqrt(-(p * p * p)))
+        t = sqrt(-p)
+        p = cos(phi / 3)
+        q = sqrt(3 - 3 * p * p)
+        o[0] = <float>(2 * t * p - a)
+        if isValidRoot(o[0]): amount += 1
+        o[amount] = <float>(-t * (p + q) - a)
+        if isValidRoot(o[amount]): amount += 1
+        o[amount] = <float>(-t * (p - q) - a)
+        return amount + 1 if isValidRoot(o[amount]) else amount
+
+    a = c2
+    b = c1
+    c = c0
+
+    if a != 0:
+        p = b * b - 4 * a * c
+        if p > 0:
+            p = sqrt(p)
+            o[0] = <float>((-b - p) / (2 * a))
+            if isValidRoot(o[0]): amount += 1
+            o[amount] = <float>((-b + p) / (2 * a))
+            return amount + 1 if isValidRoot(o[amount]) else amount
+        if p == 0:
+            o[0] = <float>(-b / (2 * a))
+            return 1 if isValidRoot(o[0]) else 0
+        return 0
+
+    if b != 0:
+        o[0] = <float>(-c / b)
+        return 1 if isValidRoot(o[0]) else 0
+
+    if c == 0:
+        o[0] = 0
+        return 1
+    return 0
+
+
+# Snapshot Cache
+########################################
+
+# Nodes are executed again and again with the same FCurves. The snapshots
+# are cached until the action they belong to changes.
+
+cdef dict snapshotsByFCurve = {}
+
+def getFCurveSnapshot(fCurve):
+    cdef FCurveSnapshot snapshot
+    key = (fCurve.as_pointer(), fCurve.id_data.as_pointer(), fCurve.data_path, fCurve.array_index)
+    snapshot = snapshotsByFCurve.get(key)
+    if snapshot is None or snapshot.isOutdated():
+        snapshot = FCurveSnapshot(fCurve)
+        snapshotsByFCurve[key] = snapshot
+    return snapshot
+
+def invalidateFCurveSnapshots(action = None):
+    if action is None:
+        snapshotsByFCurve.clear()
+        return
+
+    actionPointer = action.as_pointer()
+    for key in [key for key in snapshotsByFCurve if key[1] == actionPointer]:
+        del snapshotsByFCurve[key]
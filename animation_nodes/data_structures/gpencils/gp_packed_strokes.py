@@ -0,0 +1,73 @@
+import textwrap
+from itertools import accumulate
+from .. color import Color
+from .. lists.base_lists import (
+    LongList, FloatList, ColorList, IntegerList, BooleanList, Vector3DList
+)
+
+class PackedGPStrokes:
+    '''
+    The strokes of a frame stored in shared lists.
+    The points of the i-th stroke are in the range
+    pointStarts[i] to pointStarts[i] + pointAmounts[i].
+    '''
+
+    def __init__(self, vertices, strengths, pressures, uvRotations, vertexColors,
+                 pointStarts, pointAmounts, lineWidths, hardnesses, useCyclic,
+                 materialIndices, vertexColorFills, startCapModes, endCapModes,
+                 displayModes):
+        self.vertices = vertices
+        self.strengths = strengths
+        self.pressures = pressures
+        self.uvRotations = uvRotations
+        self.vertexColors = vertexColors
+        self.pointStarts = pointStarts
+        self.pointAmounts = pointAmounts
+        self.lineWidths = lineWidths
+        self.hardnesses = hardnesses
+        self.useCyclic = useCyclic
+        self.materialIndices = materialIndices
+        self.vertexColorFills = vertexColorFills
+        self.startCapModes = startCapModes
+        self.endCapModes = endCapModes
+        self.displayModes = displayModes
+
+    @classmethod
+    def fromStrokes(cls, strokes):
+        '''Strokes without points are ignored. Point attributes that are
+        shorter than the vertices are filled with default values.'''
+        strokes = [stroke for stroke in strokes if len(stroke.vertices) > 0]
+
+        pointAmounts = LongList.fromValues([len(stroke.vertices) for stroke in strokes])
+        pointStarts = LongList.fromValues(list(accumulate(pointAmounts, initial = 0))[:-1])
+
+        return cls(
+            Vector3DList.join(*(stroke.vertices for stroke in strokes)),
+            FloatList.join(*(fitLength(stroke.strengths, stroke, 0.75) for stroke in strokes)),
+            FloatList.join(*(fitLength(stroke.pressures, stroke, 1) for stroke in strokes)),
+            FloatList.join(*(fitLength(stroke.uvRotations, stroke, 0) for stroke in strokes)),
+            ColorList.join(*(fitLength(stroke.vertexColors, stroke, Color((0, 0, 0, 0))) for stroke in strokes)),
+            pointStarts, pointAmounts,
+            IntegerList.fromValues([int(stroke.lineWidth) for stroke in strokes]),
+            FloatList.fromValues([stroke.hardness for stroke in strokes]),
+            BooleanList.fromValues([stroke.useCyclic for stroke in strokes]),
+            IntegerList.fromValues([int(stroke.materialIndex) for stroke in strokes]),
+            ColorList.fromValues([stroke.vertexColorFill for stroke in strokes]),
+            [stroke.startCapMode for stroke in strokes],
+            [stroke.endCapMode for stroke in strokes],
+            [stroke.displayMode for stroke in strokes])
+
+    def __len__(self):
+        return len(self.pointAmounts)
+
+    def __repr__(self):
+        return textwrap.dedent(
+        f"""AN Packed Strokes Object:
+        Strokes: {len(self.pointAmounts)}
+        Points: {len(self.vertices)}""")
+
+def fitLength(values, stroke, default):
+    amount = len(stroke.vertices)
+    if len(values) == amount: return values
+    if len(values) > amount: return values[:amount]
+    return values + type(values).fromValue(default, amount - len(values))
@@ -0,0 +1,26 @@
+from .. math cimport Vector3
+from . lists.base_lists cimport Vector3DList, LongList, CharList
+
+cdef struct KDTreeNeighbour:
+    Py_ssize_t index
+    float distanceSquared
+
+cdef class KDTree:
+    cdef readonly Vector3DList points
+    cdef LongList order
+    cdef CharList axes
+
+    cdef Vector3 *_points
+    cdef long *_order
+    cdef char *_axes
+    cdef Py_ssize_t length
+
+    cdef void build(self, Py_ssize_t start, Py_ssize_t end) nogil
+
+    cdef Py_ssize_t findNearest_LowLevel(self, Vector3 *point, Py_ssize_t amount,
+                                         KDTreeNeighbour *result) nogil
+    cdef Py_ssize_t countInRadius_LowLevel(self, Vector3 *point, float radius) nogil
+    cdef Py_ssize_t findInRadius_LowLevel(self, Vector3 *point, float radius,
+                                          KDTreeNeighbour *result) nogil
+
+    cdef toResultTuple(self, KDTreeNeighbour *neighbour)
@@ -0,0 +1,358 @@
+# setup: options = openmp
+
+from libc.math cimport sqrt
+from cython.parallel cimport prange
+from libc.stdlib cimport malloc, free
+from .. utils.parallel cimport getThreadAmount
+from .. math cimport Vector3, toVector3, toPyVector3, distanceSquaredVec3
+from . lists.base_lists cimport Vector3DList, LongList, CharList, DoubleList
+
+# The tree is stored implicitly in an array of point indices. The node of a
+# range is its center element. Elements before it are not greater and
+# elements after it are not smaller on the split axis of the node.
+# Besides the methods of mathutils.kdtree.KDTree, it has methods that
+# search the neighbours of many points at once and return flat lists.
+
+cdef class KDTree:
+    def __cinit__(self, Vector3DList points not None):
+        cdef Py_ssize_t i
+        self.points = points.copy()
+        self.length = self.points.length
+        self.order = LongList(length = self.length)
+        self.axes = CharList(length = self.length)
+        for i in range(self.length):
+            self.order.data[i] = i
+
+        self._points = self.points.data
+        self._order = self.order.data
+        self._axes = self.axes.data
+        with nogil:
+            self.build(0, self.length)
+
+    def __len__(self):
+        return self.length
+
+    def __repr__(self):
+        return "<KDTree with {} points>".format(self.length)
+
+    cdef void build(self, Py_ssize_t start, Py_ssize_t end) nogil:
+        if end - start <= 0: return
+        cdef Py_ssize_t center = (start + end) // 2
+        cdef char axis = findSplitAxis(self._points, self._order, start, end)
+        selectNth(self._points, self._order, start, end, center, axis)
+        self._axes[center] = axis
+        self.build(start, center)
+        self.build(center + 1, end)
+
+
+    # Low Level Search
+    ###############################################
+
+    cdef Py_ssize_t findNearest_LowLevel(self, Vector3 *point, Py_ssize_t amount,
+                                         KDTreeNeighbour *result) nogil:
+        '''result has to have space for amount elements, it is sorted by distance'''
+        cdef Py_ssize_t found = 0
+        if amount <= 0: return 0
+        searchNearest(self, 0, self.length, point, result, amount, &found)
+        sortHeap(result, found)
+        return found
+
+    cdef Py_ssize_t countInRadius_LowLevel(self, Vector3 *point, float radius) nogil:
+        return countInRadius(self, 0, self.length, point, radius * radius)
+
+    cdef Py_ssize_t findInRadius_LowLevel(self, Vector3 *point, float radius,
+                                          KDTreeNeighbour *result) nogil:
+        '''result has to have space for countInRadius_LowLevel elements, it is sorted by distance'''
+        cdef Py_ssize_t found = 0
+        searchInRadius(self, 0, self.length, point, radius * radius, result, &found)
+        sortNeighbours(result, found)
+        return found
+
+
+    # Compatible with mathutils.kdtree.KDTree
+    ###############################################
+
+    def find(self, co):
+        cdef Vector3 point = toVector3(co)
+        cdef KDTreeNeighbour neighbour
+        if self.findNearest_LowLevel(&point, 1, &neighbour) == 0:
+            return None, None, None
+        return self.toResultTuple(&neighbour)
+
+    def find_n(self, co, Py_ssize_t n):
+        cdef Vector3 point = toVector3(co)
+        n = max(0, min(n, self.length))
+        cdef KDTreeNeighbour *neighbours = <KDTreeNeighbour*>malloc(max(n, 1) * sizeof(KDTreeNeighbour))
+        cdef Py_ssize_t i, amount
+        try:
+            amount = self.findNearest_LowLevel(&point, n, neighbours)
+            return [self.toResultTuple(neighbours + i) for i in range(amount)]
+        finally:
+            free(neighbours)
+
+    def find_range(self, co, float radius):
+        cdef Vector3 point = toVector3(co)
+        cdef Py_ssize_t amount = self.countInRadius_LowLevel(&point, radius)
+        cdef KDTreeNeighbour *neighbours = <KDTreeNeighbour*>malloc(max(amount, 1) * sizeof(KDTreeNeighbour))
+        cdef Py_ssize_t i
+        try:
+            amount = self.findInRadius_LowLevel(&point, radius, neighbours)
+            return [self.toResultTuple(neighbours + i) for i in range(amount)]
+        finally:
+            free(neighbours)
+
+    cdef toResultTuple(self, KDTreeNeighbour *neighbour):
+        return (toPyVector3(self._points + neighbour.index), neighbour.index,
+                sqrt(neighbour.distanceSquared))
+
+
+    # Search for many Points
+    ###############################################
+
+    def findNearestForList(self, Vector3DList points not None, Py_ssize_t amount):
+        '''
+        Returns the indices of the nearest points, their distances and the
+        offsets of the results of every search point (length + 1 elements).
+        '''
+        amount = max(0, min(amount, self.length))
+        cdef Py_ssize_t i, length = points.length
+        cdef LongList offsets = LongList(length = length + 1)
+        for i in range(length + 1):
+            offsets.data[i] = i * amount
+
+        cdef KDTreeNeighbour *neighbours = <KDTreeNeighbour*>malloc(max(length * amount, 1) * sizeof(KDTreeNeighbour))
+        cdef Vector3 *_points = points.data
+        cdef int threads = getThreadAmount(length)
+        try:
+            if threads > 1:
+                for i in prange(length, nogil = True, num_threads = threads):
+                    self.findNearest_LowLevel(_points + i, amount, neighbours + i * amount)
+            else:
+                with nogil:
+                    for i in range(length):
+                        self.findNearest_LowLevel(_points + i, amount, neighbours + i * amount)
+            return splitNeighbours(neighbours, length * amount) + (offsets, )
+        finally:
+            free(neighbours)
+
+    def findInRadiusForList(self, Vector3DList points not None, float radius):
+        '''
+        Returns the indices of the points in the radius, their distances and
+        the offsets of the results of every search point (length + 1 elements).
+        '''
+        cdef Py_ssize_t i, length = points.length
+        cdef Vector3 *_points = points.data
+        cdef int threads = getThreadAmount(length)
+
+        # count first, so that every search point can write into its own part of the result
+        cdef LongList offsets = LongList(length = length + 1)
+        cdef long *_offsets = offsets.data
+        _offsets[0] = 0
+        if threads > 1:
+            for i in prange(length, nogil = True, num_threads = threads):
+                _offsets[i + 1] = self.countInRadius_LowLevel(_points + i, radius)
+        else:
+            for i in range(length):
+                _offsets[i + 1] = self.countInRadius_LowLevel(_points + i, radius)
+        for i in range(length):
+            _offsets[i + 1] += _offsets[i]
+
+        cdef Py_ssize_t total = _offsets[length]
+        cdef KDTreeNeighbour *neighbours = <KDTreeNeighbour*>malloc(max(total, 1) * sizeof(KDTreeNeighbour))
+        try:
+            if threads > 1:
+                for i in prange(length, nogil = True, num_threads = threads):
+                    self.findInRadius_LowLevel(_points + i, radius, neighbours + _offsets[i])
+            else:
+                with nogil:
+                    for i in range(length):
+                        self.findInRadius_LowLevel(_points + i, radius, neighbours + _offsets[i])
+            return splitNeighbours(neighbours, total) + (offsets, )
+        finally:
+            free(neighbours)
+
+cdef tuple splitNeighbours(KDTreeNeighbour *neighbours, Py_ssize_t amount):
+    cdef LongList indices = LongList(length = amount)
+    cdef DoubleList distances = DoubleList(length = amount)
+    cdef Py_ssize_t i
+    for i in range(amount):
+        indices.data[i] = neighbours[i].index
+        distances.data[i] = sqrt(neighbours[i].distanceSquared)
+    return indices, distances
+
+
+# Construction
+###############################################
+
+cdef inline float getCoordinate(Vector3 *v, char axis) nogil:
+    return (<float*>v)[axis]
+
+cdef char findSplitAxis(Vector3 *points, long *order, Py_ssize_t start, Py_ssize_t end) nogil:
+    '''Split on the axis with the largest extent of the points in the range.'''
+    cdef Vector3 low = points[order[start]]
+    cdef Vector3 high = low
+    cdef Vector3 *p
+    cdef Py_ssize_t i
+    for i in range(start + 1, end):
+        p = points + order[i]
+        if p.x < low.x: low.x = p.x
+        if p.x > high.x: high.x = p.x
+        if p.y < low.y: low.y = p.y
+        if p.y > high.y: high.y = p.y
+        if p.z < low.z: low.z = p.z
+        if p.z > high.z: high.z = p.z
+
+    cdef float dx = high.x - low.x
+    cdef float dy = high.y - low.y
+    cdef float dz = high.z - low.z
+    if dx >= dy and dx >= dz: return 0
+    if dy >= dz: return 1
+    return 2
+
+cdef void selectNth(Vector3 *points, long *order, Py_ssize_t start, Py_ssize_t end,
+                    Py_ssize_t nth, char axis) nogil:
+    '''Quickselect, afterwards the nth element is at its sorted position.'''
+    cdef Py_ssize_t left = start
+    cdef Py_ssize_t right = end - 1
+    cdef Py_ssize_t i, j
+    cdef long tmp
+    cdef float pivot
+
+    while right > left:
+        pivot = getCoordinate(points + order[(left + right) // 2], axis)
+        i = left
+        j = right
+        while i <= j:
+            while getCoordinate(points + order[i], axis) < pivot: i += 1
+            while getCoordinate(points + order[j], axis) > pivot: j -= 1
+            if i <= j:
+                tmp = order[i]
+                order[i] = order[j]
+                order[j] = tmp
+                i += 1
+                j -= 1
+        if nth <= j: right = j
+        elif nth >= i: left = i
+        else: break
+
+
+# Search
+###############################################
+
+cdef void searchNearest(KDTree tree, Py_ssize_t start, Py_ssize_t end, Vector3 *point,
+                        KDTreeNeighbour *heap, Py_ssize_t capacity, Py_ssize_t *amount) nogil:
+    if start >= end: return
+    cdef Py_ssize_t center = (start + end) // 2
+    cdef long index = tree._order[center]
+    cdef char axis = tree._axes[center]
+    cdef Vector3 *other = tree._points + index
+
+    pushNeighbour(heap, capacity, amount, index, distanceSquaredVec3(point, other))
+
+    cdef float difference = getCoordinate(point, axis) - getCoordinate(other, axis)
+    if difference < 0:
+        searchNearest(tree, start, center, point, heap, capacity, amount)
+        if amount[0] < capacity or difference * difference < heap[0].distanceSquared:
+            searchNearest(tree, center + 1, end, point, heap, capacity, amount)
+    else:
+        searchNearest(tree, center + 1, end, point, heap, capacity, amount)
+        if amount[0] < capacity or difference * difference < heap[0].distanceSquared:
+            searchNearest(tree, start, center, point, heap, capacity, amount)
+
+cdef Py_ssize_t countInRadius(KDTree tree, Py_ssize_t start, Py_ssize_t end,
+                              Vector3 *point, float radiusSquared) nogil:
+    if start >= end: return 0
+    cdef Py_ssize_t center = (start + end) // 2
+    cdef char axis = tree._axes[center]
+    cdef Vector3 *other = tree._points + tree._order[center]
+    cdef Py_ssize_t amount = 0
+
+    if distanceSquaredVec3(point, other) <= radiusSquared:
+        amount += 1
+
+    cdef float difference = getCoordinate(point, axis) - getCoordinate(other, axis)
+    if difference <= 0 or difference * difference <= radiusSquared:
+        amount += countInRadius(tree, start, center, point, radiusSquared)
+    if difference >= 0 or difference * difference <= radiusSquared:
+        amount += countInRadius(tree, center + 1, end, point, radiusSquared)
+    return amount
+
+cdef void searchInRadius(KDTree tree, Py_ssize_t start, Py_ssize_t end, Vector3 *point,
+                         float radiusSquared, KDTreeNeighbour *result, Py_ssize_t *amount) nogil:
+    if start >= end: return
+    cdef Py_ssize_t center = (start + end) // 2
+    cdef long index = tree._order[center]
+    cdef char axis = tree._axes[center]
+    cdef Vector3 *other = tree._points + index
+    cdef float distanceSquared = distanceSquaredVec3(point, other)
+
+    if distanceSquared <= radiusSquared:
+        result[amount[0]].index = index
+        result[amount[0]].distanceSquared = distanceSquared
+        amount[0] += 1
+
+    cdef float difference = getCoordinate(point, axis) - getCoordinate(other, axis)
+    if difference <= 0 or difference * difference <= radiusSquared:
+        searchInRadius(tree, start, center, point, radiusSquared, result, amount)
+    if difference >= 0 or difference * difference <= radiusSquared:
+        searchInRadius(tree, center + 1, end, point, radiusSquared, result, amount)
+
+
+# Neighbour Heap
+###############################################
+
+# Max-heap on the distance, so that the farthest of the
+# currently found neighbours can be replaced quickly.
+
+cdef void pushNeighbour(KDTreeNeighbour *heap, Py_ssize_t capacity, Py_ssize_t *amount,
+                        Py_ssize_t index, float distanceSquared) nogil:
+    cdef Py_ssize_t position
+    if amount[0] < capacity:
+        position = amount[0]
+        amount[0] += 1
+        heap[position].index = index
+        heap[position].distanceSquared = distanceSquared
+        siftUp(heap, position)
+    elif distanceSquared < heap[0].distanceSquared:
+        heap[0].index = index
+        heap[0].distanceSquared = distanceSquared
+        siftDown(heap, 0, amount[0])
+
+cdef void siftUp(KDTreeNeighbour *heap, Py_ssize_t position) nogil:
+    cdef KDTreeNeighbour element = heap[position]
+    cdef Py_ssize_t parent
+    while position > 0:
+        parent = (position - 1) // 2
+        if heap[parent].distanceSquared >= element.distanceSquared: break
+        heap[position] = heap[parent]
+        position = parent
+    heap[position] = element
+
+cdef void siftDown(KDTreeNeighbour *heap, Py_ssize_t position, Py_ssize_t amount) nogil:
+    cdef KDTreeNeighbour element = heap[position]
+    cdef Py_ssize_t child
+    while True:
+        child = 2 * position + 1
+        if child >= amount: break
+        if child + 1 < amount and heap[child + 1].distanceSquared > heap[child].distanceSquared:
+            child += 1
+        if heap[child].distanceSquared <= element.distanceSquared: break
+        heap[position] = heap[child]
+        position = child
+    heap[position] = element
+
+cdef void sortHeap(KDTreeNeighbour *heap, Py_ssize_t amount) nogil:
+    '''Sorts a max-heap by increasing distance.'''
+    cdef KDTreeNeighbour tmp
+    cdef Py_ssize_t end
+    for end in range(amount - 1, 0, -1):
+        tmp = heap[0]
+        heap[0] = heap[end]
+        heap[end] = tmp
+        siftDown(heap, 0, end)
+
+cdef void sortNeighbours(KDTreeNeighbour *neighbours, Py_ssize_t amount) nogil:
+    cdef Py_ssize_t i
+    for i in range(amount // 2 - 1, -1, -1):
+        siftDown(neighbours, i, amount)
+    sortHeap(neighbours, amount)
@@ -16,6 +16,16 @@ cdef class CList:
     cdef Py_ssize_t getCapacity(self):
         raise NotImplementedError()
 
+    def getMemoryUsage(self):
+        '''Amount of bytes allocated for the elements.'''
+        return self.getCapacity() * self.getElementSize()
+
+    def asBytes(self):
+        return (<char*>self.getPointer())[:self.getLength() * self.getElementSize()]
+
+    def __reduce__(self):
+        return (restoreCList, (type(self), self.asBytes()))
+
     def repeated(self, *, Py_ssize_t length = -1, Py_ssize_t amount = -1, default = None):
         if length < 0 and amount < 0:
             raise ValueError("'length' or 'amount' has to be non-negative")
@@ -99,3 +109,10 @@ cdef class CList:
                    <char*>oldData + (offset - i) * elementSize,
                    elementSize)
         return newList
+
+def restoreCList(cls, bytes data):
+    cdef CList newList = cls()
+    cdef Py_ssize_t length = len(data) // newList.getElementSize()
+    newList = cls(length = length)
+    memcpy(newList.getPointer(), <char*>data, length * newList.getElementSize())
+    return newList
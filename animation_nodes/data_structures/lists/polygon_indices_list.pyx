@@ -101,6 +101,11 @@ cdef class PolygonIndicesList:
         newList.polyLengths.overwrite(self.polyLengths)
         return newList
 
+    def getMemoryUsage(self):
+        return (self.indices.getMemoryUsage() +
+                self.polyStarts.getMemoryUsage() +
+                self.polyLengths.getMemoryUsage())
+
     cpdef index(self, value):
         cdef:
             UIntegerList _value = UIntegerList.fromValues(value)
@@ -317,10 +322,21 @@ cdef class PolygonIndicesList:
             newList.extend(elements)
         return newList
 
+    def __reduce__(self):
+        return (restorePolygonIndicesList, (self.indices, self.polyStarts, self.polyLengths))
+
     def __repr__(self):
         return "<PolygonIndicesList {}>".format(list(self[i] for i in range(self.getLength())))
 
 
+def restorePolygonIndicesList(UIntegerList indices, UIntegerList polyStarts, UIntegerList polyLengths):
+    cdef PolygonIndicesList newList = PolygonIndicesList()
+    newList.indices = indices
+    newList.polyStarts = polyStarts
+    newList.polyLengths = polyLengths
+    return newList
+
+
 cdef class PolygonIndicesListIterator:
     cdef:
         PolygonIndicesList source
@@ -247,6 +247,15 @@ cdef class Mesh:
             for name, value in sourceMeshAttributes.items():
                 meshAttributes[name] = value.copy()
 
+    def getMemoryUsage(self):
+        size = (self.vertices.getMemoryUsage() +
+                self.edges.getMemoryUsage() +
+                self.polygons.getMemoryUsage())
+        for attributes in self.getAttributeDictionaries():
+            for attribute in attributes.values():
+                size += attribute.data.getMemoryUsage()
+        return size
+
     def transform(self, transformation):
         self.vertices.transform(transformation)
         self.verticesTransformed()
@@ -1,38 +1,104 @@
 from typing import List
+from bisect import bisect_right
+from itertools import accumulate
+from operator import attrgetter
 from . midi_note import MIDINote
 from dataclasses import dataclass, field
+from .. lists.base_lists import DoubleList
 
 @dataclass
 class MIDITrack:
     name: str = ""
     index: int = 0
     notes: List[MIDINote] = field(default_factory = list)
+    _noteIndex: "MIDINoteIndex" = field(default = None, init = False, repr = False, compare = False)
 
-    def evaluate(self, time, channel, noteNumber, 
-        attackTime, attackInterpolation, decayTime, decayInterpolation, sustainLevel, 
+    def evaluate(self, time, channel, noteNumber,
+        attackTime, attackInterpolation, decayTime, decayInterpolation, sustainLevel,
         releaseTime, releaseInterpolation, velocitySensitivity):
 
-        noteFilter = lambda note: note.channel == channel and note.noteNumber == noteNumber
-        timeFilter = lambda note: note.timeOff + releaseTime >= time >= note.timeOn
-        filteredNotes = filter(lambda note: noteFilter(note) and timeFilter(note), self.notes)
-        arguments = (time, attackTime, attackInterpolation, decayTime, decayInterpolation, 
+        notes = self.getNoteIndex().getNotesOfNumber(channel, noteNumber)
+        if notes is None: return 0.0
+        arguments = (time, attackTime, attackInterpolation, decayTime, decayInterpolation,
             sustainLevel, releaseTime, releaseInterpolation, velocitySensitivity)
-        return max((note.evaluate(*arguments) for note in filteredNotes), default = 0.0)
+        return max((note.evaluate(*arguments) for note in notes.iterActiveNotes(time, releaseTime)),
+            default = 0.0)
 
-    def evaluateAll(self, time, channel, 
+    def evaluateAll(self, time, channel,
         attackTime, attackInterpolation, decayTime, decayInterpolation, sustainLevel,
         releaseTime, releaseInterpolation, velocitySensitivity):
-        channelFilter = lambda note: note.channel == channel
-        timeFilter = lambda note: note.timeOff + releaseTime >= time >= note.timeOn
-        filteredNotes = list(filter(lambda note: channelFilter(note) and timeFilter(note), self.notes))
-        arguments = (time, attackTime, attackInterpolation, decayTime, decayInterpolation, 
+        noteValues = DoubleList.fromValue(0, 128)
+        notes = self.getNoteIndex().getNotesOfChannel(channel)
+        if notes is None: return noteValues
+
+        arguments = (time, attackTime, attackInterpolation, decayTime, decayInterpolation,
             sustainLevel, releaseTime, releaseInterpolation, velocitySensitivity)
-        noteValues = []
-        for i in range(128):
-            filteredByNumberNotes = filter(lambda note: note.noteNumber == i, filteredNotes)
-            value = max((note.evaluate(*arguments) for note in filteredByNumberNotes), default = 0.0)
-            noteValues.append(value)
+        maxValues = {}
+        for note in notes.iterActiveNotes(time, releaseTime):
+            if not 0 <= note.noteNumber < 128: continue
+            value = note.evaluate(*arguments)
+            if note.noteNumber not in maxValues or value > maxValues[note.noteNumber]:
+                maxValues[note.noteNumber] = value
+
+        for noteNumber, value in maxValues.items():
+            noteValues[noteNumber] = value
         return noteValues
 
+    def getNoteIndex(self):
+        if self._noteIndex is None or not self._noteIndex.isValidFor(self.notes):
+            self._noteIndex = MIDINoteIndex(self.notes)
+        return self._noteIndex
+
+    def invalidateNoteIndex(self):
+        '''Has to be called after notes in the track have been changed.'''
+        self._noteIndex = None
+
     def copy(self):
         return MIDITrack(self.name, self.index, [n.copy() for n in self.notes])
+
+
+# Note Index
+###########################################
+
+# Built once per track and reused until the notes list changes. Notes are
+# grouped by channel and by channel and note number. Within a group they
+# are sorted by their start time.
+
+class MIDINoteIndex:
+    def __init__(self, notes):
+        self.notes = notes
+        self.noteAmount = len(notes)
+
+        notesByChannel = {}
+        notesByNumber = {}
+        for note in notes:
+            notesByChannel.setdefault(note.channel, []).append(note)
+            notesByNumber.setdefault((note.channel, note.noteNumber), []).append(note)
+
+        self.notesByChannel = {key : SortedNotes(group) for key, group in notesByChannel.items()}
+        self.notesByNumber = {key : SortedNotes(group) for key, group in notesByNumber.items()}
+
+    def isValidFor(self, notes):
+        return self.notes is notes and self.noteAmount == len(notes)
+
+    def getNotesOfChannel(self, channel):
+        return self.notesByChannel.get(channel)
+
+    def getNotesOfNumber(self, channel, noteNumber):
+        return self.notesByNumber.get((channel, noteNumber))
+
+class SortedNotes:
+    def __init__(self, notes):
+        self.notes = sorted(notes, key = attrgetter("timeOn"))
+        self.timeOns = [note.timeOn for note in self.notes]
+        # the largest end time of all notes up to an index, it never decreases,
+        # so the search can stop at the first index where it is too small
+        self.maxTimeOffs = list(accumulate((note.timeOff for note in self.notes), max))
+
+    def iterActiveNotes(self, time, releaseTime):
+        '''Notes with timeOn <= time <= timeOff + releaseTime.'''
+        for i in range(bisect_right(self.timeOns, time) - 1, -1, -1):
+            if self.maxTimeOffs[i] + releaseTime < time: break
+            note = self.notes[i]
+            if note.timeOff + releaseTime >= time:
+                yield note
@@ -0,0 +1,91 @@
+import random
+from unittest import TestCase
+from . midi_note import MIDINote
+from . midi_track import MIDITrack
+from ... algorithms.interpolations import Linear, PowerIn, PowerOut
+
+# The note index has to give the same results as the filter based
+# implementation it replaced, which checked every note of the track.
+
+def filterEvaluate(notes, time, channel, noteNumber, arguments):
+    attackTime, attackInterpolation, decayTime, decayInterpolation, sustainLevel, \
+        releaseTime, releaseInterpolation, velocitySensitivity = arguments
+    noteFilter = lambda note: note.channel == channel and note.noteNumber == noteNumber
+    timeFilter = lambda note: note.timeOff + releaseTime >= time >= note.timeOn
+    filteredNotes = filter(lambda note: noteFilter(note) and timeFilter(note), notes)
+    return max((note.evaluate(time, *arguments) for note in filteredNotes), default = 0.0)
+
+def filterEvaluateAll(notes, time, channel, arguments):
+    releaseTime = arguments[5]
+    channelFilter = lambda note: note.channel == channel
+    timeFilter = lambda note: note.timeOff + releaseTime >= time >= note.timeOn
+    filteredNotes = list(filter(lambda note: channelFilter(note) and timeFilter(note), notes))
+    noteValues = []
+    for i in range(128):
+        filteredByNumberNotes = filter(lambda note: note.noteNumber == i, filteredNotes)
+        value = max((note.evaluate(time, *arguments) for note in filteredByNumberNotes), default = 0.0)
+        noteValues.append(value)
+    return noteValues
+
+def randomNotes(amount, seed = 0):
+    rng = random.Random(seed)
+    notes = []
+    for _ in range(amount):
+        timeOn = rng.uniform(0, 20)
+        # few note numbers so that notes overlap, some outside of 0 - 127
+        noteNumber = rng.choice((-3, 0, 1, 60, 61, 127, 128, 200))
+        notes.append(MIDINote(rng.randint(0, 2), noteNumber,
+            timeOn, timeOn + rng.uniform(0, 3), rng.uniform(0, 1)))
+    return notes, rng
+
+def getArguments(releaseTime):
+    return (0.2, Linear(), 0.5, PowerOut(2), 0.6, releaseTime, PowerIn(3), 0.4)
+
+class TestCompareWithFilter(TestCase):
+    def setUp(self):
+        self.notes, self.rng = randomNotes(300)
+        self.track = MIDITrack(notes = self.notes)
+
+    def randomTimes(self, amount):
+        # include note starts and ends where the time filters are inclusive
+        times = [self.rng.uniform(-1, 25) for _ in range(amount)]
+        times += [note.timeOn for note in self.notes[:20]]
+        times += [note.timeOff for note in self.notes[:20]]
+        return times
+
+    def testEvaluate(self):
+        for releaseTime in (0.01, 0.5, 4):
+            arguments = getArguments(releaseTime)
+            for time in self.randomTimes(100):
+                for channel in (0, 1, 2, 3):
+                    for noteNumber in (-3, 0, 60, 61, 127, 128, 200, 5):
+                        self.assertEqual(
+                            self.track.evaluate(time, channel, noteNumber, *arguments),
+                            filterEvaluate(self.notes, time, channel, noteNumber, arguments))
+
+    def testEvaluateAll(self):
+        for releaseTime in (0.01, 0.5, 4):
+            arguments = getArguments(releaseTime)
+            for time in self.randomTimes(50):
+                for channel in (0, 1, 2, 3):
+                    self.assertEqual(
+                        list(self.track.evaluateAll(time, channel, *arguments)),
+                        filterEvaluateAll(self.notes, time, channel, arguments))
+
+    def testReleaseTails(self):
+        # times right after the end of notes, only the release tail is active
+        arguments = getArguments(2)
+        activeAmount = 0
+        for note in self.notes[:50]:
+            time = note.timeOff + 1
+            expected = filterEvaluate(self.notes, time, note.channel, note.noteNumber, arguments)
+            self.assertEqual(self.track.evaluate(time, note.channel, note.noteNumber, *arguments), expected)
+            activeAmount += expected > 0
+        self.assertGreater(activeAmount, 0)
+
+    def testChangedNotes(self):
+        arguments = getArguments(0.5)
+        self.track.evaluate(5, 0, 60, *arguments)
+        self.notes.append(MIDINote(0, 60, 4.5, 6, 1))
+        self.assertEqual(self.track.evaluate(5, 0, 60, *arguments),
+                         filterEvaluate(self.notes, 5, 0, 60, arguments))
@@ -0,0 +1,118 @@
+import os
+import time
+import numpy
+import hashlib
+import tempfile
+
+# Decoding and resampling a sound file is slow and the decoded samples of
+# long files need a lot of memory. So the samples are decoded once in
+# chunks into a float32 cache file. The file is memory mapped, so that
+# only the parts of the sound that are actually used are loaded.
+# The files are shared between Blender sessions. When they need more than
+# maxCacheSize bytes, the least recently used files are removed.
+
+chunkDuration = 30
+cacheFormatVersion = 1
+maxCacheSize = 2 * 1024 ** 3
+temporaryFileLifetime = 24 * 60 * 60
+
+def getCacheDirectory():
+    return os.path.join(tempfile.gettempdir(), "animation_nodes_sound_cache")
+
+def getCacheKeyFromPath(path, sampleRate):
+    stat = os.stat(path)
+    return getCacheKey(os.path.abspath(path), stat.st_mtime_ns, stat.st_size, sampleRate)
+
+def getCacheKeyFromPackedFile(packedFile, sampleRate):
+    return getCacheKey(hashlib.sha1(packedFile.data).hexdigest(), packedFile.size, sampleRate)
+
+def getCacheKey(*parts):
+    data = repr((cacheFormatVersion, ) + parts).encode()
+    return hashlib.sha1(data).hexdigest()
+
+def loadSamples(key, sound, sampleRate):
+    '''
+    Returns a read-only memory mapped float32 array with the mono samples
+    of the sound. The aud sound is only decoded when there is no cache file yet.
+    '''
+    path = os.path.join(getCacheDirectory(), key + ".f32")
+    if os.path.isfile(path):
+        markAsUsed(path)
+    else:
+        try:
+            writeCacheFile(path, sound, sampleRate)
+        except OSError:
+            return decodeSamples(sound, sampleRate)
+        limitCacheSize()
+
+    if os.path.getsize(path) == 0:
+        return numpy.zeros(0, dtype = numpy.float32)
+    return numpy.memmap(path, dtype = numpy.float32, mode = "r")
+
+def writeCacheFile(path, sound, sampleRate):
+    os.makedirs(os.path.dirname(path), exist_ok = True)
+    sound = prepareSound(sound, sampleRate)
+
+    # write into a temporary file first, so that no incomplete cache file can exist
+    temporaryPath = "{}.{}.tmp".format(path, os.getpid())
+    try:
+        with open(temporaryPath, "wb") as f:
+            for chunk in iterDecodedChunks(sound, sampleRate):
+                f.write(chunk.tobytes())
+        os.replace(temporaryPath, path)
+    finally:
+        if os.path.exists(temporaryPath):
+            os.remove(temporaryPath)
+
+def iterDecodedChunks(sound, sampleRate):
+    # a chunk can be shorter than the duration before the end of the sound
+    # is reached (e.g. after resampling), so only an empty chunk ends the loop
+    start = 0
+    while True:
+        chunk = sound.limit(start, start + chunkDuration).data().ravel().astype(numpy.float32, copy = False)
+        if len(chunk) == 0:
+            break
+        yield chunk
+        start += chunkDuration
+
+def markAsUsed(path):
+    try: os.utime(path)
+    except OSError: pass
+
+def limitCacheSize():
+    directory = getCacheDirectory()
+    try: names = os.listdir(directory)
+    except OSError: return
+
+    files = []
+    now = time.time()
+    for name in names:
+        path = os.path.join(directory, name)
+        try: stat = os.stat(path)
+        except OSError: continue
+        if name.endswith(".f32"):
+            files.append((stat.st_mtime, stat.st_size, path))
+        elif name.endswith(".tmp") and now - stat.st_mtime > temporaryFileLifetime:
+            # left behind by a Blender session that has been terminated while decoding
+            removeFile(path)
+
+    totalSize = sum(size for _, size, _ in files)
+    for _, size, path in sorted(files):
+        if totalSize <= maxCacheSize: break
+        # files that are still memory mapped can't be removed on Windows
+        if removeFile(path):
+            totalSize -= size
+
+def removeFile(path):
+    try: os.remove(path)
+    except OSError: return False
+    return True
+
+def decodeSamples(sound, sampleRate):
+    return prepareSound(sound, sampleRate).data().ravel().astype(numpy.float32, copy = False)
+
+def prepareSound(sound, sampleRate):
+    sound = sound.rechannel(1)
+    if sound.specs[0] != sampleRate:
+        sound = sound.resample(sampleRate, True)
+    return sound
@@ -7,10 +7,18 @@ class Sound:
     def __init__(self, soundSequences):
         self.soundSequences = soundSequences
 
-    def getSamplesInRange(self, start, end):
+    def getSamplesInRange(self, start, end, out = None):
+        '''
+        When an output array is given, its first part is used
+        to store the samples instead of allocating a new array.
+        '''
         if end <= start: raise ValueError("Invaild range!")
         start, end = int(start * sampleRate), int(end * sampleRate)
-        samples = numpy.zeros(end - start + 1)
+        if out is None:
+            samples = numpy.zeros(end - start + 1)
+        else:
+            samples = out[:end - start + 1]
+            samples.fill(0)
 
         for sequence in self.soundSequences:
             sequenceStart = int(sequence.start * sampleRate)
@@ -20,14 +28,16 @@ class Sound:
             sequenceStartOffset = int(sequence.startOffset * sampleRate)
             i, j = max(start, sequenceStart), min(end, sequenceEnd)
             chunk = sequence.data.samples[i - sequenceStart + sequenceStartOffset:
-                                          j - sequenceStart + sequenceStartOffset] * sequence.volume
-            samples[i - start:i - start + len(chunk)] += chunk
+                                          j - sequenceStart + sequenceStartOffset]
+            target = samples[i - start:i - start + len(chunk)]
+            target += chunk * sequence.volume
         return samples
 
     def computeSpectrum(self, start, end, beta = 6):
-        samples = self.getSamplesInRange(start, end)
-        chunk = numpy.zeros(2**ceil(log(len(samples), 2)))
-        chunk[:len(samples)] = samples * getCachedKaiser(len(samples), beta)
+        samples = self.getSamplesInRange(start, end, out = getBuffer("samples", getSampleAmount(start, end)))
+        chunk = getBuffer("chunk", 2**ceil(log(len(samples), 2)))
+        numpy.multiply(samples, getCachedKaiser(len(samples), beta), out = chunk[:len(samples)])
+        chunk[len(samples):] = 0
         return numpy.abs(numpy.fft.rfft(chunk)) / len(samples) * 2
 
     def computeTimeSmoothedSpectrum(self, start, end, attack, release, smoothingSamples = 5, beta = 6):
@@ -41,6 +51,19 @@ class Sound:
                 FFT = FFT * factor + newFFT * (1 - factor)
         return FFT
 
+def getSampleAmount(start, end):
+    return int(end * sampleRate) - int(start * sampleRate) + 1
+
 @lru_cache(maxsize = 16)
 def getCachedKaiser(length, beta):
     return numpy.kaiser(length, beta)
+
+# Temporary arrays that are reused between spectrum computations.
+_buffers = {}
+
+def getBuffer(name, length):
+    buffer = _buffers.get(name)
+    if buffer is None or len(buffer) < length:
+        buffer = numpy.empty(length)
+        _buffers[name] = buffer
+    return buffer[:length]
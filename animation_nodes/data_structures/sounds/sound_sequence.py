@@ -3,7 +3,14 @@ import bpy
 import aud
 from functools import lru_cache
 from . sound_data import SoundData
+from . sample_cache import (
+    loadSamples,
+    limitCacheSize,
+    getCacheKeyFromPath,
+    getCacheKeyFromPackedFile
+)
 from ... utils.scene import getFPS
+from ... utils.handlers import eventHandler
 from ... utils.depsgraph import getEvaluatedID
 
 # We define a constant sampleRate to avoid expensive resampling during execution.
@@ -33,19 +40,25 @@ class SoundSequence:
         return cls(soundData, sequence.frame_final_start / fps, sequence.frame_offset_start / fps,
             sequence.frame_final_end / fps, sequence.volume, fps)
 
-@lru_cache(maxsize=16)
 def getCachedSoundDataFromPath(path):
-    return getSoundData(aud.Sound.file(path))
+    # the key contains the modification time, so changed files are loaded again
+    return getCachedSoundDataFromKey(getCacheKeyFromPath(path, sampleRate), path)
+
+@lru_cache(maxsize=16)
+def getCachedSoundDataFromKey(key, path):
+    return SoundData(loadSamples(key, aud.Sound.file(path), sampleRate), sampleRate)
 
 @lru_cache(maxsize=16)
 def getCachedSoundDataFromSound(sound):
-    return getSoundData(getEvaluatedID(sound).factory)
+    key = getCacheKeyFromPackedFile(sound.packed_file, sampleRate)
+    return SoundData(loadSamples(key, getEvaluatedID(sound).factory, sampleRate), sampleRate)
 
-def getSoundData(sound):
-    if sound.specs[0] == sampleRate:
-        return SoundData(sound.rechannel(1).data().ravel(), sampleRate)
-    else:
-        return SoundData(sound.rechannel(1).resample(sampleRate, True).data().ravel(), sampleRate)
+@eventHandler("FILE_LOAD_POST")
+def clearSoundDataCache():
+    # release the memory mapped cache files of the previous file
+    getCachedSoundDataFromKey.cache_clear()
+    getCachedSoundDataFromSound.cache_clear()
+    limitCacheSize()
 
 def findSceneWithSequence(sequence):
     for scene in bpy.data.scenes:
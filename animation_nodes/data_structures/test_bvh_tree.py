@@ -0,0 +1,181 @@
+import random
+from math import sqrt, inf
+from unittest import TestCase
+from . bvh_tree import BVHTree
+from . lists.base_lists import Vector3DList
+from . lists.polygon_indices_list import PolygonIndicesList
+
+# The queries are compared with brute force implementations that test every triangle.
+
+def sub(a, b): return (a[0] - b[0], a[1] - b[1], a[2] - b[2])
+def add(a, b): return (a[0] + b[0], a[1] + b[1], a[2] + b[2])
+def scale(a, f): return (a[0] * f, a[1] * f, a[2] * f)
+def dot(a, b): return a[0] * b[0] + a[1] * b[1] + a[2] * b[2]
+def cross(a, b): return (a[1] * b[2] - a[2] * b[1], a[2] * b[0] - a[0] * b[2], a[0] * b[1] - a[1] * b[0])
+def length(a): return sqrt(dot(a, a))
+def normalized(a): return scale(a, 1 / length(a))
+
+def rayTriangleDistance(start, direction, a, b, c):
+    '''Möller–Trumbore intersection, returns None when the triangle is missed.'''
+    edge1, edge2 = sub(b, a), sub(c, a)
+    p = cross(direction, edge2)
+    determinant = dot(edge1, p)
+    if abs(determinant) < 1e-12: return None
+    t = sub(start, a)
+    u = dot(t, p) / determinant
+    if u < 0 or u > 1: return None
+    q = cross(t, edge1)
+    v = dot(direction, q) / determinant
+    if v < 0 or u + v > 1: return None
+    distance = dot(edge2, q) / determinant
+    return distance if distance >= 0 else None
+
+def closestPointOnTriangle(p, a, b, c):
+    '''From Real-Time Collision Detection by Christer Ericson.'''
+    ab, ac, ap = sub(b, a), sub(c, a), sub(p, a)
+    d1, d2 = dot(ab, ap), dot(ac, ap)
+    if d1 <= 0 and d2 <= 0: return a
+    bp = sub(p, b)
+    d3, d4 = dot(ab, bp), dot(ac, bp)
+    if d3 >= 0 and d4 <= d3: return b
+    vc = d1 * d4 - d3 * d2
+    if vc <= 0 and d1 >= 0 and d3 <= 0: return add(a, scale(ab, d1 / (d1 - d3)))
+    cp = sub(p, c)
+    d5, d6 = dot(ab, cp), dot(ac, cp)
+    if d6 >= 0 and d5 <= d6: return c
+    vb = d5 * d2 - d1 * d6
+    if vb <= 0 and d2 >= 0 and d6 <= 0: return add(a, scale(ac, d2 / (d2 - d6)))
+    va = d3 * d6 - d5 * d4
+    if va <= 0 and d4 - d3 >= 0 and d5 - d6 >= 0:
+        return add(b, scale(sub(c, b), (d4 - d3) / ((d4 - d3) + (d5 - d6))))
+    denominator = 1 / (va + vb + vc)
+    return add(a, add(scale(ab, vb * denominator), scale(ac, vc * denominator)))
+
+def bruteForceRayCast(triangles, start, direction, maxDistance = inf):
+    direction = normalized(direction)
+    hits = [(rayTriangleDistance(start, direction, *triangle), index)
+            for index, triangle in enumerate(triangles)]
+    hits = [(distance, index) for distance, index in hits
+            if distance is not None and distance <= maxDistance]
+    return min(hits, default = (None, None))
+
+def bruteForceNearest(triangles, point):
+    return min((length(sub(closestPointOnTriangle(point, *triangle), point)), index)
+               for index, triangle in enumerate(triangles))
+
+def randomTriangles(amount, seed = 0):
+    rng = random.Random(seed)
+    vertices = [(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5)) for _ in range(3 * amount)]
+    polygons = [(3 * i, 3 * i + 1, 3 * i + 2) for i in range(amount)]
+    tree = BVHTree(Vector3DList.fromValues(vertices), PolygonIndicesList.fromValues(polygons))
+    # use the single precision locations that are stored in the tree
+    vertices = tree.vertices.asNumpyArray().reshape(-1, 3).tolist()
+    triangles = [tuple(vertices[i] for i in polygon) for polygon in polygons]
+    return tree, triangles, rng
+
+def randomVector(rng, size):
+    return (rng.uniform(-size, size), rng.uniform(-size, size), rng.uniform(-size, size))
+
+class TestCompareWithBruteForce(TestCase):
+    def setUp(self):
+        self.tree, self.triangles, self.rng = randomTriangles(200)
+
+    def testRayCast(self):
+        hitAmount = 0
+        for _ in range(200):
+            start, direction = randomVector(self.rng, 8), randomVector(self.rng, 1)
+            location, normal, index, distance = self.tree.ray_cast(start, direction)
+            expectedDistance, expectedIndex = bruteForceRayCast(self.triangles, start, direction)
+            self.assertEqual(index, expectedIndex)
+            if expectedIndex is not None:
+                self.assertAlmostEqual(distance, expectedDistance, places = 4)
+                hitAmount += 1
+        self.assertGreater(hitAmount, 0)
+
+    def testRayCastMaxDistance(self):
+        for _ in range(100):
+            start, direction = randomVector(self.rng, 8), randomVector(self.rng, 1)
+            index = self.tree.ray_cast(start, direction, 2)[2]
+            self.assertEqual(index, bruteForceRayCast(self.triangles, start, direction, 2)[1])
+
+    def testFindNearest(self):
+        for _ in range(200):
+            point = randomVector(self.rng, 8)
+            location, normal, index, distance = self.tree.find_nearest(point)
+            expectedDistance, expectedIndex = bruteForceNearest(self.triangles, point)
+            self.assertAlmostEqual(distance, expectedDistance, places = 4)
+            self.assertEqual(index, expectedIndex)
+
+    def testFindNearestRange(self):
+        for _ in range(50):
+            point = randomVector(self.rng, 6)
+            indices = {index for _, _, index, _ in self.tree.find_nearest_range(point, 1.5)}
+            expected = {index for index, triangle in enumerate(self.triangles)
+                        if length(sub(closestPointOnTriangle(point, *triangle), point)) <= 1.5}
+            self.assertEqual(indices, expected)
+
+    def testRayCastList(self):
+        starts = [randomVector(self.rng, 8) for _ in range(100)]
+        directions = [randomVector(self.rng, 1) for _ in range(100)]
+        locations, normals, distances, indices, hitStates = self.tree.rayCastList(
+            Vector3DList.fromValues(starts), Vector3DList.fromValues(directions))
+        for i, (start, direction) in enumerate(zip(starts, directions)):
+            expectedDistance, expectedIndex = bruteForceRayCast(self.triangles, start, direction)
+            self.assertEqual(indices[i], -1 if expectedIndex is None else expectedIndex)
+            self.assertEqual(hitStates[i], expectedIndex is not None)
+            if expectedIndex is not None:
+                self.assertAlmostEqual(distances[i], expectedDistance, places = 4)
+
+    def testFindNearestList(self):
+        points = [randomVector(self.rng, 8) for _ in range(100)]
+        locations, normals, distances, indices, hitStates = self.tree.findNearestList(
+            Vector3DList.fromValues(points))
+        for i, point in enumerate(points):
+            expectedDistance, expectedIndex = bruteForceNearest(self.triangles, point)
+            self.assertEqual(indices[i], expectedIndex)
+            self.assertAlmostEqual(distances[i], expectedDistance, places = 4)
+
+class TestPolygons(TestCase):
+    def setUp(self):
+        # a unit cube with quads, the normals point outwards
+        vertices = [(x, y, z) for x in (0, 1) for y in (0, 1) for z in (0, 1)]
+        polygons = [(0, 1, 3, 2), (4, 6, 7, 5), (0, 4, 5, 1),
+                    (2, 3, 7, 6), (0, 2, 6, 4), (1, 5, 7, 3)]
+        self.tree = BVHTree(Vector3DList.fromValues(vertices), PolygonIndicesList.fromValues(polygons))
+
+    def testRayCastHitsQuad(self):
+        location, normal, index, distance = self.tree.ray_cast((0.9, 0.2, 5), (0, 0, -1))
+        self.assertEqual(index, 5)
+        self.assertAlmostEqual(distance, 4)
+
+    def testFindNearestOnQuad(self):
+        location, normal, index, distance = self.tree.find_nearest((-2, 0.9, 0.1))
+        self.assertEqual(index, 0)
+        self.assertAlmostEqual(distance, 2)
+
+    def testInsideVolume(self):
+        self.assertTrue(self.tree.isInsideVolume((0.5, 0.5, 0.5)))
+        self.assertFalse(self.tree.isInsideVolume((1.5, 0.5, 0.5)))
+
+class TestEmptyTree(TestCase):
+    def setUp(self):
+        self.tree = BVHTree(Vector3DList(), PolygonIndicesList())
+
+    def testRayCast(self):
+        self.assertEqual(self.tree.ray_cast((0, 0, 0), (0, 0, 1)), (None, None, None, None))
+
+    def testFindNearest(self):
+        self.assertEqual(self.tree.find_nearest((0, 0, 0)), (None, None, None, None))
+        self.assertEqual(self.tree.find_nearest_range((0, 0, 0)), [])
+
+    def testInsideVolume(self):
+        self.assertFalse(self.tree.isInsideVolume((0, 0, 0)))
+
+    def testQueryLists(self):
+        points = Vector3DList.fromValues([(0, 0, 0), (1, 1, 1)])
+        indices, hitStates = self.tree.rayCastList(points, points)[3:]
+        self.assertEqual(indices, (-1, -1))
+        self.assertEqual(hitStates, (False, False))
+        indices, hitStates = self.tree.findNearestList(points)[3:]
+        self.assertEqual(indices, (-1, -1))
+        self.assertEqual(hitStates, (False, False))
@@ -0,0 +1,85 @@
+import bpy
+from unittest import TestCase
+from . fcurve_snapshot import FCurveSnapshot
+
+# The snapshots have to give the same results as fCurve.evaluate,
+# so they are compared with Blender for all evaluated segment types.
+
+class FCurveSnapshotTestCase(TestCase):
+    def setUp(self):
+        self.action = bpy.data.actions.new("AN Test")
+
+    def tearDown(self):
+        bpy.data.actions.remove(self.action)
+
+    def newFCurve(self, keyframes, interpolation, extrapolation = "CONSTANT"):
+        fCurve = self.action.fcurves.new("location", index = len(self.action.fcurves))
+        for frame, value in keyframes:
+            fCurve.keyframe_points.insert(frame, value)
+        for point in fCurve.keyframe_points:
+            point.interpolation = interpolation
+        fCurve.extrapolation = extrapolation
+        fCurve.update()
+        return fCurve
+
+    def assertEqualsBlender(self, fCurve, start = -5, end = 35, steps = 400):
+        snapshot = FCurveSnapshot(fCurve)
+        for i in range(steps + 1):
+            frame = start + (end - start) * i / steps
+            self.assertAlmostEqual(snapshot(frame), fCurve.evaluate(frame), places = 4,
+                msg = "Frame {}".format(frame))
+
+keyframes = [(1, 0), (7, 3.5), (10, -2), (21, 1.25), (30, 4)]
+
+class TestSegments(FCurveSnapshotTestCase):
+    def testBezier(self):
+        self.assertEqualsBlender(self.newFCurve(keyframes, "BEZIER"))
+
+    def testLinear(self):
+        self.assertEqualsBlender(self.newFCurve(keyframes, "LINEAR"))
+
+    def testConstant(self):
+        self.assertEqualsBlender(self.newFCurve(keyframes, "CONSTANT"))
+
+    def testMovedHandles(self):
+        fCurve = self.newFCurve(keyframes, "BEZIER")
+        point = fCurve.keyframe_points[2]
+        point.handle_left_type = point.handle_right_type = "FREE"
+        point.handle_left = (4, 10)
+        point.handle_right = (18, -8)
+        fCurve.update()
+        self.assertEqualsBlender(fCurve)
+
+    def testSingleKeyframe(self):
+        self.assertEqualsBlender(self.newFCurve([(5, 2)], "BEZIER", "LINEAR"))
+
+class TestExtrapolation(FCurveSnapshotTestCase):
+    def testBezier(self):
+        self.assertEqualsBlender(self.newFCurve(keyframes, "BEZIER", "LINEAR"))
+
+    def testLinear(self):
+        self.assertEqualsBlender(self.newFCurve(keyframes, "LINEAR", "LINEAR"))
+
+    def testConstant(self):
+        self.assertEqualsBlender(self.newFCurve(keyframes, "CONSTANT", "LINEAR"))
+
+class TestIntegerProperty(TestCase):
+    def setUp(self):
+        self.object = bpy.data.objects.new("AN Test", None)
+        for frame, value in [(1, 0), (11, 7), (20, 2)]:
+            self.object.pass_index = value
+            self.object.keyframe_insert("pass_index", frame = frame)
+        self.fCurve = self.object.animation_data.action.fcurves[0]
+
+    def tearDown(self):
+        action = self.object.animation_data.action
+        bpy.data.objects.remove(self.object)
+        bpy.data.actions.remove(action)
+
+    def testRounded(self):
+        for point in self.fCurve.keyframe_points:
+            point.interpolation = "LINEAR"
+        snapshot = FCurveSnapshot(self.fCurve)
+        for frame in range(-3, 25):
+            # frames where the value is not close to x.5, which could be rounded both ways
+            self.assertEqual(snapshot(frame + 0.4), self.fCurve.evaluate(frame + 0.4))
@@ -0,0 +1,119 @@
+import random
+from math import dist
+from unittest import TestCase
+from . kd_tree import KDTree
+from . lists.base_lists import Vector3DList
+
+def randomPoints(amount, seed = 0):
+    rng = random.Random(seed)
+    return Vector3DList.fromValues([(rng.uniform(-5, 5), rng.uniform(-5, 5), rng.uniform(-5, 5))
+                                    for _ in range(amount)])
+
+def toTuples(points):
+    return points.asNumpyArray().reshape(-1, 3).tolist()
+
+def bruteForceDistances(points, co):
+    return sorted((dist(point, co), index) for index, point in enumerate(toTuples(points)))
+
+class TestEmptyTree(TestCase):
+    def setUp(self):
+        self.tree = KDTree(Vector3DList())
+
+    def testLength(self):
+        self.assertEqual(len(self.tree), 0)
+
+    def testFind(self):
+        self.assertEqual(self.tree.find((0, 0, 0)), (None, None, None))
+
+    def testFindN(self):
+        self.assertEqual(self.tree.find_n((0, 0, 0), 5), [])
+
+    def testFindRange(self):
+        self.assertEqual(self.tree.find_range((0, 0, 0), 10), [])
+
+    def testSearchForList(self):
+        indices, distances, offsets = self.tree.findNearestForList(randomPoints(3), 2)
+        self.assertEqual(len(indices), 0)
+        self.assertEqual(offsets, (0, 0, 0, 0))
+
+        indices, distances, offsets = self.tree.findInRadiusForList(randomPoints(3), 2)
+        self.assertEqual(len(indices), 0)
+        self.assertEqual(offsets, (0, 0, 0, 0))
+
+class TestCompareWithBruteForce(TestCase):
+    def setUp(self):
+        self.points = randomPoints(500)
+        self.tree = KDTree(self.points)
+        self.searchPoints = toTuples(randomPoints(50, seed = 1))
+
+    def testFind(self):
+        for co in self.searchPoints:
+            location, index, distance = self.tree.find(co)
+            expectedDistance, expectedIndex = bruteForceDistances(self.points, co)[0]
+            self.assertEqual(index, expectedIndex)
+            self.assertAlmostEqual(distance, expectedDistance, places = 5)
+
+    def testFindN(self):
+        for co in self.searchPoints:
+            result = self.tree.find_n(co, 10)
+            expected = bruteForceDistances(self.points, co)[:10]
+            self.assertEqual([index for _, index, _ in result], [index for _, index in expected])
+
+    def testFindRange(self):
+        for co in self.searchPoints:
+            result = self.tree.find_range(co, 2)
+            expected = [(d, index) for d, index in bruteForceDistances(self.points, co) if d <= 2]
+            self.assertEqual([index for _, index, _ in result], [index for _, index in expected])
+
+    def testFindNearestForList(self):
+        indices, distances, offsets = self.tree.findNearestForList(
+            Vector3DList.fromValues(self.searchPoints), 4)
+        self.assertEqual(len(offsets), len(self.searchPoints) + 1)
+        for i, co in enumerate(self.searchPoints):
+            expected = [index for _, index in bruteForceDistances(self.points, co)[:4]]
+            self.assertEqual(list(indices[offsets[i]:offsets[i + 1]]), expected)
+
+    def testFindInRadiusForList(self):
+        indices, distances, offsets = self.tree.findInRadiusForList(
+            Vector3DList.fromValues(self.searchPoints), 1.5)
+        for i, co in enumerate(self.searchPoints):
+            expected = [index for d, index in bruteForceDistances(self.points, co) if d <= 1.5]
+            self.assertEqual(sorted(indices[offsets[i]:offsets[i + 1]]), sorted(expected))
+
+class TestDuplicatePoints(TestCase):
+    def setUp(self):
+        self.tree = KDTree(Vector3DList.fromValues([(1, 2, 3)] * 20 + [(5, 5, 5)] * 3))
+
+    def testFindN(self):
+        result = self.tree.find_n((1, 2, 3), 25)
+        self.assertEqual(len(result), 23)
+        self.assertEqual(sorted(index for _, index, _ in result[:20]), list(range(20)))
+        self.assertEqual(sorted(index for _, index, _ in result[20:]), [20, 21, 22])
+        self.assertTrue(all(distance == 0 for _, _, distance in result[:20]))
+
+    def testFindRange(self):
+        result = self.tree.find_range((1, 2, 3), 0)
+        self.assertEqual(sorted(index for _, index, _ in result), list(range(20)))
+
+class TestAmountLimits(TestCase):
+    def setUp(self):
+        self.points = randomPoints(7)
+        self.tree = KDTree(self.points)
+
+    def testMoreThanPoints(self):
+        result = self.tree.find_n((0, 0, 0), 100)
+        expected = bruteForceDistances(self.points, (0, 0, 0))
+        self.assertEqual([index for _, index, _ in result], [index for _, index in expected])
+
+    def testZeroOrNegative(self):
+        self.assertEqual(self.tree.find_n((0, 0, 0), 0), [])
+        self.assertEqual(self.tree.find_n((0, 0, 0), -3), [])
+
+    def testMoreThanPointsForList(self):
+        indices, distances, offsets = self.tree.findNearestForList(Vector3DList.fromValues([(0, 0, 0)] * 2), 100)
+        self.assertEqual(offsets, (0, 7, 14))
+        self.assertEqual(sorted(indices[:7]), list(range(7)))
+
+    def testPointsAreCopied(self):
+        self.points.fill((100, 100, 100))
+        self.assertNotEqual(self.tree.find((100, 100, 100))[2], 0)
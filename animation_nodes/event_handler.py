@@ -1,6 +1,8 @@
 import bpy
 import itertools
 from . import problems
+from . import tree_info
+from . preferences import usePersistentExecutionUnits
 from . update import updateEverything
 from . utils.recursion import noRecursion
 from . utils.nodes import iterNodesInAnimationNodeTrees, getAnimationNodeTrees
@@ -13,7 +15,11 @@ def update(events):
         print("Skip event: cannot write to ID classes")
         return
 
-    if didNameChange() or events.intersection({"File", "Addon", "Tree"}):
+    nameChanged = didNameChange()
+    if nameChanged:
+        tree_info.treeChanged()
+
+    if nameChanged or events.intersection({"File", "Addon", "Tree"}):
         updateEverything()
 
     if not problems.canAutoExecute(): return
@@ -21,10 +27,11 @@ def update(events):
     nodeTrees = list(iterAutoExecutionNodeTrees(events))
     if len(nodeTrees) == 0: return
 
-    setupExecutionUnits(nodeTrees)
+    persistent = usePersistentExecutionUnits()
+    setupExecutionUnits(nodeTrees, persistent)
     executeNodeTrees(nodeTrees)
     afterExecution()
-    finishExecutionUnits(nodeTrees)
+    finishExecutionUnits(nodeTrees, persistent)
 
 
 def failsToWriteToIDClasses():
@@ -3,7 +3,9 @@ from . import tree_info
 from . import event_handler
 from . update import updateEverything
 from . utils.handlers import eventHandler
+from . utils.fcurve import invalidateChangedFCurveSnapshots
 from . execution.measurements import resetMeasurements
+from . execution.persistence import propertyOwnerChanged
 
 class EventState:
     def __init__(self):
@@ -56,12 +58,16 @@ def renderPre(scene):
 @eventHandler("DEPSGRAPH_UPDATE_POST")
 def sceneChanged(scene, depsgraph):
     global evaluatedDepsgraph
+    from . nodes.object.object_instancer import invalidateInstanceCachesOnObjectChanges
+    invalidateChangedFCurveSnapshots(depsgraph)
+    invalidateInstanceCachesOnObjectChanges(depsgraph)
     evaluatedDepsgraph = depsgraph
     event_handler.update(event.getActives().union({"Scene"}))
     evaluatedDepsgraph = None
 
 def propertyChanged(self = None, context = None):
     event.propertyChanged = True
+    propertyOwnerChanged(self)
     resetMeasurements()
 
 @eventHandler("FILE_LOAD_POST")
@@ -98,7 +104,14 @@ def networkChanged(self = None, context = None):
 
 def treeChanged(self = None, context = None):
     event.treeChanged = True
-    tree_info.treeChanged()
+    tree_info.treeChanged(getChangedNodeTree(self))
+
+def getChangedNodeTree(owner):
+    # Changes of nodes and sockets only affect the tree they are in.
+    idData = getattr(owner, "id_data", None)
+    if isinstance(idData, bpy.types.NodeTree):
+        return idData
+    return None
 
 
 @eventHandler("RENDER_INIT")
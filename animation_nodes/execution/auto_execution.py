@@ -1,16 +1,31 @@
 import bpy
+from .. utils import textures
+from . profiler import beginExecution
 from .. preferences import getPreferences
 from .. utils.blender_ui import redrawAll
 from .. utils.nodes import getAnimationNodeTrees
 
+_autoExecutionSuspended = False
+
+def suspendAutoExecution():
+    global _autoExecutionSuspended
+    _autoExecutionSuspended = True
+
+def resumeAutoExecution():
+    global _autoExecutionSuspended
+    _autoExecutionSuspended = False
+
 def iterAutoExecutionNodeTrees(events):
+    if _autoExecutionSuspended: return
     for nodeTree in getAnimationNodeTrees():
         if nodeTree.canAutoExecute(events):
             yield nodeTree
 
 def executeNodeTrees(nodeTrees):
+    beginExecution()
     for nodeTree in nodeTrees:
         nodeTree.autoExecute()
+    textures.clearCache()
 
 def afterExecution():
     from .. events import isRendering
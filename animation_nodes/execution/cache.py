@@ -1,4 +1,5 @@
-from .. utils import fcurve
+from .. utils import fcurve, textures
 
 def clearExecutionCache():
     fcurve.clearCache()
+    textures.clearCache()
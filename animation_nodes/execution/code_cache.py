@@ -0,0 +1,217 @@
+import os
+import bpy
+import sys
+import marshal
+import hashlib
+from .. utils.handlers import eventHandler
+from .. tree_info import getNetworkLinkIDs, getSubprogramNetworks
+from .. preferences import (addonName, getExecutionCodeType, getExecutionCodeSettings,
+                            getAnimationNodesVersion)
+
+# The generated scripts of an execution unit only depend on the structure
+# of its network. When the structure did not change since the scripts have
+# been generated the last time, the old scripts can be used again.
+# Everything that is written into the scripts (e.g. the tree name that is
+# used to look up the nodes) has to be part of the key.
+
+cacheFileFormatVersion = 5
+maxCacheSize = 500
+
+_cachedScriptsByKey = {}
+
+class CachedScripts:
+    __slots__ = ("codes", "socketValueLines", "neededCopies")
+
+    def __init__(self, codes, socketValueLines, neededCopies):
+        self.codes = codes
+        self.socketValueLines = socketValueLines
+        self.neededCopies = neededCopies
+
+def getCachedScripts(key, nodeByID):
+    cachedScripts = _cachedScriptsByKey.get(key)
+    if cachedScripts is not None:
+        applyNeededCopies(cachedScripts.neededCopies, nodeByID)
+    return cachedScripts
+
+def cacheScripts(key, network, nodeByID, codes, socketValueLoaders):
+    if not all(codes): return
+    if len(_cachedScriptsByKey) >= maxCacheSize:
+        _cachedScriptsByKey.clear()
+
+    neededCopies = getNeededCopies(network, nodeByID)
+    socketValueLines = dict(socketValueLoaders.linesBySocketID)
+    _cachedScriptsByKey[key] = CachedScripts(tuple(codes), socketValueLines, neededCopies)
+
+def clearScriptsCache():
+    _cachedScriptsByKey.clear()
+
+def getNeededCopies(network, nodeByID):
+    neededCopies = {}
+    for node in network.getAnimationNodes(nodeByID):
+        nodeID = node.toID()
+        for socket in node.outputs:
+            amount = socket.execution.neededCopies
+            if amount > 0:
+                neededCopies[(nodeID, True, socket.identifier)] = amount
+    return neededCopies
+
+def applyNeededCopies(neededCopies, nodeByID):
+    for (nodeID, isOutput, identifier), amount in neededCopies.items():
+        node = nodeByID[nodeID]
+        for socket in node.outputs:
+            if socket.identifier == identifier:
+                socket.execution.neededCopies = amount
+
+
+# Network Hashing
+##########################################
+
+ignoredNodeProperties = {"inInvalidNetwork", "useNetworkColor", "activeInputIndex",
+    "activeOutputIndex", "viewLocation", "isAnimationNode"}
+ignoredSocketProperties = {"display", "textProps", "execution", "show",
+    "isAnimationNodeSocket", "defaultDrawType", "removeable", "moveable", "moveGroup"}
+
+def getScriptsKey(network, nodeByID):
+    data = [cacheFileFormatVersion, getExecutionCodeType(),
+            getExecutionCodeSettings().removeUnusedNodes,
+            getExecutionCodeSettings().foldConstantNodes,
+            addonName, network.treeName, network.name,
+            type(network).__name__, network.type, network.identifier]
+
+    # the code of invoke subprogram nodes depends on existing subprograms
+    if len(network.invokeSubprogramIDs) > 0:
+        data.append(sorted(subnetwork.identifier for subnetwork in getSubprogramNetworks()))
+
+    nodes = sorted(network.getAnimationNodes(nodeByID), key = lambda node: node.identifier)
+    for node in nodes:
+        data.append((node.bl_idname, node.name, node.identifier))
+        data.append(tuple(iterPropertyValues(node, getIgnoredNodeProperties())))
+        for socket in node.inputs:
+            data.append(tuple(iterSocketState(socket)))
+        for socket in node.outputs:
+            data.append(tuple(iterSocketState(socket)))
+
+    data.append(getNetworkLinkIDs(network))
+    return hashlib.sha1(repr(data).encode()).hexdigest()
+
+def iterSocketState(socket):
+    yield socket.bl_idname
+    yield socket.identifier
+    yield from iterPropertyValues(socket, getIgnoredSocketProperties())
+
+def iterPropertyValues(owner, ignoredProperties, depth = 0):
+    for prop in owner.bl_rna.properties:
+        identifier = prop.identifier
+        if identifier in ignoredProperties or identifier == "rna_type":
+            continue
+
+        value = getattr(owner, identifier, None)
+        if prop.type == "POINTER":
+            if value is None: yield identifier, None
+            elif isinstance(value, bpy.types.ID): yield identifier, value.name
+            elif depth < 2: yield identifier, tuple(iterPropertyValues(value, (), depth + 1))
+        elif prop.type == "COLLECTION":
+            if depth < 2:
+                yield identifier, tuple(tuple(iterPropertyValues(item, (), depth + 1)) for item in value)
+        else:
+            yield identifier, toHashableValue(value)
+
+def toHashableValue(value):
+    if isinstance(value, (str, int, float, bool)): return value
+    if isinstance(value, set): return tuple(sorted(value))
+    try: return tuple(toHashableValue(element) for element in value)
+    except TypeError: return repr(value)
+
+_ignoredNodeProperties = None
+_ignoredSocketProperties = None
+
+def getIgnoredNodeProperties():
+    global _ignoredNodeProperties
+    if _ignoredNodeProperties is None:
+        _ignoredNodeProperties = ignoredNodeProperties.union(
+            prop.identifier for prop in bpy.types.Node.bl_rna.properties)
+    return _ignoredNodeProperties
+
+def getIgnoredSocketProperties():
+    global _ignoredSocketProperties
+    if _ignoredSocketProperties is None:
+        _ignoredSocketProperties = ignoredSocketProperties.union(
+            prop.identifier for prop in bpy.types.NodeSocket.bl_rna.properties)
+    return _ignoredSocketProperties
+
+
+# Disk Cache
+##########################################
+
+# The cache file is stored next to the .blend file, so that the code
+# generation does not have to run after reopening the file. It only
+# contains the script texts, they are compiled again after loading.
+# The scripts are executed, so the file is only read when Blender is
+# allowed to run scripts of the .blend file. Every entry contains a hash
+# of its key and scripts, entries that don't match are ignored.
+
+def getCacheFilePath():
+    if bpy.data.filepath == "": return None
+    return os.path.splitext(bpy.data.filepath)[0] + ".ancache"
+
+def getCacheFileHeader():
+    return (cacheFileFormatVersion, tuple(sys.version_info[:2]), tuple(getAnimationNodesVersion()))
+
+def diskCacheIsEnabled():
+    return getExecutionCodeSettings().storeCodeCacheOnDisk
+
+def scriptsAreTrusted():
+    if bpy.app.autoexec_fail: return False
+    return bpy.context.preferences.filepaths.use_scripts_auto_execute
+
+def getEntryHash(key, codes, socketValueLines, neededCopies):
+    data = repr((key, codes, sorted(socketValueLines.items()), sorted(neededCopies.items())))
+    return hashlib.sha1(data.encode()).hexdigest()
+
+def isValidEntry(key, entry):
+    if not isinstance(entry, tuple) or len(entry) != 4: return False
+    codes, socketValueLines, neededCopies, entryHash = entry
+    if not (isinstance(codes, tuple) and all(isinstance(code, str) for code in codes)): return False
+    if not (isinstance(socketValueLines, dict) and isinstance(neededCopies, dict)): return False
+    try: return entryHash == getEntryHash(key, codes, socketValueLines, neededCopies)
+    except TypeError: return False
+
+@eventHandler("FILE_SAVE_POST")
+def writeCacheFile():
+    path = getCacheFilePath()
+    if path is None or not diskCacheIsEnabled(): return
+
+    entries = {}
+    for key, cachedScripts in _cachedScriptsByKey.items():
+        entries[key] = (cachedScripts.codes, cachedScripts.socketValueLines, cachedScripts.neededCopies,
+                        getEntryHash(key, cachedScripts.codes, cachedScripts.socketValueLines,
+                                     cachedScripts.neededCopies))
+
+    try:
+        with open(path, "wb") as f:
+            marshal.dump((getCacheFileHeader(), entries), f)
+    except OSError:
+        print("Could not write the execution code cache: {}".format(repr(path)))
+
+@eventHandler("FILE_LOAD_POST")
+def readCacheFile():
+    clearScriptsCache()
+
+    path = getCacheFilePath()
+    if path is None or not diskCacheIsEnabled(): return
+    if not os.path.isfile(path): return
+    if not scriptsAreTrusted(): return
+
+    try:
+        with open(path, "rb") as f:
+            header, entries = marshal.load(f)
+    except (OSError, EOFError, ValueError, TypeError):
+        return
+
+    if header != getCacheFileHeader(): return
+    if not isinstance(entries, dict): return
+
+    for key, entry in entries.items():
+        if isValidEntry(key, entry):
+            codes, socketValueLines, neededCopies, _ = entry
+            _cachedScriptsByKey[key] = CachedScripts(codes, socketValueLines, neededCopies)
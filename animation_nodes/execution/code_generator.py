@@ -5,8 +5,8 @@ from .. utils.names import replaceVariableName
 from .. sockets.info import getAllowedInputDataTypes
 from .. sockets.implicit_conversion import getConversionCode
 from .. problems import NodeFailesToCreateExecutionCode
-from .. preferences import addonName, getExecutionCodeType
-from .. tree_info import (iterLinkedSocketsWithInfo, isSocketLinked,
+from .. preferences import addonName, getExecutionCodeType, getExecutionCodeSettings
+from .. tree_info import (iterLinkedSocketsWithInfo, isSocketLinked, getOriginNodes,
                           iterLinkedInputSocketsWithOriginDataType)
 
 
@@ -26,12 +26,105 @@ def getInitialVariables(nodes):
     return variables
 
 
+# Dead Node Elimination
+##########################################
+
+def getDeadNodeIdentifiers(network, nodeByID, requiredNodes = []):
+    '''
+    Nodes that don't have a path to a node with side effects
+    don't have to be executed.
+    '''
+    if not getExecutionCodeSettings().removeUnusedNodes: return set()
+
+    nodes = network.getAnimationNodes(nodeByID)
+    liveIdentifiers = set()
+    uncheckedNodes = [node for node in nodes if isSideEffectNode(node)]
+    uncheckedNodes.extend(node for node in requiredNodes if node is not None)
+    while uncheckedNodes:
+        node = uncheckedNodes.pop()
+        if node.identifier in liveIdentifiers: continue
+        liveIdentifiers.add(node.identifier)
+        uncheckedNodes.extend(getOriginNodes(node, nodeByID))
+
+    return {node.identifier for node in nodes if node.identifier not in liveIdentifiers}
+
+def isSideEffectNode(node):
+    return node.hasSideEffects or len(node.outputs) == 0
+
+def removeDeadNodes(nodes, deadNodeIdentifiers):
+    if len(deadNodeIdentifiers) == 0: return nodes
+    return [node for node in nodes if node.identifier not in deadNodeIdentifiers]
+
+
+# Constant Folding
+##########################################
+
+# Sockets of these types reference data that can change
+# without triggering an update of the node tree.
+sceneDependentDataTypes = {"Object", "Collection", "Scene", "Text Block", "FCurve",
+    "Material", "Texture", "Font", "Particle System", "Sequence", "Shape Key", "Sound"}
+sceneDependentDataTypes.update([dataType + " List" for dataType in sceneDependentDataTypes])
+
+def getConstantNodeIdentifiers(network, nodeByID, deadNodeIdentifiers = set()):
+    '''
+    Nodes whose inputs only depend on unlinked sockets
+    and other constant nodes can be computed once in the setup.
+    '''
+    if not getExecutionCodeSettings().foldConstantNodes: return set()
+
+    try: nodes = network.getSortedAnimationNodes(nodeByID)
+    except: return set()
+
+    constantIdentifiers = set()
+    for node in nodes:
+        if node.identifier in deadNodeIdentifiers: continue
+        if not isFoldableNode(node): continue
+        if all(origin.identifier in constantIdentifiers for origin in getOriginNodes(node, nodeByID)):
+            constantIdentifiers.add(node.identifier)
+    return constantIdentifiers
+
+def isFoldableNode(node):
+    if node.hasSideEffects or not node.allowConstantFolding: return False
+    if len(node.outputs) == 0: return False
+    for socket in chain(node.inputs, node.outputs):
+        if socket.dataType in sceneDependentDataTypes: return False
+    return True
+
+def splitConstantNodes(nodes, constantIdentifiers):
+    constantNodes, otherNodes = [], []
+    for node in nodes:
+        if node.identifier in constantIdentifiers: constantNodes.append(node)
+        else: otherNodes.append(node)
+    return constantNodes, otherNodes
+
+def getConstantTargetSockets(constantNodes, nodeByID):
+    targets = set()
+    for node in constantNodes:
+        for socket in node.linkedOutputs:
+            targets.update(iterLinkedSocketsWithInfo(socket, node, nodeByID))
+    return targets
+
+def iterConstantInputCopyLines(node, variables, constantSockets):
+    '''
+    Values of constant nodes are reused in every execution,
+    so they have to be copied before a node modifies them.
+    '''
+    for socket in node.inputs:
+        if socket in constantSockets and socket.dataIsModified and socket.isCopyable():
+            newName = variables[socket] + "_constant_copy"
+            yield from iterProfiledLines([getCopyLine(socket, newName, variables)],
+                                         getCopySpanName(socket, node), "copy")
+            variables[socket] = newName
+
+
 # Setup Code
 ##########################################
 
 def iterSetupCodeLines(nodes, variables):
     yield from iter_Imports(nodes)
     yield get_LoadMeasurementsDict()
+    if getExecutionCodeType() == "PROFILE":
+        yield from iter_LoadProfilerFunctions()
     yield from iter_GetNodeReferences(nodes)
     yield from iter_GetSocketValues(nodes, variables)
 
@@ -59,6 +152,10 @@ def getModulesNeededByNodes(nodes):
 def get_LoadMeasurementsDict():
     return "_node_execution_times = animation_nodes.execution.measurements.getMeasurementsDict()"
 
+def iter_LoadProfilerFunctions():
+    yield "_profiler_begin = animation_nodes.execution.profiler.beginSpan"
+    yield "_profiler_end = animation_nodes.execution.profiler.endSpan"
+
 def iter_GetNodeReferences(nodes):
     yield "nodes = bpy.data.node_groups[{}].nodes".format(repr(nodes[0].nodeTree.name))
     for node in nodes:
@@ -70,6 +167,16 @@ def iter_GetSocketValues(nodes, variables):
             if not isSocketLinked(socket, node):
                 yield getLoadSocketValueLine(socket, node, variables, i)
 
+def getSocketValueLinesByID(nodes, variables):
+    lines = {}
+    for node in nodes:
+        nodeID = node.toID()
+        for i, socket in enumerate(node.inputs):
+            if not isSocketLinked(socket, node):
+                socketID = (nodeID, False, socket.identifier)
+                lines[socketID] = getLoadSocketValueLine(socket, node, variables, i)
+    return lines
+
 def getLoadSocketValueLine(socket, node, variables, index = None):
     return "{} = {}".format(variables[socket], getSocketValueExpression(socket, node, index))
 
@@ -108,6 +215,8 @@ def getFunction_IterNodeExecutionLines():
         return iterNodeExecutionLines_MeasureTimes
     elif mode == "BAKE":
         return iterNodeExecutionLines_Bake
+    elif mode == "PROFILE":
+        return iterNodeExecutionLines_Profile
 
 def iterNodeExecutionLines_Basic(node, variables):
     yield from iterNodeCommentLines(node)
@@ -153,6 +262,21 @@ def iterNodeExecutionLines_Bake(node, variables):
     except:
         handleExecutionCodeCreationException(node)
 
+def iterNodeExecutionLines_Profile(node, variables):
+    yield from iterNodeCommentLines(node)
+    yield "_profiler_begin({}, 'node')".format(repr(getNodeSpanName(node)))
+    try:
+        for socket, originType, line in iterInputConversions(node, variables):
+            name = "Convert {} to {}".format(originType, socket.dataType)
+            yield from iterProfiledLines([line], name, "conversion")
+        for socket, line in iterInputCopies(node, variables):
+            yield from iterProfiledLines([line], getCopySpanName(socket, node), "copy")
+        resolveInnerLinks(node, variables)
+        yield from iterRealNodeExecutionLines(node, variables)
+    except:
+        handleExecutionCodeCreationException(node)
+    yield "_profiler_end()"
+
 def iterNodeCommentLines(node):
     yield ""
     yield "# Node: {} - {}".format(repr(node.nodeTree.name), repr(node.name))
@@ -166,11 +290,15 @@ def iterNodePreExecutionLines(node, variables):
     yield from iterInputCopyLines(node, variables)
 
 def iterInputConversionLines(node, variables):
+    for socket, originType, line in iterInputConversions(node, variables):
+        yield line
+
+def iterInputConversions(node, variables):
     for socket, originType in iterLinkedInputSocketsWithOriginDataType(node):
         if socket.dataType != originType:
             convertCode = getConversionCode(originType, socket.dataType)
             if convertCode is not None:
-                yield getConvertInputLine(node, socket, convertCode, variables)
+                yield socket, originType, getConvertInputLine(node, socket, convertCode, variables)
 
 def getConvertInputLine(node, socket, convertCode, variables):
     convertCode = replaceVariableName(convertCode, "value", variables[socket])
@@ -179,6 +307,10 @@ def getConvertInputLine(node, socket, convertCode, variables):
     return "{} = {}".format(newVariableName, convertCode)
 
 def iterInputCopyLines(node, variables):
+    for socket, line in iterInputCopies(node, variables):
+        yield line
+
+def iterInputCopies(node, variables):
     for socket in node.inputs:
         if socket.dataIsModified and socket.isCopyable() and not isSocketLinked(socket, node):
             newName = variables[socket] + "_copy"
@@ -186,7 +318,7 @@ def iterInputCopyLines(node, variables):
                 line = "{} = {}".format(newName, socket.getDefaultValueCode())
             else: line = getCopyLine(socket, newName, variables)
             variables[socket] = newName
-            yield line
+            yield socket, line
 
 def iterRealNodeExecutionLines(node, variables, bake = False):
     requiredOutputs = getRequiredOutputIdentifiers(node)
@@ -228,18 +360,20 @@ def resolveInnerLinks(node, variables):
     for inputName, outputName in node.iterInnerLinks():
         variables[outputs[outputName]] = variables[inputs[inputName]]
 
-def linkOutputSocketsToTargets(node, variables, nodeByID):
+def linkOutputSocketsToTargets(node, variables, nodeByID, deadNodeIdentifiers = set()):
     for socket in node.linkedOutputs:
-        yield from linkSocketToTargets(socket, node, variables, nodeByID)
+        yield from linkSocketToTargets(socket, node, variables, nodeByID, deadNodeIdentifiers)
 
-def linkSocketToTargets(socket, node, variables, nodeByID):
-    targets = tuple(iterLinkedSocketsWithInfo(socket, node, nodeByID))
+def linkSocketToTargets(socket, node, variables, nodeByID, deadNodeIdentifiers = set()):
+    # removed nodes don't need the value, so they must not cause copies
+    targets = tuple(iterLinkedSocketsWithInfo(socket, node, nodeByID, deadNodeIdentifiers))
     needACopy = getTargetsThatNeedACopy(socket, targets)
     socket.execution.neededCopies = len(needACopy)
 
     for target in targets:
         if target in needACopy:
-            yield getCopyLine(socket, variables[target], variables)
+            yield from iterProfiledLines([getCopyLine(socket, variables[target], variables)],
+                                         getCopySpanName(socket, node), "copy")
         else:
             variables[target] = variables[socket]
 
@@ -256,3 +390,23 @@ def getCopyLine(fromSocket, targetName, variables):
 
 def getCopyExpression(socket, variables):
     return socket.getCopyExpression().replace("value", variables[socket])
+
+
+
+# Profiling
+##########################################
+
+def iterProfiledLines(lines, name, category):
+    if getExecutionCodeType() != "PROFILE":
+        yield from lines
+        return
+
+    yield "_profiler_begin({}, {})".format(repr(name), repr(category))
+    yield from lines
+    yield "_profiler_end()"
+
+def getNodeSpanName(node):
+    return "{} ({})".format(node.name, node.nodeTree.name)
+
+def getCopySpanName(socket, node):
+    return "Copy {} of {}".format(socket.dataType, node.name)
@@ -1,7 +1,12 @@
 from . compile_scripts import compileScript
+from . persistence import SocketValueLoaders
+from . code_cache import getScriptsKey, getCachedScripts, cacheScripts
 from .. problems import ExecutionUnitNotSetup
 from . code_generator import (getInitialVariables,
                               iterSetupCodeLines,
+                              getSocketValueLinesByID,
+                              getDeadNodeIdentifiers,
+                              removeDeadNodes,
                               getGlobalizeStatement,
                               linkOutputSocketsToTargets,
                               getFunction_IterNodeExecutionLines)
@@ -12,8 +17,12 @@ class GroupExecutionUnit:
         self.setupScript = ""
         self.setupCodeObject = None
         self.executionData = {}
+        self.socketValueLoaders = SocketValueLoaders({})
+        self.isSetup = False
+        self.deadNodeIdentifiers = getDeadNodeIdentifiers(network, nodeByID,
+            requiredNodes = [network.getGroupInputNode(nodeByID), network.getGroupOutputNode(nodeByID)])
 
-        self.generateScript(nodeByID)
+        self.loadOrGenerateScript(nodeByID)
         self.compileScript()
         self.execute = self.raiseNotSetupException
 
@@ -22,6 +31,10 @@ class GroupExecutionUnit:
         self.executionData = {}
         exec(self.setupCodeObject, self.executionData, self.executionData)
         self.execute = self.executionData["main"]
+        self.isSetup = True
+
+    def reloadSocketValues(self, socketIDs, nodeIDs):
+        self.socketValueLoaders.reload(socketIDs, nodeIDs, self.executionData)
 
     def insertSubprogramFunctions(self, data):
         self.executionData.update(data)
@@ -29,17 +42,30 @@ class GroupExecutionUnit:
     def finish(self):
         self.executionData.clear()
         self.execute = self.raiseNotSetupException
+        self.isSetup = False
 
 
     def getCodes(self):
         return [self.setupScript]
 
 
+    def loadOrGenerateScript(self, nodeByID):
+        key = getScriptsKey(self.network, nodeByID)
+        cachedScripts = getCachedScripts(key, nodeByID)
+        if cachedScripts is None:
+            self.generateScript(nodeByID)
+            cacheScripts(key, self.network, nodeByID, self.getCodes(), self.socketValueLoaders)
+        else:
+            self.setupScript, = cachedScripts.codes
+            self.socketValueLoaders = SocketValueLoaders(cachedScripts.socketValueLines)
+
     def generateScript(self, nodeByID):
         try: nodes = self.network.getSortedAnimationNodes(nodeByID)
         except: return
 
+        nodes = removeDeadNodes(nodes, self.deadNodeIdentifiers)
         variables = getInitialVariables(nodes)
+        self.socketValueLoaders = SocketValueLoaders(getSocketValueLinesByID(nodes, variables))
         self.setupScript = "\n".join(self.iterSetupScriptLines(nodes, variables, nodeByID))
 
     def iterSetupScriptLines(self, nodes, variables, nodeByID):
@@ -68,11 +94,11 @@ class GroupExecutionUnit:
     def iterExecutionScriptLines(self, nodes, variables, inputNode, nodeByID):
         iterNodeExecutionLines = getFunction_IterNodeExecutionLines()
 
-        yield from linkOutputSocketsToTargets(inputNode, variables, nodeByID)
+        yield from linkOutputSocketsToTargets(inputNode, variables, nodeByID, self.deadNodeIdentifiers)
         for node in nodes:
             if node.bl_idname in ("an_GroupInputNode", "an_GroupOutputNode"): continue
             yield from iterNodeExecutionLines(node, variables)
-            yield from linkOutputSocketsToTargets(node, variables, nodeByID)
+            yield from linkOutputSocketsToTargets(node, variables, nodeByID, self.deadNodeIdentifiers)
 
     def getReturnStatement(self, outputNode, variables):
         if outputNode is None: return "return"
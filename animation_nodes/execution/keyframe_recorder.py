@@ -0,0 +1,164 @@
+import re
+import bpy
+import numpy
+from .. data_structures.fcurve_snapshot import invalidateFCurveSnapshots
+
+# In bake mode the keyframes are not inserted one by one. When a recorder
+# is active, the values are collected for every frame and written
+# into the fcurves at once when the baking is done.
+# Values that can't be recorded (e.g. integers and booleans) are inserted
+# immediately. The keyframes they replaced are remembered, so that they
+# can be restored when the baking is cancelled.
+
+_activeRecorder = None
+
+keyframeInsertPattern = re.compile(r"([\w\.]+)\.keyframe_insert\(")
+
+def redirectKeyframeInsertion(code):
+    return keyframeInsertPattern.sub(
+        r"animation_nodes.execution.keyframe_recorder.insertKeyframe(\1, ", code)
+
+def insertKeyframe(owner, dataPath, index = -1):
+    if _activeRecorder is None:
+        owner.keyframe_insert(dataPath, index = index)
+    else:
+        _activeRecorder.insert(owner, dataPath, index)
+
+def startRecording(recorder):
+    global _activeRecorder
+    _activeRecorder = recorder
+
+def stopRecording():
+    global _activeRecorder
+    _activeRecorder = None
+
+class KeyframeRecorder:
+    def __init__(self, startFrame, endFrame):
+        self.startFrame = startFrame
+        self.endFrame = endFrame
+        self.frame = startFrame
+        self.valuesByChannel = {}
+        self.oldKeyframesByChannel = {}
+
+    def insert(self, owner, dataPath, index = -1):
+        value = owner.path_resolve(dataPath)
+        channel = self.getChannel(owner, dataPath)
+
+        if channel is None or not isFloatValue(value, index):
+            self.insertDirectly(owner, dataPath, index, channel, value)
+        elif index == -1 and hasattr(value, "__len__"):
+            for i, element in enumerate(value):
+                self.record(channel, i, element)
+        else:
+            self.record(channel, max(index, 0), value if index == -1 else value[index])
+
+    def getChannel(self, owner, dataPath):
+        idBlock = owner.id_data
+        if idBlock is None: return None
+        if owner == idBlock: return (idBlock, dataPath)
+        try: return (idBlock, owner.path_from_id(dataPath))
+        except ValueError: return None
+
+    def insertDirectly(self, owner, dataPath, index, channel, value):
+        if channel is not None:
+            if index == -1 and hasattr(value, "__len__"): indices = range(len(value))
+            else: indices = [max(index, 0)]
+            for i in indices:
+                if (channel, i) not in self.oldKeyframesByChannel:
+                    fcurve = findFCurve(channel[0], channel[1], i)
+                    self.oldKeyframesByChannel[(channel, i)] = (None if fcurve is None else
+                        getKeyframeStates(fcurve, self.startFrame, self.endFrame))
+        owner.keyframe_insert(dataPath, index = index, frame = self.frame)
+
+    def record(self, channel, index, value):
+        values = self.valuesByChannel.setdefault((channel, index), {})
+        values[self.frame] = value
+
+    @property
+    def channelAmount(self):
+        return len(self.valuesByChannel)
+
+    def write(self):
+        for ((idBlock, dataPath), index), values in self.valuesByChannel.items():
+            fcurve = getOrCreateFCurve(idBlock, dataPath, index)
+            replaceKeyframes(fcurve, values, self.startFrame, self.endFrame)
+        self.valuesByChannel.clear()
+        self.oldKeyframesByChannel.clear()
+        invalidateFCurveSnapshots()
+
+    def rollback(self):
+        '''Restore the keyframes that have been inserted directly.'''
+        for ((idBlock, dataPath), index), states in self.oldKeyframesByChannel.items():
+            fcurve = findFCurve(idBlock, dataPath, index)
+            if fcurve is None: continue
+            if states is None:
+                idBlock.animation_data.action.fcurves.remove(fcurve)
+            else:
+                restoreKeyframes(fcurve, states, self.startFrame, self.endFrame)
+        self.valuesByChannel.clear()
+        self.oldKeyframesByChannel.clear()
+        invalidateFCurveSnapshots()
+
+def isFloatValue(value, index):
+    if index >= 0 or hasattr(value, "__len__"):
+        try: value = value[max(index, 0)]
+        except (TypeError, IndexError): return False
+    return isinstance(value, float)
+
+def findFCurve(idBlock, dataPath, index):
+    animationData = idBlock.animation_data
+    if animationData is None or animationData.action is None: return None
+    return animationData.action.fcurves.find(dataPath, index = index)
+
+def getOrCreateFCurve(idBlock, dataPath, index):
+    animationData = idBlock.animation_data
+    if animationData is None:
+        animationData = idBlock.animation_data_create()
+    if animationData.action is None:
+        animationData.action = bpy.data.actions.new(idBlock.name + "Action")
+
+    fcurves = animationData.action.fcurves
+    fcurve = fcurves.find(dataPath, index = index)
+    if fcurve is None:
+        fcurve = fcurves.new(dataPath, index = index)
+    return fcurve
+
+def replaceKeyframes(fcurve, values, startFrame, endFrame):
+    points = fcurve.keyframe_points
+    for point in reversed(points):
+        if startFrame <= point.co.x <= endFrame:
+            points.remove(point, fast = True)
+
+    oldLength = len(points) * 2
+    newCoordinates = numpy.array(sorted(values.items()), dtype = numpy.float32).reshape(-1)
+    points.add(len(values))
+
+    # the handles of new keyframes are recalculated in fcurve.update()
+    for attribute in ("co", "handle_left", "handle_right"):
+        data = numpy.empty(oldLength + len(newCoordinates), dtype = numpy.float32)
+        points.foreach_get(attribute, data)
+        data[oldLength:] = newCoordinates
+        points.foreach_set(attribute, data)
+
+    fcurve.update()
+
+def getKeyframeStates(fcurve, startFrame, endFrame):
+    return [(tuple(point.co), tuple(point.handle_left), tuple(point.handle_right),
+             point.handle_left_type, point.handle_right_type, point.interpolation)
+            for point in fcurve.keyframe_points if startFrame <= point.co.x <= endFrame]
+
+def restoreKeyframes(fcurve, states, startFrame, endFrame):
+    points = fcurve.keyframe_points
+    for point in reversed(points):
+        if startFrame <= point.co.x <= endFrame:
+            points.remove(point, fast = True)
+
+    for co, handleLeft, handleRight, leftType, rightType, interpolation in states:
+        point = points.insert(co[0], co[1], options = {"FAST"})
+        point.handle_left_type = leftType
+        point.handle_right_type = rightType
+        point.handle_left = handleLeft
+        point.handle_right = handleRight
+        point.interpolation = interpolation
+
+    fcurve.update()
@@ -1,9 +1,14 @@
 from .. sockets.info import toIdName
 from .. tree_info import getNodesByType
 from . compile_scripts import compileScript
+from . persistence import SocketValueLoaders
+from . code_cache import getScriptsKey, getCachedScripts, cacheScripts
 from .. problems import ExecutionUnitNotSetup
 from . code_generator import (getInitialVariables,
                               iterSetupCodeLines,
+                              getSocketValueLinesByID,
+                              getDeadNodeIdentifiers,
+                              removeDeadNodes,
                               getCopyExpression,
                               iterNodeCommentLines,
                               getGlobalizeStatement,
@@ -18,8 +23,12 @@ class LoopExecutionUnit:
         self.setupScript = ""
         self.setupCodeObject = None
         self.executionData = {}
+        self.socketValueLoaders = SocketValueLoaders({})
+        self.isSetup = False
+        self.deadNodeIdentifiers = getDeadNodeIdentifiers(network, nodeByID,
+            requiredNodes = [network.getLoopInputNode(nodeByID)])
 
-        self.generateScript(nodeByID)
+        self.loadOrGenerateScript(nodeByID)
         self.compileScript()
         self.execute = self.raiseNotSetupException
 
@@ -28,6 +37,10 @@ class LoopExecutionUnit:
         self.executionData = {}
         exec(self.setupCodeObject, self.executionData, self.executionData)
         self.execute = self.executionData["main"]
+        self.isSetup = True
+
+    def reloadSocketValues(self, socketIDs, nodeIDs):
+        self.socketValueLoaders.reload(socketIDs, nodeIDs, self.executionData)
 
     def insertSubprogramFunctions(self, data):
         self.executionData.update(data)
@@ -35,6 +48,7 @@ class LoopExecutionUnit:
     def finish(self):
         self.executionData.clear()
         self.execute = self.raiseNotSetupException
+        self.isSetup = False
 
 
     def getCodes(self):
@@ -42,11 +56,23 @@ class LoopExecutionUnit:
 
 
 
+    def loadOrGenerateScript(self, nodeByID):
+        key = getScriptsKey(self.network, nodeByID)
+        cachedScripts = getCachedScripts(key, nodeByID)
+        if cachedScripts is None:
+            self.generateScript(nodeByID)
+            cacheScripts(key, self.network, nodeByID, self.getCodes(), self.socketValueLoaders)
+        else:
+            self.setupScript, = cachedScripts.codes
+            self.socketValueLoaders = SocketValueLoaders(cachedScripts.socketValueLines)
+
     def generateScript(self, nodeByID):
         try: nodes = self.network.getSortedAnimationNodes(nodeByID)
         except: return
 
+        nodes = removeDeadNodes(nodes, self.deadNodeIdentifiers)
         variables = getInitialVariables(nodes)
+        self.socketValueLoaders = SocketValueLoaders(getSocketValueLinesByID(nodes, variables))
         self.setupScript = "\n".join(self.iterSetupScriptLines(nodes, variables, nodeByID))
 
     def iterSetupScriptLines(self, nodes, variables, nodeByID):
@@ -155,14 +181,14 @@ class LoopExecutionUnit:
 
 
     def iter_LoopBody(self, inputNode, nodes, variables, nodeByID):
-        yield from linkOutputSocketsToTargets(inputNode, variables, nodeByID)
+        yield from linkOutputSocketsToTargets(inputNode, variables, nodeByID, self.deadNodeIdentifiers)
 
         iterNodeExecutionLines = getFunction_IterNodeExecutionLines()
         ignoreNodes = {"an_LoopInputNode", "an_LoopGeneratorOutputNode", "an_ReassignLoopParameterNode", "an_LoopBreakNode"}
         for node in nodes:
             if node.bl_idname in ignoreNodes: continue
             yield from iterNodeExecutionLines(node, variables)
-            yield from linkOutputSocketsToTargets(node, variables, nodeByID)
+            yield from linkOutputSocketsToTargets(node, variables, nodeByID, self.deadNodeIdentifiers)
 
         yield from self.iter_LoopBreak(inputNode, variables, nodeByID)
         yield from self.iter_AddToGenerators(inputNode, variables, nodeByID)
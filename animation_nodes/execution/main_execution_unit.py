@@ -1,9 +1,18 @@
 import sys, traceback
 from .. import problems
 from . compile_scripts import compileScript
+from . persistence import SocketValueLoaders
+from . code_cache import getScriptsKey, getCachedScripts, cacheScripts
 from .. problems import ExecutionUnitNotSetup, ExceptionDuringExecution
 from . code_generator import (getInitialVariables,
                               iterSetupCodeLines,
+                              getSocketValueLinesByID,
+                              getDeadNodeIdentifiers,
+                              removeDeadNodes,
+                              getConstantNodeIdentifiers,
+                              splitConstantNodes,
+                              getConstantTargetSockets,
+                              iterConstantInputCopyLines,
                               linkOutputSocketsToTargets,
                               getFunction_IterNodeExecutionLines)
 
@@ -11,12 +20,20 @@ class MainExecutionUnit:
     def __init__(self, network, nodeByID):
         self.network = network
         self.setupScript = ""
+        self.constantsScript = ""
         self.executeScript = ""
         self.setupCodeObject = None
+        self.constantsCodeObject = None
         self.executeCodeObject = None
         self.executionData = {}
-
-        self.generateScripts(nodeByID)
+        self.socketValueLoaders = SocketValueLoaders({})
+        self.isSetup = False
+        self.deadNodeIdentifiers = getDeadNodeIdentifiers(network, nodeByID)
+        self.constantNodeIdentifiers = getConstantNodeIdentifiers(network, nodeByID, self.deadNodeIdentifiers)
+        self.constantNodeIDs = {node.toID() for node in network.getAnimationNodes(nodeByID)
+                                if node.identifier in self.constantNodeIdentifiers}
+
+        self.loadOrGenerateScripts(nodeByID)
         self.compileScripts()
         self.execute = self.raiseNotSetupException
 
@@ -24,7 +41,19 @@ class MainExecutionUnit:
     def setup(self):
         self.executionData = {}
         exec(self.setupCodeObject, self.executionData, self.executionData)
+        exec(self.constantsCodeObject, self.executionData, self.executionData)
         self.execute = self.executeUnit
+        self.isSetup = True
+
+    def reloadSocketValues(self, socketIDs, nodeIDs):
+        self.socketValueLoaders.reload(socketIDs, nodeIDs, self.executionData)
+        if self.affectsConstantNodes(socketIDs, nodeIDs):
+            exec(self.constantsCodeObject, self.executionData, self.executionData)
+
+    def affectsConstantNodes(self, socketIDs, nodeIDs):
+        if len(self.constantNodeIDs) == 0: return False
+        return (any(socketID[0] in self.constantNodeIDs for socketID in socketIDs) or
+                not self.constantNodeIDs.isdisjoint(nodeIDs))
 
     def insertSubprogramFunctions(self, data):
         self.executionData.update(data)
@@ -32,6 +61,7 @@ class MainExecutionUnit:
     def finish(self):
         self.executionData.clear()
         self.execute = self.raiseNotSetupException
+        self.isSetup = False
 
     def executeUnit(self):
         try:
@@ -45,27 +75,49 @@ class MainExecutionUnit:
 
 
     def getCodes(self):
-        return [self.setupScript, self.executeScript]
+        return [self.setupScript, self.constantsScript, self.executeScript]
 
 
 
+    def loadOrGenerateScripts(self, nodeByID):
+        key = getScriptsKey(self.network, nodeByID)
+        cachedScripts = getCachedScripts(key, nodeByID)
+        if cachedScripts is None:
+            self.generateScripts(nodeByID)
+            cacheScripts(key, self.network, nodeByID, self.getCodes(), self.socketValueLoaders)
+        else:
+            self.setupScript, self.constantsScript, self.executeScript = cachedScripts.codes
+            self.socketValueLoaders = SocketValueLoaders(cachedScripts.socketValueLines)
+
     def generateScripts(self, nodeByID):
         try: nodes = self.network.getSortedAnimationNodes(nodeByID)
         except: return
 
+        nodes = removeDeadNodes(nodes, self.deadNodeIdentifiers)
         variables = getInitialVariables(nodes)
         self.setupScript = "\n".join(iterSetupCodeLines(nodes, variables))
-        self.executeScript = "\n".join(self.iterExecutionScriptLines(nodes, variables, nodeByID))
+        self.socketValueLoaders = SocketValueLoaders(getSocketValueLinesByID(nodes, variables))
+
+        constantNodes, nodes = splitConstantNodes(nodes, self.constantNodeIdentifiers)
+        self.constantsScript = "\n".join(self.iterConstantsScriptLines(constantNodes, variables, nodeByID))
+        constantSockets = getConstantTargetSockets(constantNodes, nodeByID)
+        self.executeScript = "\n".join(self.iterExecutionScriptLines(nodes, variables, nodeByID, constantSockets))
+
+    def iterConstantsScriptLines(self, nodes, variables, nodeByID):
+        yield "# Constant Nodes"
+        yield from self.iterExecutionScriptLines(nodes, variables, nodeByID)
 
-    def iterExecutionScriptLines(self, nodes, variables, nodeByID):
+    def iterExecutionScriptLines(self, nodes, variables, nodeByID, constantSockets = set()):
         iterNodeExecutionLines = getFunction_IterNodeExecutionLines()
 
         for node in nodes:
+            yield from iterConstantInputCopyLines(node, variables, constantSockets)
             yield from iterNodeExecutionLines(node, variables)
-            yield from linkOutputSocketsToTargets(node, variables, nodeByID)
+            yield from linkOutputSocketsToTargets(node, variables, nodeByID, self.deadNodeIdentifiers)
 
     def compileScripts(self):
         self.setupCodeObject = compileScript(self.setupScript, name = "setup: {}".format(repr(self.network.treeName)))
+        self.constantsCodeObject = compileScript(self.constantsScript, name = "constants: {}".format(repr(self.network.treeName)))
         self.executeCodeObject = compileScript(self.executeScript, name = "execution: {}".format(repr(self.network.treeName)))
 
 
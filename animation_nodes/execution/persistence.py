@@ -0,0 +1,117 @@
+import re
+import bpy
+from .. utils.handlers import eventHandler
+
+# Persistent execution units keep their setup state between executions.
+# Only the values of sockets whose properties changed since the last
+# execution are loaded again. Everything else (imports, node references,
+# unchanged socket values) is reused.
+
+_changedSocketIDs = set()
+_changedNodeIDs = set()
+_everythingChanged = True
+_lastIDSignature = None
+
+idCollectionNames = ("objects", "collections", "meshes", "curves", "materials",
+    "images", "textures", "texts", "actions", "scenes", "node_groups", "sounds")
+
+def propertyOwnerChanged(owner):
+    global _everythingChanged
+    if isinstance(owner, bpy.types.NodeSocket):
+        _changedSocketIDs.add(owner.toID())
+    elif isinstance(owner, bpy.types.Node):
+        _changedNodeIDs.add(owner.toID())
+    else:
+        _everythingChanged = True
+
+@eventHandler("UNDO_POST")
+@eventHandler("REDO_POST")
+@eventHandler("FILE_LOAD_POST")
+def invalidatePersistentState():
+    global _everythingChanged
+    _everythingChanged = True
+
+def consumeChanges():
+    '''
+    Returns None when all persistent units have to be setup again.
+    Otherwise a tuple containing the changed socket and node ids.
+    '''
+    global _everythingChanged, _lastIDSignature
+
+    # Python references to removed ID blocks become invalid.
+    signature = getIDSignature()
+    if signature != _lastIDSignature:
+        _lastIDSignature = signature
+        _everythingChanged = True
+
+    if _everythingChanged:
+        changes = None
+    else:
+        changes = (set(_changedSocketIDs), set(_changedNodeIDs))
+
+    _everythingChanged = False
+    _changedSocketIDs.clear()
+    _changedNodeIDs.clear()
+    return changes
+
+def getIDSignature():
+    return tuple(len(getattr(bpy.data, name, ())) for name in idCollectionNames)
+
+
+# Socket Value Reloading
+##########################################
+
+class SocketValueLoaders:
+    def __init__(self, linesBySocketID):
+        self.linesBySocketID = linesBySocketID
+        self.socketIDsByNodeID = {}
+        for socketID in linesBySocketID.keys():
+            self.socketIDsByNodeID.setdefault(socketID[0], []).append(socketID)
+        self.codeObjects = {}
+
+    def reload(self, socketIDs, nodeIDs, executionData):
+        for socketID in self.iterAffectedSocketIDs(socketIDs, nodeIDs):
+            exec(self.getCodeObject(socketID), executionData, executionData)
+
+    def iterAffectedSocketIDs(self, socketIDs, nodeIDs):
+        for socketID in socketIDs:
+            if socketID in self.linesBySocketID:
+                yield socketID
+        for nodeID in nodeIDs:
+            yield from self.socketIDsByNodeID.get(nodeID, ())
+
+    def getCodeObject(self, socketID):
+        codeObject = self.codeObjects.get(socketID)
+        if codeObject is None:
+            codeObject = compile(self.linesBySocketID[socketID], "reload socket value", "exec")
+            self.codeObjects[socketID] = codeObject
+        return codeObject
+
+    @property
+    def nodeIDs(self):
+        return self.socketIDsByNodeID.keys()
+
+
+# Animated Sockets
+##########################################
+
+# Socket properties can be animated. Those changes don't trigger
+# the update callback, so the values have to be reloaded every time.
+
+animatedNodePattern = re.compile(r'^nodes\["((?:[^"\\]|\\.)*)"\]')
+
+def getAnimatedNodeIDs(nodeTree):
+    animationData = nodeTree.animation_data
+    if animationData is None: return set()
+
+    fcurves = list(animationData.drivers)
+    if animationData.action is not None:
+        fcurves.extend(animationData.action.fcurves)
+
+    nodeIDs = set()
+    for fcurve in fcurves:
+        match = animatedNodePattern.match(fcurve.data_path)
+        if match is not None:
+            nodeName = re.sub(r"\\(.)", r"\1", match.group(1))
+            nodeIDs.add((nodeTree.name, nodeName))
+    return nodeIDs
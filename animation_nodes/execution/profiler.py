@@ -0,0 +1,92 @@
+import json
+import functools
+from time import perf_counter as getCurrentTime
+from .. preferences import getExecutionCodeType
+
+# Profiling
+###########################################
+
+# Spans are recorded as begin and end events. Only the events of the
+# last execution are kept, unless a frame range is recorded.
+# The generated execution code ends node spans without a name, spans
+# that end with a name also end all spans that are still open inside.
+
+events = []
+isRecordingRange = False
+
+def isProfiling():
+    return getExecutionCodeType() == "PROFILE"
+
+def beginSpan(name, category):
+    events.append((name, category, getCurrentTime()))
+
+def endSpan(name = None):
+    events.append((name, None, getCurrentTime()))
+
+def beginExecution():
+    if not isRecordingRange:
+        events.clear()
+
+def startRangeRecording():
+    global isRecordingRange
+    events.clear()
+    isRecordingRange = True
+
+def stopRangeRecording():
+    global isRecordingRange
+    isRecordingRange = False
+
+def hasRecordedEvents():
+    return len(events) > 0
+
+def profileFunction(function, name, category):
+    @functools.wraps(function)
+    def profiledFunction(*args):
+        beginSpan(name, category)
+        try: return function(*args)
+        finally: endSpan(name)
+    return profiledFunction
+
+
+# Trace Export
+###########################################
+
+def getTraceEvents():
+    '''
+    Duration events of the Chrome trace format. They can be opened
+    in chrome://tracing, Perfetto and speedscope.
+    '''
+    traceEvents = []
+    openSpans = []
+    startTime = events[0][2] if len(events) > 0 else 0
+
+    def closeSpan(time):
+        name, category = openSpans.pop()
+        traceEvents.append(newTraceEvent("E", name, category, time - startTime))
+
+    for name, category, time in events:
+        if category is not None:
+            openSpans.append((name, category))
+            traceEvents.append(newTraceEvent("B", name, category, time - startTime))
+        elif name is None:
+            if len(openSpans) > 0: closeSpan(time)
+        elif any(span[0] == name for span in openSpans):
+            while openSpans[-1][0] != name:
+                closeSpan(time)
+            closeSpan(time)
+
+    # spans of executions that have been interrupted by an exception
+    endTime = events[-1][2] if len(events) > 0 else 0
+    while len(openSpans) > 0:
+        closeSpan(endTime)
+
+    return traceEvents
+
+def newTraceEvent(phase, name, category, time):
+    return {"name" : name, "cat" : category, "ph" : phase,
+            "ts" : time * 1000000, "pid" : 1, "tid" : 1}
+
+def exportTrace(path):
+    data = {"traceEvents" : getTraceEvents(), "displayTimeUnit" : "ms"}
+    with open(path, "w") as f:
+        json.dump(data, f)
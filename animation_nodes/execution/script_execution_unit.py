@@ -1,7 +1,9 @@
 from .. utils.code import isCodeValid, getSyntaxError, containsStarImport
 from . compile_scripts import compileScript
+from . persistence import SocketValueLoaders
 from .. problems import ExecutionUnitNotSetup
-from . code_generator import getSocketValueExpression, iterSetupCodeLines, getInitialVariables
+from . code_generator import (getSocketValueExpression, iterSetupCodeLines,
+                              getInitialVariables, getSocketValueLinesByID)
 
 userCodeStartComment = "# User Code"
 
@@ -11,6 +13,8 @@ class ScriptExecutionUnit:
         self.setupScript = ""
         self.setupCodeObject = None
         self.executionData = {}
+        self.socketValueLoaders = SocketValueLoaders({})
+        self.isSetup = False
 
         self.scriptUpdated(nodeByID)
 
@@ -18,11 +22,16 @@ class ScriptExecutionUnit:
         self.generateScript(nodeByID)
         self.compileScript()
         self.execute = self.raiseNotSetupException
+        self.isSetup = False
 
     def setup(self):
         self.executionData = {}
         exec(self.setupCodeObject, self.executionData, self.executionData)
         self.execute = self.executionData["main"]
+        self.isSetup = True
+
+    def reloadSocketValues(self, socketIDs, nodeIDs):
+        self.socketValueLoaders.reload(socketIDs, nodeIDs, self.executionData)
 
     def insertSubprogramFunctions(self, data):
         self.executionData.update(data)
@@ -30,6 +39,7 @@ class ScriptExecutionUnit:
     def finish(self):
         self.executionData.clear()
         self.execute = self.raiseNotSetupException
+        self.isSetup = False
 
     def getCodes(self):
         return [self.setupScript]
@@ -40,6 +50,7 @@ class ScriptExecutionUnit:
         userCode = node.executionCode
 
         variables = getInitialVariables([node])
+        self.socketValueLoaders = SocketValueLoaders(getSocketValueLinesByID([node], variables))
 
         finalCode = []
         finalCode.extend(iterSetupCodeLines([node], variables))
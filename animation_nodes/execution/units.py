@@ -1,66 +1,116 @@
+import time
 import traceback
 from .. import problems
+from . import persistence
 from collections import defaultdict
 from . cache import clearExecutionCache
 from . measurements import resetMeasurements
+from . profiler import isProfiling, profileFunction
 from . main_execution_unit import MainExecutionUnit
 from . loop_execution_unit import LoopExecutionUnit
 from . group_execution_unit import GroupExecutionUnit
 from . script_execution_unit import ScriptExecutionUnit
-from .. utils.nodes import getAnimationNodeTrees, iterAnimationNodes
 from .. problems import ExceptionDuringCodeCreation, CouldNotSetupExecutionUnits
-from .. tree_info import getNetworksByType, getSubprogramNetworks, getNetworkByIdentifier
+from .. tree_info import getNetworks, getNetworksByType, getSubprogramNetworks, getNetworkByIdentifier
 
 _mainUnitsByNodeTree = defaultdict(list)
 _subprogramUnitsByIdentifier = {}
+_unitsByNetwork = {}
+_persistentUnits = set()
 
 def createExecutionUnits(nodeByID):
-    reset()
+    reusableUnits = getReusableUnits()
+    reset(reusableUnits, nodeByID)
     try:
-        createMainUnits(nodeByID)
-        createSubprogramUnits(nodeByID)
+        createMainUnits(nodeByID, reusableUnits)
+        createSubprogramUnits(nodeByID, reusableUnits)
     except:
+        _unitsByNetwork.clear()
         print("\n"*5)
         traceback.print_exc()
         ExceptionDuringCodeCreation().report()
 
-def reset():
+def getReusableUnits():
+    '''
+    Networks that have not been analysed again since the last time
+    the units have been created still have the same code.
+    Units are only reused when the set of subprograms did not change,
+    because the code of invoke subprogram nodes depends on it.
+    '''
+    networks = set(getNetworks())
+    subprogramIDs = {network.identifier for network in networks if network.isSubnetwork}
+    oldSubprogramIDs = {network.identifier for network in _unitsByNetwork if network.isSubnetwork}
+    if subprogramIDs != oldSubprogramIDs:
+        return {}
+    return {network : unit for network, unit in _unitsByNetwork.items() if network in networks}
+
+def reset(reusableUnits, nodeByID):
     resetMeasurements()
     _mainUnitsByNodeTree.clear()
     _subprogramUnitsByIdentifier.clear()
+    _unitsByNetwork.clear()
+    _persistentUnits.intersection_update(reusableUnits.values())
 
-    for node in iterAnimationNodes():
-        for socket in node.outputs:
-            socket.execution.neededCopies = 0
+    for network in getNetworks():
+        if network in reusableUnits: continue
+        for node in network.getAnimationNodes(nodeByID):
+            for socket in node.outputs:
+                socket.execution.neededCopies = 0
 
-def createMainUnits(nodeByID):
+def createMainUnits(nodeByID, reusableUnits):
     for network in getNetworksByType("Main"):
-        unit = MainExecutionUnit(network, nodeByID)
+        unit = reusableUnits.get(network)
+        if unit is None:
+            unit = MainExecutionUnit(network, nodeByID)
         _mainUnitsByNodeTree[network.treeName].append(unit)
+        _unitsByNetwork[network] = unit
 
-def createSubprogramUnits(nodeByID):
+def createSubprogramUnits(nodeByID, reusableUnits):
     for network in getSubprogramNetworks():
-        if network.type == "Group":
-            unit = GroupExecutionUnit(network, nodeByID)
-        if network.type == "Loop":
-            unit = LoopExecutionUnit(network, nodeByID)
-        if network.type == "Script":
-            unit = ScriptExecutionUnit(network, nodeByID)
+        unit = reusableUnits.get(network)
+        if unit is None:
+            unit = createSubprogramUnit(network, nodeByID)
         _subprogramUnitsByIdentifier[network.identifier] = unit
+        _unitsByNetwork[network] = unit
 
+def createSubprogramUnit(network, nodeByID):
+    if network.type == "Group":
+        return GroupExecutionUnit(network, nodeByID)
+    if network.type == "Loop":
+        return LoopExecutionUnit(network, nodeByID)
+    if network.type == "Script":
+        return ScriptExecutionUnit(network, nodeByID)
 
-def setupExecutionUnits(nodeTrees):
+
+def setupExecutionUnits(nodeTrees, persistent = False):
     try:
         if len(nodeTrees) == 0: return
         if not problems.canExecute(): return
 
-        executionUnits = getExecutionUnits(nodeTrees)
+        if persistent: prepareReusedUnits(nodeTrees)
+
+        executionUnits = []
+        for nodeTree in nodeTrees:
+            start = time.perf_counter()
+            for unit in getExecutionUnits([nodeTree]):
+                if unit in executionUnits: continue
+                if not (persistent and unit.isSetup):
+                    unit.setup()
+                if persistent:
+                    _persistentUnits.add(unit)
+                executionUnits.append(unit)
+            end = time.perf_counter()
+            nodeTree.lastExecutionInfo.setupTime = end - start
 
         subprograms = {}
+        profiling = isProfiling()
         for unit in executionUnits:
-            unit.setup()
             if unit.network.isSubnetwork:
-                subprograms["_subprogram" + unit.network.identifier] = unit.execute
+                function = unit.execute
+                if profiling:
+                    name = "{}: {}".format(unit.network.type, unit.network.name)
+                    function = profileFunction(function, name, "subprogram")
+                subprograms["_subprogram" + unit.network.identifier] = function
 
         for unit in executionUnits:
             unit.insertSubprogramFunctions(subprograms)
@@ -69,12 +119,42 @@ def setupExecutionUnits(nodeTrees):
         traceback.print_exc()
         CouldNotSetupExecutionUnits().report()
 
-def finishExecutionUnits(nodeTrees):
-    for unit in getExecutionUnits(nodeTrees):
-        unit.finish()
+def prepareReusedUnits(nodeTrees):
+    changes = persistence.consumeChanges()
+    if changes is None:
+        finishPersistentUnits()
+        return
+
+    socketIDs, nodeIDs = changes
+    for nodeTree in nodeTrees:
+        nodeIDs.update(persistence.getAnimatedNodeIDs(nodeTree))
+
+    if len(socketIDs) + len(nodeIDs) == 0: return
+    for unit in _persistentUnits:
+        if unit.isSetup:
+            unit.reloadSocketValues(socketIDs, nodeIDs)
+
+def reloadAnimatedSocketValues(nodeTrees, nodeIDs):
+    '''Units that execute multiple frames without a new setup have
+    to reload the values of animated nodes after every frame change.'''
+    if len(nodeIDs) == 0: return
+    for unit in set(getExecutionUnits(nodeTrees)):
+        if unit.isSetup:
+            unit.reloadSocketValues(set(), nodeIDs)
+
+def finishExecutionUnits(nodeTrees, persistent = False):
+    if not persistent:
+        for unit in getExecutionUnits(nodeTrees):
+            unit.finish()
+            _persistentUnits.discard(unit)
 
     clearExecutionCache()
 
+def finishPersistentUnits():
+    for unit in _persistentUnits:
+        unit.finish()
+    _persistentUnits.clear()
+
 
 def getMainUnitsByNodeTree(nodeTree):
     return _mainUnitsByNodeTree[nodeTree.name]
@@ -89,6 +169,16 @@ def getSubprogramUnitsByName(name):
             programs.append(subprogram)
     return programs
 
+def getDeadNodeIdentifiers(nodeTree):
+    units = list(_mainUnitsByNodeTree[nodeTree.name])
+    units.extend(unit for unit in _subprogramUnitsByIdentifier.values()
+                 if unit.network.treeName == nodeTree.name)
+
+    identifiers = set()
+    for unit in units:
+        identifiers.update(getattr(unit, "deadNodeIdentifiers", ()))
+    return identifiers
+
 def getExecutionUnitByNetwork(network):
     for unit in getExecutionUnits([network.nodeTree]):
         if unit.network == network: return unit
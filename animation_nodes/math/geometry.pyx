@@ -16,7 +16,7 @@ cdef double distancePointToPlane(Vector3* planePoint, Vector3* planeNormal, Vect
     normalizeVec3_InPlace(&normPlaneNormal)
     return abs(signedDistancePointToPlane_Normalized(planePoint, &normPlaneNormal, point))
 
-cdef double signedDistancePointToPlane_Normalized(Vector3* planePoint, Vector3* normalizedPlaneNormal, Vector3* point):
+cdef double signedDistancePointToPlane_Normalized(Vector3* planePoint, Vector3* normalizedPlaneNormal, Vector3* point) nogil:
     cdef Vector3 diff
     diff.x = point.x - planePoint.x
     diff.y = point.y - planePoint.y
@@ -1,5 +1,10 @@
+# setup: options = openmp
+
+from cython.parallel cimport prange
+from . euler cimport Euler3
 from . conversion cimport toMatrix4
-from . vector cimport distanceVec3, mixVec3
+from .. utils.parallel cimport getThreadAmount
+from . vector cimport distanceVec3, mixVec3, scaleVec3_Inplace
 from . matrix cimport (transformVec3AsPoint_InPlace, transformVec3AsDirection_InPlace,
                        multMatrix4, setIdentityMatrix, setComposedMatrix)
 
@@ -9,8 +14,16 @@ cpdef void transformVector3DList(Vector3DList vectors, matrix, bint ignoreTransl
     transformVector3DListAsPoints(vectors.data, vectors.length, &_matrix, ignoreTranslation)
 
 cdef void transformVector3DListAsPoints(Vector3* vectors, long arrayLength, Matrix4* matrix, bint ignoreTranslation):
+    cdef int threads = getThreadAmount(arrayLength)
     cdef long i
-    if ignoreTranslation:
+    if threads > 1:
+        if ignoreTranslation:
+            for i in prange(arrayLength, nogil = True, num_threads = threads):
+                transformVec3AsDirection_InPlace(vectors + i, matrix)
+        else:
+            for i in prange(arrayLength, nogil = True, num_threads = threads):
+                transformVec3AsPoint_InPlace(vectors + i, matrix)
+    elif ignoreTranslation:
         for i in range(arrayLength):
             transformVec3AsDirection_InPlace(vectors + i, matrix)
     else:
@@ -23,10 +36,19 @@ cpdef Matrix4x4List composeMatrixList(Vector3DList locations, EulerList rotation
         raise ValueError("lists have different lengths")
     cdef:
         Matrix4x4List newList = Matrix4x4List(length = len(locations))
-        Py_ssize_t i
+        Matrix4 *_matrices = newList.data
+        Vector3 *_locations = locations.data
+        Euler3 *_rotations = rotations.data
+        Vector3 *_scales = scales.data
+        Py_ssize_t i, amount = len(locations)
+        int threads = getThreadAmount(amount)
 
-    for i in range(len(locations)):
-        setComposedMatrix(newList.data + i, locations.data + i, rotations.data + i, scales.data + i)
+    if threads > 1:
+        for i in prange(amount, nogil = True, num_threads = threads):
+            setComposedMatrix(_matrices + i, _locations + i, _rotations + i, _scales + i)
+    else:
+        for i in range(amount):
+            setComposedMatrix(_matrices + i, _locations + i, _rotations + i, _scales + i)
     return newList
 
 
@@ -46,8 +68,11 @@ cdef void mixVec3Arrays(Vector3* target, Vector3* a, Vector3* b, long arrayLengt
 
 def scaleVector3DList(Vector3DList vectors, float factor):
     cdef Vector3* data = vectors.data
+    cdef int threads = getThreadAmount(vectors.length)
     cdef long i
-    for i in range(vectors.length):
-        data[i].x *= factor
-        data[i].y *= factor
-        data[i].z *= factor
+    if threads > 1:
+        for i in prange(vectors.length, nogil = True, num_threads = threads):
+            scaleVec3_Inplace(data + i, factor)
+    else:
+        for i in range(vectors.length):
+            scaleVec3_Inplace(data + i, factor)
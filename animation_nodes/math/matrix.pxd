@@ -16,51 +16,51 @@ ctypedef fused Matrix3_or_Matrix4:
     Matrix3
     Matrix4
 
-cdef void transformVec3AsPoint_InPlace(Vector3* vector, Matrix4* matrix)
-cdef void transformVec3AsPoint(Vector3* target, Vector3* vector, Matrix4* matrix)
+cdef void transformVec3AsPoint_InPlace(Vector3* vector, Matrix4* matrix) nogil
+cdef void transformVec3AsPoint(Vector3* target, Vector3* vector, Matrix4* matrix) nogil
 
-cdef void transformVec3AsDirection_InPlace(Vector3* v, Matrix3_or_Matrix4* m)
-cdef void transformVec3AsDirection(Vector3* target, Vector3* v, Matrix3_or_Matrix4* m)
+cdef void transformVec3AsDirection_InPlace(Vector3* v, Matrix3_or_Matrix4* m) nogil
+cdef void transformVec3AsDirection(Vector3* target, Vector3* v, Matrix3_or_Matrix4* m) nogil
 
-cdef void multMatrix4AndVec4(Vector4* target, Matrix4* m, Vector4* v)
+cdef void multMatrix4AndVec4(Vector4* target, Matrix4* m, Vector4* v) nogil
 
-cdef void setIdentityMatrix(Matrix3_or_Matrix4* m)
-cdef void setTranslationMatrix(Matrix4* m, Vector3* v)
-cdef void setRotationMatrix(Matrix3_or_Matrix4* m, Euler3* e)
-cdef void setScaleMatrix(Matrix3_or_Matrix4* m, Vector3* s)
-cdef void setMatrixTranslation(Matrix4* m, Vector3* v)
+cdef void setIdentityMatrix(Matrix3_or_Matrix4* m) nogil
+cdef void setTranslationMatrix(Matrix4* m, Vector3* v) nogil
+cdef void setRotationMatrix(Matrix3_or_Matrix4* m, Euler3* e) nogil
+cdef void setScaleMatrix(Matrix3_or_Matrix4* m, Vector3* s) nogil
+cdef void setMatrixTranslation(Matrix4* m, Vector3* v) nogil
 
-cdef void setTranslationScaleMatrix(Matrix4* m, Vector3* t, Vector3* s)
-cdef void setRotationScaleMatrix(Matrix3_or_Matrix4* m, Euler3* e, Vector3* s)
-cdef void setTranslationRotationScaleMatrix(Matrix4* m, Vector3* t, Euler3* e, Vector3* s)
+cdef void setTranslationScaleMatrix(Matrix4* m, Vector3* t, Vector3* s) nogil
+cdef void setRotationScaleMatrix(Matrix3_or_Matrix4* m, Euler3* e, Vector3* s) nogil
+cdef void setTranslationRotationScaleMatrix(Matrix4* m, Vector3* t, Euler3* e, Vector3* s) nogil
 
-cdef void setRotationXMatrix(Matrix3_or_Matrix4* m, float angle)
-cdef void setRotationYMatrix(Matrix3_or_Matrix4* m, float angle)
-cdef void setRotationZMatrix(Matrix3_or_Matrix4* m, float angle)
+cdef void setRotationXMatrix(Matrix3_or_Matrix4* m, float angle) nogil
+cdef void setRotationYMatrix(Matrix3_or_Matrix4* m, float angle) nogil
+cdef void setRotationZMatrix(Matrix3_or_Matrix4* m, float angle) nogil
 
 cdef void mult3xMatrix_Reversed(Matrix3_or_Matrix4* target,
             Matrix3_or_Matrix4* m1,
             Matrix3_or_Matrix4* m2,
-            Matrix3_or_Matrix4* m3)
+            Matrix3_or_Matrix4* m3) nogil
 
-cdef void setComposedMatrix(Matrix4* m, Vector3* t, Euler3* e, Vector3* s)
+cdef void setComposedMatrix(Matrix4* m, Vector3* t, Euler3* e, Vector3* s) nogil
 
-cdef void convertMatrix3ToMatrix4(Matrix4* t, Matrix3* s)
-cdef void convertMatrix4ToMatrix3(Matrix3* t, Matrix4* s)
+cdef void convertMatrix3ToMatrix4(Matrix4* t, Matrix3* s) nogil
+cdef void convertMatrix4ToMatrix3(Matrix3* t, Matrix4* s) nogil
 
-cdef void multMatrix3(Matrix3_or_Matrix4* target, Matrix3_or_Matrix4* x, Matrix3_or_Matrix4* y)
-cdef void multMatrix4(Matrix4* target, Matrix4* x, Matrix4* y)
-cdef void multMatrix3Parts(Matrix4* target, Matrix4* x, Matrix4* y, bint keepFirst = ?)
+cdef void multMatrix3(Matrix3_or_Matrix4* target, Matrix3_or_Matrix4* x, Matrix3_or_Matrix4* y) nogil
+cdef void multMatrix4(Matrix4* target, Matrix4* x, Matrix4* y) nogil
+cdef void multMatrix3Parts(Matrix4* target, Matrix4* x, Matrix4* y, bint keepFirst = ?) nogil
 
-cdef void normalizeMatrix_3x3_Part(Matrix3_or_Matrix4* t, Matrix3_or_Matrix4* m)
+cdef void normalizeMatrix_3x3_Part(Matrix3_or_Matrix4* t, Matrix3_or_Matrix4* m) nogil
 
-cdef void transposeMatrix_Inplace(Matrix3_or_Matrix4 *m)
-cdef void transposeMatrix(Matrix3_or_Matrix4* t, Matrix3_or_Matrix4 *m)
+cdef void transposeMatrix_Inplace(Matrix3_or_Matrix4 *m) nogil
+cdef void transposeMatrix(Matrix3_or_Matrix4* t, Matrix3_or_Matrix4 *m) nogil
 
-cdef void invertOrthogonalTransformation(Matrix4* t, Matrix4* m)
-cdef void scaleMatrix3x3Part(Matrix3_or_Matrix4 *m, float s)
+cdef void invertOrthogonalTransformation(Matrix4* t, Matrix4* m) nogil
+cdef void scaleMatrix3x3Part(Matrix3_or_Matrix4 *m, float s) nogil
 
-cdef float getMatrix3x3PartDeterminant(Matrix3_or_Matrix4 *m)
+cdef float getMatrix3x3PartDeterminant(Matrix3_or_Matrix4 *m) nogil
 
 cdef void matrixFromNormalizedAxisData(Matrix4 *m, Vector3 *center, Vector3 *tangent,
-                                       Vector3 *bitangent, Vector3 *normal)
+                                       Vector3 *bitangent, Vector3 *normal) nogil
@@ -0,0 +1,45 @@
+import numpy
+from unittest import TestCase
+from .. preferences import applyThreadAmount
+from .. utils.parallel import setThreadAmount
+from .. data_structures import Vector3DList
+from . list_operations import scaleVector3DList, composeMatrixList
+from .. nodes.rotation.c_utils import vectorsToEulers
+
+# Lists with at least minParallelAmount (50000) elements are processed
+# on multiple threads. The results have to be the same as with one thread.
+
+amount = 100000
+
+def randomVectors(seed):
+    values = numpy.random.RandomState(seed).uniform(-10, 10, (amount, 3)).astype(numpy.float32)
+    return Vector3DList.fromNumpyArray(values.ravel())
+
+def randomEulers(seed):
+    return vectorsToEulers(randomVectors(seed), False)
+
+class TestSerialAndThreadedResults(TestCase):
+    def tearDown(self):
+        applyThreadAmount()
+
+    def compute(self, function, threadAmount):
+        setThreadAmount(threadAmount)
+        return function()
+
+    def assertSameResults(self, function):
+        serial = self.compute(function, 1)
+        threaded = self.compute(function, 4)
+        self.assertTrue(numpy.allclose(serial.asNumpyArray(), threaded.asNumpyArray(), rtol = 1e-6, atol = 0))
+
+    def testScaleVectors(self):
+        def scale():
+            vectors = randomVectors(0)
+            scaleVector3DList(vectors, 1.7)
+            return vectors
+        self.assertSameResults(scale)
+
+    def testComposeMatrices(self):
+        locations, rotations, scales = randomVectors(1), randomEulers(2), randomVectors(3)
+        def compose():
+            return composeMatrixList(locations, rotations, scales)
+        self.assertSameResults(compose)
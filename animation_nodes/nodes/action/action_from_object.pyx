@@ -1,9 +1,11 @@
 import bpy
 from ... base_types import AnimationNode
 from ... utils.attributes import pathBelongsToArray
+from ... data_structures.fcurve_snapshot import getFCurveSnapshot
 from ... data_structures cimport (
     BoundedAction, BoundedActionEvaluator,
-    PathActionChannel, PathIndexActionChannel
+    PathActionChannel, PathIndexActionChannel,
+    FCurveSnapshot
 )
 
 class ActionFromObjectNode(AnimationNode, bpy.types.Node):
@@ -55,11 +57,11 @@ cdef class FCurveAction(BoundedAction):
         return FCurveActionEvaluator(fCurves)
 
 cdef class FCurveActionEvaluator(BoundedActionEvaluator):
-    cdef list fCurves
+    cdef list snapshots
     cdef float start, end, length
 
     def __cinit__(self, list fCurves):
-        self.fCurves = fCurves
+        self.snapshots = [getFCurveSnapshot(fCurve) for fCurve in fCurves]
         self.channelAmount = len(fCurves)
         self.start, self.end = self.calculateRange(fCurves)
         self.length = self.end - self.start
@@ -87,7 +89,7 @@ cdef class FCurveActionEvaluator(BoundedActionEvaluator):
     cdef void evaluate(self, float frame, Py_ssize_t index, float *target):
         cdef Py_ssize_t i
         for i in range(self.channelAmount):
-            target[i] = self.fCurves[i].evaluate(frame)
+            target[i] = (<FCurveSnapshot>self.snapshots[i]).evaluate(frame)
 
     cpdef float getStart(self, Py_ssize_t index):
         return self.start
@@ -7,6 +7,7 @@ a = None
 class ActionViewerNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ActionViewerNode"
     bl_label = "Action Viewer"
+    hasSideEffects = True
 
     def create(self):
         self.newInput("Action", "Action", "action")
@@ -23,6 +23,7 @@ modeItems = [
 class ObjectActionOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ObjectActionOutputNode"
     bl_label = "Object Action Output"
+    hasSideEffects = True
     errorHandlingType = "MESSAGE"
 
     __annotations__ = {}
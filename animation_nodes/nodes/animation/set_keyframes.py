@@ -16,6 +16,7 @@ class SetKeyframesNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_SetKeyframesNode"
     bl_label = "Set Keyframes"
     bl_width_default = 200
+    hasSideEffects = True
     errorHandlingType = "MESSAGE"
 
     paths: CollectionProperty(type = KeyframePath)
@@ -5,6 +5,7 @@ class TimeInfoNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_TimeInfoNode"
     bl_label = "Time Info"
     searchTags = ["Frame"]
+    allowConstantFolding = False
 
     def create(self):
         self.newInput("Scene", "Scene", "scene", hide = True)
@@ -1,8 +1,8 @@
 import bpy
 from bpy.props import *
-from mathutils.bvhtree import BVHTree
 from ... base_types import AnimationNode
 from ... utils.depsgraph import getEvaluatedID
+from ... data_structures import BVHTree, Vector3DList, PolygonIndicesList
 
 sourceTypeItems = [
     ("MESH_DATA", "Mesh", "", "NONE", 0),
@@ -43,10 +43,13 @@ class ConstructBVHTreeNode(AnimationNode, bpy.types.Node):
         if len(mesh.polygons) == 0:
             return self.getFallbackBVHTree()
 
-        return BVHTree.FromPolygons(mesh.vertices, mesh.polygons, epsilon = max(epsilon, 0))
+        return BVHTree(mesh.vertices, mesh.polygons, epsilon)
 
     def execute_BMesh(self, bm, epsilon):
-        return BVHTree.FromBMesh(bm, epsilon = max(epsilon, 0))
+        bm.verts.index_update()
+        vertices = Vector3DList.fromValues(v.co for v in bm.verts)
+        polygons = PolygonIndicesList.fromValues(tuple(v.index for v in face.verts) for face in bm.faces)
+        return BVHTree(vertices, polygons, epsilon)
 
     def execute_Object(self, object, epsilon):
         if object is None:
@@ -62,7 +65,7 @@ class ConstructBVHTreeNode(AnimationNode, bpy.types.Node):
         vertices = mesh.an.getVertices()
         vertices.transform(evaluatedObject.matrix_world)
 
-        return BVHTree.FromPolygons(vertices, polygons, epsilon = max(epsilon, 0))
+        return BVHTree(vertices, polygons, epsilon)
 
     def getFallbackBVHTree(self):
         return self.outputs[0].getDefaultValue()
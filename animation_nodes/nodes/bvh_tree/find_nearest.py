@@ -5,7 +5,6 @@ class FindNearestSurfacePointNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_FindNearestSurfacePointNode"
     bl_label = "Find Nearest Surface Point"
     bl_width_default = 160
-    codeEffects = [VectorizedSocket.CodeEffect]
 
     useVectorList: VectorizedSocket.newProperty()
 
@@ -35,6 +34,10 @@ class FindNearestSurfacePointNode(AnimationNode, bpy.types.Node):
             ("Hit", "hit"), ("Hits", "hits")))
 
     def getExecutionCode(self, required):
+        if self.useVectorList:
+            yield "locations, normals, distances, polygonIndices, hits = bvhTree.findNearestList(vectors, maxDistance)"
+            return
+
         yield "location, normal, polygonIndex, distance = bvhTree.find_nearest(vector, maxDistance)"
         yield "if location is None:"
         yield "    location = Vector((0, 0, 0))"
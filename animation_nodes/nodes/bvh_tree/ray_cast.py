@@ -7,7 +7,6 @@ class RayCastBVHTreeNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_RayCastBVHTreeNode"
     bl_label = "Ray Cast BVHTree"
     bl_width_default = 160
-    codeEffects = [VectorizedSocket.CodeEffect]
 
     useStartList: VectorizedSocket.newProperty()
     useDirectionList: VectorizedSocket.newProperty()
@@ -48,6 +47,10 @@ class RayCastBVHTreeNode(AnimationNode, bpy.types.Node):
         layout.prop(self, "startInInfinity")
 
     def getExecutionCode(self, required):
+        if self.useStartList or self.useDirectionList:
+            yield from self.iterListCode()
+            return
+
         yield "_direction = direction.normalized()"
         if self.startInInfinity:
             yield from self.iterStartInInfinityCode()
@@ -77,3 +80,19 @@ class RayCastBVHTreeNode(AnimationNode, bpy.types.Node):
         yield "    hit = False"
         yield "else:"
         yield "    hit = True"
+
+    def iterListCode(self):
+        if not self.useStartList:
+            yield "starts = Vector3DList.fromValue(start, len(directions))"
+        if not self.useDirectionList:
+            yield "directions = Vector3DList.fromValue(direction, len(starts))"
+        if self.useStartList and self.useDirectionList:
+            yield "if len(starts) != len(directions):"
+            yield "    _amount = min(len(starts), len(directions))"
+            yield "    starts, directions = starts[:_amount], directions[:_amount]"
+
+        if self.startInInfinity:
+            yield "locations, normals, _, polygonIndices, hits = bvhTree.rayCastList(starts, directions, -100000)"
+            yield "distances = DoubleList.fromValue(0, len(locations))"
+        else:
+            yield "locations, normals, distances, polygonIndices, hits = bvhTree.rayCastList(starts, directions, minDistance, maxDistance)"
@@ -19,6 +19,7 @@ colorLayerIdentifierTypeItems = [
 class SetVertexColorNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_SetVertexColorNode"
     bl_label = "Set Vertex Color"
+    hasSideEffects = True
     errorHandlingType = "EXCEPTION"
 
     colorMode: EnumProperty(name = "Color Mode", default = "LOOP",
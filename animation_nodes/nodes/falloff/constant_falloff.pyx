@@ -1,6 +1,6 @@
 import bpy
 from ... base_types import AnimationNode
-from ... data_structures cimport BaseFalloff
+from ... data_structures cimport BaseFalloff, BaseFalloffListFunction
 
 class ConstantFalloffNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ConstantFalloffNode"
@@ -27,6 +27,15 @@ cdef class ConstantFalloff(BaseFalloff):
 
     cdef void evaluateList(self, void *values, Py_ssize_t startIndex,
                            Py_ssize_t amount, float *target):
-        cdef Py_ssize_t i
-        for i in range(amount):
-            target[i] = self.value
+        evaluateConstantList(&self.value, values, startIndex, amount, target)
+
+    cdef BaseFalloffListFunction getListFunction_NoGil(self, void **outSettings):
+        outSettings[0] = &self.value
+        return evaluateConstantList
+
+cdef void evaluateConstantList(void *settings, void *values, Py_ssize_t startIndex,
+                               Py_ssize_t amount, float *target) nogil:
+    cdef float value = (<float*>settings)[0]
+    cdef Py_ssize_t i
+    for i in range(amount):
+        target[i] = value
@@ -1,6 +1,7 @@
+cimport cython
 import bpy
 from bpy.props import *
-from ... data_structures cimport BaseFalloff
+from ... data_structures cimport BaseFalloff, BaseFalloffListFunction
 from ... base_types import AnimationNode
 from . constant_falloff import ConstantFalloff
 from ... math cimport Vector3, setVector3, normalizeVec3_InPlace
@@ -37,31 +38,63 @@ class DirectionalFalloffNode(AnimationNode, bpy.types.Node):
             return ConstantFalloff(0)
 
 
+cdef struct DirectionalSettings:
+    Vector3 position, direction
+    float size
+
 cdef class DirectionalFalloff(BaseFalloff):
-    cdef float size
-    cdef Vector3 position, direction
+    cdef DirectionalSettings settings
 
     def __cinit__(self, position, direction, float size):
         assert size >= 0
         if size == 0: size = 0.00001
-        setVector3(&self.position, position)
-        setVector3(&self.direction, direction)
-        normalizeVec3_InPlace(&self.direction)
-        self.size = size
+        setVector3(&self.settings.position, position)
+        setVector3(&self.settings.direction, direction)
+        normalizeVec3_InPlace(&self.settings.direction)
+        self.settings.size = size
         self.clamped = True
         self.dataType = "LOCATION"
 
 cdef class UniDirectionalFalloff(DirectionalFalloff):
     cdef float evaluate(self, void *value, Py_ssize_t index):
-        cdef float distance = signedDistance(&self.position, &self.direction, <Vector3*>value)
-        cdef float result = 1 - distance / self.size
-        if result < 0: return 0
-        if result > 1: return 1
-        return result
+        return calcUniDirectional(&self.settings, <Vector3*>value)
+
+    cdef BaseFalloffListFunction getListFunction_NoGil(self, void **outSettings):
+        outSettings[0] = &self.settings
+        return evaluateUniDirectionalList
 
 cdef class BiDirectionalFalloff(DirectionalFalloff):
     cdef float evaluate(self, void *value, Py_ssize_t index):
-        cdef float distance = abs(signedDistance(&self.position, &self.direction, <Vector3*>value))
-        cdef float result = 1 - distance / self.size
-        if result < 0: return 0
-        return result
+        return calcBiDirectional(&self.settings, <Vector3*>value)
+
+    cdef BaseFalloffListFunction getListFunction_NoGil(self, void **outSettings):
+        outSettings[0] = &self.settings
+        return evaluateBiDirectionalList
+
+
+cdef void evaluateUniDirectionalList(void *settings, void *values, Py_ssize_t startIndex,
+                                     Py_ssize_t amount, float *target) nogil:
+    cdef Py_ssize_t i
+    for i in range(amount):
+        target[i] = calcUniDirectional(<DirectionalSettings*>settings, <Vector3*>values + i)
+
+cdef void evaluateBiDirectionalList(void *settings, void *values, Py_ssize_t startIndex,
+                                    Py_ssize_t amount, float *target) nogil:
+    cdef Py_ssize_t i
+    for i in range(amount):
+        target[i] = calcBiDirectional(<DirectionalSettings*>settings, <Vector3*>values + i)
+
+@cython.cdivision(True)
+cdef inline float calcUniDirectional(DirectionalSettings *settings, Vector3 *v) nogil:
+    cdef float distance = signedDistance(&settings.position, &settings.direction, v)
+    cdef float result = 1 - distance / settings.size
+    if result < 0: return 0
+    if result > 1: return 1
+    return result
+
+@cython.cdivision(True)
+cdef inline float calcBiDirectional(DirectionalSettings *settings, Vector3 *v) nogil:
+    cdef float distance = abs(signedDistance(&settings.position, &settings.direction, v))
+    cdef float result = 1 - distance / settings.size
+    if result < 0: return 0
+    return result
@@ -1,10 +1,8 @@
 import bpy
 import cython
-from mathutils import Vector
 from ... math cimport Vector3
-from ... utils.bvh import isInsideVolume
 from ... base_types import AnimationNode
-from ... data_structures cimport BaseFalloff
+from ... data_structures cimport BaseFalloff, BVHTree, BVHHit
 from . constant_falloff import ConstantFalloff
 
 class MeshFalloffNode(AnimationNode, bpy.types.Node):
@@ -25,13 +23,13 @@ class MeshFalloffNode(AnimationNode, bpy.types.Node):
 
 cdef class MeshFalloff(BaseFalloff):
     cdef:
-        bvhTree
+        BVHTree bvhTree
         float factor
         bint fillInside
         float minDistance, maxDistance
 
     @cython.cdivision(True)
-    def __cinit__(self, bvhTree,float size, float falloffWidth, bint fillInside):
+    def __cinit__(self, BVHTree bvhTree, float size, float falloffWidth, bint fillInside):
         self.bvhTree = bvhTree
         self.fillInside = fillInside
         if falloffWidth < 0:
@@ -53,14 +51,16 @@ cdef class MeshFalloff(BaseFalloff):
         cdef Vector3* v
         v = <Vector3*>value
         if self.fillInside:
-            strength = <float>isInsideVolume(self.bvhTree, Vector((v.x, v.y, v.z)))
+            strength = <float>self.bvhTree.isInsideVolume_LowLevel(v)
             distance = calculateDistance(self, v)
             return max(distance, strength)
         else:
             return calculateDistance(self, <Vector3*>value)
 
 cdef inline float calculateDistance(MeshFalloff self, Vector3 *v):
-    cdef float distance = self.bvhTree.find_nearest(Vector((v.x, v.y, v.z)), 1e10)[3]
+    cdef BVHHit hit
+    if not self.bvhTree.findNearest_LowLevel(v, 1e10, &hit): return 0
+    cdef float distance = hit.distance
     if distance <= self.minDistance: return 1
     if distance <= self.maxDistance: return 1 - (distance - self.minDistance) * self.factor
     return 0
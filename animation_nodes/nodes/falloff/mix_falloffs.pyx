@@ -2,7 +2,7 @@ import bpy
 from bpy.props import *
 from ... base_types import AnimationNode
 from . constant_falloff import ConstantFalloff
-from ... data_structures cimport CompoundFalloff, Falloff
+from ... data_structures cimport CompoundFalloff, Falloff, CompoundFalloffListFunction
 
 mixTypeItems = [
     ("ADD", "Add", "", "NONE", 0),
@@ -95,55 +95,50 @@ cdef class AddTwoFalloffs(MixTwoFalloffsBase):
         return dependencyResults[0] + dependencyResults[1]
 
     cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
-        cdef Py_ssize_t i
-        cdef float *a = dependencyResults[0]
-        cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = a[i] + b[i]
+        addTwoFalloffLists(NULL, dependencyResults, amount, target)
+
+    cdef CompoundFalloffListFunction getListFunction_NoGil(self, void **outSettings):
+        return addTwoFalloffLists
 
 cdef class MultiplyTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         return dependencyResults[0] * dependencyResults[1]
 
     cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
-        cdef Py_ssize_t i
-        cdef float *a = dependencyResults[0]
-        cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = a[i] * b[i]
+        multiplyTwoFalloffLists(NULL, dependencyResults, amount, target)
+
+    cdef CompoundFalloffListFunction getListFunction_NoGil(self, void **outSettings):
+        return multiplyTwoFalloffLists
 
 cdef class MinTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         return min(dependencyResults[0], dependencyResults[1])
 
     cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
-        cdef Py_ssize_t i
-        cdef float *a = dependencyResults[0]
-        cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = min(a[i], b[i])
+        minTwoFalloffLists(NULL, dependencyResults, amount, target)
+
+    cdef CompoundFalloffListFunction getListFunction_NoGil(self, void **outSettings):
+        return minTwoFalloffLists
 
 cdef class MaxTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         return max(dependencyResults[0], dependencyResults[1])
 
     cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
-        cdef Py_ssize_t i
-        cdef float *a = dependencyResults[0]
-        cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = max(a[i], b[i])
+        maxTwoFalloffLists(NULL, dependencyResults, amount, target)
+
+    cdef CompoundFalloffListFunction getListFunction_NoGil(self, void **outSettings):
+        return maxTwoFalloffLists
 
 cdef class SubtractTwoFalloffs(MixTwoFalloffsBase):
     cdef float evaluate(self, float *dependencyResults):
         return dependencyResults[0] - dependencyResults[1]
 
     cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
-        cdef Py_ssize_t i
-        cdef float *a = dependencyResults[0]
-        cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            target[i] = a[i] - b[i]
+        subtractTwoFalloffLists(NULL, dependencyResults, amount, target)
+
+    cdef CompoundFalloffListFunction getListFunction_NoGil(self, void **outSettings):
+        return subtractTwoFalloffLists
 
 # Overlay is defined as follows:
 # - First the A falloff is clamped.
@@ -169,14 +164,62 @@ cdef class OverlayTwoFalloffs(MixTwoFalloffsBase):
             return a + b * (1 - a)
 
     cdef void evaluateList(self, float **dependencyResults, Py_ssize_t amount, float *target):
-        cdef Py_ssize_t i
-        cdef float *a = dependencyResults[0]
-        cdef float *b = dependencyResults[1]
-        for i in range(amount):
-            if a[i] < 0.5:
-                target[i] = a[i] * (1 + b[i])
-            else:
-                target[i] = a[i] + b[i] * (1 - a[i])
+        overlayTwoFalloffLists(NULL, dependencyResults, amount, target)
+
+    cdef CompoundFalloffListFunction getListFunction_NoGil(self, void **outSettings):
+        return overlayTwoFalloffLists
+
+
+cdef void addTwoFalloffLists(void *settings, float **dependencyResults,
+                             Py_ssize_t amount, float *target) nogil:
+    cdef Py_ssize_t i
+    cdef float *a = dependencyResults[0]
+    cdef float *b = dependencyResults[1]
+    for i in range(amount):
+        target[i] = a[i] + b[i]
+
+cdef void multiplyTwoFalloffLists(void *settings, float **dependencyResults,
+                                  Py_ssize_t amount, float *target) nogil:
+    cdef Py_ssize_t i
+    cdef float *a = dependencyResults[0]
+    cdef float *b = dependencyResults[1]
+    for i in range(amount):
+        target[i] = a[i] * b[i]
+
+cdef void minTwoFalloffLists(void *settings, float **dependencyResults,
+                             Py_ssize_t amount, float *target) nogil:
+    cdef Py_ssize_t i
+    cdef float *a = dependencyResults[0]
+    cdef float *b = dependencyResults[1]
+    for i in range(amount):
+        target[i] = min(a[i], b[i])
+
+cdef void maxTwoFalloffLists(void *settings, float **dependencyResults,
+                             Py_ssize_t amount, float *target) nogil:
+    cdef Py_ssize_t i
+    cdef float *a = dependencyResults[0]
+    cdef float *b = dependencyResults[1]
+    for i in range(amount):
+        target[i] = max(a[i], b[i])
+
+cdef void subtractTwoFalloffLists(void *settings, float **dependencyResults,
+                                  Py_ssize_t amount, float *target) nogil:
+    cdef Py_ssize_t i
+    cdef float *a = dependencyResults[0]
+    cdef float *b = dependencyResults[1]
+    for i in range(amount):
+        target[i] = a[i] - b[i]
+
+cdef void overlayTwoFalloffLists(void *settings, float **dependencyResults,
+                                 Py_ssize_t amount, float *target) nogil:
+    cdef Py_ssize_t i
+    cdef float *a = dependencyResults[0]
+    cdef float *b = dependencyResults[1]
+    for i in range(amount):
+        if a[i] < 0.5:
+            target[i] = a[i] * (1 + b[i])
+        else:
+            target[i] = a[i] + b[i] * (1 - a[i])
 
 
 cdef class MixFalloffsBase(CompoundFalloff):
@@ -1,7 +1,7 @@
 import bpy
 from bpy.props import *
 from ... events import propertyChanged
-from ... data_structures cimport BaseFalloff
+from ... data_structures cimport BaseFalloff, BaseFalloffListFunction
 from .. falloff . mix_falloffs import MixFalloffs
 from ... math cimport Vector3, setVector3, distanceVec3
 from ... base_types import AnimationNode, VectorizedSocket
@@ -60,39 +60,49 @@ class PointDistanceFalloffNode(AnimationNode, bpy.types.Node):
         return MixFalloffs(falloffs, self.mixListType)
 
 
+cdef struct PointDistanceSettings:
+    Vector3 origin
+    float factor
+    float minDistance, maxDistance
+
 cdef class PointDistanceFalloff(BaseFalloff):
-    cdef:
-        Vector3 origin
-        float factor
-        float minDistance, maxDistance
+    cdef PointDistanceSettings settings
 
     def __cinit__(self, vector, float size, float falloffWidth):
         if falloffWidth < 0:
             size += falloffWidth
             falloffWidth = -falloffWidth
-        self.minDistance = size
-        self.maxDistance = size + falloffWidth
+        self.settings.minDistance = size
+        self.settings.maxDistance = size + falloffWidth
 
-        if self.minDistance == self.maxDistance:
-            self.minDistance -= 0.00001
-        self.factor = 1 / (self.maxDistance - self.minDistance)
-        setVector3(&self.origin, vector)
+        if self.settings.minDistance == self.settings.maxDistance:
+            self.settings.minDistance -= 0.00001
+        self.settings.factor = 1 / (self.settings.maxDistance - self.settings.minDistance)
+        setVector3(&self.settings.origin, vector)
 
         self.dataType = "LOCATION"
         self.clamped = True
 
     cdef float evaluate(self, void *value, Py_ssize_t index):
-        return calcDistance(self, <Vector3*>value)
+        return calcDistance(&self.settings, <Vector3*>value)
 
     cdef void evaluateList(self, void *values, Py_ssize_t startIndex,
                            Py_ssize_t amount, float *target):
-        cdef Py_ssize_t i
-        for i in range(amount):
-            target[i] = calcDistance(self, <Vector3*>values + i)
+        evaluatePointDistanceList(&self.settings, values, startIndex, amount, target)
+
+    cdef BaseFalloffListFunction getListFunction_NoGil(self, void **outSettings):
+        outSettings[0] = &self.settings
+        return evaluatePointDistanceList
+
 
+cdef void evaluatePointDistanceList(void *settings, void *values, Py_ssize_t startIndex,
+                                    Py_ssize_t amount, float *target) nogil:
+    cdef Py_ssize_t i
+    for i in range(amount):
+        target[i] = calcDistance(<PointDistanceSettings*>settings, <Vector3*>values + i)
 
-cdef inline float calcDistance(PointDistanceFalloff self, Vector3 *v):
-    cdef float distance = distanceVec3(&self.origin, v)
-    if distance <= self.minDistance: return 1
-    if distance <= self.maxDistance: return 1 - (distance - self.minDistance) * self.factor
+cdef inline float calcDistance(PointDistanceSettings *settings, Vector3 *v) nogil:
+    cdef float distance = distanceVec3(&settings.origin, v)
+    if distance <= settings.minDistance: return 1
+    if distance <= settings.maxDistance: return 1 - (distance - settings.minDistance) * settings.factor
     return 0
@@ -15,6 +15,7 @@ class ExpressionNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ExpressionNode"
     bl_label = "Expression"
     bl_width_default = 200
+    hasSideEffects = True
     dynamicLabelType = "HIDDEN_ONLY"
 
     def settingChanged(self, context = None):
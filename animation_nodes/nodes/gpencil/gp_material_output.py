@@ -6,6 +6,7 @@ from ... base_types import AnimationNode
 class GPMaterialOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_GPMaterialOutputNode"
     bl_label = "GP Material Output"
+    hasSideEffects = True
     errorHandlingType = "EXCEPTION"
 
     def create(self):
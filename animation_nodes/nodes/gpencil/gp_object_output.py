@@ -1,16 +1,28 @@
 import bpy
+import zlib
 from bpy.props import *
+from collections import defaultdict
+from ... events import propertyChanged
+from ... data_structures import Color
+from ... utils.handlers import eventHandler
+from ... data_structures import PackedGPStrokes
 from ... base_types import AnimationNode, VectorizedSocket
 
 class GPObjectOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_GPObjectOutputNode"
     bl_label = "GP Object Output"
+    hasSideEffects = True
     errorHandlingType = "EXCEPTION"
 
     appendLayers: BoolProperty(name = "Append Layers", default = False,
         description = "This option allow to add custom layers",
         update = AnimationNode.refresh)
 
+    incrementalUpdate: BoolProperty(name = "Incremental Update", default = False,
+        description = ("Reuse the existing frames and strokes when the stroke and point amounts "
+                       "did not change since the last execution and only update changed data"),
+        update = propertyChanged)
+
     useLayerList: VectorizedSocket.newProperty()
 
     def create(self):
@@ -25,6 +37,15 @@ class GPObjectOutputNode(AnimationNode, bpy.types.Node):
         row = layout.row(align = True)
         row.prop(self, "appendLayers")
 
+        col = layout.column(align = True)
+        col.prop(self, "incrementalUpdate")
+        if self.incrementalUpdate:
+            counter = updateCounters[self.identifier]
+            col.label(text = "Full Rebuilds: {}".format(counter["REBUILD"]))
+            col.label(text = "Incremental Updates: {}".format(counter["INCREMENTAL"]))
+            col.label(text = "Skipped Buffers: {}".format(counter["SKIPPED_BUFFERS"]))
+            self.invokeFunction(col, "resetUpdateCounters", text = "Reset Counters")
+
     def getExecutionFunctionName(self):
         if self.useLayerList:
             return "execute_LayerList"
@@ -35,7 +56,7 @@ class GPObjectOutputNode(AnimationNode, bpy.types.Node):
         if object is None: return None
         if layer.layerName == "": return object
 
-        gpencil = self.getObjectData(object)
+        gpencil = self.getObjectData(object, [layer])
         self.setLayerData(gpencil, layer)
 
         self.setMaskLayers(gpencil, layer)
@@ -46,7 +67,7 @@ class GPObjectOutputNode(AnimationNode, bpy.types.Node):
         if object is None: return None
         if len(layers) == 0: return object
 
-        gpencil = self.getObjectData(object)
+        gpencil = self.getObjectData(object, layers)
         for layer in layers:
             self.setLayerData(gpencil, layer)
 
@@ -57,21 +78,55 @@ class GPObjectOutputNode(AnimationNode, bpy.types.Node):
 
     def setLayerData(self, gpencil, layer):
         gpencilLayer = self.getLayer(gpencil, layer)
+        if self.incrementalUpdate:
+            self.updateLayerFrames(gpencil, gpencilLayer, layer)
+            return
 
-        for frame in layer.frames:
+        for frame, strokes in zip(layer.frames, self.getPackedFrames(layer)):
             gpFrame = gpencilLayer.frames.new(frame.frameNumber, active = True)
-            for stroke in frame.strokes:
-                vertices = stroke.vertices
-                if len(vertices) > 0:
-                    gpStroke = gpFrame.strokes.new()
-                    self.setStrokeProperties(gpStroke, stroke)
-                    gpPoints = gpStroke.points
-                    gpPoints.add(len(vertices), strength = 0.75, pressure = 1)
-                    gpPoints.foreach_set("co", vertices.asNumpyArray())
-                    gpPoints.foreach_set("strength", stroke.strengths)
-                    gpPoints.foreach_set("pressure", stroke.pressures)
-                    gpPoints.foreach_set("uv_rotation", stroke.uvRotations)
-                    gpPoints.foreach_set("vertex_color", stroke.vertexColors.asNumpyArray())
+            createStrokes(gpFrame, strokes)
+            gpFrame.strokes.update()
+
+    def getPackedFrames(self, layer):
+        cacheKey = (self.identifier, layer.layerName)
+        lastEntries = packedStrokesCache.get(cacheKey, {})
+        entries = {}
+        packedFrames = []
+        for frame in layer.frames:
+            strokesKey = getStrokesKey(frame.strokes)
+            entry = lastEntries.get(frame.frameNumber)
+            if entry is None or entry[0] != strokesKey:
+                entry = (strokesKey, PackedGPStrokes.fromStrokes(frame.strokes))
+            entries[frame.frameNumber] = entry
+            packedFrames.append(entry[1])
+        packedStrokesCache[cacheKey] = entries
+        return packedFrames
+
+    def updateLayerFrames(self, gpencil, gpencilLayer, layer):
+        counter = updateCounters[self.identifier]
+        gpFrames = {gpFrame.frame_number : gpFrame for gpFrame in gpencilLayer.frames}
+        frameNumbers = {frame.frameNumber for frame in layer.frames}
+        for frameNumber, gpFrame in gpFrames.items():
+            if frameNumber not in frameNumbers:
+                gpencilLayer.frames.remove(gpFrame)
+
+        for frame, strokes in zip(layer.frames, self.getPackedFrames(layer)):
+            fingerprint = getStrokesFingerprint(strokes)
+            stateKey = (gpencil.as_pointer(), layer.layerName, frame.frameNumber)
+            state = frameStates.get(stateKey)
+            gpFrame = gpFrames.get(frame.frameNumber)
+
+            if gpFrame is not None and state is not None and state.canBeUpdated(fingerprint, gpFrame):
+                counter["SKIPPED_BUFFERS"] += updateStrokes(gpFrame, strokes, state)
+                counter["INCREMENTAL"] += 1
+            else:
+                if gpFrame is None:
+                    gpFrame = gpencilLayer.frames.new(frame.frameNumber, active = True)
+                else:
+                    gpFrame.clear()
+                createStrokes(gpFrame, strokes)
+                frameStates[stateKey] = FrameState(fingerprint, getBufferChecksums(strokes))
+                counter["REBUILD"] += 1
             gpFrame.strokes.update()
 
     def setMaskLayers(self, gpencil, layer):
@@ -81,23 +136,16 @@ class GPObjectOutputNode(AnimationNode, bpy.types.Node):
         for maskLayer in layer.maskLayers:
             maskLayerName = maskLayer.layerName
             if maskLayerName in gpLayers and maskLayerName != layerName and maskLayerName != "":
-                gpencilLayer.mask_layers.add(gpLayers[maskLayerName])
+                if maskLayerName not in gpencilLayer.mask_layers:
+                    gpencilLayer.mask_layers.add(gpLayers[maskLayerName])
                 gpencilLayer.mask_layers[maskLayerName].invert = maskLayer.invertAsMask
 
-    def setStrokeProperties(self, gpStroke, stroke):
-        gpStroke.line_width = stroke.lineWidth
-        gpStroke.hardness = stroke.hardness
-        gpStroke.use_cyclic = stroke.useCyclic
-        gpStroke.start_cap_mode = stroke.startCapMode
-        gpStroke.end_cap_mode = stroke.endCapMode
-        gpStroke.vertex_color_fill = stroke.vertexColorFill
-        gpStroke.material_index = stroke.materialIndex
-        gpStroke.display_mode = stroke.displayMode
-
     def getLayer(self, gpencil, layer):
         layerName = layer.layerName
         gpLayers = gpencil.layers
-        if layerName in gpLayers and self.appendLayers:
+        if layerName in gpLayers and self.incrementalUpdate:
+            gpencilLayer = gpLayers[layerName]
+        elif layerName in gpLayers and self.appendLayers:
             gpencilLayer = gpLayers[layerName]
             gpencilLayer.clear()
         else:
@@ -113,11 +161,174 @@ class GPObjectOutputNode(AnimationNode, bpy.types.Node):
             gpencilLayer.use_mask_layer = True
         return gpencilLayer
 
-    def getObjectData(self, object):
+    def getObjectData(self, object, layers):
         if object.type != "GPENCIL":
             self.raiseErrorMessage("Object is not a grease pencil object.")
         if object.mode == "EDIT":
             self.raiseErrorMessage("Object is not in object mode.")
         gpencil = object.data
-        if not self.appendLayers: gpencil.clear()
+        if not self.appendLayers:
+            if self.incrementalUpdate:
+                layerNames = {layer.layerName for layer in layers}
+                for gpencilLayer in list(gpencil.layers):
+                    if gpencilLayer.info not in layerNames:
+                        gpencil.layers.remove(gpencilLayer)
+            else:
+                gpencil.clear()
         return gpencil
+
+    def resetUpdateCounters(self):
+        updateCounters.pop(self.identifier, None)
+
+    def delete(self):
+        for key in [key for key in packedStrokesCache if key[0] == self.identifier]:
+            del packedStrokesCache[key]
+
+
+# Stroke Creation
+###########################################
+
+def createStrokes(gpFrame, strokes):
+    gpStrokes = gpFrame.strokes
+    for i in range(len(strokes)):
+        gpStroke = gpStrokes.new()
+        gpStroke.points.add(strokes.pointAmounts[i], strength = 0.75, pressure = 1)
+        # only set the enum properties that differ from the defaults of a new stroke
+        if strokes.startCapModes[i] != "ROUND": gpStroke.start_cap_mode = strokes.startCapModes[i]
+        if strokes.endCapModes[i] != "ROUND": gpStroke.end_cap_mode = strokes.endCapModes[i]
+        if strokes.displayModes[i] != "3DSPACE": gpStroke.display_mode = strokes.displayModes[i]
+
+    # new points have the default values already
+    setPointBuffers(gpStrokes, strokes, [name for name in pointBufferNames
+                                         if not hasNewPointValues(strokes, name)])
+    for name in strokeBufferNames:
+        setStrokeBuffer(gpStrokes, strokes, name)
+
+def setPointBuffers(gpStrokes, strokes, names):
+    # Grease Pencil has no buffer for all points of a frame,
+    # so all point attributes are written in one pass over the strokes.
+    if len(names) == 0: return
+    buffers = [(*pointBuffers[name], getattr(strokes, name).asMemoryView()) for name in names]
+    for gpStroke, start, amount in zip(gpStrokes, strokes.pointStarts, strokes.pointAmounts):
+        points = gpStroke.points
+        for attribute, size, data in buffers:
+            points.foreach_set(attribute, data[start * size:(start + amount) * size])
+
+def hasNewPointValues(strokes, name):
+    if name not in newPointValues: return False
+    data = getattr(strokes, name)
+    return data == type(data).fromValue(newPointValues[name], len(data))
+
+def setStrokeBuffer(gpStrokes, strokes, name):
+    gpStrokes.foreach_set(strokeBuffers[name], getattr(strokes, name).asMemoryView())
+
+def setStrokeEnums(gpStrokes, strokes, name):
+    attribute = strokeEnums[name]
+    for gpStroke, value in zip(gpStrokes, getattr(strokes, name)):
+        if getattr(gpStroke, attribute) != value:
+            setattr(gpStroke, attribute, value)
+
+pointBuffers = {
+    "vertices" : ("co", 3),
+    "strengths" : ("strength", 1),
+    "pressures" : ("pressure", 1),
+    "uvRotations" : ("uv_rotation", 1),
+    "vertexColors" : ("vertex_color", 4)
+}
+
+newPointValues = {
+    "strengths" : 0.75,
+    "pressures" : 1,
+    "uvRotations" : 0,
+    "vertexColors" : Color((0, 0, 0, 0))
+}
+
+strokeBuffers = {
+    "lineWidths" : "line_width",
+    "hardnesses" : "hardness",
+    "useCyclic" : "use_cyclic",
+    "materialIndices" : "material_index",
+    "vertexColorFills" : "vertex_color_fill"
+}
+
+strokeEnums = {
+    "startCapModes" : "start_cap_mode",
+    "endCapModes" : "end_cap_mode",
+    "displayModes" : "display_mode"
+}
+
+pointBufferNames = tuple(pointBuffers)
+strokeBufferNames = tuple(strokeBuffers)
+strokeEnumNames = tuple(strokeEnums)
+
+
+# Packed Strokes Cache
+###########################################
+
+# Packing the strokes of a frame is only done again when the frame does not
+# contain the same stroke objects with the same attributes anymore. Lists are
+# compared by identity first, so that unchanged strokes are found quickly.
+
+packedStrokesCache = {}
+
+def getStrokesKey(strokes):
+    return [(stroke.vertices, stroke.strengths, stroke.pressures, stroke.uvRotations,
+             stroke.vertexColors, len(stroke.vertices), len(stroke.strengths), len(stroke.pressures),
+             len(stroke.uvRotations), len(stroke.vertexColors), stroke.lineWidth, stroke.hardness,
+             stroke.useCyclic, stroke.startCapMode, stroke.endCapMode, tuple(stroke.vertexColorFill),
+             stroke.materialIndex, stroke.displayMode) for stroke in strokes]
+
+
+# Incremental Update
+###########################################
+
+# The state of frames that have been written by this node in incremental mode.
+# When the stroke and point amounts of a frame are the same, only the changed
+# buffers are written into the existing strokes.
+
+frameStates = {}
+updateCounters = defaultdict(lambda: defaultdict(int))
+
+@eventHandler("FILE_LOAD_POST")
+@eventHandler("UNDO_POST")
+@eventHandler("REDO_POST")
+def clearFrameStates():
+    frameStates.clear()
+    packedStrokesCache.clear()
+
+class FrameState:
+    def __init__(self, fingerprint, bufferChecksums):
+        self.fingerprint = fingerprint
+        self.bufferChecksums = bufferChecksums
+
+    def canBeUpdated(self, fingerprint, gpFrame):
+        # the frame could have been changed by something else in the meantime
+        return self.fingerprint == fingerprint and self.fingerprint[0] == len(gpFrame.strokes)
+
+def updateStrokes(gpFrame, strokes, state):
+    checksums = getBufferChecksums(strokes)
+    changedBuffers = {name for name, checksum in checksums.items()
+                      if state.bufferChecksums.get(name) != checksum}
+    state.bufferChecksums = checksums
+
+    gpStrokes = gpFrame.strokes
+    setPointBuffers(gpStrokes, strokes, [name for name in pointBufferNames if name in changedBuffers])
+    for name in strokeBufferNames:
+        if name in changedBuffers: setStrokeBuffer(gpStrokes, strokes, name)
+    for name in strokeEnumNames:
+        if name in changedBuffers: setStrokeEnums(gpStrokes, strokes, name)
+    return len(checksums) - len(changedBuffers)
+
+def getStrokesFingerprint(strokes):
+    return (len(strokes), len(strokes.vertices), getChecksum(strokes.pointAmounts))
+
+def getBufferChecksums(strokes):
+    checksums = {}
+    for name in pointBufferNames + strokeBufferNames:
+        checksums[name] = getChecksum(getattr(strokes, name))
+    for name in strokeEnumNames:
+        checksums[name] = hash(tuple(getattr(strokes, name)))
+    return checksums
+
+def getChecksum(data):
+    return zlib.crc32(data.asMemoryView())
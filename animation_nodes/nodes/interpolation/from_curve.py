@@ -19,6 +19,7 @@ class CurveInterpolationNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_InterpolationFromCurveNode"
     bl_label = "Curve Interpolation"
     bl_width_default = 200
+    allowConstantFolding = False
 
     curveMapCache: PointerProperty(type = CurveMapCache)
     cacheInterpolation: BoolProperty(name = "Cache Interpolation", default = False,
@@ -1,10 +1,10 @@
 import bpy
 from ... base_types import AnimationNode, VectorizedSocket
+from ... data_structures import Vector3DList, DoubleList, LongList
 
 class FindNearestPointInKDTreeNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_FindNearestPointInKDTreeNode"
     bl_label = "Find Nearest Point"
-    codeEffects = [VectorizedSocket.CodeEffect]
 
     useVectorList: VectorizedSocket.newProperty()
 
@@ -22,6 +22,19 @@ class FindNearestPointInKDTreeNode(AnimationNode, bpy.types.Node):
             ("Index", "index"), ("Indices", "indices")))
 
     def getExecutionCode(self, required):
-        yield "nearestVector, index, distance = kdTree.find(searchVector)"
-        yield "if nearestVector is None:"
-        yield "    nearestVector, index, distance = Vector((0, 0, 0)), 0.0, -1"
+        if self.useVectorList:
+            yield "nearestVectors, distances, indices = self.findNearestPoints(kdTree, searchVectors)"
+        else:
+            yield "nearestVector, index, distance = kdTree.find(searchVector)"
+            yield "if nearestVector is None:"
+            yield "    nearestVector, index, distance = Vector((0, 0, 0)), 0.0, -1"
+
+    def findNearestPoints(self, kdTree, searchVectors):
+        if len(kdTree) == 0:
+            amount = len(searchVectors)
+            return (Vector3DList.fromValue((0, 0, 0), amount),
+                    DoubleList.fromValue(-1, amount),
+                    LongList.fromValue(0, amount))
+
+        indices, distances, _ = kdTree.findNearestForList(searchVectors, 1)
+        return kdTree.points[indices], distances, indices
@@ -15,10 +15,5 @@ class FindPointsInRadiusInKDTreeNode(AnimationNode, bpy.types.Node):
         self.newOutput("an_IntegerListSocket", "Indices", "indices")
 
     def getExecutionCode(self, required):
-        yield "nearestVectors = Vector3DList()"
-        yield "distances = DoubleList()"
-        yield "indices = LongList()"
-        yield "for vector, index, distance in kdTree.find_range(searchVector, max(radius, 0)):"
-        yield "    nearestVectors.append(vector)"
-        yield "    indices.append(index)"
-        yield "    distances.append(distance)"
+        yield "indices, distances, _ = kdTree.findInRadiusForList(Vector3DList.fromValue(searchVector), max(radius, 0))"
+        yield "nearestVectors = kdTree.points[indices]"
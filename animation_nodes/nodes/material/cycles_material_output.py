@@ -15,6 +15,7 @@ class CyclesMaterialOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_CyclesMaterialOutputNode"
     bl_label = "Cycles Material Output"
     bl_width_default = 160
+    hasSideEffects = True
 
     def getPossibleSocketItems(self, context):
         sockets = self.getPossibleSockets()
@@ -8,6 +8,7 @@ class MaterialAttributeOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_MaterialAttributeOutputNode"
     bl_label = "Material Attribute Output"
     bl_width_default = 180
+    hasSideEffects = True
     errorHandlingType = "MESSAGE"
 
     attribute: StringProperty(name = "Attribute", default = "",
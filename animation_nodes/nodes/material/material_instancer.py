@@ -10,6 +10,7 @@ noPrefixMatMessage = "No Prefix Name"
 class MaterialInstancerNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_MaterialInstancerNode"
     bl_label = "Material Instancer"
+    hasSideEffects = True
     options = {"NOT_IN_SUBPROGRAM"}
 
     instMaterialBool: BoolProperty(name="Instance Material",
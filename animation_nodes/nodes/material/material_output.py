@@ -17,6 +17,7 @@ attributes = (
 class MaterialOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_MaterialOutputNode"
     bl_label = "Material Output"
+    hasSideEffects = True
 
     def create(self):
         self.newInput("Material", "Material", "material", defaultDrawType = "PROPERTY_ONLY")
@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class ObjectMaterialOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ObjectMaterialOutputNode"
     bl_label = "Object Material Output"
+    hasSideEffects = True
 
     appendMaterials: BoolProperty(name = "Append Materials", default = False,
         description = "Append input material(s) to the object's materials instead of overwriting them")
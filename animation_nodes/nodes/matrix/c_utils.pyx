@@ -1,3 +1,5 @@
+# setup: options = openmp
+
 from ... data_structures cimport (
     DoubleList, FloatList,
     Vector3DList, EulerList, Matrix4x4List, VirtualMatrix4x4List,
@@ -21,8 +23,11 @@ from ... math cimport (
 
 from ... math import matrix4x4ListToEulerList
 
+from ... utils.parallel cimport getThreadAmount
+
 from libc.math cimport sqrt
 from libc.math cimport M_PI as PI
+from cython.parallel cimport prange
 
 
 # Compose/Create Matrix
@@ -121,14 +126,21 @@ def extractMatrixRotations(Matrix4x4List matrices):
 
 def extractMatrixScales(Matrix4x4List matrices):
     cdef Vector3DList scales = Vector3DList(length = len(matrices))
-    cdef Py_ssize_t i
+    cdef Matrix4 *_matrices = matrices.data
+    cdef Vector3 *_scales = scales.data
+    cdef Py_ssize_t i, amount = len(scales)
+    cdef int threads = getThreadAmount(amount)
 
-    for i in range(len(scales)):
-        scaleFromMatrix(scales.data + i, matrices.data + i)
+    if threads > 1:
+        for i in prange(amount, nogil = True, num_threads = threads):
+            scaleFromMatrix(_scales + i, _matrices + i)
+    else:
+        for i in range(amount):
+            scaleFromMatrix(_scales + i, _matrices + i)
 
     return scales
 
-cdef void scaleFromMatrix(Vector3 *scale, Matrix4 *m):
+cdef void scaleFromMatrix(Vector3 *scale, Matrix4 *m) nogil:
     scale.x = <float>sqrt(m.a11 * m.a11 + m.a21 * m.a21 + m.a31 * m.a31)
     scale.y = <float>sqrt(m.a12 * m.a12 + m.a22 * m.a22 + m.a32 * m.a32)
     scale.z = <float>sqrt(m.a13 * m.a13 + m.a23 * m.a23 + m.a33 * m.a33)
@@ -239,13 +251,10 @@ def vectorizedMatrixMultiplication(matricesA, matricesB):
 def multiplyMatrixWithList(Matrix4x4List matrices, _transformation, str type):
     cdef Matrix4 transformation = toMatrix4(_transformation)
     cdef Matrix4x4List outMatrices = Matrix4x4List(length = len(matrices))
-    cdef Py_ssize_t i
     if type == "LEFT":
-        for i in range(len(outMatrices)):
-            multMatrix4(outMatrices.data + i, &transformation, matrices.data + i)
+        multMatrixArrays(outMatrices.data, &transformation, 0, matrices.data, 1, len(outMatrices))
     elif type == "RIGHT":
-        for i in range(len(outMatrices)):
-            multMatrix4(outMatrices.data + i, matrices.data + i, &transformation)
+        multMatrixArrays(outMatrices.data, matrices.data, 1, &transformation, 0, len(outMatrices))
     else:
         raise Exception("type has to be 'LEFT' or 'RIGHT'")
     return outMatrices
@@ -254,11 +263,20 @@ def multiplyMatrixLists(Matrix4x4List listA, Matrix4x4List listB):
     assert listA.length == listB.length
 
     cdef Matrix4x4List outMatrices = Matrix4x4List(length = len(listA))
-    cdef Py_ssize_t i
-    for i in range(len(listA)):
-        multMatrix4(outMatrices.data + i, listA.data + i, listB.data + i)
+    multMatrixArrays(outMatrices.data, listA.data, 1, listB.data, 1, len(listA))
     return outMatrices
 
+cdef void multMatrixArrays(Matrix4 *target, Matrix4 *a, Py_ssize_t aStride,
+                           Matrix4 *b, Py_ssize_t bStride, Py_ssize_t amount):
+    cdef int threads = getThreadAmount(amount)
+    cdef Py_ssize_t i
+    if threads > 1:
+        for i in prange(amount, nogil = True, num_threads = threads):
+            multMatrix4(target + i, a + i * aStride, b + i * bStride)
+    else:
+        for i in range(amount):
+            multMatrix4(target + i, a + i * aStride, b + i * bStride)
+
 def transformVirtualMatrix4x4List(Py_ssize_t amount,
                                  VirtualMatrix4x4List mA,
                                  VirtualMatrix4x4List mB):
@@ -46,6 +46,37 @@ def createEdgeIndices(Py_ssize_t amount,
         edges.data[i].v2 = <unsigned int>index2 if index2 >= 0 else 0
     return edges
 
+def edgesFromNeighbours(LongList neighbours, LongList offsets):
+    '''
+    Connects every point with its neighbours, which are stored in
+    neighbours[offsets[i]:offsets[i + 1]]. Every edge is only created once.
+    '''
+    cdef Py_ssize_t amount = max(offsets.length - 1, 0)
+    cdef EdgeIndicesList edges = EdgeIndicesList(capacity = neighbours.length)
+    cdef EdgeIndices edge
+    cdef Py_ssize_t i, j
+    cdef long index
+
+    for i in range(amount):
+        for j in range(offsets.data[i], offsets.data[i + 1]):
+            index = neighbours.data[j]
+            if index == i:
+                continue
+            # the edge has been created already when i is a neighbour of index
+            if index < i and containsIndex(neighbours, offsets.data[index], offsets.data[index + 1], i):
+                continue
+            edge.v1 = <unsigned int>min(index, i)
+            edge.v2 = <unsigned int>max(index, i)
+            edges.append_LowLevel(edge)
+    return edges
+
+cdef bint containsIndex(LongList indices, Py_ssize_t start, Py_ssize_t end, long index):
+    cdef Py_ssize_t i
+    for i in range(start, end):
+        if indices.data[i] == index:
+            return True
+    return False
+
 def createEdges(Vector3DList points1, Vector3DList points2):
     assert(len(points1) == len(points2))
 
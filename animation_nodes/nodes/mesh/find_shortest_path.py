@@ -1,6 +1,7 @@
 import bpy
 from bpy.props import *
-from ... data_structures import Mesh, LongList
+from math import inf
+from ... data_structures import Mesh, LongList, DoubleList
 from ... base_types import AnimationNode, VectorizedSocket
 from ... algorithms.mesh_generation.find_shortest_path import getShortestPath, getShortestTree
 
@@ -29,16 +30,24 @@ class FindShortestPathNode(AnimationNode, bpy.types.Node):
     joinMeshes: BoolProperty(name = "Join Meshes", default = True,
         update = AnimationNode.refresh)
 
+    useMaxDistance: BoolProperty(name = "Use Max Distance", default = False,
+        description = "Ignore vertices that are farther away from the sources",
+        update = AnimationNode.refresh)
+
     useSourceList: VectorizedSocket.newProperty()
 
     def create(self):
         self.newInput("Mesh", "Mesh", "mesh")
         if self.mode == "PATH":
-            self.newInput("Integer", "Source", "source")
+            # keep the identifier of the single source socket, so that links in old files are kept
+            self.newInput(VectorizedSocket("Integer", "useSourceList",
+                    ("Source", "source"), ("Sources", "sources")))
             self.newInput("Integer", "Target", "target", value = 1)
         else:
             self.newInput(VectorizedSocket("Integer", "useSourceList",
                     ("Source", "sources"), ("Sources", "sources")))
+        if self.mode == "TREE" and self.useMaxDistance:
+            self.newInput("Float", "Max Distance", "maxDistance", value = 1, minValue = 0)
 
         if self.mode == "PATH":
             self.newOutput("Integer List", "Indices", "indices")
@@ -52,6 +61,7 @@ class FindShortestPathNode(AnimationNode, bpy.types.Node):
                 self.newOutput("Spline List", "Splines", "outSplines")
             elif self.pathType == "STROKE":
                 self.newOutput("GPStroke List", "Strokes", "outStrokes")
+            self.newOutput("Float List", "Distances", "distances", hide = True)
 
     def draw(self, layout):
         layout.prop(self, "mode", text = "")
@@ -60,39 +70,46 @@ class FindShortestPathNode(AnimationNode, bpy.types.Node):
             if self.pathType == "MESH":
                 layout.prop(self, "joinMeshes")
 
+    def drawAdvanced(self, layout):
+        if self.mode == "TREE":
+            layout.prop(self, "useMaxDistance")
+
     def getExecutionFunctionName(self):
         if self.mode == "PATH":
             return "execute_Path"
         else:
             return "execute_Tree"
 
-    def execute_Path(self, mesh, source, target):
-        if mesh is None:
+    def execute_Path(self, mesh, sources, target):
+        if not self.useSourceList: sources = LongList.fromValue(sources)
+        if mesh is None or len(sources) == 0:
             return LongList()
 
-        if source < 0 or source >= len(mesh.vertices):
-            self.raiseErrorMessage(f"Source index is out of range '{str(source)}'")
+        self.checkSources(mesh, sources)
         if target < 0 or target >= len(mesh.vertices):
             self.raiseErrorMessage(f"Target index is out of range '{str(target)}'")
 
-        sources = LongList.fromValue(source)
         return getShortestPath(mesh, sources, target)
 
-    def execute_Tree(self, mesh, sources):
+    def execute_Tree(self, mesh, sources, maxDistance = inf):
         if not self.useSourceList: sources = LongList.fromValue(sources)
         if mesh is None or len(sources) == 0:
             if self.joinMeshes and self.pathType == "MESH":
-                return Mesh()
+                return Mesh(), DoubleList()
             else:
-                return []
+                return [], DoubleList()
+
+        self.checkSources(mesh, sources)
+
+        tree, distances = getShortestTree(mesh, sources, self.pathType, max(maxDistance, 0))
+        if self.pathType == "MESH" and self.joinMeshes:
+            return Mesh.join(*tree), distances
+        return tree, distances
 
+    def checkSources(self, mesh, sources):
         sourceMin = sources.getMinValue()
         sourceMax = sources.getMaxValue()
         if sourceMin < 0:
             self.raiseErrorMessage(f"Source index is out of range '{str(sourceMin)}'")
         if  sourceMax >= len(mesh.vertices):
             self.raiseErrorMessage(f"Source index is out of range '{str(sourceMax)}'")
-
-        if self.pathType == "MESH" and self.joinMeshes:
-            return Mesh.join(*getShortestTree(mesh, sources, self.pathType))
-        return getShortestTree(mesh, sources, self.pathType)
@@ -12,6 +12,7 @@ from ... data_structures import (
 class InsertVertexGroupNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_InsertVertexGroupNode"
     bl_label = "Insert Vertex Group"
+    hasSideEffects = True
     errorHandlingType = "EXCEPTION"
 
     useFloatList: VectorizedSocket.newProperty()
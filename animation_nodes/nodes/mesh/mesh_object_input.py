@@ -1,6 +1,7 @@
 import bpy
 from bpy.props import *
 from ... base_types import AnimationNode, VectorizedSocket
+from ... utils.vertex_groups import getVertexGroupWeights
 from ... data_structures import Mesh, Attribute, AttributeType, AttributeDomain, AttributeDataType, DoubleList, BooleanList
 
 class MeshObjectInputNode(AnimationNode, bpy.types.Node):
@@ -218,14 +219,13 @@ class MeshObjectInputNode(AnimationNode, bpy.types.Node):
 
     def loadVertexWeights(self, mesh, sourceMesh, object, useModifiers, scene):
         if object.mode != "EDIT":
+            # the evaluated mesh keeps the weights of the vertices created by modifiers
             vertexGroups = object.vertex_groups
-            for vertexGroupName in vertexGroups.keys():
-                if useModifiers:
-                    weights = DoubleList(length = len(mesh.vertices))
-                    weights.fill(0)
-                else:
-                    weights = self.execute_All_WithoutModifiers(mesh, vertexGroups[vertexGroupName])
-                mesh.insertVertexWeightAttribute(Attribute(vertexGroupName,
+            allWeights = getVertexGroupWeights(sourceMesh, len(vertexGroups))
+            for vertexGroup in vertexGroups:
+                if len(mesh.vertices) == 0: weights = DoubleList()
+                else: weights = DoubleList.fromNumpyArray(allWeights[vertexGroup.index])
+                mesh.insertVertexWeightAttribute(Attribute(vertexGroup.name,
                                                            AttributeType.VERTEX_WEIGHT,
                                                            AttributeDomain.POINT,
                                                            AttributeDataType.FLOAT,
@@ -245,13 +245,3 @@ class MeshObjectInputNode(AnimationNode, bpy.types.Node):
                                                      sourceMesh.an.getCustomAttribute(customAttributeName)))
         else:
             self.setErrorMessage("Object is in edit mode.")
-
-    def execute_All_WithoutModifiers(self, mesh, vertexGroup):
-        vertexAmount = len(mesh.vertices)
-        weights = DoubleList(length = vertexAmount)
-        getWeight = vertexGroup.weight
-
-        for i in range(vertexAmount):
-            try: weights[i] = getWeight(i)
-            except: weights[i] = 0
-        return weights
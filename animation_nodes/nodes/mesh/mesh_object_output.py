@@ -1,10 +1,14 @@
 import bpy
+import zlib
 import bmesh
 import numpy
 from bpy.props import *
+from collections import defaultdict
+from ... utils.handlers import eventHandler
 from ... utils.layout import writeText
 from ... base_types import AnimationNode
 from ... utils.animation import isAnimated
+from ... utils.vertex_groups import setVertexGroupWeights
 from ... data_structures import UShortList, AttributeType
 from ... events import propertyChanged, executionCodeChanged
 
@@ -17,6 +21,7 @@ class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_MeshObjectOutputNode"
     bl_label = "Mesh Object Output"
     bl_width_default = 180
+    hasSideEffects = True
     errorHandlingType = "MESSAGE"
 
     meshDataType: EnumProperty(name = "Mesh Type", default = "MESH_DATA",
@@ -37,6 +42,11 @@ class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
         description = "Make sure Blender will draw edges that are not part of a polygon",
         update = propertyChanged)
 
+    incrementalUpdate: BoolProperty(name = "Incremental Update", default = False,
+        description = ("Only update changed vertex locations and attributes when the "
+                       "topology did not change since the last execution"),
+        update = propertyChanged)
+
     def create(self):
         socket = self.newInput("Object", "Object", "object")
         socket.defaultDrawType = "PROPERTY_ONLY"
@@ -76,6 +86,16 @@ class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
 
         layout.prop(self, "calculateLooseEdges")
 
+        if self.meshDataType == "MESH_DATA":
+            col = layout.column(align = True)
+            col.prop(self, "incrementalUpdate")
+            if self.incrementalUpdate:
+                counter = updateCounters[self.identifier]
+                col.label(text = "Full Rebuilds: {}".format(counter["REBUILD"]))
+                col.label(text = "Incremental Updates: {}".format(counter["INCREMENTAL"]))
+                col.label(text = "Skipped Buffers: {}".format(counter["SKIPPED_BUFFERS"]))
+                self.invokeFunction(col, "resetUpdateCounters", text = "Reset Counters")
+
     def getExecutionCode(self, required):
         if not self.isInputUsed(): return
 
@@ -113,6 +133,56 @@ class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
         return True
 
     def setMesh(self, outMesh, mesh, object):
+        if not self.incrementalUpdate:
+            self.rebuildMesh(outMesh, mesh, object)
+            return
+
+        counter = updateCounters[self.identifier]
+        fingerprint = getTopologyFingerprint(mesh)
+        state = meshStates.get(outMesh.as_pointer())
+
+        if state is not None and state.canBeUpdated(fingerprint, outMesh):
+            counter["SKIPPED_BUFFERS"] += self.updateMesh(outMesh, mesh, object, state)
+            counter["INCREMENTAL"] += 1
+        else:
+            self.rebuildMesh(outMesh, mesh, object)
+            meshStates[outMesh.as_pointer()] = MeshState(fingerprint, outMesh, getBufferChecksums(mesh))
+            counter["REBUILD"] += 1
+
+    def updateMesh(self, outMesh, mesh, object, state):
+        checksums = getBufferChecksums(mesh)
+        changedBuffers = {name for name, checksum in checksums.items()
+                          if state.bufferChecksums.get(name) != checksum}
+        state.bufferChecksums = checksums
+
+        if "Vertices" in changedBuffers:
+            outMesh.vertices.foreach_set("co", mesh.vertices.asMemoryView())
+            outMesh.vertices.foreach_set("normal", mesh.getVertexNormals().asMemoryView())
+
+        for attribute in mesh.iterUVMapAttributes():
+            if ("UV", attribute.name) in changedBuffers:
+                outMesh.uv_layers[attribute.name].data.foreach_set("uv", attribute.data.asMemoryView())
+
+        for attribute in mesh.iterVertexColorAttributes():
+            if ("Color", attribute.name) in changedBuffers:
+                outMesh.vertex_colors[attribute.name].data.foreach_set("color", attribute.data.asMemoryView())
+
+        for attribute in mesh.iterVertexWeightAttributes():
+            if ("Weight", attribute.name) in changedBuffers:
+                vertexGroup = object.vertex_groups.get(attribute.name)
+                if vertexGroup is None:
+                    vertexGroup = object.vertex_groups.new(name = attribute.name)
+                weights = attribute.data.asNumpyArray()[:len(outMesh.vertices)]
+                setVertexGroupWeights(vertexGroup, numpy.arange(len(weights)), weights)
+
+        for attribute in mesh.iterCustomAttributes():
+            if ("Custom", attribute.name) in changedBuffers:
+                setCustomAttributeData(outMesh.attributes[attribute.name], attribute)
+
+        outMesh.update()
+        return len(checksums) - len(changedBuffers)
+
+    def rebuildMesh(self, outMesh, mesh, object):
         # clear existing mesh
         bmesh.new().to_mesh(outMesh)
 
@@ -159,9 +229,8 @@ class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
             vertexGroup = object.vertex_groups.get(attribute.name)
             if vertexGroup is None:
                 vertexGroup = object.vertex_groups.new(name = attribute.name)
-            weights = attribute.data
-            for i in range(vertexAmount):
-                vertexGroup.add([i], weights[i], "REPLACE")
+            weights = attribute.data.asNumpyArray()[:vertexAmount]
+            setVertexGroupWeights(vertexGroup, numpy.arange(len(weights)), weights)
         object.data.update()
 
         # Custom Attributes
@@ -171,15 +240,7 @@ class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
             data = attribute.data
 
             attributeOut = outMesh.attributes.new(attribute.name, dataType, domain)
-
-            if dataType in ("FLOAT", "INT", "INT32_2D"):
-                attributeOut.data.foreach_set("value", data.asMemoryView())
-            elif dataType in ("FLOAT2", "FLOAT_VECTOR"):
-                attributeOut.data.foreach_set("vector", data.asMemoryView())
-            elif dataType == "BOOLEAN":
-                attributeOut.data.foreach_set("value", numpy.not_equal(data.asNumpyArray(), b'\0'))
-            else:
-                attributeOut.data.foreach_set("color", data.asMemoryView())
+            setCustomAttributeData(attributeOut, attribute)
 
         if self.validateMesh:
             outMesh.validate(verbose = self.validateMeshVerbose)
@@ -202,3 +263,91 @@ class MeshObjectOutputNode(AnimationNode, bpy.types.Node):
         if not isAnimated(mesh):
             mesh['an_helper_property'] = 0
             mesh.keyframe_insert(data_path = '["an_helper_property"]')
+
+    def resetUpdateCounters(self):
+        updateCounters.pop(self.identifier, None)
+
+def setCustomAttributeData(attributeOut, attribute):
+    dataType = attribute.getListTypeAsString()
+    data = attribute.data
+
+    if dataType in ("FLOAT", "INT", "INT32_2D"):
+        attributeOut.data.foreach_set("value", data.asMemoryView())
+    elif dataType in ("FLOAT2", "FLOAT_VECTOR"):
+        attributeOut.data.foreach_set("vector", data.asMemoryView())
+    elif dataType == "BOOLEAN":
+        attributeOut.data.foreach_set("value", numpy.not_equal(data.asNumpyArray(), b'\0'))
+    else:
+        attributeOut.data.foreach_set("color", data.asMemoryView())
+
+
+# Incremental Update
+###########################################
+
+# The state of meshes that have been written by this node in incremental mode.
+# When the topology of the new mesh is the same, only the changed buffers
+# are written into the existing mesh.
+
+meshStates = {}
+updateCounters = defaultdict(lambda: defaultdict(int))
+
+# Undo and redo restore the mesh data without changing the written checksums.
+@eventHandler("FILE_LOAD_POST")
+@eventHandler("UNDO_POST")
+@eventHandler("REDO_POST")
+def clearMeshStates():
+    meshStates.clear()
+
+class MeshState:
+    def __init__(self, fingerprint, outMesh, bufferChecksums):
+        self.fingerprint = fingerprint
+        self.layerNames = getLayerNames(outMesh)
+        self.bufferChecksums = bufferChecksums
+
+    def canBeUpdated(self, fingerprint, outMesh):
+        # the mesh could have been changed by something else in the meantime
+        return (self.fingerprint == fingerprint and
+                self.fingerprint[:4] == getElementAmounts(outMesh) and
+                self.layerNames == getLayerNames(outMesh))
+
+def getTopologyFingerprint(mesh):
+    polygons = mesh.polygons
+    materialIndices = mesh.getBuiltInAttribute("Material Indices")
+    return (len(mesh.vertices), len(mesh.edges), len(polygons), len(polygons.indices),
+            getChecksum(mesh.edges), getChecksum(polygons.indices),
+            getChecksum(polygons.polyStarts), getChecksum(polygons.polyLengths),
+            None if materialIndices is None else getChecksum(materialIndices.data),
+            tuple(getAttributeLayout(mesh)))
+
+def getAttributeLayout(mesh):
+    for attribute in mesh.iterUVMapAttributes():
+        yield ("UV", attribute.name)
+    for attribute in mesh.iterVertexColorAttributes():
+        yield ("Color", attribute.name)
+    for attribute in mesh.iterVertexWeightAttributes():
+        yield ("Weight", attribute.name)
+    for attribute in mesh.iterCustomAttributes():
+        yield ("Custom", attribute.name, attribute.getDomainAsString(), attribute.getListTypeAsString())
+
+def getBufferChecksums(mesh):
+    checksums = {"Vertices" : getChecksum(mesh.vertices)}
+    for attribute in mesh.iterUVMapAttributes():
+        checksums[("UV", attribute.name)] = getChecksum(attribute.data)
+    for attribute in mesh.iterVertexColorAttributes():
+        checksums[("Color", attribute.name)] = getChecksum(attribute.data)
+    for attribute in mesh.iterVertexWeightAttributes():
+        checksums[("Weight", attribute.name)] = getChecksum(attribute.data)
+    for attribute in mesh.iterCustomAttributes():
+        checksums[("Custom", attribute.name)] = getChecksum(attribute.data)
+    return checksums
+
+def getChecksum(data):
+    return zlib.crc32(data.asMemoryView())
+
+def getElementAmounts(outMesh):
+    return (len(outMesh.vertices), len(outMesh.edges), len(outMesh.polygons), len(outMesh.loops))
+
+def getLayerNames(outMesh):
+    return (tuple(layer.name for layer in outMesh.uv_layers),
+            tuple(layer.name for layer in outMesh.vertex_colors),
+            tuple(attribute.name for attribute in outMesh.attributes))
@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class SetBevelEdgeWeightNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_SetBevelEdgeWeightNode"
     bl_label = "Set Bevel Edge Weight"
+    hasSideEffects = True
     errorHandlingType = "EXCEPTION"
 
     useWeightList: VectorizedSocket.newProperty()
@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class SetBevelVertexWeightNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_SetBevelVertexWeightNode"
     bl_label = "Set Bevel Vertex Weight"
+    hasSideEffects = True
     errorHandlingType = "EXCEPTION"
 
     useWeightList: VectorizedSocket.newProperty()
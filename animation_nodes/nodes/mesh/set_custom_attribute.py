@@ -35,6 +35,7 @@ dataTypeItems = [
 class SetCustomAttributeNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_SetCustomAttributeNode"
     bl_label = "Set Custom Attribute"
+    hasSideEffects = True
     errorHandlingType = "EXCEPTION"
 
     domain: EnumProperty(name = "Domain", default = "POINT",
@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class SetEdgeCreaseNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_SetEdgeCreaseNode"
     bl_label = "Set Edge Crease"
+    hasSideEffects = True
     errorHandlingType = "EXCEPTION"
 
     useFloatList: VectorizedSocket.newProperty()
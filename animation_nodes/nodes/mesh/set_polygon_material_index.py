@@ -5,6 +5,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class SetPolygonMaterialIndexNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_SetPolygonMaterialIndexNode"
     bl_label = "Set Polygon Material Index"
+    hasSideEffects = True
     errorHandlingType = "EXCEPTION"
 
     useMaterialIndexList: VectorizedSocket.newProperty()
@@ -13,6 +13,7 @@ mapIdentifierTypeItems = [
 class SetUVMapNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_SetUVMapNode"
     bl_label = "Set UV Map"
+    hasSideEffects = True
     errorHandlingType = "EXCEPTION"
 
     mapIdentifierType: EnumProperty(name = "UV Map Identifier Type", default = "INDEX",
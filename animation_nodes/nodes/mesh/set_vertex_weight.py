@@ -1,7 +1,9 @@
 import bpy
+import numpy
 from bpy.props import *
 from ... events import propertyChanged
 from ... data_structures import VirtualDoubleList
+from ... utils.vertex_groups import setVertexGroupWeights
 from ... base_types import AnimationNode, VectorizedSocket
 
 modeItems = [
@@ -17,6 +19,7 @@ groupIdentifierTypeItems = [
 class SetVertexWeightNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_SetVertexWeightNode"
     bl_label = "Set Vertex Weight"
+    hasSideEffects = True
     errorHandlingType = "EXCEPTION"
 
     mode: EnumProperty(name = "Mode", default = "ALL",
@@ -87,9 +90,8 @@ class SetVertexWeightNode(AnimationNode, bpy.types.Node):
         if object is None: return
         vertexGroup = self.getVertexGroup(object, identifier)
 
-        weights = VirtualDoubleList.create(weights, 0)
-        for i, index in enumerate(indices):
-            vertexGroup.add([index], weights[i], "REPLACE")
+        weights = VirtualDoubleList.create(weights, 0).materialize(len(indices))
+        setVertexGroupWeights(vertexGroup, indices.asNumpyArray(), weights.asNumpyArray())
         object.data.update()    
         return object
 
@@ -107,9 +109,9 @@ class SetVertexWeightNode(AnimationNode, bpy.types.Node):
         if object is None: return
         vertexGroup = self.getVertexGroup(object, identifier)
 
-        weights = VirtualDoubleList.create(weights, 0)
-        for i in range(len(object.data.vertices)):
-            vertexGroup.add([i], weights[i], "REPLACE") 
+        vertexAmount = len(object.data.vertices)
+        weights = VirtualDoubleList.create(weights, 0).materialize(vertexAmount)
+        setVertexGroupWeights(vertexGroup, numpy.arange(vertexAmount), weights.asNumpyArray())
         object.data.update()
         return object            
 
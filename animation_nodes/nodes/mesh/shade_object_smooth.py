@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class ShadeObjectSmooth(AnimationNode, bpy.types.Node):
     bl_idname = "an_ShadeObjectSmoothNode"
     bl_label = "Shade Object Smooth"
+    hasSideEffects = True
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useObjectList: VectorizedSocket.newProperty()
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class CollectionOperationsNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_CollectionOperationsNode"
     bl_label = "Collection Operations"
+    hasSideEffects = True
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useObjectList: VectorizedSocket.newProperty()
@@ -7,6 +7,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class CopyObjectDataNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_CopyObjectDataNode"
     bl_label = "Copy Object Data"
+    hasSideEffects = True
     codeEffects = [VectorizedSocket.CodeEffect]
 
     deepCopy : BoolProperty(name = "Deep Copy", default = False, update = propertyChanged,
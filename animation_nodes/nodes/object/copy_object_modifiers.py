@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class CopyObjectModifiersNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_CopyObjectModifiersNode"
     bl_label = "Copy Object Modifiers"
+    hasSideEffects = True
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useFromList: VectorizedSocket.newProperty()
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class LampOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_LampOutputNode"
     bl_label = "Lamp Output"
+    hasSideEffects = True
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useObjectList: VectorizedSocket.newProperty()
@@ -8,6 +8,7 @@ class ObjectAttributeOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ObjectAttributeOutputNode"
     bl_label = "Object Attribute Output"
     bl_width_default = 180
+    hasSideEffects = True
     errorHandlingType = "MESSAGE"
 
     attribute: StringProperty(name = "Attribute", default = "",
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode, VectorizedSocket
 class ObjectColorOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ObjectColorOutputNode"
     bl_label = "Object Color Output"
+    hasSideEffects = True
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useObjectList: VectorizedSocket.newProperty()
@@ -5,6 +5,7 @@ from ... utils.attributes import pathBelongsToArray
 class ObjectDataPathOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ObjectDataPathOutputNode"
     bl_label = "Object Data Path Output"
+    hasSideEffects = True
     errorHandlingType = "MESSAGE"
 
     def create(self):
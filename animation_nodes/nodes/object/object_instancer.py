@@ -1,8 +1,11 @@
 import bpy
+import time
 from bpy.props import *
 from ... events import propertyChanged
 from ... base_types import AnimationNode
+from ... utils.timing import prettyTime
 from ... utils.names import getRandomString
+from ... utils.handlers import eventHandler
 from ... utils.blender_ui import iterActiveSpacesByType
 from ... utils.data_blocks import removeNotUsedDataBlock
 from ... nodes.container_provider import getMainObjectContainer
@@ -15,6 +18,55 @@ from ... utils.names import (getPossibleMeshName,
 lastSourceHashes = {}
 lastContainerHashes = {}
 
+
+# Instance Cache
+###########################################
+
+# Reading the objects from the collection property is slow when there are
+# many instances, so they are kept in a list for every node as well. Undo and
+# loading a file invalidate all object references. The cache is also rebuilt
+# when objects were added or removed outside of the node (e.g. deleted objects)
+# and when the first or last object is not the one that has been cached.
+
+class InstanceCache:
+    def __init__(self):
+        self.objects = []
+        self.generation = -1
+        self.objectAmount = -1
+        self.sessionUIDs = None
+
+        self.collectTime = 0
+        self.removeTime = 0
+        self.createTime = 0
+        self.createdAmount = 0
+
+    def isValid(self, linkedAmount):
+        if self.generation != cacheGeneration: return False
+        if self.objectAmount != len(bpy.data.objects): return False
+        if len(self.objects) != linkedAmount: return False
+        try: return self.sessionUIDs == getEndSessionUIDs(self.objects)
+        except ReferenceError: return False
+
+def getEndSessionUIDs(objects):
+    if len(objects) == 0: return None
+    return (objects[0].session_uid, objects[-1].session_uid)
+
+instanceCaches = {}
+cacheGeneration = 0
+
+@eventHandler("FILE_LOAD_POST")
+@eventHandler("UNDO_POST")
+@eventHandler("REDO_POST")
+def invalidateInstanceCaches():
+    global cacheGeneration
+    cacheGeneration += 1
+
+def invalidateInstanceCachesOnObjectChanges(depsgraph):
+    # objects are linked to or unlinked from collections when they are added or removed
+    if depsgraph.id_type_updated("COLLECTION"):
+        invalidateInstanceCaches()
+
+
 objectTypeItems = [
     ("MESH", "Mesh", "", "MESH_DATA", 0),
     ("TEXT", "Text", "", "FONT_DATA", 1),
@@ -45,6 +97,7 @@ class ObjectInstancerNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ObjectInstancerNode"
     bl_label = "Object Instancer"
     bl_width_default = 160
+    hasSideEffects = True
     options = {"NOT_IN_SUBPROGRAM"}
 
     def copyFromSourceChanged(self, context):
@@ -119,6 +172,13 @@ class ObjectInstancerNode(AnimationNode, bpy.types.Node):
             text = "Unlink Instances from Node",
             description = "This will make sure that the objects won't be removed if you remove the Instancer Node")
 
+        cache = instanceCaches.get(self.identifier)
+        if cache is not None:
+            col = layout.column(align = True)
+            col.label(text = "Collect: " + prettyTime(cache.collectTime))
+            col.label(text = "Remove: " + prettyTime(cache.removeTime))
+            col.label(text = "Create: {} ({} objects)".format(prettyTime(cache.createTime), cache.createdAmount))
+
     def getExecutionCode(self, required):
         if self.containerType in ("SCENES", "MAIN_CONTAINER"): yield "containers = set(scenes)"
         elif self.containerType == "COLLECTIONS": yield "containers = set(collections)"
@@ -161,30 +221,59 @@ class ObjectInstancerNode(AnimationNode, bpy.types.Node):
             self.removeAllObjects()
             self.resetInstances = False
 
-        self.removeObjectsInRange(instancesAmount, len(self.linkedObjects))
-
         return self.getOutputObjects(instancesAmount, sourceObject, containers)
 
 
     def getOutputObjects(self, instancesAmount, sourceObject, containers):
-        objects = []
+        cache = self.getInstanceCache()
+
+        start = time.perf_counter()
+        objects = self.getLinkedObjects()
+        cache.collectTime = time.perf_counter() - start
+
+        start = time.perf_counter()
+        self.removeObjectsInRange(instancesAmount, len(objects))
+        cache.removeTime = time.perf_counter() - start
+
+        start = time.perf_counter()
+        missingAmount = instancesAmount - len(objects)
+        self.createNewObjects(missingAmount, sourceObject, containers)
+        cache.createTime = time.perf_counter() - start
+        cache.createdAmount = max(missingAmount, 0)
+
+        # the cached list must not be changed by other nodes
+        return list(cache.objects)
 
-        for i, objectGroup in enumerate(self.linkedObjects):
+    def getInstanceCache(self):
+        cache = instanceCaches.get(self.identifier)
+        if cache is None:
+            cache = instanceCaches[self.identifier] = InstanceCache()
+        return cache
+
+    def getLinkedObjects(self):
+        cache = self.getInstanceCache()
+        if cache.isValid(len(self.linkedObjects)):
+            return cache.objects
+
+        objects = []
+        for i, objectGroup in reversed(list(enumerate(self.linkedObjects))):
             object = objectGroup.object
             if object is None:
                 self.linkedObjects.remove(i)
             else:
                 objects.append(object)
+        objects.reverse()
 
-        missingAmount = instancesAmount - len(objects)
-        if missingAmount == 0:
-            return objects
-
-        newObjects = self.createNewObjects(missingAmount, sourceObject, containers)
-        objects.extend(newObjects)
-
+        cache.objects = objects
+        self.markInstanceCacheValid()
         return objects
 
+    def markInstanceCacheValid(self):
+        cache = self.getInstanceCache()
+        cache.generation = cacheGeneration
+        cache.objectAmount = len(bpy.data.objects)
+        cache.sessionUIDs = getEndSessionUIDs(cache.objects)
+
     def removeAllObjects(self):
         for objectGroup in self.linkedObjects:
             object = objectGroup.object
@@ -192,16 +281,17 @@ class ObjectInstancerNode(AnimationNode, bpy.types.Node):
                 self.removeObject(object)
 
         self.linkedObjects.clear()
+        self.getInstanceCache().objects = []
+        self.markInstanceCacheValid()
 
     def removeObjectsInRange(self, start, end):
+        if start >= end: return
+        objects = self.getLinkedObjects()
         for i in reversed(range(start, end)):
-            self.removeObjectAtIndex(i)
-
-    def removeObjectAtIndex(self, index):
-        object = self.linkedObjects[index].object
-        if object is not None:
-            self.removeObject(object)
-        self.linkedObjects.remove(index)
+            self.removeObject(objects[i])
+            self.linkedObjects.remove(i)
+        del objects[start:end]
+        self.markInstanceCacheValid()
 
     def removeObject(self, object):
         data = object.data
@@ -226,42 +316,32 @@ class ObjectInstancerNode(AnimationNode, bpy.types.Node):
             object.shape_key_remove(object.active_shape_key)
 
     def createNewObjects(self, amount, sourceObject, containers):
-        objects = []
+        if amount <= 0: return
+        objects = self.getLinkedObjects()
+
         nameSuffix = "instance_{}_".format(getRandomString(5))
-        for i in range(amount):
-            name = nameSuffix + str(i)
-            newObject = self.appendNewObject(name, sourceObject, containers)
-            objects.append(newObject)
-        return objects
+        newObjects = [self.newInstance(nameSuffix + str(i), sourceObject) for i in range(amount)]
 
-    def appendNewObject(self, name, sourceObject, containers):
-        object = self.newInstance(name, sourceObject)
-        self.linkObject(object, containers)
-        self.linkedObjects.add().object = object
-        return object
+        for collection in self.getTargetCollections(containers):
+            link = collection.objects.link
+            for object in newObjects:
+                link(object)
 
-    def linkObject(self, object, containers):
+        linkedObjects = self.linkedObjects
+        for object in newObjects:
+            linkedObjects.add().object = object
+
+        objects.extend(newObjects)
+        self.markInstanceCacheValid()
+
+    def getTargetCollections(self, containers):
+        containers = [container for container in containers if container is not None]
         if self.containerType == "MAIN_CONTAINER":
-            self.linkObjectToMainContainer(object, containers)
+            return [getMainObjectContainer(scene) for scene in containers]
         elif self.containerType == "SCENES":
-            self.linkObjectToScenes(object, containers)
+            return [scene.collection for scene in containers]
         else:
-            self.linkObjectToCollections(object, containers)
-
-    def linkObjectToMainContainer(self, object, scenes):
-        for scene in scenes:
-            if scene is None: continue
-            getMainObjectContainer(scene).objects.link(object)
-
-    def linkObjectToScenes(self, object, scenes):
-        for scene in scenes:
-            if scene is None: continue
-            scene.collection.objects.link(object)
-
-    def linkObjectToCollections(self, object, collections):
-        for collection in collections:
-            if collection is None: continue
-            collection.objects.link(object)
+            return containers
 
     def newInstance(self, name, sourceObject):
         instanceData = self.getSourceObjectData(sourceObject)
@@ -311,10 +391,13 @@ class ObjectInstancerNode(AnimationNode, bpy.types.Node):
 
     def unlinkInstancesFromNode(self):
         self.linkedObjects.clear()
+        instanceCaches.pop(self.identifier, None)
         self.inputs.get("Instances").number = 0
 
     def delete(self):
         self.removeAllObjects()
+        instanceCaches.pop(self.identifier, None)
 
     def duplicate(self, sourceNode):
         self.linkedObjects.clear()
+        instanceCaches.pop(self.identifier, None)
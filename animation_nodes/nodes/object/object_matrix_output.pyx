@@ -1,9 +1,11 @@
 import bpy
 from bpy.props import *
-from ... math cimport toPyMatrix4
+from libc.math cimport fabs
 from ... sockets.info import isList
-from ... events import executionCodeChanged
-from ... data_structures cimport Matrix4x4List
+from ... math cimport Matrix4, toPyMatrix4
+from ... events import propertyChanged, executionCodeChanged
+from ... data_structures cimport LongList, Matrix4x4List
+from . write_cache import getWriteCache, removeWriteCache, drawWriteStatistics
 from ... base_types import AnimationNode, VectorizedSocket
 
 outputItems = [	("BASIS", "Basis", "", "NONE", 0),
@@ -15,12 +17,27 @@ outputItems = [	("BASIS", "Basis", "", "NONE", 0),
 class ObjectMatrixOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ObjectMatrixOutputNode"
     bl_label = "Object Matrix Output"
+    hasSideEffects = True
+
+    def skipUnchangedChanged(self, context):
+        # the written values are not known anymore when the option is enabled again
+        removeWriteCache(self.identifier)
+        propertyChanged(self)
 
     __annotations__ = {}
 
     __annotations__["outputType"] = EnumProperty(name = "Type", default = "WORLD",
         items = outputItems, update = executionCodeChanged)
 
+    __annotations__["skipUnchanged"] = BoolProperty(name = "Skip Unchanged", default = False,
+        description = ("Only write the matrices of objects whose matrix changed since the last execution; "
+                       "changes done outside of Animation Nodes are not overwritten then"),
+        update = skipUnchangedChanged)
+
+    __annotations__["tolerance"] = FloatProperty(name = "Tolerance", default = 1e-6, min = 0,
+        description = "Matrices whose values differ less are considered unchanged",
+        precision = 6, update = propertyChanged)
+
     __annotations__["useObjectList"] = VectorizedSocket.newProperty()
     __annotations__["useMatrixList"] = VectorizedSocket.newProperty()
 
@@ -40,6 +57,14 @@ class ObjectMatrixOutputNode(AnimationNode, bpy.types.Node):
         if self.outputType != "WORLD":
             layout.label(text = "This mode might not work as expected", icon = "INFO")
 
+        col = layout.column(align = True)
+        col.prop(self, "skipUnchanged")
+        subcol = col.column(align = True)
+        subcol.active = self.skipUnchanged
+        subcol.prop(self, "tolerance")
+        if self.useObjectList:
+            drawWriteStatistics(layout, self.identifier)
+
     def getExecutionFunctionName(self):
         if isList(self.inputs[1].dataType):
             return "execute_List"
@@ -59,6 +84,9 @@ class ObjectMatrixOutputNode(AnimationNode, bpy.types.Node):
         if t == "WORLD":          yield indent + "    object.matrix_world = matrix"
 
     def execute_List(self, list objects, Matrix4x4List matrices):
+        if self.skipUnchanged:
+            return self.execute_List_SkipUnchanged(objects, matrices)
+
         cdef:
             Py_ssize_t i
             str attribute = self.outputType
@@ -85,6 +113,46 @@ class ObjectMatrixOutputNode(AnimationNode, bpy.types.Node):
                     obj.matrix_basis = toPyMatrix4(matrices.data + i)
         return objects
 
+    def execute_List_SkipUnchanged(self, list objects, Matrix4x4List matrices):
+        cdef:
+            Py_ssize_t i, lastAmount = 0
+            Py_ssize_t amount = min(len(objects), len(matrices))
+            LongList objectIDs = LongList.fromValue(0, amount)
+            Matrix4x4List writtenMatrices = matrices[:amount]
+            LongList lastObjectIDs = None
+            Matrix4x4List lastMatrices = None
+            float epsilon = self.tolerance
+
+        cache = getWriteCache(self.identifier, self.outputType, epsilon)
+        if cache.matrices is not None:
+            lastObjectIDs = cache.objectIDs
+            lastMatrices = cache.matrices
+            lastAmount = min(len(lastObjectIDs), len(lastMatrices))
+
+        setMatrix = matrixSetters[self.outputType]
+        for i in range(amount):
+            obj = objects[i]
+            if obj is None: continue
+            objectIDs.data[i] = obj.session_uid
+            if (i < lastAmount and lastObjectIDs.data[i] == objectIDs.data[i] and
+                    matricesAreClose(lastMatrices.data + i, matrices.data + i, epsilon)):
+                # keep the matrix that was written, so that slow changes are not lost
+                writtenMatrices.data[i] = lastMatrices.data[i]
+                cache.skippedAmount += 1
+            else:
+                setMatrix(obj, toPyMatrix4(matrices.data + i))
+                cache.writtenAmount += 1
+
+        cache.objectIDs = objectIDs
+        cache.matrices = writtenMatrices
+        return objects
+
+    def delete(self):
+        removeWriteCache(self.identifier)
+
+    def duplicate(self, sourceNode):
+        removeWriteCache(self.identifier)
+
     def getBakeCode(self):
         if self.useObjectList:
             yield "for object in objects:"
@@ -94,3 +162,32 @@ class ObjectMatrixOutputNode(AnimationNode, bpy.types.Node):
         yield "    object.keyframe_insert('location')"
         yield "    object.keyframe_insert('rotation_euler')"
         yield "    object.keyframe_insert('scale')"
+
+
+cdef bint matricesAreClose(Matrix4 *a, Matrix4 *b, float epsilon):
+    cdef float *_a = <float*>a
+    cdef float *_b = <float*>b
+    cdef int i
+    for i in range(16):
+        if fabs(_a[i] - _b[i]) > epsilon:
+            return False
+    return True
+
+def setMatrixWorld(obj, matrix):
+    obj.matrix_world = matrix
+
+def setMatrixLocal(obj, matrix):
+    obj.matrix_local = matrix
+
+def setMatrixParentInverse(obj, matrix):
+    obj.matrix_parent_inverse = matrix
+
+def setMatrixBasis(obj, matrix):
+    obj.matrix_basis = matrix
+
+matrixSetters = {
+    "WORLD" : setMatrixWorld,
+    "LOCAL" : setMatrixLocal,
+    "PARENT_INVERSE" : setMatrixParentInverse,
+    "BASIS" : setMatrixBasis
+}
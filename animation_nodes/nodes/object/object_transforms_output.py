@@ -1,18 +1,25 @@
 import bpy
 from bpy.props import *
-from ... base_types import AnimationNode, VectorizedSocket
-from ... events import executionCodeChanged
+from ... events import propertyChanged, executionCodeChanged
+from ... base_types import AnimationNode, VectorizedSocket, PrependCodeEffect
+from . write_cache import getWriteCache, removeWriteCache, drawWriteStatistics
 
 class ObjectTransformsOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ObjectTransformsOutputNode"
     bl_label = "Object Transforms Output"
     bl_width_default = 180
+    hasSideEffects = True
     codeEffects = [VectorizedSocket.CodeEffect]
 
     def checkedPropertiesChanged(self, context):
         self.updateSocketVisibility()
         executionCodeChanged()
 
+    def skipUnchangedChanged(self, context):
+        # the written values are not known anymore when the option is enabled again
+        removeWriteCache(self.identifier)
+        self.refresh()
+
     useLocation: BoolVectorProperty(update = checkedPropertiesChanged)
     useRotation: BoolVectorProperty(update = checkedPropertiesChanged)
     useScale: BoolVectorProperty(update = checkedPropertiesChanged)
@@ -21,6 +28,15 @@ class ObjectTransformsOutputNode(AnimationNode, bpy.types.Node):
         description = "Apply changes on delta transforms",
         update = executionCodeChanged)
 
+    skipUnchanged: BoolProperty(name = "Skip Unchanged", default = False,
+        description = ("Only write the transforms of objects whose transforms changed since the last execution; "
+                       "changes done outside of Animation Nodes are not overwritten then"),
+        update = skipUnchangedChanged)
+
+    tolerance: FloatProperty(name = "Tolerance", default = 1e-6, min = 0,
+        description = "Values that differ less are considered unchanged",
+        precision = 6, update = propertyChanged)
+
     useObjectList: VectorizedSocket.newProperty()
     useLocationList: VectorizedSocket.newProperty()
     useRotationList: VectorizedSocket.newProperty()
@@ -76,6 +92,14 @@ class ObjectTransformsOutputNode(AnimationNode, bpy.types.Node):
     def drawAdvanced(self, layout):
         layout.prop(self, "deltaTransforms")
 
+        col = layout.column(align = True)
+        col.prop(self, "skipUnchanged")
+        subcol = col.column(align = True)
+        subcol.active = self.skipUnchanged
+        subcol.prop(self, "tolerance")
+        if self.skipUnchanged:
+            drawWriteStatistics(layout, self.identifier)
+
     def updateSocketVisibility(self):
         self.inputs[1].hide = not any(self.useLocation)
         self.inputs[2].hide = not any(self.useRotation)
@@ -89,7 +113,14 @@ class ObjectTransformsOutputNode(AnimationNode, bpy.types.Node):
         if not any((*useLoc, *useRot, *useScale)):
             return
 
-        yield "if object is not None:"
+        if self.skipUnchanged:
+            values = []
+            if any(useLoc): values.append("*location")
+            if any(useRot): values.append("*rotation")
+            if any(useScale): values.append("*scale")
+            yield "if object is not None and _writeCache.hasChanged(object.session_uid, ({}, )):".format(", ".join(values))
+        else:
+            yield "if object is not None:"
 
         # Location
         if all((*useLoc, )):
@@ -112,6 +143,23 @@ class ObjectTransformsOutputNode(AnimationNode, bpy.types.Node):
             for i in range(3):
                 if useScale[i]: yield "    object.{0}[{1}] = scale[{1}]".format(self.scalePath, i)
 
+    def getCodeEffects(self):
+        if self.skipUnchanged:
+            return [PrependCodeEffect("_writeCache = self.prepareWriteCache()")]
+        return []
+
+    def prepareWriteCache(self):
+        key = (self.locationPath, tuple(self.useLocation),
+               self.rotationPath, tuple(self.useRotation),
+               self.scalePath, tuple(self.useScale))
+        return getWriteCache(self.identifier, key, self.tolerance)
+
+    def delete(self):
+        removeWriteCache(self.identifier)
+
+    def duplicate(self, sourceNode):
+        removeWriteCache(self.identifier)
+
     def getBakeCode(self):
         yield "if object is not None:"
         yield "    pass"
@@ -14,6 +14,7 @@ attributes = [
 class ObjectVisibilityOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ObjectVisibilityOutputNode"
     bl_label = "Object Visibility Output"
+    hasSideEffects = True
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useObjectList: VectorizedSocket.newProperty()
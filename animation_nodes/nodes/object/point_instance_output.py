@@ -0,0 +1,207 @@
+import bpy
+from bpy.props import *
+from ... base_types import AnimationNode
+from ... events import propertyChanged
+from ... preferences import getBlenderVersion
+from .. rotation.c_utils import eulersToVectors
+from .. number.c_utils import range_LongList_StartStep
+from .. matrix.c_utils import (
+    extractMatrixTranslations,
+    extractMatrixRotations,
+    extractMatrixScales
+)
+
+modifierName = "AN Point Instance"
+nodeGroupName = "AN Point Instance"
+
+class PointInstanceOutputNode(AnimationNode, bpy.types.Node):
+    bl_idname = "an_PointInstanceOutputNode"
+    bl_label = "Point Instance Output"
+    bl_width_default = 170
+    hasSideEffects = True
+    errorHandlingType = "EXCEPTION"
+
+    rotationName: StringProperty(name = "Rotation", default = "rotation",
+        update = propertyChanged)
+
+    scaleName: StringProperty(name = "Scale", default = "scale",
+        update = propertyChanged)
+
+    indexName: StringProperty(name = "Instance Index", default = "instance_index",
+        update = propertyChanged)
+
+    colorName: StringProperty(name = "Color", default = "instance_color",
+        update = propertyChanged)
+
+    def create(self):
+        socket = self.newInput("Object", "Object", "object")
+        socket.defaultDrawType = "PROPERTY_ONLY"
+        socket.objectCreationType = "MESH"
+
+        self.newInput("Collection", "Collection", "collection", defaultDrawType = "PROPERTY_ONLY")
+        self.newInput("Matrix List", "Matrices", "matrices")
+        self.newInput("Integer List", "Instance Indices", "instanceIndices")
+        self.newInput("Color List", "Colors", "colors")
+
+        for socket in self.inputs[3:]:
+            socket.useIsUsedProperty = True
+            socket.isUsed = False
+
+        self.newOutput("Object", "Object", "object")
+
+    def drawAdvanced(self, layout):
+        col = layout.column(align = True)
+        col.label(text = "Attribute Names:")
+        col.prop(self, "rotationName")
+        col.prop(self, "scaleName")
+        col.prop(self, "indexName")
+        col.prop(self, "colorName")
+
+        layout.label(text = "The collection is instanced by a geometry nodes modifier", icon = "INFO")
+
+    def execute(self, object, collection, matrices, instanceIndices, colors):
+        if object is None: return object
+        if object.type != "MESH": self.raiseErrorMessage("Object is not a mesh object.")
+        if object.mode != "OBJECT": self.raiseErrorMessage("Object is not in object mode.")
+
+        mesh = object.data
+        amount = len(matrices)
+        if len(mesh.vertices) != amount or len(mesh.edges) > 0 or len(mesh.polygons) > 0:
+            mesh.clear_geometry()
+            mesh.vertices.add(amount)
+
+        mesh.vertices.foreach_set("co", extractMatrixTranslations(matrices).asMemoryView())
+
+        rotations = eulersToVectors(extractMatrixRotations(matrices), False)
+        self.setPointAttribute(mesh, self.rotationName, "FLOAT_VECTOR", "vector", rotations)
+        self.setPointAttribute(mesh, self.scaleName, "FLOAT_VECTOR", "vector",
+                               extractMatrixScales(matrices))
+
+        if self.inputs["Instance Indices"].isUsed:
+            if len(instanceIndices) != amount:
+                self.raiseErrorMessage("The amount of instance indices is not equal to the amount of matrices.")
+        else:
+            instanceIndices = range_LongList_StartStep(amount, 0, 1)
+        self.setPointAttribute(mesh, self.indexName, "INT", "value", instanceIndices)
+
+        if self.inputs["Colors"].isUsed:
+            if len(colors) != amount:
+                self.raiseErrorMessage("The amount of colors is not equal to the amount of matrices.")
+            self.setPointAttribute(mesh, self.colorName, "FLOAT_COLOR", "color", colors)
+
+        if collection is not None:
+            self.setupModifier(object, collection)
+
+        mesh.update()
+        return object
+
+    def setupModifier(self, object, collection):
+        modifier = object.modifiers.get(modifierName)
+        if modifier is None:
+            modifier = object.modifiers.new(modifierName, "NODES")
+        elif modifier.type != "NODES":
+            self.raiseErrorMessage("The {} modifier is not a geometry nodes modifier.".format(repr(modifierName)))
+        if modifier.node_group is None:
+            modifier.node_group = getPointInstanceNodeGroup()
+
+        nodeGroup = modifier.node_group
+        setModifierInput(modifier, nodeGroup, "Collection", collection)
+        if getBlenderVersion() >= (3, 0, 0):
+            setModifierAttribute(modifier, nodeGroup, "Instance Index", self.indexName)
+            setModifierAttribute(modifier, nodeGroup, "Rotation", self.rotationName)
+            setModifierAttribute(modifier, nodeGroup, "Scale", self.scaleName)
+
+    def setPointAttribute(self, mesh, name, dataType, propertyName, data):
+        if name == "": self.raiseErrorMessage("Attribute name can't be empty.")
+
+        attribute = mesh.attributes.get(name)
+        if attribute is not None and (attribute.data_type != dataType or attribute.domain != "POINT"):
+            mesh.attributes.remove(attribute)
+            attribute = None
+        if attribute is None:
+            attribute = mesh.attributes.new(name, dataType, "POINT")
+
+        attribute.data.foreach_set(propertyName, data.asMemoryView())
+
+
+# Geometry Nodes
+###########################################
+
+# Blender 2.93 only has the Point Instance node, which always reads the
+# "rotation" and "scale" attributes and can't pick instances by index.
+# Newer versions pass the attributes as modifier inputs to Instance on Points.
+
+def getPointInstanceNodeGroup():
+    nodeGroup = bpy.data.node_groups.get(nodeGroupName)
+    if nodeGroup is None or nodeGroup.bl_idname != "GeometryNodeTree":
+        nodeGroup = newPointInstanceNodeGroup()
+    return nodeGroup
+
+def newPointInstanceNodeGroup():
+    nodeGroup = bpy.data.node_groups.new(nodeGroupName, "GeometryNodeTree")
+    newGroupSocket(nodeGroup, "INPUT", "NodeSocketGeometry", "Geometry")
+    newGroupSocket(nodeGroup, "INPUT", "NodeSocketCollection", "Collection")
+    newGroupSocket(nodeGroup, "OUTPUT", "NodeSocketGeometry", "Geometry")
+
+    nodes, links = nodeGroup.nodes, nodeGroup.links
+    groupInput = nodes.new("NodeGroupInput")
+    groupOutput = nodes.new("NodeGroupOutput")
+    groupOutput.location = (600, 0)
+
+    if getBlenderVersion() < (3, 0, 0):
+        instancer = nodes.new("GeometryNodePointInstance")
+        instancer.instance_type = "COLLECTION"
+        links.new(groupInput.outputs["Geometry"], instancer.inputs["Geometry"])
+        links.new(groupInput.outputs["Collection"], instancer.inputs["Collection"])
+        links.new(instancer.outputs["Geometry"], groupOutput.inputs["Geometry"])
+    else:
+        newGroupSocket(nodeGroup, "INPUT", "NodeSocketInt", "Instance Index")
+        newGroupSocket(nodeGroup, "INPUT", "NodeSocketVector", "Rotation")
+        newGroupSocket(nodeGroup, "INPUT", "NodeSocketVector", "Scale")
+
+        collectionInfo = nodes.new("GeometryNodeCollectionInfo")
+        collectionInfo.inputs["Separate Children"].default_value = True
+        collectionInfo.inputs["Reset Children"].default_value = True
+        instancer = nodes.new("GeometryNodeInstanceOnPoints")
+        instancer.inputs["Pick Instance"].default_value = True
+
+        links.new(groupInput.outputs["Collection"], collectionInfo.inputs["Collection"])
+        links.new(collectionInfo.outputs[0], instancer.inputs["Instance"])
+        links.new(groupInput.outputs["Geometry"], instancer.inputs["Points"])
+        for name in ("Instance Index", "Rotation", "Scale"):
+            links.new(groupInput.outputs[name], instancer.inputs[name])
+        links.new(instancer.outputs["Instances"], groupOutput.inputs["Geometry"])
+        collectionInfo.location = (150, 150)
+
+    instancer.location = (350, 0)
+    return nodeGroup
+
+def newGroupSocket(nodeGroup, inOut, socketType, name):
+    if getBlenderVersion() >= (4, 0, 0):
+        nodeGroup.interface.new_socket(name, in_out = inOut, socket_type = socketType)
+    elif inOut == "INPUT":
+        nodeGroup.inputs.new(socketType, name)
+    else:
+        nodeGroup.outputs.new(socketType, name)
+
+def getGroupInputIdentifier(nodeGroup, name):
+    if getBlenderVersion() >= (4, 0, 0):
+        for item in nodeGroup.interface.items_tree:
+            if item.item_type == "SOCKET" and item.in_out == "INPUT" and item.name == name:
+                return item.identifier
+        return None
+    socket = nodeGroup.inputs.get(name)
+    return None if socket is None else socket.identifier
+
+def setModifierInput(modifier, nodeGroup, name, value):
+    identifier = getGroupInputIdentifier(nodeGroup, name)
+    if identifier is not None and modifier.get(identifier) != value:
+        modifier[identifier] = value
+
+def setModifierAttribute(modifier, nodeGroup, name, attributeName):
+    identifier = getGroupInputIdentifier(nodeGroup, name)
+    if identifier is None: return
+    if not modifier.get(identifier + "_use_attribute"):
+        modifier[identifier + "_use_attribute"] = True
+    if modifier.get(identifier + "_attribute_name") != attributeName:
+        modifier[identifier + "_attribute_name"] = attributeName
@@ -11,6 +11,7 @@ class CopyTransformsNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_CopyTransformsNode"
     bl_label = "Copy Transforms"
     bl_width_default = 160
+    hasSideEffects = True
 
     def useCurrentTransformsChanged(self, context):
         self.inputs["Frame"].hide = self.useCurrentTransforms
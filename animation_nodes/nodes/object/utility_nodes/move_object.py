@@ -5,6 +5,7 @@ from .... utils.depsgraph import getEvaluatedID
 class MoveObjectNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_MoveObjectNode"
     bl_label = "Move Object"
+    hasSideEffects = True
 
     def create(self):
         self.newInput("Object", "Object", "object").defaultDrawType = "PROPERTY_ONLY"
@@ -4,6 +4,7 @@ from .... base_types import AnimationNode
 class ResetObjectTransformsNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ResetObjectTransformsNode"
     bl_label = "Reset Object Transforms"
+    hasSideEffects = True
 
     def create(self):
         self.newInput("Object", "Object", "object").defaultDrawType = "PROPERTY_ONLY"
@@ -8,6 +8,7 @@ from .... utils.depsgraph import getEvaluatedID
 class TransformObjectNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_TransformObjectNode"
     bl_label = "Transform Object"
+    hasSideEffects = True
 
     useCenter: BoolProperty(name = "Use Center", default = True,
         description = "Use the object location as origin", update = propertyChanged)
@@ -0,0 +1,62 @@
+from ... utils.handlers import eventHandler
+
+# Output nodes remember the values they wrote in the last execution,
+# so that objects whose values did not change don't have to be updated.
+# Changes done outside of Animation Nodes are not detected. Objects are
+# identified by their session_uid, because the memory of removed objects
+# can be reused by new ones.
+
+class WriteCache:
+    def __init__(self, key):
+        self.key = key
+        self.generation = cacheGeneration
+        self.epsilon = 0.0
+        self.values = {}
+        self.objectIDs = None
+        self.matrices = None
+        self.writtenAmount = 0
+        self.skippedAmount = 0
+
+    def resetStatistics(self):
+        self.writtenAmount = 0
+        self.skippedAmount = 0
+
+    def hasChanged(self, objectID, values):
+        lastValues = self.values.get(objectID)
+        if lastValues is not None:
+            epsilon = self.epsilon
+            if all(abs(a - b) <= epsilon for a, b in zip(lastValues, values)):
+                self.skippedAmount += 1
+                return False
+        self.values[objectID] = values
+        self.writtenAmount += 1
+        return True
+
+writeCaches = {}
+cacheGeneration = 0
+
+@eventHandler("FILE_LOAD_POST")
+@eventHandler("UNDO_POST")
+@eventHandler("REDO_POST")
+def invalidateWriteCaches():
+    global cacheGeneration
+    cacheGeneration += 1
+
+def getWriteCache(identifier, key, epsilon):
+    '''The cache is recreated when the key (the node settings) changed.'''
+    cache = writeCaches.get(identifier)
+    if cache is None or cache.key != key or cache.generation != cacheGeneration:
+        cache = writeCaches[identifier] = WriteCache(key)
+    cache.epsilon = epsilon
+    cache.resetStatistics()
+    return cache
+
+def removeWriteCache(identifier):
+    writeCaches.pop(identifier, None)
+
+def drawWriteStatistics(layout, identifier):
+    cache = writeCaches.get(identifier)
+    if cache is None: return
+    col = layout.column(align = True)
+    col.label(text = "Written: {}".format(cache.writtenAmount))
+    col.label(text = "Skipped: {}".format(cache.skippedAmount))
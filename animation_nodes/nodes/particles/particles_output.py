@@ -9,6 +9,7 @@ class ParticlesOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ParticlesOutputNode"
     bl_label = "Particles Output"
     bl_width_default = 180
+    hasSideEffects = True
     errorHandlingType = "EXCEPTION"
 
     def checkedPropertiesChanged(self, context):
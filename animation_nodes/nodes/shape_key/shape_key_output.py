@@ -5,6 +5,7 @@ class ShapeKeyOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ShapeKeyOutputNode"
     bl_label = "Shape Key Output"
     bl_width_default = 160
+    hasSideEffects = True
     codeEffects = [VectorizedSocket.CodeEffect]
 
     useShapeKeyList: VectorizedSocket.newProperty()
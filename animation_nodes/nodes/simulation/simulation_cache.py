@@ -0,0 +1,148 @@
+import bpy
+import pickle
+import tempfile
+from ... utils.handlers import eventHandler
+from ... utils.animation import isAnimationPlaying
+
+# Keeping the state of every simulated frame in memory is not possible for
+# long simulations. Besides the last simulated state and the state of the
+# current frame, only every n-th state is kept as checkpoint. When there are too many checkpoints in memory, the
+# oldest ones are written into a temporary file. Frames in between are
+# simulated again starting at the closest checkpoint before them.
+
+class SimulationCache:
+    def __init__(self, startFrame):
+        self.startFrame = startFrame
+        self.checkpointInterval = 10
+        self.memoryCheckpointAmount = 50
+
+        self.lastFrame = None
+        self.lastState = None
+        self.currentFrame = None
+        self.currentState = None
+        self.validFrame = None
+        self.checkpoints = {}
+        self.spilledCheckpoints = {}
+        self.spillFile = None
+
+    def store(self, frame, state):
+        self.lastFrame = frame
+        self.lastState = state
+        if (frame - self.startFrame) % self.checkpointInterval != 0: return
+        if frame in self.spilledCheckpoints: return
+
+        self.checkpoints[frame] = state
+        self.spillCheckpoints()
+
+    def load(self, frame):
+        if frame == self.currentFrame: return self.currentState
+        if frame == self.lastFrame: return self.lastState
+        if frame in self.checkpoints: return self.checkpoints[frame]
+        if frame in self.spilledCheckpoints: return self.readCheckpoint(frame)
+        return None
+
+    def loadCurrent(self, frame):
+        '''The state is kept until another frame becomes the current one,
+        so that executing the same frame again does not need a re-simulation.'''
+        state = self.load(frame)
+        if state is not None:
+            self.currentFrame = frame
+            self.currentState = state
+        return state
+
+    def findCheckpointBefore(self, frame):
+        frames = [f for f in self.iterStoredFrames() if f < frame]
+        return max(frames) if len(frames) > 0 else None
+
+    def iterStoredFrames(self):
+        if self.lastFrame is not None: yield self.lastFrame
+        if self.currentFrame is not None: yield self.currentFrame
+        yield from self.checkpoints.keys()
+        yield from self.spilledCheckpoints.keys()
+
+    def clear(self):
+        self.lastFrame = None
+        self.lastState = None
+        self.currentFrame = None
+        self.currentState = None
+        self.validFrame = None
+        self.checkpoints.clear()
+        self.spilledCheckpoints.clear()
+        if self.spillFile is not None:
+            self.spillFile.close()
+            self.spillFile = None
+
+
+    # Disk Spill
+    ###########################################
+
+    def spillCheckpoints(self):
+        while len(self.checkpoints) > self.memoryCheckpointAmount:
+            frame = min(self.checkpoints)
+            state = self.checkpoints.pop(frame)
+            # states that cannot be serialized are simulated again when needed
+            try: self.writeCheckpoint(frame, state)
+            except (pickle.PicklingError, TypeError, AttributeError, OSError): pass
+
+    def writeCheckpoint(self, frame, state):
+        data = pickle.dumps(state, protocol = pickle.HIGHEST_PROTOCOL)
+        if self.spillFile is None:
+            self.spillFile = tempfile.TemporaryFile(prefix = "an_simulation_")
+        self.spillFile.seek(0, 2)
+        self.spilledCheckpoints[frame] = (self.spillFile.tell(), len(data))
+        self.spillFile.write(data)
+
+    def readCheckpoint(self, frame):
+        offset, length = self.spilledCheckpoints[frame]
+        self.spillFile.seek(offset)
+        return pickle.loads(self.spillFile.read(length))
+
+
+# Re-Simulation
+###########################################
+
+# The nodes of a simulation can only be evaluated by changing the frame.
+# So frames are simulated again in a timer, outside of the execution.
+
+_isResimulating = False
+
+def resimulateLater(sceneName, startFrame, targetFrame):
+    if _isResimulating or isAnimationPlaying(): return
+    bpy.app.timers.register(lambda: resimulate(sceneName, startFrame, targetFrame))
+
+def resimulate(sceneName, startFrame, targetFrame):
+    global _isResimulating
+    scene = bpy.data.scenes.get(sceneName)
+    if scene is None or scene.frame_current != targetFrame: return
+
+    _isResimulating = True
+    try:
+        for frame in range(startFrame, targetFrame + 1):
+            scene.frame_set(frame)
+    finally:
+        _isResimulating = False
+
+
+# Cache Storage
+###########################################
+
+_cacheByNodeIdentifier = {}
+
+def getSimulationCache(nodeIdentifier):
+    return _cacheByNodeIdentifier.get(nodeIdentifier)
+
+def resetSimulationCache(nodeIdentifier, startFrame):
+    removeSimulationCache(nodeIdentifier)
+    cache = _cacheByNodeIdentifier[nodeIdentifier] = SimulationCache(startFrame)
+    return cache
+
+def removeSimulationCache(nodeIdentifier):
+    cache = _cacheByNodeIdentifier.pop(nodeIdentifier, None)
+    if cache is not None:
+        cache.clear()
+
+@eventHandler("FILE_LOAD_POST")
+def clearSimulationCaches():
+    for cache in _cacheByNodeIdentifier.values():
+        cache.clear()
+    _cacheByNodeIdentifier.clear()
@@ -6,20 +6,28 @@ from ... base_types import AnimationNode
 from ... preferences import getColorSettings
 from ... algorithms.random import getRandomColor
 from ... utils.nodes import newNodeAtCursor, invokeTranslation
+from . simulation_cache import (getSimulationCache, resetSimulationCache,
+                                removeSimulationCache, resimulateLater)
 
 class SimulationInputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_SimulationInputNode"
     bl_label = "Simulation Input"
+    hasSideEffects = True
 
-    simulationBlockID = 0
-    simulationBlocks = {}
-    simulationBlockFrames = {}
     simulationOutputIdentifier: StringProperty(update = propertyChanged)
-    simulationBlockIdentifier: StringProperty(update = propertyChanged)
     sceneName: StringProperty(update = propertyChanged)
     startFrame: IntProperty(update = propertyChanged)
     endFrame: IntProperty(update = propertyChanged)
 
+    checkpointInterval: IntProperty(name = "Checkpoint Interval", default = 10, min = 1,
+        description = ("Keep the state of every n-th frame, frames in between are "
+                       "simulated again when they are needed"),
+        update = propertyChanged)
+
+    memoryCheckpointAmount: IntProperty(name = "Checkpoints in Memory", default = 50, min = 1,
+        description = "Older checkpoints are moved into a temporary file",
+        update = propertyChanged)
+
     def setup(self):
         self.use_custom_color = True
         self.useNetworkColor = False
@@ -39,10 +47,13 @@ class SimulationInputNode(AnimationNode, bpy.types.Node):
         if self.outputNode is None:
             self.invokeFunction(layout, "createSimulationOutputNode", text = "Output Node", icon = "PLUS")
 
+    def drawAdvanced(self, layout):
+        col = layout.column(align = True)
+        col.prop(self, "checkpointInterval")
+        col.prop(self, "memoryCheckpointAmount")
+        self.invokeFunction(layout, "clearCache", text = "Clear Cache")
+
     def execute(self, dataInitial, startFrame, endFrame, scene):
-        self.simulationBlockID += 1
-        simulationBlockIdentifier = self.identifier + str(self.simulationBlockID) + "_"
-        self.simulationBlockIdentifier = simulationBlockIdentifier
         self.sceneName = scene.name
         self.startFrame = startFrame
         self.endFrame = endFrame
@@ -51,28 +62,48 @@ class SimulationInputNode(AnimationNode, bpy.types.Node):
 
         currentFrame = scene.frame_current
         if currentFrame < startFrame:
-            self.resetSimulationBlock(simulationBlockIdentifier, startFrame, endFrame)
+            self.resetCache(startFrame)
             return ANStruct(), deltaTime, elapsedTime
 
+        cache = self.getCache(startFrame)
         if currentFrame == startFrame:
-            self.resetSimulationBlock(simulationBlockIdentifier, startFrame, endFrame)
-            self.simulationBlocks[simulationBlockIdentifier + str(currentFrame)] = dataInitial
-            self.simulationBlockFrames[simulationBlockIdentifier + str(currentFrame)] = currentFrame
+            cache = self.resetCache(startFrame)
+            cache.store(currentFrame, dataInitial)
 
         if currentFrame > endFrame:
             currentFrame = endFrame
         elapsedTime = currentFrame - startFrame
-        return self.simulationBlocks.get(simulationBlockIdentifier + str(currentFrame), ANStruct()), deltaTime, elapsedTime
 
-    def resetSimulationBlock(self, simulationBlockIdentifier, start, end):
-        for key in list(self.simulationBlocks.keys()):
-            if key.startswith(simulationBlockIdentifier):
-                self.simulationBlocks.pop(key, None)
-                self.simulationBlockFrames.pop(key, None)
+        data = cache.loadCurrent(currentFrame)
+        if data is None:
+            cache.validFrame = None
+            checkpointFrame = cache.findCheckpointBefore(currentFrame)
+            if checkpointFrame is not None and currentFrame == scene.frame_current:
+                resimulateLater(scene.name, checkpointFrame, currentFrame)
+            return ANStruct(), deltaTime, elapsedTime
+
+        cache.validFrame = currentFrame
+        return data, deltaTime, elapsedTime
+
+    def getCache(self, startFrame):
+        cache = getSimulationCache(self.identifier)
+        if cache is None or cache.startFrame != startFrame:
+            cache = self.resetCache(startFrame)
+        cache.checkpointInterval = self.checkpointInterval
+        cache.memoryCheckpointAmount = self.memoryCheckpointAmount
+        return cache
+
+    def resetCache(self, startFrame):
+        cache = resetSimulationCache(self.identifier, startFrame)
+        cache.checkpointInterval = self.checkpointInterval
+        cache.memoryCheckpointAmount = self.memoryCheckpointAmount
+        return cache
+
+    def clearCache(self):
+        removeSimulationCache(self.identifier)
 
-        for i in range(start, end + 1):
-            self.simulationBlocks[simulationBlockIdentifier + str(i)] = ANStruct()
-            self.simulationBlockFrames[simulationBlockIdentifier + str(i)] = None
+    def delete(self):
+        removeSimulationCache(self.identifier)
 
     @property
     def outputNode(self):
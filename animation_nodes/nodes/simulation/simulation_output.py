@@ -3,10 +3,12 @@ from bpy.props import *
 from ... events import propertyChanged
 from ... data_structures import ANStruct
 from ... base_types import AnimationNode
+from . simulation_cache import getSimulationCache
 
 class SimulationOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_SimulationOutputNode"
     bl_label = "Simulation Output"
+    hasSideEffects = True
     onlySearchTags = True
 
     simulationInputIdentifier: StringProperty(update = propertyChanged)
@@ -23,19 +25,22 @@ class SimulationOutputNode(AnimationNode, bpy.types.Node):
         if inputNode is None: return
         self.setColor(inputNode)
 
+        cache = getSimulationCache(inputNode.identifier)
+        if cache is None: return ANStruct()
+
+        # only continue the simulation when the input node got a simulated state
         currentFrame = bpy.data.scenes[inputNode.sceneName].frame_current
         if currentFrame >= inputNode.startFrame and currentFrame <= inputNode.endFrame:
-            simulationBlockIdentifier = inputNode.simulationBlockIdentifier + str(currentFrame + 1)
-            if inputNode.simulationBlockFrames.get(simulationBlockIdentifier, None) is None:
-                inputNode.simulationBlocks[simulationBlockIdentifier] = data
-                inputNode.simulationBlockFrames[simulationBlockIdentifier] = currentFrame + 1
+            if cache.validFrame == currentFrame:
+                cache.store(currentFrame + 1, data)
 
         if currentFrame < inputNode.startFrame:
             currentFrame = inputNode.startFrame
         elif currentFrame > inputNode.endFrame:
             currentFrame = inputNode.endFrame
-        
-        return inputNode.simulationBlocks.get(inputNode.simulationBlockIdentifier + str(currentFrame + 1), ANStruct())
+
+        data = cache.load(currentFrame + 1)
+        return ANStruct() if data is None else data
 
     def inputNode(self):
         return self.network.getSimulationInputNode(self.identifier)
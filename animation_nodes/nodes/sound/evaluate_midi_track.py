@@ -48,6 +48,6 @@ class EvaluateMIDITrackNode(AnimationNode, bpy.types.Node):
                    "attackTime, attackInterpolation, decayTime, decayInterpolation, min(max(sustainLevel, 0), 1), releaseTime, releaseInterpolation,"
                    "min(max(velocitySensitivity, 0), 1))")
         else:
-            yield ("noteValues = DoubleList.fromValues(track.evaluateAll(time, channel,"
+            yield ("noteValues = track.evaluateAll(time, channel,"
                    "attackTime, attackInterpolation, decayTime, decayInterpolation, min(max(sustainLevel, 0), 1), releaseTime, releaseInterpolation,"
-                   "min(max(velocitySensitivity, 0), 1)))")
+                   "min(max(velocitySensitivity, 0), 1))")
@@ -7,6 +7,7 @@ class ReadMIDIFileNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ReadMIDIFileNode"
     bl_label = "Read MIDI File"
     errorHandlingType = "EXCEPTION"
+    allowConstantFolding = False
 
     def create(self):
         self.newInput("Text", "Path", "path", showFileChooser = True)
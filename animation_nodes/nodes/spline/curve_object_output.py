@@ -7,6 +7,7 @@ class CurveObjectOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_CurveObjectOutputNode"
     bl_label = "Curve Object Output"
     bl_width_default = 180
+    hasSideEffects = True
     errorHandlingType = "MESSAGE"
 
     useSplineList: VectorizedSocket.newProperty()
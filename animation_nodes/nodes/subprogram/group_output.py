@@ -11,6 +11,7 @@ class GroupOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_GroupOutputNode"
     bl_label = "Group Output"
     bl_width_default = 180
+    hasSideEffects = True
     onlySearchTags = True
 
     def inputNodeIdentifierChanged(self, context):
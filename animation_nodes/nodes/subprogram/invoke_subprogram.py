@@ -5,6 +5,7 @@ from ... base_types import AnimationNode
 from ... events import executionCodeChanged
 from ... utils.blender_ui import getDpiFactor
 from ... utils.enum_items import cacheEnumItems
+from . subprogram_cache import subprogramCache
 from ... tree_info import (getSubprogramNetworks,
                            getNodeByIdentifier,
                            getNetworkByIdentifier)
@@ -15,14 +16,11 @@ cacheTypeItems = [
     ("FRAME_BASED", "Once per Frame", ""),
     ("INPUT_BASED", "Once per Input", "")]
 
-oneTimeCache = {}
-frameBasedCache = {}
-inputBasedCache = {}
-
 class InvokeSubprogramNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_InvokeSubprogramNode"
     bl_label = "Invoke Subprogram"
     bl_width_default = 160
+    hasSideEffects = True
     dynamicLabelType = "HIDDEN_ONLY"
 
     subprogramIdentifier: StringProperty(name = "Subprogram Identifier", default = "",
@@ -80,26 +78,25 @@ class InvokeSubprogramNode(AnimationNode, bpy.types.Node):
             return lines
 
     def getCachedData(self, *args):
+        key = self.getCacheKey(args)
+        if key is None: return False, None
+        return subprogramCache.get(key, self.identifier)
+
+    def setCacheData(self, data, *args):
+        key = self.getCacheKey(args)
+        if key is None: return
+        subprogramCache.set(key, data, self.identifier)
+
+    def getCacheKey(self, args):
+        # the first element is the owner of the entry, see clearCache
         if self.cacheType == "ONE_TIME":
-            try: return True, oneTimeCache[self.identifier]
-            except: pass
+            return (self.identifier, "ONE_TIME")
         if self.cacheType == "FRAME_BASED":
-            try: return True, frameBasedCache[self.identifier][str(self.nodeTree.scene.frame_current)]
-            except: pass
+            return (self.identifier, "FRAME_BASED", self.nodeTree.scene.frame_current)
         if self.cacheType == "INPUT_BASED":
-            try: return True, inputBasedCache[self.subprogramIdentifier][self.getArgsHash(args)]
-            except: pass
-
-        return False, None
-
-    def setCacheData(self, data, *args):
-        if self.cacheType == "ONE_TIME": oneTimeCache[self.identifier] = data
-        elif self.cacheType == "FRAME_BASED":
-            if self.identifier not in frameBasedCache: frameBasedCache[self.identifier] = {}
-            frameBasedCache[self.identifier][str(self.nodeTree.scene.frame_current)] = data
-        elif self.cacheType == "INPUT_BASED":
-            if self.subprogramIdentifier not in inputBasedCache: inputBasedCache[self.subprogramIdentifier] = {}
-            inputBasedCache[self.subprogramIdentifier][self.getArgsHash(args)] = data
+            try: return (self.subprogramIdentifier, "INPUT_BASED", self.getArgsHash(args))
+            except TypeError: return None
+        return None
 
     def getArgsHash(self, args):
         return tuple(hash(arg.freeze() if hasattr(arg, "freeze") else arg) for arg in args)
@@ -130,6 +127,8 @@ class InvokeSubprogramNode(AnimationNode, bpy.types.Node):
 
     def drawAdvanced(self, layout):
         self.drawCacheOptions(layout)
+        if self.cacheType != "DISABLED":
+            self.drawCacheStatistics(layout)
         col = layout.column()
         col.active = self.cacheType == "DISABLED"
         col.prop(self, "showCacheOptions")
@@ -145,14 +144,26 @@ class InvokeSubprogramNode(AnimationNode, bpy.types.Node):
             if not self.isInputComparable: col.label(text = "  - The input is not comparable")
         self.invokeFunction(layout, "clearCache", text = "Clear Cache")
 
+    def drawCacheStatistics(self, layout):
+        statistics = self.cacheStatistics
+        col = layout.column(align = True)
+        col.label(text = "Hits: {}  Misses: {}".format(statistics.hits, statistics.misses))
+        col.label(text = "Evictions: {}".format(statistics.evictions))
+        col.label(text = "Memory: {:.1f} MB".format(
+            subprogramCache.getNodeMemoryUsage(self.identifier) / 1024 ** 2))
+
     def checkCachingPossibilities(self):
         self.isInputComparable = all(socket.comparable for socket in self.inputs)
         self.isOutputStorable = all(socket.storable for socket in self.outputs)
 
     def clearCache(self):
-        oneTimeCache.pop(self.identifier, None)
-        frameBasedCache.pop(self.identifier, None)
-        inputBasedCache.pop(self.subprogramIdentifier, None)
+        subprogramCache.removeOwner(self.identifier)
+        subprogramCache.removeOwner(self.subprogramIdentifier)
+        subprogramCache.resetStatistics(self.identifier)
+
+    @property
+    def cacheStatistics(self):
+        return subprogramCache.getStatistics(self.identifier)
 
 
     @property
@@ -7,6 +7,7 @@ from ... events import treeChanged, propertyChanged
 class LoopBreakNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_LoopBreakNode"
     bl_label = "Loop Break"
+    hasSideEffects = True
     onlySearchTags = True
 
     loopInputIdentifier: StringProperty(update = treeChanged)
@@ -9,6 +9,7 @@ from . subprogram_sockets import subprogramInterfaceChanged
 class LoopGeneratorOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_LoopGeneratorOutputNode"
     bl_label = "Loop Generator Output"
+    hasSideEffects = True
     dynamicLabelType = "ALWAYS"
     onlySearchTags = True
 
@@ -7,6 +7,7 @@ class ReassignLoopParameterNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ReassignLoopParameterNode"
     bl_label = "Reassign Loop Parameter"
     bl_width_default = 180
+    hasSideEffects = True
     onlySearchTags = True
 
     def identifierChanged(self, context):
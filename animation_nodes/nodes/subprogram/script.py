@@ -14,6 +14,7 @@ class ScriptNode(AnimationNode, bpy.types.Node, SubprogramBaseNode):
     bl_idname = "an_ScriptNode"
     bl_label = "Script"
     bl_width_default = 200
+    hasSideEffects = True
 
     def scriptExecutionCodeChanged(self, context):
         self.errorMessage = ""
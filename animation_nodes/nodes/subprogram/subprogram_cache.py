@@ -0,0 +1,104 @@
+import sys
+from collections import OrderedDict
+from ... preferences import getSubprogramCacheBudget
+
+# The results of cached subprograms can be big (e.g. a mesh for every
+# frame of a long animation). All cached results share one memory budget.
+# When it is exceeded, the results that have not been used for the longest
+# time are removed.
+
+class CacheEntry:
+    __slots__ = ("data", "size", "nodeIdentifier")
+
+    def __init__(self, data, size, nodeIdentifier):
+        self.data = data
+        self.size = size
+        self.nodeIdentifier = nodeIdentifier
+
+class CacheStatistics:
+    __slots__ = ("hits", "misses", "evictions")
+
+    def __init__(self):
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+class SubprogramCache:
+    def __init__(self):
+        self.entries = OrderedDict()
+        self.totalSize = 0
+        self.statisticsByNode = {}
+
+    def get(self, key, nodeIdentifier):
+        statistics = self.getStatistics(nodeIdentifier)
+        entry = self.entries.get(key)
+        if entry is None:
+            statistics.misses += 1
+            return False, None
+
+        self.entries.move_to_end(key)
+        statistics.hits += 1
+        return True, entry.data
+
+    def set(self, key, data, nodeIdentifier):
+        self.remove(key)
+
+        size = estimateMemoryUsage(data)
+        budget = getSubprogramCacheBudget()
+        if size > budget: return
+
+        self.shrink(budget - size)
+        self.entries[key] = CacheEntry(data, size, nodeIdentifier)
+        self.totalSize += size
+
+    def shrink(self, budget = None):
+        if budget is None: budget = getSubprogramCacheBudget()
+        while self.totalSize > budget and len(self.entries) > 0:
+            key, entry = self.entries.popitem(last = False)
+            self.totalSize -= entry.size
+            self.getStatistics(entry.nodeIdentifier).evictions += 1
+
+    def remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.totalSize -= entry.size
+
+    def removeOwner(self, owner):
+        for key in [key for key in self.entries if key[0] == owner]:
+            self.remove(key)
+
+    def getStatistics(self, nodeIdentifier):
+        statistics = self.statisticsByNode.get(nodeIdentifier)
+        if statistics is None:
+            statistics = self.statisticsByNode[nodeIdentifier] = CacheStatistics()
+        return statistics
+
+    def resetStatistics(self, nodeIdentifier):
+        self.statisticsByNode.pop(nodeIdentifier, None)
+
+    def getNodeMemoryUsage(self, nodeIdentifier):
+        return sum(entry.size for entry in self.entries.values()
+                   if entry.nodeIdentifier == nodeIdentifier)
+
+    def clear(self):
+        self.entries.clear()
+        self.totalSize = 0
+
+subprogramCache = SubprogramCache()
+
+
+# Memory Usage
+###########################################
+
+def estimateMemoryUsage(value):
+    '''Approximate amount of bytes that are referenced by the value.'''
+    if hasattr(value, "getMemoryUsage"):
+        return sys.getsizeof(value) + value.getMemoryUsage()
+    if hasattr(value, "nbytes"):
+        return value.nbytes
+    if isinstance(value, (list, tuple, set)):
+        return sys.getsizeof(value) + sum(estimateMemoryUsage(element) for element in value)
+    if isinstance(value, dict):
+        return sys.getsizeof(value) + sum(estimateMemoryUsage(key) + estimateMemoryUsage(element)
+                                          for key, element in value.items())
+    return sys.getsizeof(value)
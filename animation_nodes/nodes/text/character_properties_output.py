@@ -5,6 +5,7 @@ from ... base_types import AnimationNode
 class CharacterPropertiesOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_CharacterPropertiesOutputNode"
     bl_label = "Character Properties Output"
+    hasSideEffects = True
 
     allowNegativeIndex: BoolProperty(default = True)
 
@@ -30,6 +30,7 @@ class SeparateTextObjectNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_SeparateTextObjectNode"
     bl_label = "Separate Text Object"
     bl_width_default = 200
+    hasSideEffects = True
 
     sourceObjectName: StringProperty(name = "Source Object")
     currentID: IntProperty(default = 0)
@@ -4,6 +4,7 @@ from ... base_types import AnimationNode
 class TextBlockWriterNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_TextBlockWriterNode"
     bl_label = "Text Block Writer"
+    hasSideEffects = True
 
     def create(self):
         self.newInput("Text Block", "Text Block", "textBlock", defaultDrawType = "PROPERTY_ONLY")
@@ -13,6 +13,7 @@ class TextFileReaderNode(AnimationNode, bpy.types.Node):
     bl_label = "Text File Reader"
     bl_width_default = 180
     errorHandlingType = "EXCEPTION"
+    allowConstantFolding = False
 
     def create(self):
         self.newInput("Text", "Path", "path", showFileChooser = True)
@@ -7,6 +7,7 @@ class TextObjectOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_TextObjectOutputNode"
     bl_label = "Text Object Output"
     bl_width_default = 160
+    hasSideEffects = True
     codeEffects = [VectorizedSocket.CodeEffect]
     errorHandlingType = "MESSAGE"
 
@@ -5,6 +5,7 @@ class TextSequenceOutputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_TextSequenceOutputNode"
     bl_label = "Text Sequence Output"
     bl_width_default = 160
+    hasSideEffects = True
     errorHandlingType = "MESSAGE"
 
     def create(self):
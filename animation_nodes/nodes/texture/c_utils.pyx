@@ -1,5 +1,6 @@
 # cython: profile=True
 import cython
+from ... math cimport Vector3
 from ... data_structures cimport (
     Color,
     ColorList,
@@ -7,23 +8,34 @@ from ... data_structures cimport (
     Vector3DList
 )
 
-@cython.cdivision(True)
-def getTextureColors(texture, Vector3DList locations, matrix):
-    cdef long amount = locations.length
+def sampleTexture(texture, Vector3DList locations):
+    '''The locations have to be in the space of the texture already.'''
+    cdef Py_ssize_t i, amount = locations.length
     cdef ColorList colors = ColorList(length = amount)
-    cdef DoubleList reds = DoubleList(length = amount)
-    cdef DoubleList greens = DoubleList(length = amount)
-    cdef DoubleList blues = DoubleList(length = amount)
-    cdef DoubleList alphas = DoubleList(length = amount)
-    cdef DoubleList intensities = DoubleList(length = amount)
-    cdef float r, g, b, a
+    cdef Vector3 *v
+    cdef Color *c
 
+    evaluate = texture.evaluate
     for i in range(amount):
-        r, g, b, a = texture.evaluate(matrix @ locations[i])
-        reds.data[i] = r
-        greens.data[i] = g
-        blues.data[i] = b
-        alphas.data[i] = a
-        colors.data[i] = Color(r, g, b, a)
-        intensities.data[i] = (r + g + b) / 3.0
-    return colors, reds, greens, blues, alphas, intensities
+        v = locations.data + i
+        c = colors.data + i
+        c.r, c.g, c.b, c.a = evaluate((v.x, v.y, v.z))
+    return colors
+
+def getColorChannel(ColorList colors, int channel):
+    '''channel: 0 = red, 1 = green, 2 = blue, 3 = alpha'''
+    cdef DoubleList result = DoubleList(length = colors.length)
+    cdef Py_ssize_t i
+    for i in range(colors.length):
+        result.data[i] = (<float*>(colors.data + i))[channel]
+    return result
+
+@cython.cdivision(True)
+def getColorIntensities(ColorList colors):
+    cdef DoubleList intensities = DoubleList(length = colors.length)
+    cdef Color *c
+    cdef Py_ssize_t i
+    for i in range(colors.length):
+        c = colors.data + i
+        intensities.data[i] = (c.r + c.g + c.b) / 3.0
+    return intensities
@@ -1,7 +1,9 @@
 import bpy
-from . c_utils import getTextureColors
+from . c_utils import sampleTexture
 from ... base_types import AnimationNode, VectorizedSocket
-from ... data_structures import DoubleList, Color, ColorList
+from ... data_structures import Color, ColorList
+from ... utils.textures import (updateImageSequenceFrame, getTextureSamplesKey,
+                                getCachedTextureSamples, storeTextureSamples)
 
 class TextureInputNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_TextureInputNode"
@@ -40,19 +42,29 @@ class TextureInputNode(AnimationNode, bpy.types.Node):
         col.label(text = "For External Texture, Alpha = Alpha")
         col.label(text = "For Internal Texture, Alpha = Intensity")
 
-    def getExecutionFunctionName(self):
+    def getExecutionCode(self, required):
         if self.useVectorList:
-            return "executeList"
+            yield from self.iterListCode(required)
         else:
-            return "executeSingle"
+            yield "color, red, green, blue, alpha, intensity = self.executeSingle(texture, location, transformation, scene)"
+
+    def iterListCode(self, required):
+        # only the outputs that are used are computed from the samples
+        if len(required) == 0: return
+        yield "_samples = self.sampleColors(texture, locations, transformation, scene)"
+        if "colors" in required:
+            yield "colors = _samples.copy()"
+        for name, channel in (("reds", 0), ("greens", 1), ("blues", 2), ("alphas", 3)):
+            if name in required:
+                yield "{} = AN.nodes.texture.c_utils.getColorChannel(_samples, {})".format(name, channel)
+        if "intensities" in required:
+            yield "intensities = AN.nodes.texture.c_utils.getColorIntensities(_samples)"
 
     def executeSingle(self, texture, location, matrix, scene):
         if texture is None:
             return Color((0, 0, 0, 0)), 0, 0, 0, 0, 0
 
-        if texture.type == "IMAGE":
-            if texture.image is not None and texture.image.source in ["SEQUENCE", "MOVIE"]:
-                texture.image_user.frame_current = scene.frame_current
+        updateImageSequenceFrame(texture, scene)
 
         color = Color(texture.evaluate(matrix @ location))
         r = color.r
@@ -60,12 +72,18 @@ class TextureInputNode(AnimationNode, bpy.types.Node):
         b = color.b
         return color, color.r, color.g, color.b, color.a, (r + g + b) / 3
 
-    def executeList(self, texture, locations, matrix, scene):
+    def sampleColors(self, texture, locations, matrix, scene):
         if texture is None or len(locations) == 0:
-            return ColorList(), DoubleList(), DoubleList(), DoubleList(), DoubleList(), DoubleList()
+            return ColorList()
 
-        if texture.type == "IMAGE":
-            if texture.image is not None and texture.image.source in ["SEQUENCE", "MOVIE"]:
-                texture.image_user.frame_current = scene.frame_current
+        updateImageSequenceFrame(texture, scene)
 
-        return getTextureColors(texture, locations, matrix)
+        frame = getattr(scene, "frame_current", None)
+        key = getTextureSamplesKey(texture, locations, matrix, frame)
+        samples = getCachedTextureSamples(key, locations)
+        if samples is None:
+            transformedLocations = locations.copy()
+            transformedLocations.transform(matrix)
+            samples = sampleTexture(texture, transformedLocations)
+            storeTextureSamples(key, locations, samples)
+        return samples
@@ -1,7 +1,11 @@
-from ... math cimport Vector3, distanceVec3, lengthVec3, dotVec3, transformVec3AsPoint
+# setup: options = openmp
+
+from cython.parallel cimport prange
+from ... math cimport Vector3, Matrix4, distanceVec3, lengthVec3, dotVec3, transformVec3AsPoint
 from ... data_structures cimport (
     DoubleList, Vector3DList, CDefaultList, Vector2DList,
     VirtualDoubleList, VirtualVector3DList, VirtualMatrix4x4List, FloatList)
+from ... utils.parallel cimport getThreadAmount
 
 def combineVectorList(Py_ssize_t amount,
                       VirtualDoubleList x, VirtualDoubleList y, VirtualDoubleList z):
@@ -120,6 +124,17 @@ def transformVirtualVectorList(Py_ssize_t amount,
                                VirtualMatrix4x4List matrices):
     cdef Py_ssize_t i
     cdef Vector3DList output = Vector3DList(length = amount)
-    for i in range(amount):
-        transformVec3AsPoint(output.data + i, vectors.get(i), matrices.get(i))
+    cdef Vector3 *target = output.data
+
+    cdef Py_ssize_t vectorStride, matrixStride
+    cdef Vector3 *_vectors = vectors.getStridedData(amount, &vectorStride)
+    cdef Matrix4 *_matrices = matrices.getStridedData(amount, &matrixStride)
+    cdef int threads = getThreadAmount(amount)
+
+    if threads > 1 and _vectors != NULL and _matrices != NULL:
+        for i in prange(amount, nogil = True, num_threads = threads):
+            transformVec3AsPoint(target + i, _vectors + i * vectorStride, _matrices + i * matrixStride)
+    else:
+        for i in range(amount):
+            transformVec3AsPoint(target + i, vectors.get(i), matrices.get(i))
     return output
@@ -1,9 +1,8 @@
 import bpy
 from bpy.props import *
-from mathutils.kdtree import KDTree
 from ... base_types import AnimationNode
-from ... data_structures import EdgeIndicesList
-from .. mesh.c_utils import calculateEdgeLengths
+from ... data_structures import KDTree
+from .. mesh.c_utils import calculateEdgeLengths, edgesFromNeighbours
 
 modeItems = [
     ("AMOUNT", "Amount", "Find a specific amount of neighbors for each point", "NONE", 0),
@@ -41,49 +40,14 @@ class FindClosePointsNode(AnimationNode, bpy.types.Node):
             yield "distances = self.calculateEdgeLengths(points, edges)"
 
     def execute_Amount(self, points, amount):
-        kdTree = self.buildKDTree(points)
-        amount = max(0, amount)
-
-        edges = EdgeIndicesList()
-        edgeSet = set()
-
-        for index, point in enumerate(points):
-            for foundPoint, foundIndex, distance in kdTree.find_n(point, amount + 1):
-                if foundIndex == index:
-                    continue
-
-                edge = (foundIndex, index) if foundIndex < index else (index, foundIndex)
-                if edge not in edgeSet:
-                    edgeSet.add(edge)
-                    edges.append(edge)
-
-        return edges
+        kdTree = KDTree(points)
+        neighbours, _, offsets = kdTree.findNearestForList(points, max(0, amount) + 1)
+        return edgesFromNeighbours(neighbours, offsets)
 
     def execute_Distance(self, points, maxDistance):
-        kdTree = self.buildKDTree(points)
-        maxDistance = max(0, maxDistance)
-
-        edges = EdgeIndicesList()
-        edgeSet = set()
-
-        for index, point in enumerate(points):
-            for foundPoint, foundIndex, distance in kdTree.find_range(point, maxDistance):
-                if foundIndex == index:
-                    continue
-
-                edge = (foundIndex, index) if foundIndex < index else (index, foundIndex)
-                if edge not in edgeSet:
-                    edgeSet.add(edge)
-                    edges.append(edge)
-
-        return edges
-
-    def buildKDTree(self, points):
-        kdTree = KDTree(len(points))
-        for i, vector in enumerate(points):
-            kdTree.insert(vector, i)
-        kdTree.balance()
-        return kdTree
+        kdTree = KDTree(points)
+        neighbours, _, offsets = kdTree.findInRadiusForList(points, max(0, maxDistance))
+        return edgesFromNeighbours(neighbours, offsets)
 
     def calculateEdgeLengths(self, points, edges):
         return calculateEdgeLengths(points, edges)
@@ -1,5 +1,8 @@
+# setup: options = openmp
+
 import bpy
 from bpy.props import *
+from cython.parallel cimport prange
 from collections import OrderedDict
 from ... base_types import AnimationNode, VectorizedSocket
 
@@ -16,9 +19,11 @@ from ... data_structures cimport (
     VirtualDoubleList
 )
 
-ctypedef void (*SingleVectorFunction)(Vector3* target, Vector3* source)
-ctypedef void (*VectorVectorFunction)(Vector3* target, Vector3* a, Vector3* b)
-ctypedef void (*VectorFloatFunction)(Vector3* target, Vector3* a, float b)
+from ... utils.parallel cimport getThreadAmount
+
+ctypedef void (*SingleVectorFunction)(Vector3* target, Vector3* source) nogil
+ctypedef void (*VectorVectorFunction)(Vector3* target, Vector3* a, Vector3* b) nogil
+ctypedef void (*VectorFloatFunction)(Vector3* target, Vector3* a, float b) nogil
 
 cdef class Operation:
     cdef:
@@ -41,9 +46,17 @@ cdef class Operation:
     def execute_vA(self, Vector3DList a):
         cdef Vector3DList result = Vector3DList(length = a.length)
         cdef SingleVectorFunction f = <SingleVectorFunction>self.function
-        cdef long i
-        for i in range(result.length):
-            f(result.data + i, a.data + i)
+        cdef Vector3* target = result.data
+        cdef Vector3* source = a.data
+        cdef int threads = getThreadAmount(result.length)
+
+        cdef Py_ssize_t i
+        if threads > 1:
+            for i in prange(result.length, nogil = True, num_threads = threads):
+                f(target + i, source + i)
+        else:
+            for i in range(result.length):
+                f(target + i, source + i)
         return result
 
     # Two Vectors as Input
@@ -56,10 +69,22 @@ cdef class Operation:
 
         cdef VectorVectorFunction f = <VectorVectorFunction>self.function
         cdef Vector3DList result = Vector3DList(length = amount)
+        cdef Vector3* target = result.data
+
+        cdef Py_ssize_t aStride, bStride
+        cdef Vector3 *aData = _a.getStridedData(amount, &aStride)
+        cdef Vector3 *bData = _b.getStridedData(amount, &bStride)
+        cdef int threads = getThreadAmount(amount)
+        if aData == NULL or bData == NULL:
+            threads = 1
 
         cdef Py_ssize_t i
-        for i in range(amount):
-            f(result.data + i, _a.get(i), _b.get(i))
+        if threads > 1:
+            for i in prange(amount, nogil = True, num_threads = threads):
+                f(target + i, aData + i * aStride, bData + i * bStride)
+        else:
+            for i in range(amount):
+                f(target + i, _a.get(i), _b.get(i))
         return result
 
     # Vector and Float as Input
@@ -72,13 +97,24 @@ cdef class Operation:
 
         cdef VectorFloatFunction f = <VectorFloatFunction>self.function
         cdef Vector3DList result = Vector3DList(length = amount)
+        cdef Vector3* target = result.data
+
+        cdef Py_ssize_t aStride, bStride
+        cdef Vector3 *aData = _a.getStridedData(amount, &aStride)
+        cdef double *bData = _b.getStridedData(amount, &bStride)
+        cdef int threads = getThreadAmount(amount)
+        if aData == NULL or bData == NULL:
+            threads = 1
 
         cdef Py_ssize_t i
-        for i in range(amount):
-            f(result.data + i, _a.get(i), _b.get(i))
+        if threads > 1:
+            for i in prange(amount, nogil = True, num_threads = threads):
+                f(target + i, aData + i * aStride, bData[i * bStride])
+        else:
+            for i in range(amount):
+                f(target + i, _a.get(i), _b.get(i))
         return result
 
-
 cdef new(str name, str label, str type, str expression, void* function):
     cdef Operation op = Operation()
     op.setup(name, label, type, expression, function)
@@ -8,6 +8,7 @@ class InterpolationViewerNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_InterpolationViewerNode"
     bl_label = "Interpolation Viewer"
     bl_width_default = 160
+    hasSideEffects = True
 
     resolution: IntProperty(name = "Resolution", min = 5, default = 100)
 
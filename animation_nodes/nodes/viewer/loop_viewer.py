@@ -9,6 +9,7 @@ class LoopViewerNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_LoopViewerNode"
     bl_label = "Loop Viewer"
     bl_width_default = 160
+    hasSideEffects = True
 
     textBlockName: StringProperty(name = "Text")
 
@@ -11,6 +11,7 @@ class ViewerNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_ViewerNode"
     bl_label = "Viewer"
     bl_width_default = 180
+    hasSideEffects = True
 
     maxRows: IntProperty(name = "Max Rows", default = 150, min = 0,
         description = "Max amount of lines visible in the floating text box")
@@ -27,6 +27,7 @@ drawableDataTypes = (Vector3DList, Vector2DList, Matrix4x4List, Vector, Matrix,
 class Viewer3DNode(AnimationNode, bpy.types.Node):
     bl_idname = "an_Viewer3DNode"
     bl_label = "3D Viewer"
+    hasSideEffects = True
 
     def drawPropertyChanged(self, context):
         self.execute(self.getCurrentData())
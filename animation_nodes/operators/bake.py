@@ -1,6 +1,19 @@
 import bpy
+import time
 from bpy.props import *
+from .. import problems
+from .. update import updateEverything
 from .. preferences import getPreferences
+from .. utils.timing import prettyTime
+from .. utils.nodes import getAnimationNodeTrees
+from .. execution.persistence import getAnimatedNodeIDs
+from .. execution.units import (
+    setupExecutionUnits,
+    finishExecutionUnits,
+    reloadAnimatedSocketValues
+)
+from .. execution.auto_execution import suspendAutoExecution, resumeAutoExecution
+from .. execution.keyframe_recorder import KeyframeRecorder, startRecording, stopRecording
 
 class BakeAnimation(bpy.types.Operator):
     bl_idname = "an.bake_to_keyframes"
@@ -39,3 +52,121 @@ class BakeAnimation(bpy.types.Operator):
         getPreferences().executionCode.type = "DEFAULT"
         bpy.context.window_manager.event_timer_remove(self.timer)
         return {"FINISHED"}
+
+class BatchBakeNodeTrees(bpy.types.Operator):
+    bl_idname = "an.batch_bake"
+    bl_label = "Batch Bake"
+    bl_description = ("Execute the node trees for every frame in the range and insert "
+                      "all keyframes at the end (only supported nodes, press Esc to cancel)")
+
+    startFrame: IntProperty(default = 1)
+    endFrame: IntProperty(default = 250)
+
+    evaluateScene: BoolProperty(name = "Evaluate Scene", default = True,
+        description = ("Update the whole scene for every frame. This is necessary when the "
+                       "node trees read animated or modified data of other objects, disable "
+                       "it only for faster baking of trees that don't"))
+
+    def invoke(self, context, event):
+        if self.startFrame > self.endFrame:
+            self.report({"ERROR"}, "The start frame has to be before the end frame")
+            return {"CANCELLED"}
+
+        executionCode = getPreferences().executionCode
+        self.oldExecutionCodeType = executionCode.type
+        executionCode.type = "BAKE"
+        updateEverything()
+
+        self.nodeTrees = [tree for tree in getAnimationNodeTrees()
+                          if tree.autoExecution.enabled and tree.hasMainExecutionUnits]
+        if len(self.nodeTrees) == 0 or not problems.canExecute():
+            self.report({"ERROR"}, "There are no node trees that can be baked")
+            self.restoreExecutionCodeType()
+            return {"CANCELLED"}
+
+        self.scene = context.scene
+        self.oldFrame = self.scene.frame_current
+        self.frame = self.startFrame
+        self.animatedNodeIDs = set().union(*(getAnimatedNodeIDs(tree) for tree in self.nodeTrees))
+        self.useFrameSet = self.evaluateScene or len(self.animatedNodeIDs) > 0
+
+        # auto execution would execute the trees a second time per frame
+        suspendAutoExecution()
+        setupExecutionUnits(self.nodeTrees)
+        self.recorder = KeyframeRecorder(self.startFrame, self.endFrame)
+        startRecording(self.recorder)
+
+        self.startTime = time.perf_counter()
+        context.window_manager.progress_begin(self.startFrame, self.endFrame)
+        context.window_manager.modal_handler_add(self)
+        self.timer = context.window_manager.event_timer_add(0.001, window = context.window)
+        return {"RUNNING_MODAL"}
+
+    def modal(self, context, event):
+        if event.type in ("RIGHTMOUSE", "ESC"):
+            self.finish(context, writeKeyframes = False)
+            self.report({"INFO"}, "Baking cancelled at frame {}".format(self.frame))
+            return {"CANCELLED"}
+
+        if event.type != "TIMER":
+            return {"RUNNING_MODAL"}
+
+        # execute as many frames as possible without blocking the interface
+        stepStart = time.perf_counter()
+        while self.frame <= self.endFrame and time.perf_counter() - stepStart < 0.1:
+            self.bakeFrame(self.frame)
+            self.frame += 1
+
+        context.window_manager.progress_update(self.frame)
+        context.workspace.status_text_set("Baking frame {} of {} ({:.1f} frames/s), press Esc to cancel".format(
+            self.frame - 1, self.endFrame, self.framesPerSecond))
+
+        if self.frame > self.endFrame:
+            self.finish(context, writeKeyframes = True)
+            self.report({"INFO"}, "Baked {} frames in {} ({:.1f} frames/s)".format(
+                self.bakedFrameAmount, prettyTime(self.elapsedTime), self.framesPerSecond))
+            return {"FINISHED"}
+
+        return {"RUNNING_MODAL"}
+
+    def bakeFrame(self, frame):
+        if self.useFrameSet:
+            self.scene.frame_set(frame)
+        else:
+            self.scene.frame_current = frame
+
+        # the units are only set up once, so animated socket values have to be reloaded
+        reloadAnimatedSocketValues(self.nodeTrees, self.animatedNodeIDs)
+        self.recorder.frame = frame
+        for nodeTree in self.nodeTrees:
+            for unit in nodeTree.mainUnits:
+                unit.execute()
+
+    def finish(self, context, writeKeyframes):
+        self.elapsedTime = time.perf_counter() - self.startTime
+        stopRecording()
+        finishExecutionUnits(self.nodeTrees)
+        if writeKeyframes:
+            self.recorder.write()
+        else:
+            self.recorder.rollback()
+
+        context.window_manager.event_timer_remove(self.timer)
+        context.window_manager.progress_end()
+        context.workspace.status_text_set(None)
+
+        resumeAutoExecution()
+        self.restoreExecutionCodeType()
+        self.scene.frame_set(self.oldFrame)
+
+    def restoreExecutionCodeType(self):
+        getPreferences().executionCode.type = self.oldExecutionCodeType
+        updateEverything()
+
+    @property
+    def bakedFrameAmount(self):
+        return self.frame - self.startFrame
+
+    @property
+    def framesPerSecond(self):
+        return self.bakedFrameAmount / max(time.perf_counter() - self.startTime, 1e-10)
@@ -36,6 +36,23 @@ class SelectNetwork(bpy.types.Operator, NodeOperator):
             node.select = True
         return {"FINISHED"}
 
+class SelectUnusedNodes(bpy.types.Operator):
+    bl_idname = "an.select_unused_nodes"
+    bl_label = "Select Unused Nodes"
+    bl_description = "Select nodes that are not executed because their results are not used"
+
+    @classmethod
+    def poll(cls, context):
+        return context.getActiveAnimationNodeTree() is not None
+
+    def execute(self, context):
+        from .. execution.units import getDeadNodeIdentifiers
+        tree = context.getActiveAnimationNodeTree()
+        deadNodeIdentifiers = getDeadNodeIdentifiers(tree)
+        for node in tree.nodes:
+            node.select = getattr(node, "identifier", None) in deadNodeIdentifiers
+        return {"FINISHED"}
+
 def getNodesWhenFollowingLinks(startNode, followInputs = False, followOutputs = False):
     nodes = set()
     nodesToCheck = {startNode}
@@ -2,7 +2,25 @@ import bpy
 import cProfile
 from bpy.props import *
 from io import StringIO
+from .. import problems
 from contextlib import redirect_stdout
+from .. utils.nodes import getAnimationNodeTrees
+from .. execution.persistence import getAnimatedNodeIDs
+from .. execution.units import (
+    setupExecutionUnits,
+    finishExecutionUnits,
+    reloadAnimatedSocketValues
+)
+from .. execution.auto_execution import suspendAutoExecution, resumeAutoExecution
+from .. execution.profiler import (
+    isProfiling,
+    beginSpan,
+    endSpan,
+    exportTrace,
+    hasRecordedEvents,
+    startRangeRecording,
+    stopRangeRecording
+)
 
 class ProfileAnimationNodes(bpy.types.Operator):
     bl_idname = "an.profile"
@@ -50,6 +68,77 @@ class ProfileAnimationNodes(bpy.types.Operator):
             return bpy.data.texts.new(textBlockName)
 
 
+class ExportExecutionTrace(bpy.types.Operator):
+    bl_idname = "an.export_execution_trace"
+    bl_label = "Export Execution Trace"
+    bl_description = ("Write the spans recorded in the last execution or in a frame range "
+                      "into a Chrome trace file (can be opened in speedscope)")
+
+    filepath: StringProperty(subtype = "FILE_PATH")
+    filter_glob: StringProperty(default = "*.json", options = {"HIDDEN"})
+
+    useFrameRange: BoolProperty(name = "Frame Range", default = False, options = {"SKIP_SAVE"})
+    startFrame: IntProperty(default = 1)
+    endFrame: IntProperty(default = 10)
+
+    @classmethod
+    def poll(cls, context):
+        return isProfiling()
+
+    def invoke(self, context, event):
+        if self.filepath == "":
+            self.filepath = "animation_nodes_trace.json"
+        context.window_manager.fileselect_add(self)
+        return {"RUNNING_MODAL"}
+
+    def execute(self, context):
+        if self.useFrameRange:
+            if self.startFrame > self.endFrame:
+                self.report({"ERROR"}, "The start frame has to be before the end frame")
+                return {"CANCELLED"}
+            if not self.recordFrameRange(context.scene):
+                self.report({"ERROR"}, "There are no node trees that can be executed")
+                return {"CANCELLED"}
+        elif not hasRecordedEvents():
+            self.report({"ERROR"}, "Nothing has been recorded, execute a node tree first")
+            return {"CANCELLED"}
+
+        path = bpy.path.abspath(self.filepath)
+        exportTrace(path)
+        self.report({"INFO"}, "Exported trace to " + path)
+        return {"FINISHED"}
+
+    def recordFrameRange(self, scene):
+        nodeTrees = [tree for tree in getAnimationNodeTrees()
+                     if tree.autoExecution.enabled and tree.hasMainExecutionUnits]
+        if len(nodeTrees) == 0 or not problems.canExecute():
+            return False
+
+        oldFrame = scene.frame_current
+        animatedNodeIDs = set().union(*(getAnimatedNodeIDs(tree) for tree in nodeTrees))
+
+        # auto execution would execute the trees a second time per frame
+        suspendAutoExecution()
+        setupExecutionUnits(nodeTrees)
+        startRangeRecording()
+        try:
+            for frame in range(self.startFrame, self.endFrame + 1):
+                scene.frame_set(frame)
+                # the units are only set up once, so animated socket values have to be reloaded
+                reloadAnimatedSocketValues(nodeTrees, animatedNodeIDs)
+                name = "Frame {}".format(frame)
+                beginSpan(name, "frame")
+                for nodeTree in nodeTrees:
+                    nodeTree._execute()
+                endSpan(name)
+        finally:
+            stopRangeRecording()
+            finishExecutionUnits(nodeTrees)
+            resumeAutoExecution()
+            scene.frame_set(oldFrame)
+        return True
+
+
 def execute_TreeExecutiong():
     bpy.context.space_data.edit_tree.execute()
 
@@ -2,6 +2,7 @@ import os
 import bpy
 import sys
 from bpy.props import *
+from . utils.handlers import eventHandler
 
 addonName = os.path.basename(os.path.dirname(__file__))
 
@@ -69,6 +70,9 @@ class ProfilingProperties(bpy.types.PropertyGroup):
     sort: EnumProperty(name = "Profiling Sort Mode",
         default = "cumtime", items = profileSortModeItems)
 
+    traceFrameStart: IntProperty(name = "Start Frame", default = 1)
+    traceFrameEnd: IntProperty(name = "End Frame", default = 10)
+
 class DeveloperProperties(bpy.types.PropertyGroup):
     bl_idname = "an_DeveloperProperties"
 
@@ -93,7 +97,8 @@ class ExecutionCodeProperties(bpy.types.PropertyGroup):
         ("DEFAULT", "Default", "", "NONE", 0),
         ("MONITOR", "Monitor Execution", "", "NONE", 1),
         ("MEASURE", "Measure Execution Times", "", "NONE", 2),
-        ("BAKE", "Bake", "", "NONE", 3)]
+        ("BAKE", "Bake", "", "NONE", 3),
+        ("PROFILE", "Profile Execution", "Record the time spans of trees, subprograms, nodes, conversions and copies", "NONE", 4)]
 
     type: EnumProperty(name = "Execution Code Type", default = "DEFAULT",
         description = "Different execution codes can be useful in different contexts",
@@ -111,6 +116,26 @@ class ExecutionCodeProperties(bpy.types.PropertyGroup):
         get = get_MeasureExecution, set = set_MeasureExecution,
         description = "Measure execution times of the individual nodes")
 
+    persistentUnits: BoolProperty(name = "Persistent Execution Units", default = False,
+        description = ("Keep the setup state of execution units between auto executions "
+                       "and only reload socket values that changed"),
+        update = settingChanged)
+
+    removeUnusedNodes: BoolProperty(name = "Remove Unused Nodes", default = False,
+        description = ("Don't execute nodes whose results are not used by nodes "
+                       "with side effects like output and viewer nodes"),
+        update = settingChanged)
+
+    foldConstantNodes: BoolProperty(name = "Fold Constant Nodes", default = False,
+        description = ("Compute nodes that only depend on unlinked inputs once during "
+                       "the setup instead of in every execution"),
+        update = settingChanged)
+
+    storeCodeCacheOnDisk: BoolProperty(name = "Store Code Cache on Disk", default = False,
+        description = ("Store the generated execution code next to the .blend file "
+                       "so that it does not have to be generated again when the file is opened "
+                       "(only loaded when the automatic execution of scripts is allowed)"))
+
 class DrawMeshIndicesProperties(bpy.types.PropertyGroup):
     bl_idname = "an_DrawMeshIndicesProperties"
     _drawVertices = _drawEdges = _drawPolygons = False
@@ -160,6 +185,23 @@ class AnimationNodesPreferences(bpy.types.AddonPreferences):
     executionCode: PointerProperty(type = ExecutionCodeProperties)
     drawHandlers: PointerProperty(type = DrawHandlerProperties)
 
+    def threadAmountChanged(self, context):
+        applyThreadAmount()
+
+    threadAmount: IntProperty(name = "Threads", default = 1, min = 0, soft_max = 64,
+        description = ("Amount of threads used by some operations on big lists "
+                       "(0 = use all cores)"),
+        update = threadAmountChanged)
+
+    def subprogramCacheSizeChanged(self, context):
+        from . nodes.subprogram.subprogram_cache import subprogramCache
+        subprogramCache.shrink()
+
+    subprogramCacheSize: IntProperty(name = "Subprogram Cache (MB)", default = 2048, min = 1,
+        description = ("Memory that can be used by cached results of Invoke Subprogram nodes, "
+                       "the least recently used results are removed first"),
+        update = subprogramCacheSizeChanged)
+
     showUninstallInfo: BoolProperty(name = "Show Deinstall Info", default = False,
         options = {"SKIP_SAVE"})
 
@@ -179,6 +221,8 @@ class AnimationNodesPreferences(bpy.types.AddonPreferences):
         col = row.column(align = True)
         col.prop(self.developer, "debug")
         col.prop(self.developer, "runTests")
+        col.prop(self, "threadAmount")
+        col.prop(self, "subprogramCacheSize")
 
         col = layout.column(align = True)
         col.split(factor = 0.25).prop(self, "showUninstallInfo", text = "How to Uninstall?",
@@ -199,6 +243,9 @@ def getExecutionCodeSettings():
 def getExecutionCodeType():
     return getExecutionCodeSettings().type
 
+def usePersistentExecutionUnits():
+    return getExecutionCodeSettings().persistentUnits
+
 def getColorSettings():
     return getPreferences().nodeColors
 
@@ -211,6 +258,15 @@ def debuggingIsEnabled():
 def testsAreEnabled():
     return getPreferences().developer.runTests
 
+@eventHandler("ADDON_LOAD_POST")
+def applyThreadAmount():
+    from . utils.parallel import setThreadAmount
+    amount = getPreferences().threadAmount
+    setThreadAmount(amount if amount > 0 else (os.cpu_count() or 1))
+
+def getSubprogramCacheBudget():
+    return getPreferences().subprogramCacheSize * 1024 * 1024
+
 def getBlenderVersion():
     return bpy.app.version
 
@@ -1,9 +1,9 @@
 import bpy
 from bpy.props import *
-from mathutils.bvhtree import BVHTree
 from .. events import propertyChanged
 from .. utils.depsgraph import getEvaluatedID
 from .. base_types import AnimationNodeSocket
+from .. data_structures import BVHTree, Vector3DList, PolygonIndicesList
 
 class BVHTreeSocket(bpy.types.NodeSocket, AnimationNodeSocket):
     bl_idname = "an_BVHTreeSocket"
@@ -41,7 +41,7 @@ class BVHTreeSocket(bpy.types.NodeSocket, AnimationNodeSocket):
         vertices = mesh.an.getVertices()
         if self.useWorldSpace:
             vertices.transform(evaluatedObject.matrix_world)
-        return BVHTree.FromPolygons(vertices, polygons)
+        return BVHTree(vertices, polygons)
 
     def setProperty(self, data):
         self.object, self.useWorldSpace = data
@@ -62,7 +62,7 @@ class BVHTreeSocket(bpy.types.NodeSocket, AnimationNodeSocket):
 
     @classmethod
     def getDefaultValue(cls):
-        return BVHTree.FromPolygons(vertices = [], polygons = [])
+        return BVHTree(Vector3DList(), PolygonIndicesList())
 
     @classmethod
     def correctValue(cls, value):
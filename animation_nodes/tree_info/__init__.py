@@ -7,9 +7,11 @@ def __setup():
     from . forest_data import ForestData
     from . networks import NodeNetworks
 
-    global _needsUpdate, _forestData, _networks
+    global _changedTreeNames, _updatedTreeNames, _forestData, _networks
 
-    _needsUpdate = True
+    # None means that all trees have to be analysed
+    _changedTreeNames = None
+    _updatedTreeNames = None
     _forestData = ForestData()
     _networks = NodeNetworks()
 
@@ -19,23 +21,47 @@ def __setup():
 
 @measureTime
 def update():
-    _forestData.update()
+    global _changedTreeNames, _updatedTreeNames
 
     nodeByID = createNodeByIdDict()
-    _networks.update(_forestData, nodeByID)
+    if _changedTreeNames and _forestData.canUpdateTrees(_changedTreeNames):
+        _forestData.updateTrees(_changedTreeNames)
+        _networks.updateTrees(_forestData, _changedTreeNames, nodeByID)
+        if _updatedTreeNames is not None:
+            _updatedTreeNames.update(_changedTreeNames)
+    else:
+        _forestData.update()
+        _networks.update(_forestData, nodeByID)
+        _updatedTreeNames = None
     nodeByID.clear()
 
-    global _needsUpdate
-    _needsUpdate = False
+    _changedTreeNames = set()
 
 def updateIfNecessary():
-    if _needsUpdate:
+    if _changedTreeNames is None or len(_changedTreeNames) > 0:
+        update()
+
+def updateChangedTrees():
+    '''
+    Analyse the trees that changed since the last call of this function.
+    Returns the names of these trees or None when all trees have been analysed.
+    '''
+    global _updatedTreeNames
+
+    updateIfNecessary()
+    if _updatedTreeNames is not None and len(_updatedTreeNames) == 0:
         update()
 
-def treeChanged():
-    global _needsUpdate
-    _needsUpdate = True
+    treeNames = _updatedTreeNames
+    _updatedTreeNames = set()
+    return treeNames
 
+def treeChanged(nodeTree = None):
+    global _changedTreeNames
+    if nodeTree is None:
+        _changedTreeNames = None
+    elif _changedTreeNames is not None:
+        _changedTreeNames.add(nodeTree.name)
 
 
 def getNodeByIdentifier(identifier):
@@ -80,12 +106,13 @@ def getDirectlyLinkedSocketsIDs(socket):
 def getUndefinedNodes(nodeByID):
     return [nodeByID[nodeID] for nodeID in _forestData.nodesByType["NodeUndefined"]]
 
-def iterLinkedSocketsWithInfo(socket, node, nodeByID):
+def iterLinkedSocketsWithInfo(socket, node, nodeByID, ignoredNodeIdentifiers = ()):
     socketID = ((node.id_data.name, node.name), socket.is_output, socket.identifier)
     linkedIDs = _forestData.linkedSockets[socketID]
     for linkedID in linkedIDs:
         linkedIdentifier = linkedID[2]
         linkedNode = nodeByID[linkedID[0]]
+        if linkedNode.identifier in ignoredNodeIdentifiers: continue
         sockets = linkedNode.outputs if linkedID[1] else linkedNode.inputs
         for socket in sockets:
             if socket.identifier == linkedIdentifier:
@@ -117,6 +144,17 @@ def getAllDataLinkIDs():
                 linkDataIDs.add((linkedID, socketID, dataType[linkedID], dataType[socketID]))
     return linkDataIDs
 
+def getNetworkLinkIDs(network):
+    linkedSockets = _forestData.linkedSockets
+    socketsByNode = _forestData.socketsByNode
+    linkIDs = []
+    for nodeID in network.nodeIDs:
+        for socketID in socketsByNode[nodeID][0]:
+            for originID in linkedSockets[socketID]:
+                linkIDs.append((originID, socketID))
+    linkIDs.sort()
+    return linkIDs
+
 def getLinkedInputsDict(node):
     linkedSockets = _forestData.linkedSockets
     socketIDs = _forestData.socketsByNode[node.toID()][0]
@@ -8,9 +8,11 @@ class ForestData:
 
     def _reset(self):
         self.nodes = []
+        self.nodesByTree = defaultdict(list)
         self.nodesByType = defaultdict(set)
         self.typeByNode = defaultdict(None)
         self.nodeByIdentifier = defaultdict(None)
+        self.identifierByNode = dict()
         self.animationNodes = set()
 
         self.socketsByNode = defaultdict(lambda: ([], []))
@@ -23,20 +25,54 @@ class ForestData:
 
     def update(self):
         self._reset()
-        self.insertNodeTrees()
+        self.insertNodeTrees(getAnimationNodeTrees())
         self.rerouteNodes = self.nodesByType["NodeReroute"]
-        self.findLinksSkippingReroutes()
+        self.findLinksSkippingReroutes(self.nodes)
 
-    def insertNodeTrees(self):
-        for tree in getAnimationNodeTrees():
+    def updateTrees(self, treeNames):
+        '''Only rescan the given trees. Links never connect different trees,
+        so the data of all other trees stays valid.'''
+        for treeName in treeNames:
+            self.removeTree(treeName)
+
+        nodeTrees = [tree for tree in getAnimationNodeTrees() if tree.name in treeNames]
+        self.insertNodeTrees(nodeTrees)
+        self.rerouteNodes = self.nodesByType["NodeReroute"]
+        self.findLinksSkippingReroutes(chain.from_iterable(
+            self.nodesByTree[tree.name] for tree in nodeTrees))
+
+    def canUpdateTrees(self, treeNames):
+        currentTreeNames = {tree.name for tree in getAnimationNodeTrees()}
+        knownTreeNames = set(self.nodesByTree.keys())
+        return currentTreeNames == knownTreeNames and treeNames.issubset(currentTreeNames)
+
+    def insertNodeTrees(self, nodeTrees):
+        for tree in nodeTrees:
             self.insertNodes(tree.nodes, tree.name)
             self.insertLinks(tree.links, tree.name)
+        self.nodes = list(chain.from_iterable(self.nodesByTree.values()))
+
+    def removeTree(self, treeName):
+        for nodeID in self.nodesByTree.pop(treeName, []):
+            self.nodesByType[self.typeByNode.pop(nodeID)].discard(nodeID)
+            self.animationNodes.discard(nodeID)
+
+            identifier = self.identifierByNode.pop(nodeID, None)
+            if self.nodeByIdentifier.get(identifier) == nodeID:
+                del self.nodeByIdentifier[identifier]
+
+            for socketID in chain.from_iterable(self.socketsByNode.pop(nodeID)):
+                self.linkedSockets.pop(socketID, None)
+                self.linkedSocketsWithReroutes.pop(socketID, None)
+                self.reroutePairs.pop(socketID, None)
+                self.dataTypeBySocket.pop(socketID, None)
 
     def insertNodes(self, nodes, treeName):
-        appendNode = self.nodes.append
+        appendNode = self.nodesByTree[treeName].append
         nodesByType = self.nodesByType
         typeByNode = self.typeByNode
         nodeByIdentifier = self.nodeByIdentifier
+        identifierByNode = self.identifierByNode
         socketsByNode = self.socketsByNode
         reroutePairs = self.reroutePairs
         dataTypeBySocket = self.dataTypeBySocket
@@ -63,6 +99,7 @@ class ForestData:
                 if node.bl_idname != "NodeUndefined":
                     animationNodes.add(nodeID)
                     nodeByIdentifier[node.identifier] = nodeID
+                    identifierByNode[nodeID] = node.identifier
 
                 chainedSockets = chain(node.inputs, node.outputs)
                 chainedSocketIDs = chain(inputIDs, outputIDs)
@@ -85,9 +122,9 @@ class ForestData:
             linkedSocketsWithReroutes[originID].append(targetID)
             linkedSocketsWithReroutes[targetID].append(originID)
 
-    def findLinksSkippingReroutes(self):
+    def findLinksSkippingReroutes(self, nodes):
         rerouteNodes = self.rerouteNodes
-        nonRerouteNodes = filter(lambda n: n not in rerouteNodes, self.nodes)
+        nonRerouteNodes = filter(lambda n: n not in rerouteNodes, nodes)
 
         socketsByNode = self.socketsByNode
         linkedSockets = self.linkedSockets
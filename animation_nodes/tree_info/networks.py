@@ -11,23 +11,49 @@ class NodeNetworks:
         self.networkByNode = {}
 
     def update(self, forestData, nodeByID):
-        self._reset()
         self.forestData = forestData
+        self.networksByTree = defaultdict(list)
+        self.joinedNetworks = {}
+        self.insertNetworks(forestData.nodes, nodeByID)
+        self.joinNetworks(nodeByID)
 
-        networksByIdentifier = defaultdict(list)
-        for nodes in self.iterNodeGroups():
-            if not self.groupContainsAnimationNodes(nodes): continue
+    def updateTrees(self, forestData, treeNames, nodeByID):
+        self.forestData = forestData
+        for treeName in treeNames:
+            self.networksByTree.pop(treeName, None)
+        nodes = chain.from_iterable(forestData.nodesByTree[treeName] for treeName in treeNames)
+        self.insertNetworks(nodes, nodeByID)
+        self.joinNetworks(nodeByID)
+
+    def insertNetworks(self, nodes, nodeByID):
+        for nodeGroup in self.iterNodeGroups(nodes):
+            if not self.groupContainsAnimationNodes(nodeGroup): continue
 
-            network = NodeNetwork(nodes, self.forestData, nodeByID)
+            network = NodeNetwork(nodeGroup, self.forestData, nodeByID)
+            self.networksByTree[network.treeName].append(network)
+
+    def joinNetworks(self, nodeByID):
+        self._reset()
+
+        networksByIdentifier = defaultdict(list)
+        for network in chain.from_iterable(self.networksByTree.values()):
             networksByIdentifier[network.identifier].append(network)
 
+        joinedNetworks = {}
         for identifier, networks in networksByIdentifier.items():
             if identifier is None:
                 # this are the main networks
                 self.networks.extend(networks)
             else:
                 # join subprogram networks if they are not connected with links
-                self.networks.append(NodeNetwork.join(networks, nodeByID))
+                # reuse the joined network when none of its parts changed
+                parts = tuple(networks)
+                oldParts, joinedNetwork = self.joinedNetworks.get(identifier, (None, None))
+                if parts != oldParts:
+                    joinedNetwork = NodeNetwork.join(networks, nodeByID)
+                joinedNetworks[identifier] = (parts, joinedNetwork)
+                self.networks.append(joinedNetwork)
+        self.joinedNetworks = joinedNetworks
 
         for network in self.networks:
             for nodeID in network.nodeIDs:
@@ -38,9 +64,9 @@ class NodeNetworks:
         nonAnimationNodes = ("NodeFrame", "NodeReroute")
         return any(typeByNode[node] not in nonAnimationNodes for node in nodes)
 
-    def iterNodeGroups(self):
+    def iterNodeGroups(self, nodes):
         foundNodes = set()
-        for node in self.forestData.nodes:
+        for node in nodes:
             if node not in foundNodes:
                 nodeGroup = self.getAllConnectedNodes(node)
                 foundNodes.update(nodeGroup)
@@ -45,6 +45,8 @@ class DeveloperPanel(bpy.types.Panel):
         row.prop(executionCode, "type", text = "")
         if executionCode.type == "MEASURE":
             row.operator("an.reset_measurements", text = "", icon = "RECOVER_LAST")
+        if executionCode.type == "PROFILE":
+            self.drawTraceExportSettings(col, preferences)
 
         row = col.row(align = True)
         row.operator("an.print_current_execution_code", text = "Print", icon = "CONSOLE")
@@ -53,6 +55,21 @@ class DeveloperPanel(bpy.types.Panel):
         subrow.active = executionCodeTextBlockName in bpy.data.texts
         subrow.operator("an.select_area", text = "", icon = "ZOOM_SELECTED").callback = setupTextEditorCallback
 
+        layout.prop(executionCode, "storeCodeCacheOnDisk")
+
+    def drawTraceExportSettings(self, layout, preferences):
+        profiling = preferences.developer.profiling
+
+        layout.operator("an.export_execution_trace", text = "Export Last Execution", icon = "EXPORT")
+
+        row = layout.row(align = True)
+        row.prop(profiling, "traceFrameStart", text = "Start")
+        row.prop(profiling, "traceFrameEnd", text = "End")
+        props = layout.operator("an.export_execution_trace", text = "Export Frame Range", icon = "EXPORT")
+        props.useFrameRange = True
+        props.startFrame = profiling.traceFrameStart
+        props.endFrame = profiling.traceFrameEnd
+
     def drawProfilingSettings(self, layout, preferences):
         profiling = preferences.developer.profiling
 
@@ -366,6 +366,7 @@ class ObjectMenu(bpy.types.Menu):
         layout.menu("AN_MT_object_utils_menu", text = "Utils")
         layout.separator()
         insertNode(layout, "an_ObjectInstancerNode", "Instancer")
+        insertNode(layout, "an_PointInstanceOutputNode", "Point Instance Output")
         layout.separator()
         insertNode(layout, "an_SetCustomAttributeNode", " Set Custom Attribute")
 
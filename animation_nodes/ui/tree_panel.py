@@ -3,6 +3,7 @@ from .. problems import canExecute
 from .. utils.layout import writeText
 from .. utils.timing import prettyTime
 from .. preferences import getExecutionCodeSettings
+from .. execution.units import getDeadNodeIdentifiers
 
 class TreePanel(bpy.types.Panel):
     bl_idname = "AN_PT_tree_panel"
@@ -34,6 +35,18 @@ class TreePanel(bpy.types.Panel):
         row.label(text = prettyTime(tree.lastExecutionInfo.executionTime), icon = "TIME")
         row.prop(getExecutionCodeSettings(), "measureExecution", text = "Details", emboss = False)
 
+        col = layout.column(align = True)
+        col.label(text = "Setup: " + prettyTime(tree.lastExecutionInfo.setupTime))
+        col.prop(getExecutionCodeSettings(), "persistentUnits", text = "Persistent Setup")
+        col.prop(getExecutionCodeSettings(), "removeUnusedNodes")
+        if getExecutionCodeSettings().removeUnusedNodes:
+            amount = len(getDeadNodeIdentifiers(tree))
+            if amount > 0:
+                row = col.row(align = True)
+                row.label(text = "Unused Nodes: {}".format(amount), icon = "INFO")
+                row.operator("an.select_unused_nodes", text = "", icon = "RESTRICT_SELECT_OFF")
+        col.prop(getExecutionCodeSettings(), "foldConstantNodes")
+
         layout.separator()
         layout.prop(tree, "globalScene", icon = "SCENE_DATA", text = "Scene")
         layout.prop(tree, "editNodeLabels")
@@ -14,10 +14,10 @@ def updateEverything():
     Call when the node tree changed in a way that the execution code does
     not work anymore.
     '''
-    tree_info.update()
+    changedTreeNames = tree_info.updateChangedTrees()
     problems.reset()
     enableUseFakeUser()
-    updateIndividualNodes()
+    updateIndividualNodes(changedTreeNames)
     correctForbiddenNodeLinks()
 
     # from now on no nodes will be created or removed
@@ -42,7 +42,7 @@ def enableUseFakeUser():
     for tree in getAnimationNodeTrees():
         tree.use_fake_user = True
 
-def updateIndividualNodes():
+def updateIndividualNodes(treeNames = None):
     tree_info.updateIfNecessary()
     nodeByID = createNodeByIdDict()
     updatedNodes = set()
@@ -61,8 +61,11 @@ def updateIndividualNodes():
         currentNodes.remove(node)
         tree_info.updateIfNecessary()
 
-    for node in iterAnimationNodes():
-        editNode(node)
+    for nodeTree in getAnimationNodeTrees():
+        if treeNames is None or nodeTree.name in treeNames:
+            for node in nodeTree.nodes:
+                if node.isAnimationNode:
+                    editNode(node)
 
 
 def checkNetworks(nodeByID):
@@ -0,0 +1,75 @@
+import bpy
+import time
+import numpy
+from . vertex_groups import setVertexGroupWeights, getVertexGroupWeights
+
+# Not part of the test suite, run it from the Python console with:
+#   from animation_nodes.utils import benchmark_vertex_groups
+#   benchmark_vertex_groups.run()
+# It compares the bulk functions with the per vertex calls they replace.
+
+def run(vertexAmounts = (1000, 10000, 100000), groupAmounts = (1, 4)):
+    for vertexAmount in vertexAmounts:
+        for groupAmount in groupAmounts:
+            with BenchmarkObject(vertexAmount) as object:
+                benchmarkSetWeights(object, vertexAmount, groupAmount)
+            with BenchmarkObject(vertexAmount) as object:
+                benchmarkGetWeights(object, vertexAmount, groupAmount)
+
+def benchmarkSetWeights(object, vertexAmount, groupAmount):
+    # quantized weights, like masks or weights painted with a few values
+    weights = numpy.random.randint(0, 5, vertexAmount).astype(numpy.float32) / 4
+    indices = numpy.arange(vertexAmount)
+
+    start = time.perf_counter()
+    for i in range(groupAmount):
+        group = object.vertex_groups.new(name = "Per Vertex")
+        for index, weight in zip(indices.tolist(), weights.tolist()):
+            group.add([index], weight, "REPLACE")
+    perVertexTime = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for i in range(groupAmount):
+        setVertexGroupWeights(object.vertex_groups.new(name = "Bulk"), indices, weights)
+    bulkTime = time.perf_counter() - start
+
+    printBenchmark("Set Weights", vertexAmount, groupAmount, perVertexTime, bulkTime)
+
+def benchmarkGetWeights(object, vertexAmount, groupAmount):
+    groups = [object.vertex_groups.new(name = str(i)) for i in range(groupAmount)]
+    for i, group in enumerate(groups):
+        # every vertex is in every second group
+        indices = numpy.arange(vertexAmount)[numpy.arange(vertexAmount) % 2 == i % 2]
+        setVertexGroupWeights(group, indices, numpy.random.random(len(indices)))
+
+    start = time.perf_counter()
+    perVertexWeights = numpy.zeros((groupAmount, vertexAmount))
+    for group in groups:
+        for index in range(vertexAmount):
+            try: perVertexWeights[group.index, index] = group.weight(index)
+            except RuntimeError: pass
+    perVertexTime = time.perf_counter() - start
+
+    start = time.perf_counter()
+    getVertexGroupWeights(object.data, groupAmount)
+    bulkTime = time.perf_counter() - start
+
+    printBenchmark("Get Weights", vertexAmount, groupAmount, perVertexTime, bulkTime)
+
+class BenchmarkObject:
+    def __init__(self, vertexAmount):
+        self.vertexAmount = vertexAmount
+
+    def __enter__(self):
+        self.mesh = bpy.data.meshes.new("AN Benchmark")
+        self.mesh.vertices.add(self.vertexAmount)
+        self.object = bpy.data.objects.new("AN Benchmark", self.mesh)
+        return self.object
+
+    def __exit__(self, type, value, traceback):
+        bpy.data.objects.remove(self.object)
+        bpy.data.meshes.remove(self.mesh)
+
+def printBenchmark(name, vertexAmount, groupAmount, oldTime, newTime):
+    print("{}, {} vertices, {} groups: {:.4f} s per vertex, {:.4f} s bulk ({:.1f}x)".format(
+        name, vertexAmount, groupAmount, oldTime, newTime, oldTime / max(newTime, 1e-10)))
@@ -1,5 +1,8 @@
 import bpy
 from . names import toDataPath
+from . handlers import eventHandler
+from .. data_structures.lists.base_lists import FloatList
+from .. data_structures.fcurve_snapshot import getFCurveSnapshot, invalidateFCurveSnapshots
 
 
 # Misc
@@ -70,8 +73,9 @@ def getArrayValueAtMultipleFrames(object, dataPath, frames, arraySize = 3):
             for i, frame in enumerate(frames):
                 values[i][index] = value
         else:
-            for i, frame in enumerate(frames):
-                values[i][index] = fCurve.evaluate(frame)
+            frameValues = getFCurveSnapshot(fCurve).evaluateList(FloatList.fromValues(frames))
+            for i, value in enumerate(frameValues):
+                values[i][index] = value
     return values
 
 def getFCurveWithIndex(fCurves, index):
@@ -122,6 +126,22 @@ def getSingleFCurveWithDataPath(object, dataPath, storeInCache = True):
 
 
 
+# fcurve snapshots
+######################
+
+def invalidateChangedFCurveSnapshots(depsgraph):
+    for update in depsgraph.updates:
+        if isinstance(update.id, bpy.types.Action):
+            invalidateFCurveSnapshots(update.id.original)
+
+@eventHandler("FILE_LOAD_POST")
+@eventHandler("UNDO_POST")
+@eventHandler("REDO_POST")
+def clearFCurveSnapshots():
+    invalidateFCurveSnapshots()
+
+
+
 # get fcurves
 ######################
 
@@ -14,10 +14,13 @@ def validCallback(function):
 
 alwaysHandlers = []
 fileSavePreHandlers = []
+fileSavePostHandlers = []
 fileLoadPostHandlers = []
 versionUpdateHandlers = []
 addonLoadPostHandlers = []
 frameChangePostHandlers = []
+undoPostHandlers = []
+redoPostHandlers = []
 depsgraphUpdatePostHandlers = []
 
 renderPreHandlers = []
@@ -29,11 +32,14 @@ def eventHandler(event):
     def eventHandlerDecorator(function):
         if event == "ALWAYS": alwaysHandlers.append(function)
         if event == "FILE_SAVE_PRE": fileSavePreHandlers.append(function)
+        if event == "FILE_SAVE_POST": fileSavePostHandlers.append(function)
         if event == "FILE_LOAD_POST": fileLoadPostHandlers.append(function)
         if event == "VERSION_UPDATE": versionUpdateHandlers.append(function)
         if event == "ADDON_LOAD_POST": addonLoadPostHandlers.append(function)
         if event == "FRAME_CHANGE_POST": frameChangePostHandlers.append(function)
         if event == "DEPSGRAPH_UPDATE_POST": depsgraphUpdatePostHandlers.append(function)
+        if event == "UNDO_POST": undoPostHandlers.append(function)
+        if event == "REDO_POST": redoPostHandlers.append(function)
 
         if event == "RENDER_INIT": renderInitHandlers.append(function)
         if event == "RENDER_PRE": renderPreHandlers.append(function)
@@ -59,6 +65,11 @@ def savePre(scene):
     for handler in fileSavePreHandlers:
         handler()
 
+@persistent
+def savePost(scene):
+    for handler in fileSavePostHandlers:
+        handler()
+
 @persistent
 def loadPost(scene):
     for handler in fileLoadPostHandlers:
@@ -84,6 +95,16 @@ def depsgraphUpdatePost(scene, depsgraph):
     for handler in depsgraphUpdatePostHandlers:
         handler(scene, depsgraph)
 
+@persistent
+def undoPost(scene):
+    for handler in undoPostHandlers:
+        handler()
+
+@persistent
+def redoPost(scene):
+    for handler in redoPostHandlers:
+        handler()
+
 @persistent
 def renderInitialized(scene):
     for handler in renderInitHandlers:
@@ -106,6 +127,9 @@ def register():
     bpy.app.handlers.load_post.append(loadPost)
     bpy.app.handlers.version_update.append(versionUpdate)
     bpy.app.handlers.save_pre.append(savePre)
+    bpy.app.handlers.save_post.append(savePost)
+    bpy.app.handlers.undo_post.append(undoPost)
+    bpy.app.handlers.redo_post.append(redoPost)
 
     bpy.app.handlers.render_complete.append(renderCompleted)
     bpy.app.handlers.render_init.append(renderInitialized)
@@ -122,6 +146,9 @@ def unregister():
     bpy.app.handlers.load_post.remove(loadPost)
     bpy.app.handlers.version_update.remove(versionUpdate)
     bpy.app.handlers.save_pre.remove(savePre)
+    bpy.app.handlers.save_post.remove(savePost)
+    bpy.app.handlers.undo_post.remove(undoPost)
+    bpy.app.handlers.redo_post.remove(redoPost)
     bpy.app.timers.unregister(always)
 
     bpy.app.handlers.render_complete.remove(renderCompleted)
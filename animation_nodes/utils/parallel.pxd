@@ -0,0 +1 @@
+cdef int getThreadAmount(Py_ssize_t amount) nogil
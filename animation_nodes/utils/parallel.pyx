@@ -0,0 +1,15 @@
+# Some element wise list operations can run on multiple cores.
+# Small lists are always processed serially, because starting the
+# threads would take longer than the computation itself.
+
+cdef int threadAmount = 1
+cdef Py_ssize_t minParallelAmount = 50000
+
+def setThreadAmount(int amount):
+    global threadAmount
+    threadAmount = max(amount, 1)
+
+cdef int getThreadAmount(Py_ssize_t amount) nogil:
+    if amount < minParallelAmount:
+        return 1
+    return threadAmount
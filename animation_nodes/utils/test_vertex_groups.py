@@ -0,0 +1,66 @@
+import bpy
+import numpy
+from unittest import TestCase
+from . vertex_groups import setVertexGroupWeights, getVertexGroupWeights
+
+class RecordingVertexGroup:
+    def __init__(self):
+        self.weights = {}
+        self.calls = 0
+
+    def add(self, indices, weight, type):
+        self.calls += 1
+        for index in indices:
+            self.weights[index] = weight
+
+class TestSetVertexGroupWeights(TestCase):
+    def testGroupsEqualWeights(self):
+        group = RecordingVertexGroup()
+        setVertexGroupWeights(group, [0, 1, 2, 3], [0.5, 1.0, 0.5, 1.0])
+        self.assertEqual(group.weights, {0 : 0.5, 1 : 1.0, 2 : 0.5, 3 : 1.0})
+        self.assertEqual(group.calls, 2)
+
+    def testLastWeightWins(self):
+        group = RecordingVertexGroup()
+        setVertexGroupWeights(group, [2, 0, 2, 1, 2], [0.75, 0.0, 0.25, 1.0, 0.5])
+        self.assertEqual(group.weights, {0 : 0.0, 1 : 1.0, 2 : 0.5})
+
+    def testEmpty(self):
+        group = RecordingVertexGroup()
+        setVertexGroupWeights(group, [], [])
+        self.assertEqual(group.calls, 0)
+
+
+class TestGetVertexGroupWeights(TestCase):
+    def setUp(self):
+        self.mesh = bpy.data.meshes.new("AN Test")
+        self.mesh.vertices.add(10)
+        self.object = bpy.data.objects.new("AN Test", self.mesh)
+
+    def tearDown(self):
+        bpy.data.objects.remove(self.object)
+        bpy.data.meshes.remove(self.mesh)
+
+    def testEqualsPerVertexWeights(self):
+        groups = [self.object.vertex_groups.new(name = str(i)) for i in range(3)]
+        groups[0].add([0, 1, 2, 3], 0.25, "REPLACE")
+        groups[1].add([2, 3, 9], 0.5, "REPLACE")
+        groups[2].add([9], 1.0, "REPLACE")
+
+        expected = numpy.zeros((3, 10))
+        for group in groups:
+            for index in range(10):
+                try: expected[group.index, index] = group.weight(index)
+                except RuntimeError: pass
+
+        self.assertTrue(numpy.array_equal(getVertexGroupWeights(self.mesh, 3), expected))
+
+    def testIgnoreMissingGroups(self):
+        self.object.vertex_groups.new(name = "0").add([1], 1.0, "REPLACE")
+        self.object.vertex_groups.new(name = "1").add([2], 1.0, "REPLACE")
+        weights = getVertexGroupWeights(self.mesh, 1)
+        self.assertEqual(weights.shape, (1, 10))
+        self.assertEqual(weights[0].tolist(), [0, 1, 0, 0, 0, 0, 0, 0, 0, 0])
+
+    def testNoGroups(self):
+        self.assertEqual(getVertexGroupWeights(self.mesh, 0).shape, (0, 10))
@@ -0,0 +1,29 @@
+def updateImageSequenceFrame(texture, scene):
+    if texture.type != "IMAGE" or scene is None: return
+    if texture.image is not None and texture.image.source in ["SEQUENCE", "MOVIE"]:
+        texture.image_user.frame_current = scene.frame_current
+
+
+# sampled texture colors
+########################
+
+# Multiple nodes often sample the same texture at the same locations.
+# The samples are kept until the execution finished, so that changes
+# of the texture are visible in the next execution.
+
+cache = {}
+
+def clearCache():
+    cache.clear()
+
+def getTextureSamplesKey(texture, locations, matrix, frame):
+    return (texture.as_pointer(), tuple(map(tuple, matrix)), id(locations), frame)
+
+def getCachedTextureSamples(key, locations):
+    entry = cache.get(key)
+    # the locations are stored to make sure that their id has not been reused
+    if entry is None or entry[0] is not locations: return None
+    return entry[1]
+
+def storeTextureSamples(key, locations, colors):
+    cache[key] = (locations, colors)
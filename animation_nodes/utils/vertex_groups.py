@@ -0,0 +1,57 @@
+import numpy
+
+def setVertexGroupWeights(vertexGroup, indices, weights):
+    '''
+    Blender only allows to set one weight for many vertices at once.
+    So the vertices are grouped by their weight and every group is added
+    with a single call. The weights are compared as 32 bit floats,
+    because that is the precision Blender stores them with.
+    '''
+    indices = numpy.asarray(indices, dtype = numpy.int64)
+    weights = numpy.asarray(weights, dtype = numpy.float32)
+    if len(indices) == 0: return
+
+    # when an index appears multiple times, the last weight wins like with one call per vertex
+    uniqueIndices, reversedPositions = numpy.unique(indices[::-1], return_index = True)
+    if len(uniqueIndices) < len(indices):
+        lastPositions = len(indices) - 1 - reversedPositions
+        indices, weights = indices[lastPositions], weights[lastPositions]
+
+    uniqueWeights, groupIndices = numpy.unique(weights, return_inverse = True)
+    sortedIndices = indices[numpy.argsort(groupIndices, kind = "stable")]
+    groupEnds = numpy.cumsum(numpy.bincount(groupIndices, minlength = len(uniqueWeights)))
+
+    start = 0
+    for weight, end in zip(uniqueWeights.tolist(), groupEnds.tolist()):
+        vertexGroup.add(sortedIndices[start:end].tolist(), weight, "REPLACE")
+        start = end
+
+def getVertexGroupWeights(mesh, groupAmount):
+    '''
+    Reads the weights of all vertex groups with a single pass over the
+    vertices instead of asking every group for the weight of every vertex.
+    Returns an array with the weights of one group per row.
+    Blender has no bulk access (like foreach_get) to the deform weights,
+    so this is still a Python loop over the vertices that have groups.
+    '''
+    result = numpy.zeros((groupAmount, len(mesh.vertices)), dtype = numpy.float64)
+    if groupAmount == 0: return result
+
+    vertexIndices = []
+    groupIndices = []
+    weights = []
+    for vertex in mesh.vertices:
+        index = vertex.index
+        for element in vertex.groups:
+            vertexIndices.append(index)
+            groupIndices.append(element.group)
+            weights.append(element.weight)
+
+    vertexIndices = numpy.array(vertexIndices, dtype = numpy.int64)
+    groupIndices = numpy.array(groupIndices, dtype = numpy.int64)
+    weights = numpy.array(weights, dtype = numpy.float64)
+
+    # the evaluated mesh can reference groups that do not exist on the object anymore
+    mask = groupIndices < groupAmount
+    result[groupIndices[mask], vertexIndices[mask]] = weights[mask]
+    return result